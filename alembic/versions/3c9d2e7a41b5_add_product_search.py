@@ -0,0 +1,142 @@
+"""add_product_search
+
+Revision ID: 3c9d2e7a41b5
+Revises: 77fea243383d
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9d2e7a41b5'
+down_revision: Union[str, Sequence[str], None] = '77fea243383d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column('products', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION product_search_document(p_id BIGINT, p_name TEXT)
+        RETURNS tsvector
+        LANGUAGE sql
+        STABLE
+        AS $$
+            SELECT
+                setweight(to_tsvector('simple', coalesce(p_name, '')), 'A')
+                || setweight(
+                    to_tsvector(
+                        'simple',
+                        coalesce(
+                            (SELECT string_agg(value, ' ')
+                             FROM product_attribute_values
+                             WHERE product_id = p_id),
+                            ''
+                        )
+                    ),
+                    'B'
+                )
+        $$
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION products_search_vector_refresh()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            NEW.search_vector := product_search_document(NEW.id, NEW.name);
+            RETURN NEW;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_products_search_vector
+            BEFORE INSERT OR UPDATE OF name ON products
+            FOR EACH ROW EXECUTE FUNCTION products_search_vector_refresh()
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION product_attribute_values_search_vector_refresh()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            target_id BIGINT;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                target_id := OLD.product_id;
+            ELSE
+                target_id := NEW.product_id;
+            END IF;
+
+            UPDATE products
+            SET search_vector = product_search_document(id, name)
+            WHERE id = target_id;
+
+            IF TG_OP = 'UPDATE' AND OLD.product_id <> NEW.product_id THEN
+                UPDATE products
+                SET search_vector = product_search_document(id, name)
+                WHERE id = OLD.product_id;
+            END IF;
+
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_pav_search_vector
+            AFTER INSERT OR UPDATE OF value, product_id OR DELETE ON product_attribute_values
+            FOR EACH ROW EXECUTE FUNCTION product_attribute_values_search_vector_refresh()
+    """)
+
+    # Заполняем поисковый документ для существующих товаров
+    op.execute("UPDATE products SET search_vector = product_search_document(id, name)")
+
+    op.create_index(
+        'ix_products_search_vector',
+        'products',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_products_name_trgm',
+        'products',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_pav_value_trgm',
+        'product_attribute_values',
+        ['value'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'value': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_pav_value_trgm', table_name='product_attribute_values')
+    op.drop_index('ix_products_name_trgm', table_name='products')
+    op.drop_index('ix_products_search_vector', table_name='products')
+
+    op.execute("DROP TRIGGER IF EXISTS trg_pav_search_vector ON product_attribute_values")
+    op.execute("DROP TRIGGER IF EXISTS trg_products_search_vector ON products")
+    op.execute("DROP FUNCTION IF EXISTS product_attribute_values_search_vector_refresh()")
+    op.execute("DROP FUNCTION IF EXISTS products_search_vector_refresh()")
+    op.execute("DROP FUNCTION IF EXISTS product_search_document(BIGINT, TEXT)")
+
+    op.drop_column('products', 'search_vector')
@@ -0,0 +1,92 @@
+"""add_product_export_delta
+
+Revision ID: 8e1f4b6c2d90
+Revises: 3c9d2e7a41b5
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e1f4b6c2d90'
+down_revision: Union[str, Sequence[str], None] = '3c9d2e7a41b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TOUCH_PRODUCT_TABLES = ("product_attribute_values", "product_images", "product_tags")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'product_tombstones',
+        sa.Column('product_id', sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('product_id'),
+    )
+    op.create_index('ix_product_tombstones_deleted_at', 'product_tombstones', ['deleted_at'], unique=False)
+    op.create_index('ix_products_updated_at', 'products', ['updated_at'], unique=False)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION product_touch_updated_at()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE products SET updated_at = now() WHERE id = NEW.product_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE products SET updated_at = now() WHERE id = OLD.product_id;
+            ELSE
+                UPDATE products SET updated_at = now() WHERE id = OLD.product_id;
+                IF NEW.product_id <> OLD.product_id THEN
+                    UPDATE products SET updated_at = now() WHERE id = NEW.product_id;
+                END IF;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+    for table in TOUCH_PRODUCT_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_touch_product
+                AFTER INSERT OR UPDATE OR DELETE ON {table}
+                FOR EACH ROW EXECUTE FUNCTION product_touch_updated_at()
+        """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION product_write_tombstone()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            INSERT INTO product_tombstones (product_id, deleted_at)
+            VALUES (OLD.id, now())
+            ON CONFLICT (product_id) DO UPDATE SET deleted_at = EXCLUDED.deleted_at;
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_products_tombstone
+            AFTER DELETE ON products
+            FOR EACH ROW EXECUTE FUNCTION product_write_tombstone()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_products_tombstone ON products")
+    op.execute("DROP FUNCTION IF EXISTS product_write_tombstone()")
+    for table in TOUCH_PRODUCT_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_touch_product ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS product_touch_updated_at()")
+
+    op.drop_index('ix_products_updated_at', table_name='products')
+    op.drop_index('ix_product_tombstones_deleted_at', table_name='product_tombstones')
+    op.drop_table('product_tombstones')
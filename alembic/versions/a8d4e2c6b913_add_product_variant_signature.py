@@ -0,0 +1,126 @@
+"""add_product_variant_signature
+
+Revision ID: a8d4e2c6b913
+Revises: f3a7c1d92b64
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d4e2c6b913'
+down_revision: Union[str, Sequence[str], None] = 'f3a7c1d92b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('products', sa.Column('variant_signature', sa.String(length=32), nullable=True))
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION product_variant_signature(p_id BIGINT)
+        RETURNS TEXT
+        LANGUAGE sql
+        STABLE
+        AS $$
+            SELECT md5(jsonb_agg(jsonb_build_array(a.name, v.value) ORDER BY a.name)::text)
+            FROM product_attribute_values v
+            JOIN product_attributes a ON a.id = v.attribute_id
+            WHERE v.product_id = p_id AND a.is_groupable
+        $$
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION product_attribute_values_variant_signature_refresh()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            target_id BIGINT;
+        BEGIN
+            IF current_setting('catalog.bulk_import', true) = 'on' THEN
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP = 'DELETE' THEN
+                target_id := OLD.product_id;
+            ELSE
+                target_id := NEW.product_id;
+            END IF;
+
+            UPDATE products
+            SET variant_signature = product_variant_signature(id)
+            WHERE id = target_id
+              AND variant_signature IS DISTINCT FROM product_variant_signature(id);
+
+            IF TG_OP = 'UPDATE' AND OLD.product_id <> NEW.product_id THEN
+                UPDATE products
+                SET variant_signature = product_variant_signature(id)
+                WHERE id = OLD.product_id
+                  AND variant_signature IS DISTINCT FROM product_variant_signature(id);
+            END IF;
+
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_pav_variant_signature
+            AFTER INSERT OR UPDATE OF value, product_id, attribute_id OR DELETE
+            ON product_attribute_values
+            FOR EACH ROW EXECUTE FUNCTION product_attribute_values_variant_signature_refresh()
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION product_attributes_variant_signature_refresh()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            IF OLD.is_groupable IS DISTINCT FROM NEW.is_groupable
+               OR (NEW.is_groupable AND OLD.name <> NEW.name) THEN
+                UPDATE products
+                SET variant_signature = product_variant_signature(id)
+                WHERE id IN (
+                    SELECT product_id
+                    FROM product_attribute_values
+                    WHERE attribute_id = NEW.id
+                );
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_product_attributes_variant_signature
+            AFTER UPDATE OF name, is_groupable ON product_attributes
+            FOR EACH ROW EXECUTE FUNCTION product_attributes_variant_signature_refresh()
+    """)
+
+    # Заполняем сигнатуры существующих товаров
+    op.execute("UPDATE products SET variant_signature = product_variant_signature(id)")
+
+    op.create_index(
+        'ix_products_category_variant_signature',
+        'products',
+        ['category_id', 'variant_signature'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_products_category_variant_signature', table_name='products')
+
+    op.execute("DROP TRIGGER IF EXISTS trg_product_attributes_variant_signature ON product_attributes")
+    op.execute("DROP TRIGGER IF EXISTS trg_pav_variant_signature ON product_attribute_values")
+    op.execute("DROP FUNCTION IF EXISTS product_attributes_variant_signature_refresh()")
+    op.execute("DROP FUNCTION IF EXISTS product_attribute_values_variant_signature_refresh()")
+    op.execute("DROP FUNCTION IF EXISTS product_variant_signature(BIGINT)")
+
+    op.drop_column('products', 'variant_signature')
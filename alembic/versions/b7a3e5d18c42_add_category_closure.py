@@ -0,0 +1,86 @@
+"""add_category_closure
+
+Revision ID: b7a3e5d18c42
+Revises: 8e1f4b6c2d90
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7a3e5d18c42'
+down_revision: Union[str, Sequence[str], None] = '8e1f4b6c2d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'category_closure',
+        sa.Column('ancestor_id', sa.BigInteger(), nullable=False),
+        sa.Column('descendant_id', sa.BigInteger(), nullable=False),
+        sa.Column('depth', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['ancestor_id'], ['categories.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['descendant_id'], ['categories.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id'),
+    )
+    op.create_index(
+        'ix_category_closure_descendant_depth',
+        'category_closure',
+        ['descendant_id', 'depth'],
+        unique=False,
+    )
+    op.add_column('categories', sa.Column('effective_device_type_id', sa.BigInteger(), nullable=True))
+    op.create_index(
+        'ix_categories_effective_device_type_id',
+        'categories',
+        ['effective_device_type_id'],
+        unique=False,
+    )
+
+    # Разовое заполнение замыкания по существующему дереву
+    op.execute("""
+        INSERT INTO category_closure (ancestor_id, descendant_id, depth)
+        WITH RECURSIVE paths AS (
+            SELECT id AS ancestor_id, id AS descendant_id, 0 AS depth
+            FROM categories
+            UNION ALL
+            SELECT p.ancestor_id, c.id, p.depth + 1
+            FROM paths p
+            JOIN categories c ON c.parent_id = p.descendant_id
+        )
+        SELECT ancestor_id, descendant_id, depth FROM paths
+    """)
+
+    op.execute("""
+        UPDATE categories c
+        SET effective_device_type_id = sub.effective_device_type_id
+        FROM (
+            SELECT
+                target.id,
+                (
+                    SELECT a.device_type_id
+                    FROM category_closure cc
+                    JOIN categories a ON a.id = cc.ancestor_id
+                    WHERE cc.descendant_id = target.id
+                      AND a.device_type_id IS NOT NULL
+                    ORDER BY cc.depth
+                    LIMIT 1
+                ) AS effective_device_type_id
+            FROM categories target
+        ) sub
+        WHERE c.id = sub.id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_categories_effective_device_type_id', table_name='categories')
+    op.drop_column('categories', 'effective_device_type_id')
+    op.drop_index('ix_category_closure_descendant_depth', table_name='category_closure')
+    op.drop_table('category_closure')
@@ -0,0 +1,183 @@
+"""product_export_touch_statement_triggers
+
+Revision ID: c2f8d4a7b1e3
+Revises: a8d4e2c6b913
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f8d4a7b1e3'
+down_revision: Union[str, Sequence[str], None] = 'a8d4e2c6b913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Инкрементальная выгрузка отбирает товары только по products.updated_at
+# (индекс ix_products_updated_at). Для этого updated_at поднимают:
+# - триггеры уровня оператора на дочерних таблицах товара (вместо
+#   построчных) — один UPDATE products на оператор;
+# - триггеры на справочниках, поля которых встроены в строку выгрузки:
+#   категория (товары всего поддерева — имя входит в parent_categories
+#   потомков), поставщик, регион, атрибут и тег.
+
+TOUCH_PRODUCT_TABLES = ("product_attribute_values", "product_images", "product_tags")
+
+TOUCH_OPERATIONS = {
+    "insert": "NEW TABLE AS new_rows",
+    "update": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "delete": "OLD TABLE AS old_rows",
+}
+
+TOUCH_REFERENCE_TABLES = {
+    "categories": (
+        ("name", "device_type_id", "parent_id"),
+        """
+        SELECT p.id
+        FROM changed
+        JOIN category_closure cc ON cc.ancestor_id = changed.id
+        JOIN products p ON p.category_id = cc.descendant_id
+        """,
+    ),
+    "suppliers": (
+        ("name",),
+        "SELECT p.id FROM changed JOIN products p ON p.supplier_id = changed.id",
+    ),
+    "regions": (
+        ("name",),
+        "SELECT p.id FROM changed JOIN products p ON p.region_id = changed.id",
+    ),
+    "product_attributes": (
+        ("name", "is_filterable"),
+        """
+        SELECT v.product_id
+        FROM changed
+        JOIN product_attribute_values v ON v.attribute_id = changed.id
+        """,
+    ),
+    "tags": (
+        ("name", "description", "color"),
+        "SELECT pt.product_id FROM changed JOIN product_tags pt ON pt.tag_id = changed.id",
+    ),
+}
+
+BULK_IMPORT_GUARD = """
+            IF current_setting('catalog.bulk_import', true) = 'on' THEN
+                RETURN NULL;
+            END IF;
+"""
+
+
+def _product_touch_updated_at(body: str) -> str:
+    return f"""
+        CREATE OR REPLACE FUNCTION product_touch_updated_at()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN{BULK_IMPORT_GUARD}{body}
+            RETURN NULL;
+        END
+        $$
+    """
+
+
+STATEMENT_TOUCH_BODY = """
+            IF TG_OP = 'INSERT' THEN
+                UPDATE products SET updated_at = now()
+                WHERE id IN (SELECT product_id FROM new_rows);
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE products SET updated_at = now()
+                WHERE id IN (SELECT product_id FROM old_rows);
+            ELSE
+                UPDATE products SET updated_at = now()
+                WHERE id IN (
+                    SELECT product_id FROM old_rows
+                    UNION
+                    SELECT product_id FROM new_rows
+                );
+            END IF;
+"""
+
+ROW_TOUCH_BODY = """
+            IF TG_OP = 'INSERT' THEN
+                UPDATE products SET updated_at = now() WHERE id = NEW.product_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE products SET updated_at = now() WHERE id = OLD.product_id;
+            ELSE
+                UPDATE products SET updated_at = now() WHERE id = OLD.product_id;
+                IF NEW.product_id <> OLD.product_id THEN
+                    UPDATE products SET updated_at = now() WHERE id = NEW.product_id;
+                END IF;
+            END IF;
+"""
+
+
+def _reference_touch_function(table: str) -> str:
+    columns, products = TOUCH_REFERENCE_TABLES[table]
+    changed = " OR ".join(f"n.{column} IS DISTINCT FROM o.{column}" for column in columns)
+    return f"""
+        CREATE OR REPLACE FUNCTION {table}_touch_products()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            WITH changed AS (
+                SELECT n.id
+                FROM new_rows n
+                JOIN old_rows o ON o.id = n.id
+                WHERE {changed}
+            )
+            UPDATE products SET updated_at = now()
+            WHERE id IN ({products});
+            RETURN NULL;
+        END
+        $$
+    """
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TOUCH_PRODUCT_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_touch_product ON {table}")
+
+    op.execute(_product_touch_updated_at(STATEMENT_TOUCH_BODY))
+    for table in TOUCH_PRODUCT_TABLES:
+        for operation, referencing in TOUCH_OPERATIONS.items():
+            op.execute(f"""
+                CREATE TRIGGER trg_{table}_touch_product_{operation}
+                    AFTER {operation.upper()} ON {table}
+                    REFERENCING {referencing}
+                    FOR EACH STATEMENT EXECUTE FUNCTION product_touch_updated_at()
+            """)
+
+    for table in TOUCH_REFERENCE_TABLES:
+        op.execute(_reference_touch_function(table))
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_touch_products
+                AFTER UPDATE ON {table}
+                REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                FOR EACH STATEMENT EXECUTE FUNCTION {table}_touch_products()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TOUCH_REFERENCE_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_touch_products ON {table}")
+        op.execute(f"DROP FUNCTION IF EXISTS {table}_touch_products()")
+
+    for table in TOUCH_PRODUCT_TABLES:
+        for operation in TOUCH_OPERATIONS:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_touch_product_{operation} ON {table}")
+
+    op.execute(_product_touch_updated_at(ROW_TOUCH_BODY))
+    for table in TOUCH_PRODUCT_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_touch_product
+                AFTER INSERT OR UPDATE OR DELETE ON {table}
+                FOR EACH ROW EXECUTE FUNCTION product_touch_updated_at()
+        """)
@@ -0,0 +1,66 @@
+"""add_category_tree_version
+
+Revision ID: d42f9a6b1e07
+Revises: b7a3e5d18c42
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd42f9a6b1e07'
+down_revision: Union[str, Sequence[str], None] = 'b7a3e5d18c42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CATEGORY_TREE_TABLES = ("categories", "category_images", "manufacturers", "product_types")
+
+# Компромисс: триггер уровня оператора обновляет единственную строку версии,
+# поэтому все пишущие в эти таблицы транзакции сериализуются на её блокировке
+# до коммита. Изменения справочников редки, так что это допустимо; если станет
+# узким местом — версия заменяется sequence (nextval без блокировки строки).
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'category_tree_version',
+        sa.Column('id', sa.SmallInteger(), autoincrement=False, nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute("INSERT INTO category_tree_version (id, version) VALUES (1, 0)")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION category_tree_bump_version()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            UPDATE category_tree_version
+            SET version = version + 1
+            WHERE id = 1;
+            RETURN NULL;
+        END
+        $$
+    """)
+
+    for table in CATEGORY_TREE_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_category_tree_version
+                AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+                FOR EACH STATEMENT EXECUTE FUNCTION category_tree_bump_version()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in CATEGORY_TREE_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_category_tree_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS category_tree_bump_version()")
+    op.drop_table('category_tree_version')
@@ -0,0 +1,137 @@
+"""product_variant_signature_statement_trigger
+
+Revision ID: d5b9e3f1a2c7
+Revises: c2f8d4a7b1e3
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5b9e3f1a2c7'
+down_revision: Union[str, Sequence[str], None] = 'c2f8d4a7b1e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Сигнатура семейства вариантов пересчитывается триггером уровня
+# оператора (вместо построчного): один UPDATE products на оператор,
+# сигнатура каждого затронутого товара считается один раз.
+
+OPERATIONS = {
+    "insert": "NEW TABLE AS new_rows",
+    "update": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "delete": "OLD TABLE AS old_rows",
+}
+
+STATEMENT_REFRESH_FUNCTION = """
+    CREATE OR REPLACE FUNCTION product_attribute_values_variant_signature_refresh()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        changed_ids BIGINT[];
+    BEGIN
+        IF current_setting('catalog.bulk_import', true) = 'on' THEN
+            RETURN NULL;
+        END IF;
+
+        IF TG_OP = 'INSERT' THEN
+            changed_ids := ARRAY(SELECT DISTINCT product_id FROM new_rows);
+        ELSIF TG_OP = 'DELETE' THEN
+            changed_ids := ARRAY(SELECT DISTINCT product_id FROM old_rows);
+        ELSE
+            changed_ids := ARRAY(
+                SELECT DISTINCT unnest(ARRAY[o.product_id, n.product_id])
+                FROM old_rows o
+                JOIN new_rows n ON n.id = o.id
+                WHERE (o.product_id, o.attribute_id, o.value)
+                      IS DISTINCT FROM (n.product_id, n.attribute_id, n.value)
+            );
+        END IF;
+
+        IF cardinality(changed_ids) = 0 THEN
+            RETURN NULL;
+        END IF;
+
+        WITH signatures AS MATERIALIZED (
+            SELECT t.id, product_variant_signature(t.id) AS signature
+            FROM unnest(changed_ids) AS t(id)
+        )
+        UPDATE products p
+        SET variant_signature = s.signature
+        FROM signatures s
+        WHERE p.id = s.id
+          AND p.variant_signature IS DISTINCT FROM s.signature;
+
+        RETURN NULL;
+    END
+    $$
+"""
+
+ROW_REFRESH_FUNCTION = """
+    CREATE OR REPLACE FUNCTION product_attribute_values_variant_signature_refresh()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        target_id BIGINT;
+    BEGIN
+        IF current_setting('catalog.bulk_import', true) = 'on' THEN
+            RETURN NULL;
+        END IF;
+
+        IF TG_OP = 'DELETE' THEN
+            target_id := OLD.product_id;
+        ELSE
+            target_id := NEW.product_id;
+        END IF;
+
+        UPDATE products
+        SET variant_signature = product_variant_signature(id)
+        WHERE id = target_id
+          AND variant_signature IS DISTINCT FROM product_variant_signature(id);
+
+        IF TG_OP = 'UPDATE' AND OLD.product_id <> NEW.product_id THEN
+            UPDATE products
+            SET variant_signature = product_variant_signature(id)
+            WHERE id = OLD.product_id
+              AND variant_signature IS DISTINCT FROM product_variant_signature(id);
+        END IF;
+
+        RETURN NULL;
+    END
+    $$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_pav_variant_signature ON product_attribute_values")
+    op.execute(STATEMENT_REFRESH_FUNCTION)
+    for operation, referencing in OPERATIONS.items():
+        op.execute(f"""
+            CREATE TRIGGER trg_pav_variant_signature_{operation}
+                AFTER {operation.upper()} ON product_attribute_values
+                REFERENCING {referencing}
+                FOR EACH STATEMENT EXECUTE FUNCTION product_attribute_values_variant_signature_refresh()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for operation in OPERATIONS:
+        op.execute(
+            f"DROP TRIGGER IF EXISTS trg_pav_variant_signature_{operation} ON product_attribute_values"
+        )
+
+    op.execute(ROW_REFRESH_FUNCTION)
+    op.execute("""
+        CREATE TRIGGER trg_pav_variant_signature
+            AFTER INSERT OR UPDATE OF value, product_id, attribute_id OR DELETE
+            ON product_attribute_values
+            FOR EACH ROW EXECUTE FUNCTION product_attribute_values_variant_signature_refresh()
+    """)
@@ -0,0 +1,61 @@
+"""add_product_read_model
+
+Revision ID: e5c81d3f07a9
+Revises: d42f9a6b1e07
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c81d3f07a9'
+down_revision: Union[str, Sequence[str], None] = 'd42f9a6b1e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Таблица создаётся пустой: снимки товаров собирает Python-код,
+    # заполнение — scripts/rebuild_product_read_model.py
+    op.create_table(
+        'product_read_model',
+        sa.Column('product_id', sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column('name', sa.String(length=200), nullable=False),
+        sa.Column('price', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column('category_id', sa.BigInteger(), nullable=True),
+        sa.Column('supplier_id', sa.BigInteger(), nullable=True),
+        sa.Column('region_id', sa.BigInteger(), nullable=True),
+        sa.Column('attribute_pairs', postgresql.JSONB(astext_type=sa.Text()), server_default='[]', nullable=False),
+        sa.Column('document', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('projected_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('product_id'),
+    )
+    op.create_index('ix_product_read_model_name', 'product_read_model', ['name'], unique=False)
+    op.create_index('ix_product_read_model_category_id', 'product_read_model', ['category_id', 'product_id'], unique=False)
+    op.create_index('ix_product_read_model_region_id', 'product_read_model', ['region_id'], unique=False)
+    op.create_index('ix_product_read_model_price', 'product_read_model', ['price', 'product_id'], unique=False)
+    op.create_index(
+        'ix_product_read_model_attribute_pairs',
+        'product_read_model',
+        ['attribute_pairs'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'attribute_pairs': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_product_read_model_attribute_pairs', table_name='product_read_model', postgresql_using='gin')
+    op.drop_index('ix_product_read_model_price', table_name='product_read_model')
+    op.drop_index('ix_product_read_model_region_id', table_name='product_read_model')
+    op.drop_index('ix_product_read_model_category_id', table_name='product_read_model')
+    op.drop_index('ix_product_read_model_name', table_name='product_read_model')
+    op.drop_table('product_read_model')
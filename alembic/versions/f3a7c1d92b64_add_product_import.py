@@ -0,0 +1,129 @@
+"""add_product_import
+
+Revision ID: f3a7c1d92b64
+Revises: e5c81d3f07a9
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a7c1d92b64'
+down_revision: Union[str, Sequence[str], None] = 'e5c81d3f07a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Внутри транзакции с SET LOCAL catalog.bulk_import = 'on' построчные триггеры
+# поискового документа и updated_at ничего не делают: массовый импорт
+# пересчитывает их для изменённых товаров одним запросом
+BULK_IMPORT_GUARD = """
+            IF current_setting('catalog.bulk_import', true) = 'on' THEN
+                RETURN {result};
+            END IF;
+"""
+
+
+def _products_search_vector_refresh(guard: str) -> str:
+    return f"""
+        CREATE OR REPLACE FUNCTION products_search_vector_refresh()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN{guard}
+            NEW.search_vector := product_search_document(NEW.id, NEW.name);
+            RETURN NEW;
+        END
+        $$
+    """
+
+
+def _attribute_values_search_vector_refresh(guard: str) -> str:
+    return f"""
+        CREATE OR REPLACE FUNCTION product_attribute_values_search_vector_refresh()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            target_id BIGINT;
+        BEGIN{guard}
+            IF TG_OP = 'DELETE' THEN
+                target_id := OLD.product_id;
+            ELSE
+                target_id := NEW.product_id;
+            END IF;
+
+            UPDATE products
+            SET search_vector = product_search_document(id, name)
+            WHERE id = target_id;
+
+            IF TG_OP = 'UPDATE' AND OLD.product_id <> NEW.product_id THEN
+                UPDATE products
+                SET search_vector = product_search_document(id, name)
+                WHERE id = OLD.product_id;
+            END IF;
+
+            RETURN NULL;
+        END
+        $$
+    """
+
+
+def _product_touch_updated_at(guard: str) -> str:
+    return f"""
+        CREATE OR REPLACE FUNCTION product_touch_updated_at()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN{guard}
+            IF TG_OP = 'INSERT' THEN
+                UPDATE products SET updated_at = now() WHERE id = NEW.product_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE products SET updated_at = now() WHERE id = OLD.product_id;
+            ELSE
+                UPDATE products SET updated_at = now() WHERE id = OLD.product_id;
+                IF NEW.product_id <> OLD.product_id THEN
+                    UPDATE products SET updated_at = now() WHERE id = NEW.product_id;
+                END IF;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'product_import_logs',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('format', sa.String(length=20), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.Column('created', sa.Integer(), nullable=False),
+        sa.Column('updated', sa.Integer(), nullable=False),
+        sa.Column('unchanged', sa.Integer(), nullable=False),
+        sa.Column('failed', sa.Integer(), nullable=False),
+        sa.Column('errors', sa.JSON(), nullable=True),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('fio', sa.String(length=255), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+    op.execute(_products_search_vector_refresh(BULK_IMPORT_GUARD.format(result="NEW")))
+    op.execute(_attribute_values_search_vector_refresh(BULK_IMPORT_GUARD.format(result="NULL")))
+    op.execute(_product_touch_updated_at(BULK_IMPORT_GUARD.format(result="NULL")))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(_product_touch_updated_at(""))
+    op.execute(_attribute_values_search_vector_refresh(""))
+    op.execute(_products_search_vector_refresh(""))
+
+    op.drop_table('product_import_logs')
@@ -6,6 +6,8 @@ cd "$PROJECT_ROOT"
 
 export ENVIRONMENT_SLUG=prod
 
+# При -w больше 1 нужен CACHE_REDIS_L2_ENABLED=true: иначе сбросы общего
+# кэша не доходят до других воркеров
 exec gunicorn src.mount:app \
   -k uvicorn.workers.UvicornWorker \
   -w 1 \
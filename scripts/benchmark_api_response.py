@@ -0,0 +1,107 @@
+"""
+Микробенчмарк сериализации ответа API: страница товаров через
+jsonable_encoder + JSONResponse (прежний путь) и через api_response
+(ApiModelResponse, однопроходная сериализация pydantic-core).
+
+Перед замером проверяет, что оба пути дают одинаковый JSON.
+
+    python -m scripts.benchmark_api_response --items 100 --number 200
+"""
+import argparse
+import json
+import timeit
+from decimal import Decimal
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.catalog.product.api.schemas.schemas import (
+    CategoryNestedSchema,
+    ProductAttributeReadSchema,
+    ProductImageReadSchema,
+    ProductPageResponse,
+    ProductRatingSchema,
+    ProductReadSchema,
+    RegionNestedSchema,
+    SupplierNestedSchema,
+    TagReadSchema,
+)
+from src.core.api.responses import api_response
+
+
+def build_page(items: int) -> ProductPageResponse:
+    """Страница полных карточек, похожая на выдачу каталога."""
+    return ProductPageResponse(
+        total=items * 10,
+        next_cursor="eyJzb3J0X3R5cGUiOiAiZGVmYXVsdCIsICJpZCI6IDEwMH0",
+        items=[
+            ProductReadSchema(
+                id=product_id,
+                name=f"Смартфон модель {product_id} 256 ГБ",
+                description="Флагманский смартфон с OLED-экраном и тройной камерой",
+                price=Decimal("59990.00") + product_id,
+                final_price=Decimal("71988.00") + product_id,
+                rating=ProductRatingSchema(value=4.6, count=product_id % 50),
+                images=[
+                    ProductImageReadSchema(
+                        upload_id=product_id * 10 + i,
+                        image_url=f"https://cdn.example.com/products/{product_id}/{i}.jpg",
+                        is_main=i == 0,
+                        ordering=i,
+                    )
+                    for i in range(4)
+                ],
+                attributes=[
+                    ProductAttributeReadSchema(
+                        id=i,
+                        name=name,
+                        value=value,
+                        is_filterable=True,
+                        is_groupable=i < 2,
+                    )
+                    for i, (name, value) in enumerate(
+                        [("Color", "Black"), ("RAM", "8 GB"), ("Storage", "256 GB"),
+                         ("Screen", "6.1\""), ("Battery", "4500 mAh"), ("OS", "Android")]
+                    )
+                ],
+                tags=[TagReadSchema(tag_id=1, name="новинка", color="#ff0000")],
+                category=CategoryNestedSchema(id=101, name="Смартфоны", description="Мобильные устройства"),
+                supplier=SupplierNestedSchema(id=210, name="ООО Поставка", contact_email="sales@example.com"),
+                region=RegionNestedSchema(id=1, name="Москва"),
+            )
+            for product_id in range(1, items + 1)
+        ],
+    )
+
+
+def encoder_response(page: ProductPageResponse) -> bytes:
+    return JSONResponse(content=jsonable_encoder({"success": True, "data": page})).body
+
+
+def model_response(page: ProductPageResponse) -> bytes:
+    return api_response(page).body
+
+
+def main(items: int, number: int, repeat: int) -> None:
+    page = build_page(items)
+
+    if json.loads(encoder_response(page)) != json.loads(model_response(page)):
+        raise SystemExit("api_response output differs from jsonable_encoder")
+
+    print(f"Product page: {items} item(s), {len(model_response(page))} bytes")
+    results = {}
+    for name, render in (("jsonable_encoder", encoder_response), ("api_response", model_response)):
+        best = min(timeit.repeat(lambda: render(page), number=number, repeat=repeat)) / number
+        results[name] = best
+        print(f"  {name:<17} {best * 1000:8.3f} ms/response")
+
+    print(f"  speedup           {results['jsonable_encoder'] / results['api_response']:8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark API response serialization")
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.items, args.number, args.repeat)
@@ -0,0 +1,98 @@
+"""
+Массовый импорт товаров из файла NDJSON или CSV — то же, что
+POST /product/admin/import, без ограничений HTTP на размер и время запроса.
+
+    python -m scripts.import_products catalog.csv --user-id 1
+    python -m scripts.import_products catalog.ndjson.gz --user-id 1 --batch-size 10000
+
+Формат определяется по расширению (.ndjson/.jsonl, .csv, опционально .gz)
+или задаётся --format.
+"""
+import argparse
+import asyncio
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+import src.mount_models  # noqa: F401  (все модели для relationship)
+from src.catalog.product.application.commands.import_products import (
+    ImportProductsCommand,
+)
+from src.catalog.product.application.services.product_import import (
+    IMPORT_FORMATS,
+    iter_import_rows,
+)
+from src.catalog.product.container import container
+from src.catalog.product.infrastructure.orm.cache.cached_product_read import (
+    ProductReadCacheInvalidator,
+)
+from src.catalog.product.infrastructure.orm.product_read_model import (
+    ProductReadModelUpdater,
+)
+from src.core.auth.schemas.user import TokenSchema, User
+from src.core.cache.factory import get_shared_cache
+from src.core.conf.settings import get_settings
+from src.core.db.database import get_sessionmaker
+from src.core.events import get_event_bus
+
+load_dotenv()
+
+
+def _detect_format(path: Path) -> str:
+    suffixes = [suffix.lower() for suffix in path.suffixes if suffix.lower() != ".gz"]
+    if suffixes and suffixes[-1] == ".csv":
+        return "csv"
+    return "ndjson"
+
+
+async def main(path: Path, format: str | None, user_id: int, fio: str | None, batch_size: int | None) -> None:
+    format = format or _detect_format(path)
+    started_at = datetime.now()
+    print(f"[{started_at.isoformat()}] Importing {path} ({format})...")
+
+    # Воркеры API узнают об импорте через общий кэш и опрос индексов;
+    # проекцию, если из неё читают, обновляем отсюда же
+    event_bus = get_event_bus()
+    event_bus.subscribe(ProductReadCacheInvalidator(get_shared_cache()).handle)
+    if get_settings().PRODUCT_READ_MODEL_ENABLED:
+        event_bus.subscribe(ProductReadModelUpdater(get_sessionmaker()).handle)
+
+    user = User(
+        id=user_id,
+        token_data=TokenSchema(exp=0, iat=0, type="script", fio=fio),
+        permissions=[],
+        fio=fio,
+    )
+
+    opener = gzip.open if path.suffix.lower() == ".gz" else open
+    with opener(path, "rt", encoding="utf-8-sig", newline="") as lines:
+        async with get_sessionmaker()() as db:
+            command: ImportProductsCommand = container.create_scope().resolve(ImportProductsCommand, db=db)
+            if batch_size:
+                command.batch_size = batch_size
+            result = await command.execute(iter_import_rows(lines, format), format=format, user=user)
+
+    await event_bus.drain()
+
+    elapsed = (datetime.now() - started_at).total_seconds()
+    print(
+        f"[{datetime.now().isoformat()}] Import #{result.import_id}: "
+        f"{result.total} row(s), {result.created} created, {result.updated} updated, "
+        f"{result.unchanged} unchanged, {result.failed} failed in {elapsed:.1f}s."
+    )
+    for error in result.errors:
+        print(json.dumps(error, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import products from NDJSON or CSV")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=IMPORT_FORMATS, default=None)
+    parser.add_argument("--user-id", type=int, required=True, help="Пользователь для записи аудита")
+    parser.add_argument("--fio", default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.path, args.format, args.user_id, args.fio, args.batch_size))
@@ -0,0 +1,40 @@
+"""
+Полная перестройка проекции product_read_model.
+
+Нужна перед включением PRODUCT_READ_MODEL_ENABLED и после изменения
+формата снимка товара. Дальше проекция поддерживается событиями шины.
+
+    python -m scripts.rebuild_product_read_model --chunk-size 500
+"""
+import argparse
+import asyncio
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+import src.mount_models  # noqa: F401  (все модели для relationship)
+from src.catalog.product.infrastructure.orm.product_read_model import (
+    ProductReadModelProjector,
+)
+from src.core.db.database import get_sessionmaker
+
+load_dotenv()
+
+
+async def main(chunk_size: int) -> None:
+    started_at = datetime.now()
+    print(f"[{started_at.isoformat()}] Rebuilding product_read_model (chunk size {chunk_size})...")
+
+    async with get_sessionmaker()() as db:
+        projected = await ProductReadModelProjector(db).rebuild(chunk_size=chunk_size)
+        await db.commit()
+
+    elapsed = (datetime.now() - started_at).total_seconds()
+    print(f"[{datetime.now().isoformat()}] Projected {projected} product(s) in {elapsed:.1f}s.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild product_read_model projection")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.chunk_size))
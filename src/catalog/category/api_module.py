@@ -12,6 +12,15 @@ from src.catalog.category.api.api_v1.pricing_policy_q import (
     category_pricing_policy_q_router,
 )
 from src.catalog.category.api.api_v1.q import category_q_router
+from src.catalog.category.infrastructure.services.category_tree import (
+    CategoryTreeInvalidator,
+    get_category_tree_provider,
+)
+from src.catalog.category.infrastructure.services.pricing import (
+    PriceFormulaInvalidator,
+    get_price_formula_provider,
+)
+from src.core.events import get_event_bus
 
 
 class CategoryApiModule:
@@ -37,3 +46,8 @@ class CategoryApiModule:
             admin_pricing_policy_router,
             prefix="/category-pricing-policy/admin",
         )
+
+        # Сверка снимка дерева категорий с БД после событий этого воркера
+        get_event_bus().subscribe(CategoryTreeInvalidator(get_category_tree_provider()).handle)
+        # Пересчёт формул конечных цен после изменений политик ценообразования
+        get_event_bus().subscribe(PriceFormulaInvalidator(get_price_formula_provider()).handle)
@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+
+@dataclass(frozen=True)
+class CategoryNode:
+    """Категория в снимке дерева вместе с данными для ответа /category/tree."""
+
+    id: int
+    name: str
+    description: Optional[str]
+    parent_id: Optional[int]
+    manufacturer_id: Optional[int] = None
+    manufacturer_name: Optional[str] = None
+    manufacturer_description: Optional[str] = None
+    device_type_id: Optional[int] = None
+    device_type_name: Optional[str] = None
+    device_type_parent_id: Optional[int] = None
+    image_key: Optional[str] = None
+    image_upload_id: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class CategoryTree:
+    """
+    Неизменяемый снимок дерева категорий (в памяти воркера).
+
+    Все производные структуры считаются один раз при построении, запросы
+    к снимку не обращаются к БД. При изменении категорий снимок не
+    правится, а заменяется новым целиком (см. CategoryTreeProvider).
+    """
+
+    version: int
+    nodes: dict[int, CategoryNode]
+    roots: tuple[int, ...]
+    children: dict[int, tuple[int, ...]]
+    # Предки от ближайшего к корню, без самой категории
+    ancestors: dict[int, tuple[int, ...]]
+    # Поддерево вместе с самой категорией
+    descendants: dict[int, frozenset[int]]
+    # device_type_id с учётом наследования: свой или ближайшего предка
+    effective_device_types: dict[int, Optional[int]]
+    categories_by_device_type: dict[int, frozenset[int]]
+
+    @classmethod
+    def build(cls, version: int, nodes: Iterable[CategoryNode]) -> "CategoryTree":
+        by_id = {node.id: node for node in sorted(nodes, key=lambda node: node.id)}
+
+        roots: list[int] = []
+        children: dict[int, list[int]] = {category_id: [] for category_id in by_id}
+        for node in by_id.values():
+            if node.parent_id is None or node.parent_id not in by_id:
+                roots.append(node.id)
+            else:
+                children[node.parent_id].append(node.id)
+
+        ancestors: dict[int, tuple[int, ...]] = {}
+        for category_id in by_id:
+            path: list[int] = []
+            visited = {category_id}
+            parent_id = by_id[category_id].parent_id
+            # visited защищает от цикла в уже существующих данных
+            while parent_id in by_id and parent_id not in visited:
+                path.append(parent_id)
+                visited.add(parent_id)
+                parent_id = by_id[parent_id].parent_id
+            ancestors[category_id] = tuple(path)
+
+        descendants: dict[int, set[int]] = {category_id: {category_id} for category_id in by_id}
+        for category_id, path in ancestors.items():
+            for ancestor_id in path:
+                descendants[ancestor_id].add(category_id)
+
+        effective_device_types: dict[int, Optional[int]] = {}
+        by_device_type: dict[int, set[int]] = {}
+        for category_id, path in ancestors.items():
+            device_type_id = next(
+                (
+                    by_id[candidate].device_type_id
+                    for candidate in (category_id, *path)
+                    if by_id[candidate].device_type_id is not None
+                ),
+                None,
+            )
+            effective_device_types[category_id] = device_type_id
+            if device_type_id is not None:
+                by_device_type.setdefault(device_type_id, set()).add(category_id)
+
+        return cls(
+            version=version,
+            nodes=by_id,
+            roots=tuple(roots),
+            children={key: tuple(value) for key, value in children.items()},
+            ancestors=ancestors,
+            descendants={key: frozenset(value) for key, value in descendants.items()},
+            effective_device_types=effective_device_types,
+            categories_by_device_type={
+                key: frozenset(value) for key, value in by_device_type.items()
+            },
+        )
+
+    def children_of(self, category_id: int) -> tuple[int, ...]:
+        return self.children.get(category_id, ())
+
+    def ancestors_of(self, category_id: int) -> tuple[int, ...]:
+        return self.ancestors.get(category_id, ())
+
+    def descendants_of(self, category_id: int) -> frozenset[int]:
+        return self.descendants.get(category_id, frozenset())
+
+    def effective_device_type(self, category_id: int) -> Optional[int]:
+        return self.effective_device_types.get(category_id)
+
+    def categories_with_device_type(self, device_type_id: int) -> frozenset[int]:
+        return self.categories_by_device_type.get(device_type_id, frozenset())
+
+    def would_create_cycle(self, category_id: int, new_parent_id: Optional[int]) -> bool:
+        """
+        Создаст ли установка new_parent_id цикл: True, если new_parent_id —
+        сама категория или её потомок.
+        """
+        if new_parent_id is None:
+            return False
+        if new_parent_id == category_id:
+            return True
+        return category_id in self.ancestors_of(new_parent_id)
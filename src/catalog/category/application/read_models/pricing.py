@@ -0,0 +1,136 @@
+"""
+Конечная цена товара по политике ценообразования категории.
+
+Шаги расчёта (порядок фиксирован):
+1. наценка: price × (1 + markup_percent / 100) + markup_fixed
+2. комиссия маркетплейса: × (1 + commission_percent / 100)
+3. скидка категории: × (1 − discount_percent / 100)
+4. НДС: × (1 + tax_rate / 100)
+
+Округление до копеек (ROUND_HALF_UP) — один раз, в конце.
+
+Все шаги линейны по цене, поэтому политика сводится к паре коэффициентов
+final = round(price × factor + addend, 2) (PriceFormula). Коэффициенты
+считаются один раз на политику, после чего цены страницы или пачки
+выгрузки — умножение и сложение на товар. По тем же коэффициентам
+сортирует SQL (ORDER BY по конечной цене).
+"""
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Context, Decimal, localcontext
+from typing import Iterable, Optional
+
+from src.catalog.category.application.read_models.category_tree import CategoryTree
+
+CENT = Decimal("0.01")
+_ONE = Decimal(1)
+_HUNDRED = Decimal(100)
+
+# Цена — Numeric(12, 2), проценты — Numeric(5, 2): произведение укладывается
+# в 60 значащих цифр, промежуточные результаты не округляются
+_EXACT = Context(prec=60, rounding=ROUND_HALF_UP)
+
+
+@dataclass(frozen=True)
+class PriceFormula:
+    factor: Decimal
+    addend: Decimal
+
+    @property
+    def is_identity(self) -> bool:
+        return self.factor == _ONE and self.addend == 0
+
+    def apply(self, price: Decimal) -> Decimal:
+        with localcontext(_EXACT):
+            return self._apply(price)
+
+    def _apply(self, price: Decimal) -> Decimal:
+        return (price * self.factor + self.addend).quantize(CENT)
+
+
+IDENTITY_FORMULA = PriceFormula(factor=_ONE, addend=Decimal(0))
+
+
+@dataclass(frozen=True)
+class PricingPolicyTerms:
+    """Условия политики категории; None — шаг не применяется."""
+    category_id: int
+    markup_fixed: Optional[Decimal] = None
+    markup_percent: Optional[Decimal] = None
+    commission_percent: Optional[Decimal] = None
+    discount_percent: Optional[Decimal] = None
+    tax_rate: Decimal = Decimal("0.00")
+
+    def formula(self) -> PriceFormula:
+        with localcontext(_EXACT):
+            # Множитель шагов после наценки действует и на фиксированную наценку
+            tail = (
+                (_ONE + (self.commission_percent or 0) / _HUNDRED)
+                * (_ONE - (self.discount_percent or 0) / _HUNDRED)
+                * (_ONE + (self.tax_rate or 0) / _HUNDRED)
+            )
+            return PriceFormula(
+                factor=(_ONE + (self.markup_percent or 0) / _HUNDRED) * tail,
+                addend=(self.markup_fixed or 0) * tail,
+            )
+
+
+class PriceFormulas:
+    """
+    Действующие формулы категорий: политика самой категории, а если её нет —
+    ближайшего предка. Категории без политики в цепочке предков (и товары
+    без категории) продают по исходной цене.
+    """
+
+    def __init__(self, by_category: dict[int, PriceFormula]):
+        self._by_category = {
+            category_id: formula
+            for category_id, formula in by_category.items()
+            if not formula.is_identity
+        }
+
+    @classmethod
+    def resolve(
+        cls,
+        policies: Iterable[PricingPolicyTerms],
+        tree: CategoryTree,
+    ) -> "PriceFormulas":
+        own = {policy.category_id: policy.formula() for policy in policies}
+        if not own:
+            return cls({})
+
+        by_category: dict[int, PriceFormula] = {}
+        for category_id in tree.nodes:
+            for candidate in (category_id, *tree.ancestors_of(category_id)):
+                if candidate in own:
+                    by_category[category_id] = own[candidate]
+                    break
+        # Категория, которой ещё нет в снимке дерева, — только своя политика
+        for category_id, formula in own.items():
+            by_category.setdefault(category_id, formula)
+        return cls(by_category)
+
+    def __bool__(self) -> bool:
+        return bool(self._by_category)
+
+    def items(self) -> list[tuple[int, PriceFormula]]:
+        """Категории с формулой, отличной от исходной цены (для SQL-сортировки)."""
+        return sorted(self._by_category.items())
+
+    def for_category(self, category_id: Optional[int]) -> PriceFormula:
+        if category_id is None:
+            return IDENTITY_FORMULA
+        return self._by_category.get(category_id, IDENTITY_FORMULA)
+
+    def final_price(self, price: Decimal, category_id: Optional[int]) -> Decimal:
+        return self.for_category(category_id).apply(price)
+
+    def final_prices(
+        self,
+        items: Iterable[tuple[Decimal, Optional[int]]],
+    ) -> list[Decimal]:
+        """Конечные цены пар (цена, категория) за один проход."""
+        with localcontext(_EXACT):
+            return [
+                self.for_category(category_id)._apply(price)
+                for price, category_id in items
+            ]
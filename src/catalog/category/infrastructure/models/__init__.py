@@ -1,13 +1,17 @@
 from .categories import Category
 from .categories_pricing import CategoryPricingPolicy
 from .category_audit_logs import CategoryAuditLog
+from .category_closure import CategoryClosure
 from .category_image import CategoryImage
+from .category_tree_version import CategoryTreeVersion
 from .pricing_policy_audit_logs import CategoryPricingPolicyAuditLog
 
 __all__ = [
     "CategoryAuditLog",
     "Category",
+    "CategoryClosure",
     "CategoryImage",
+    "CategoryTreeVersion",
     "CategoryPricingPolicy",
     "CategoryPricingPolicyAuditLog",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, Column, ForeignKey, String, Text
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, String, Text
 from sqlalchemy.orm import relationship
 
 from src.core.db.database import Base
@@ -7,6 +7,9 @@ from src.core.db.mixins import TimestampMixin
 
 class Category(TimestampMixin, Base):
     __tablename__ = "categories"
+    __table_args__ = (
+        Index("ix_categories_effective_device_type_id", "effective_device_type_id"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     name = Column(String(150), nullable=False)
@@ -30,6 +33,10 @@ class Category(TimestampMixin, Base):
         nullable=True,
     )
 
+    # device_type_id с учётом наследования: свой или ближайшего предка.
+    # Денормализация для фильтров по типу товара (см. category_hierarchy.py)
+    effective_device_type_id = Column(BigInteger, nullable=True)
+
     parent = relationship(
         "Category",
         remote_side=[id],
@@ -0,0 +1,30 @@
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, Integer
+
+from src.core.db.database import Base
+
+
+class CategoryClosure(Base):
+    """
+    Таблица замыкания дерева категорий: пара (предок, потомок) для всех
+    уровней вложенности, включая саму категорию (depth = 0).
+
+    Поддерживается SqlAlchemyCategoryRepository при создании и переносе
+    категории; при удалении строки удаляются каскадом.
+    """
+
+    __tablename__ = "category_closure"
+    __table_args__ = (
+        Index("ix_category_closure_descendant_depth", "descendant_id", "depth"),
+    )
+
+    ancestor_id = Column(
+        BigInteger,
+        ForeignKey("categories.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    descendant_id = Column(
+        BigInteger,
+        ForeignKey("categories.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    depth = Column(Integer, nullable=False)
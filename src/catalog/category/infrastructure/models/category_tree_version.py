@@ -0,0 +1,87 @@
+"""
+Версия дерева категорий для снимков CategoryTree в воркерах.
+
+Единственная строка category_tree_version увеличивается триггером на каждое
+изменение категорий, их изображений, производителей и типов товаров. Версия
+меняется в той же транзакции, что и данные, поэтому воркер, прочитавший
+версию, а затем категории, не запомнит снимок новее своей версии.
+
+Цена: строка версии блокируется до коммита, поэтому транзакции, пишущие
+в эти таблицы, выполняются по очереди (см. миграцию). Для редких изменений
+справочников это допустимо.
+
+Как и в product_search.py, DDL навешан на metadata для create_all,
+а в БД его создаёт миграция add_category_tree_version.
+"""
+
+from sqlalchemy import DDL, BigInteger, Column, SmallInteger, event
+
+from src.core.db.database import Base
+
+
+class CategoryTreeVersion(Base):
+    __tablename__ = "category_tree_version"
+
+    id = Column(SmallInteger, primary_key=True, autoincrement=False)
+    version = Column(BigInteger, nullable=False, default=0)
+
+
+CATEGORY_TREE_VERSION_ID = 1
+
+# Таблицы, изменения которых видны в снимке дерева категорий
+CATEGORY_TREE_TABLES = ("categories", "category_images", "manufacturers", "product_types")
+
+SEED_CATEGORY_TREE_VERSION = f"""
+INSERT INTO category_tree_version (id, version)
+VALUES ({CATEGORY_TREE_VERSION_ID}, 0)
+ON CONFLICT (id) DO NOTHING
+"""
+
+CREATE_BUMP_VERSION_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION category_tree_bump_version()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE category_tree_version
+    SET version = version + 1
+    WHERE id = {CATEGORY_TREE_VERSION_ID};
+    RETURN NULL;
+END
+$$
+"""
+
+
+def bump_trigger_name(table: str) -> str:
+    return f"trg_{table}_category_tree_version"
+
+
+def create_bump_trigger(table: str) -> str:
+    return f"""
+CREATE TRIGGER {bump_trigger_name(table)}
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+    FOR EACH STATEMENT EXECUTE FUNCTION category_tree_bump_version()
+"""
+
+
+# Каждая DDL-команда выполняется отдельно: asyncpg не принимает
+# несколько команд в одном prepared statement
+CATEGORY_TREE_VERSION_DDL = (
+    SEED_CATEGORY_TREE_VERSION,
+    CREATE_BUMP_VERSION_FUNCTION,
+    *(
+        statement
+        for table in CATEGORY_TREE_TABLES
+        for statement in (
+            f"DROP TRIGGER IF EXISTS {bump_trigger_name(table)} ON {table}",
+            create_bump_trigger(table),
+        )
+    ),
+)
+
+for _statement in CATEGORY_TREE_VERSION_DDL:
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
@@ -15,6 +15,15 @@ from src.catalog.category.domain.exceptions import (
 from src.catalog.category.domain.repository.category import CategoryRepository
 from src.catalog.category.infrastructure.models.categories import Category
 from src.catalog.category.infrastructure.models.category_image import CategoryImage
+from src.catalog.category.infrastructure.orm.category_hierarchy import (
+    add_category_to_hierarchy,
+    move_category_in_hierarchy,
+    refresh_effective_device_types,
+)
+from src.catalog.category.infrastructure.services.category_tree import (
+    CategoryTreeProvider,
+    get_category_tree_provider,
+)
 from src.catalog.manufacturer.domain.aggregates.manufacturer import (
     ManufacturerAggregate,
 )
@@ -25,45 +34,24 @@ from src.catalog.product.infrastructure.models.product_type import ProductType
 
 class SqlAlchemyCategoryRepository(CategoryRepository):
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        category_tree: Optional[CategoryTreeProvider] = None,
+    ):
         self.db = db
+        self.category_tree = category_tree or get_category_tree_provider()
 
     async def _has_cycle(self, category_id: int, new_parent_id: Optional[int]) -> bool:
         """
         Проверить, создаст ли установка new_parent_id циклическую зависимость.
 
         Возвращает True, если new_parent_id является потомком category_id
-        (т.е. установка создаст цикл).
+        (т.е. установка создаст цикл). Проверка идёт по снимку дерева,
+        версия которого сверяется с БД перед записью.
         """
-        if new_parent_id is None:
-            return False
-
-        # Если пытаемся установить родителя равным самой категории — это цикл
-        if new_parent_id == category_id:
-            return True
-
-        # Проверяем, является ли new_parent_id потомком category_id
-        # (т.е. category_id находится в цепочке родителей new_parent_id)
-        current_id = new_parent_id
-        visited = set()
-
-        while current_id is not None:
-            if current_id in visited:
-                # Обнаружен цикл в существующих данных
-                return True
-            visited.add(current_id)
-
-            if current_id == category_id:
-                # category_id является родителем new_parent_id — будет цикл
-                return True
-
-            # Получаем родителя текущей категории
-            stmt = select(Category.parent_id).where(Category.id == current_id)
-            result = await self.db.execute(stmt)
-            parent_id = result.scalar_one_or_none()
-            current_id = parent_id
-
-        return False
+        tree = await self.category_tree.get(self.db, check_version=True)
+        return tree.would_create_cycle(category_id, new_parent_id)
 
     async def get(self, category_id: int) -> Optional[CategoryAggregate]:
         stmt = (
@@ -106,6 +94,12 @@ class SqlAlchemyCategoryRepository(CategoryRepository):
 
         await self.db.flush()
 
+        # Таблица замыкания и effective_device_type_id — в той же транзакции
+        await add_category_to_hierarchy(self.db, model.id, model.parent_id)
+        # Снимок дерева сверит версию при следующем обращении (после коммита —
+        # ещё и по событию категории)
+        self.category_tree.invalidate()
+
         aggregate._set_id(model.id)
         return aggregate
 
@@ -114,9 +108,10 @@ class SqlAlchemyCategoryRepository(CategoryRepository):
         if not model:
             return False
 
-        # При удалении категории записи из category_images удаляются (CASCADE),
-        # но файлы в S3 остаются
+        # При удалении категории записи из category_images и category_closure
+        # удаляются (CASCADE), но файлы в S3 остаются
         await self.db.delete(model)
+        self.category_tree.invalidate()
         return True
 
     async def update(self, aggregate: CategoryAggregate) -> CategoryAggregate:
@@ -128,6 +123,8 @@ class SqlAlchemyCategoryRepository(CategoryRepository):
         # Сначала удаляем объект из сессии, чтобы SQLAlchemy не синхронизировал
         # старое состояние parent_id при flush()
         existing = await self.db.get(Category, aggregate.id)
+        old_parent_id = existing.parent_id if existing is not None else None
+        old_device_type_id = existing.device_type_id if existing is not None else None
         if existing is not None:
             self.db.expunge(existing)
 
@@ -176,6 +173,14 @@ class SqlAlchemyCategoryRepository(CategoryRepository):
             await self.db.delete(model.images[0])
 
         await self.db.flush()
+
+        # Перенос поддерева в таблице замыкания и пересчёт наследуемого типа
+        if old_parent_id != aggregate.parent_id:
+            await move_category_in_hierarchy(self.db, aggregate.id, aggregate.parent_id)
+        elif old_device_type_id != aggregate.device_type_id:
+            await refresh_effective_device_types(self.db, aggregate.id)
+
+        self.category_tree.invalidate()
         return aggregate
 
     def _to_aggregate(self, model: Category) -> CategoryAggregate:
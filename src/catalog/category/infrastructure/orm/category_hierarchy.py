@@ -0,0 +1,115 @@
+"""
+Поддержка таблицы замыкания категорий и effective_device_type_id.
+
+Все функции выполняются в сессии вызывающего кода, то есть в той же
+транзакции, что и изменение самой категории.
+"""
+
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+INSERT_CATEGORY_PATHS_SQL = text("""
+    INSERT INTO category_closure (ancestor_id, descendant_id, depth)
+    SELECT CAST(:category_id AS BIGINT), CAST(:category_id AS BIGINT), 0
+    UNION ALL
+    SELECT ancestor_id, CAST(:category_id AS BIGINT), depth + 1
+    FROM category_closure
+    WHERE descendant_id = :parent_id
+""")
+
+# Отрываем поддерево от старых предков (связи внутри поддерева остаются)
+DETACH_SUBTREE_SQL = text("""
+    DELETE FROM category_closure
+    WHERE descendant_id IN (
+        SELECT descendant_id FROM category_closure WHERE ancestor_id = :category_id
+    )
+    AND ancestor_id NOT IN (
+        SELECT descendant_id FROM category_closure WHERE ancestor_id = :category_id
+    )
+""")
+
+# Подвешиваем поддерево ко всем предкам нового родителя
+ATTACH_SUBTREE_SQL = text("""
+    INSERT INTO category_closure (ancestor_id, descendant_id, depth)
+    SELECT super.ancestor_id, sub.descendant_id, super.depth + sub.depth + 1
+    FROM category_closure super
+    CROSS JOIN category_closure sub
+    WHERE super.descendant_id = :parent_id
+      AND sub.ancestor_id = :category_id
+""")
+
+# effective_device_type_id = device_type_id ближайшего предка (или самой категории)
+_REFRESH_EFFECTIVE_DEVICE_TYPE_SQL = """
+    UPDATE categories c
+    SET effective_device_type_id = sub.effective_device_type_id
+    FROM (
+        SELECT
+            target.id,
+            (
+                SELECT a.device_type_id
+                FROM category_closure cc
+                JOIN categories a ON a.id = cc.ancestor_id
+                WHERE cc.descendant_id = target.id
+                  AND a.device_type_id IS NOT NULL
+                ORDER BY cc.depth
+                LIMIT 1
+            ) AS effective_device_type_id
+        FROM ({targets}) target
+    ) sub
+    WHERE c.id = sub.id
+      AND c.effective_device_type_id IS DISTINCT FROM sub.effective_device_type_id
+"""
+
+REFRESH_SUBTREE_DEVICE_TYPE_SQL = text(
+    _REFRESH_EFFECTIVE_DEVICE_TYPE_SQL.format(
+        targets="SELECT descendant_id AS id FROM category_closure WHERE ancestor_id = :category_id"
+    )
+)
+
+REFRESH_ALL_DEVICE_TYPES_SQL = text(
+    _REFRESH_EFFECTIVE_DEVICE_TYPE_SQL.format(targets="SELECT id FROM categories")
+)
+
+
+async def add_category_to_hierarchy(
+    db: AsyncSession,
+    category_id: int,
+    parent_id: Optional[int],
+) -> None:
+    """Пути для новой категории: она сама и все предки родителя."""
+    await db.execute(
+        INSERT_CATEGORY_PATHS_SQL,
+        {"category_id": category_id, "parent_id": parent_id},
+    )
+    await refresh_effective_device_types(db, category_id)
+
+
+async def move_category_in_hierarchy(
+    db: AsyncSession,
+    category_id: int,
+    parent_id: Optional[int],
+) -> None:
+    """Перенос категории вместе с поддеревом под нового родителя (или в корень)."""
+    await db.execute(DETACH_SUBTREE_SQL, {"category_id": category_id})
+    if parent_id is not None:
+        await db.execute(
+            ATTACH_SUBTREE_SQL,
+            {"category_id": category_id, "parent_id": parent_id},
+        )
+    await refresh_effective_device_types(db, category_id)
+
+
+async def refresh_effective_device_types(
+    db: AsyncSession,
+    category_id: Optional[int] = None,
+) -> None:
+    """
+    Пересчитать effective_device_type_id для поддерева category_id
+    (или для всех категорий, если category_id не передан).
+    """
+    if category_id is None:
+        await db.execute(REFRESH_ALL_DEVICE_TYPES_SQL)
+        return None
+    await db.execute(REFRESH_SUBTREE_DEVICE_TYPE_SQL, {"category_id": category_id})
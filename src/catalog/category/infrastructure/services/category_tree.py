@@ -0,0 +1,154 @@
+import asyncio
+import time
+from functools import lru_cache
+from typing import Any, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.catalog.category.application.read_models.category_tree import (
+    CategoryNode,
+    CategoryTree,
+)
+from src.catalog.category.infrastructure.models.categories import Category
+from src.catalog.category.infrastructure.models.category_image import CategoryImage
+from src.catalog.category.infrastructure.models.category_tree_version import (
+    CATEGORY_TREE_VERSION_ID,
+    CategoryTreeVersion,
+)
+from src.catalog.manufacturer.infrastructure.models.manufacturer import Manufacturer
+from src.catalog.product.infrastructure.models.product_type import ProductType
+from src.core.conf.settings import get_settings
+from src.uploads.infrastructure.models.upload_history import UploadHistory
+
+
+class CategoryTreeProvider:
+    """
+    Снимок дерева категорий в памяти воркера с версионным обновлением.
+
+    Снимок помечен версией из category_tree_version. Версия в БД
+    перечитывается (один SELECT по первичному ключу) не чаще раза в
+    check_interval секунд, сразу после события категорий этого воркера
+    (invalidate) или по запросу вызывающего кода (check_version=True).
+    Если версия изменилась, снимок строится заново и подменяется целиком:
+    читатели всегда видят либо старый, либо новый снимок.
+    """
+
+    def __init__(self, check_interval: float):
+        self._check_interval = check_interval
+        self._tree: Optional[CategoryTree] = None
+        self._checked_at: Optional[float] = None
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        """Проверить версию при следующем обращении."""
+        self._generation += 1
+        self._checked_at = None
+
+    def reset(self) -> None:
+        self._tree = None
+        self.invalidate()
+        self._lock = asyncio.Lock()
+
+    async def get(self, db: AsyncSession, check_version: bool = False) -> CategoryTree:
+        if not check_version and self._is_fresh():
+            return self._tree
+
+        async with self._lock:
+            if not check_version and self._is_fresh():
+                return self._tree
+
+            # invalidate во время перестройки оставляет снимок непроверенным
+            generation = self._generation
+            version = await self._load_version(db)
+            if self._tree is None or self._tree.version != version:
+                self._tree = await self._load_tree(db, version)
+            if generation == self._generation:
+                self._checked_at = time.monotonic()
+            return self._tree
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._tree is not None
+            and self._checked_at is not None
+            and time.monotonic() - self._checked_at < self._check_interval
+        )
+
+    @staticmethod
+    async def _load_version(db: AsyncSession) -> int:
+        result = await db.execute(
+            select(CategoryTreeVersion.version)
+            .where(CategoryTreeVersion.id == CATEGORY_TREE_VERSION_ID)
+        )
+        return result.scalar_one_or_none() or 0
+
+    @staticmethod
+    async def _load_tree(db: AsyncSession, version: int) -> CategoryTree:
+        images_result = await db.execute(
+            select(CategoryImage.category_id, CategoryImage.upload_id, UploadHistory.file_path)
+            .join(UploadHistory, UploadHistory.id == CategoryImage.upload_id)
+            .order_by(CategoryImage.category_id, CategoryImage.id)
+        )
+        images: dict[int, Any] = {}
+        for row in images_result:
+            images.setdefault(row.category_id, row)
+
+        result = await db.execute(
+            select(
+                Category.id,
+                Category.name,
+                Category.description,
+                Category.parent_id,
+                Category.manufacturer_id,
+                Manufacturer.name.label("manufacturer_name"),
+                Manufacturer.description.label("manufacturer_description"),
+                Category.device_type_id,
+                ProductType.name.label("device_type_name"),
+                ProductType.parent_id.label("device_type_parent_id"),
+            )
+            .outerjoin(Manufacturer, Manufacturer.id == Category.manufacturer_id)
+            .outerjoin(ProductType, ProductType.id == Category.device_type_id)
+        )
+
+        nodes = []
+        for row in result:
+            image = images.get(row.id)
+            nodes.append(
+                CategoryNode(
+                    id=row.id,
+                    name=row.name,
+                    description=row.description,
+                    parent_id=row.parent_id,
+                    manufacturer_id=row.manufacturer_id,
+                    manufacturer_name=row.manufacturer_name,
+                    manufacturer_description=row.manufacturer_description,
+                    device_type_id=row.device_type_id,
+                    device_type_name=row.device_type_name,
+                    device_type_parent_id=row.device_type_parent_id,
+                    image_key=image.file_path if image else None,
+                    image_upload_id=image.upload_id if image else None,
+                )
+            )
+
+        return CategoryTree.build(version, nodes)
+
+
+class CategoryTreeInvalidator:
+    """Проверка версии снимка после событий, меняющих данные дерева категорий."""
+
+    ENTITIES = {"category", "category_images", "manufacturer", "product_type"}
+
+    def __init__(self, provider: CategoryTreeProvider):
+        self._provider = provider
+
+    async def handle(self, message: dict[str, Any]) -> None:
+        if message.get("entity") in self.ENTITIES:
+            self._provider.invalidate()
+
+
+@lru_cache
+def get_category_tree_provider() -> CategoryTreeProvider:
+    return CategoryTreeProvider(
+        check_interval=get_settings().CATEGORY_TREE_VERSION_CHECK_SECONDS,
+    )
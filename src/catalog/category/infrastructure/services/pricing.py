@@ -0,0 +1,147 @@
+import asyncio
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.catalog.category.application.read_models.pricing import (
+    PriceFormulas,
+    PricingPolicyTerms,
+)
+from src.catalog.category.infrastructure.models.categories_pricing import (
+    CategoryPricingPolicy,
+)
+from src.catalog.category.infrastructure.services.category_tree import (
+    CategoryTreeProvider,
+    get_category_tree_provider,
+)
+from src.core.conf.settings import get_settings
+
+# (число политик, последнее изменение) — меняется при создании, изменении
+# и удалении политики
+PolicyVersion = tuple[int, Optional[datetime]]
+
+
+class PriceFormulaProvider:
+    """
+    Формулы конечных цен всех категорий в памяти воркера.
+
+    Формулы зависят от политик и от дерева категорий (наследование от
+    предков), поэтому снимок помечен парой (версия политик, версия дерева).
+    Версия политик перечитывается одним агрегатным запросом не чаще раза
+    в check_interval секунд или сразу после события политик этого воркера
+    (invalidate); политики загружаются заново, только если она изменилась.
+    """
+
+    def __init__(self, check_interval: float, tree_provider: CategoryTreeProvider):
+        self._check_interval = check_interval
+        self._tree_provider = tree_provider
+        self._formulas: Optional[PriceFormulas] = None
+        self._key: Optional[tuple[PolicyVersion, int]] = None
+        self._policies: Optional[list[PricingPolicyTerms]] = None
+        self._policy_version: Optional[PolicyVersion] = None
+        self._checked_at: Optional[float] = None
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        """Проверить версию политик при следующем обращении."""
+        self._generation += 1
+        self._checked_at = None
+
+    def reset(self) -> None:
+        self._formulas = None
+        self._key = None
+        self._policies = None
+        self._policy_version = None
+        self.invalidate()
+        self._lock = asyncio.Lock()
+
+    async def get(self, db: AsyncSession) -> PriceFormulas:
+        tree = await self._tree_provider.get(db)
+        if self._is_fresh(tree.version):
+            return self._formulas
+
+        async with self._lock:
+            if self._is_fresh(tree.version):
+                return self._formulas
+
+            generation = self._generation
+            if self._policies is None or self._checked_at is None:
+                version = await self._load_version(db)
+                if self._policies is None or version != self._policy_version:
+                    self._policies = await self._load_policies(db)
+                    self._policy_version = version
+                if generation == self._generation:
+                    self._checked_at = time.monotonic()
+
+            key = (self._policy_version, tree.version)
+            if self._key != key:
+                self._formulas = PriceFormulas.resolve(self._policies, tree)
+                self._key = key
+            return self._formulas
+
+    def _is_fresh(self, tree_version: int) -> bool:
+        return (
+            self._formulas is not None
+            and self._key is not None
+            and self._key[1] == tree_version
+            and self._checked_at is not None
+            and time.monotonic() - self._checked_at < self._check_interval
+        )
+
+    @staticmethod
+    async def _load_version(db: AsyncSession) -> PolicyVersion:
+        result = await db.execute(
+            select(func.count(), func.max(CategoryPricingPolicy.updated_at))
+        )
+        count, updated_at = result.one()
+        return count, updated_at
+
+    @staticmethod
+    async def _load_policies(db: AsyncSession) -> list[PricingPolicyTerms]:
+        result = await db.execute(
+            select(
+                CategoryPricingPolicy.category_id,
+                CategoryPricingPolicy.markup_fixed,
+                CategoryPricingPolicy.markup_percent,
+                CategoryPricingPolicy.commission_percent,
+                CategoryPricingPolicy.discount_percent,
+                CategoryPricingPolicy.tax_rate,
+            )
+        )
+        return [
+            PricingPolicyTerms(
+                category_id=row.category_id,
+                markup_fixed=row.markup_fixed,
+                markup_percent=row.markup_percent,
+                commission_percent=row.commission_percent,
+                discount_percent=row.discount_percent,
+                tax_rate=row.tax_rate,
+            )
+            for row in result
+        ]
+
+
+class PriceFormulaInvalidator:
+    """Проверка версии политик после команд политик ценообразования."""
+
+    ENTITIES = {"category_pricing_policy"}
+
+    def __init__(self, provider: PriceFormulaProvider):
+        self._provider = provider
+
+    async def handle(self, message: dict[str, Any]) -> None:
+        if message.get("entity") in self.ENTITIES:
+            self._provider.invalidate()
+
+
+@lru_cache
+def get_price_formula_provider() -> PriceFormulaProvider:
+    return PriceFormulaProvider(
+        check_interval=get_settings().PRICING_POLICY_VERSION_CHECK_SECONDS,
+        tree_provider=get_category_tree_provider(),
+    )
@@ -8,9 +8,17 @@ from src.catalog.category.application.dto.category import (
     CategoryImageReadDTO,
     CategoryReadDTO,
 )
+from src.catalog.category.application.read_models.category_tree import (
+    CategoryNode,
+    CategoryTree,
+)
 from src.catalog.category.domain.aggregates.category import CategoryAggregate
 from src.catalog.category.infrastructure.models.categories import Category
 from src.catalog.category.infrastructure.models.category_image import CategoryImage
+from src.catalog.category.infrastructure.services.category_tree import (
+    CategoryTreeProvider,
+    get_category_tree_provider,
+)
 from src.catalog.manufacturer.domain.aggregates.manufacturer import (
     ManufacturerAggregate,
 )
@@ -22,9 +30,14 @@ from src.core.services.images.storage import S3ImageStorageService
 
 class CategoryReadRepository:
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        category_tree: Optional[CategoryTreeProvider] = None,
+    ):
         self.db = db
         self.image_storage = S3ImageStorageService.from_settings()
+        self.category_tree = category_tree or get_category_tree_provider()
 
     def _to_read_dto(self, model: Category) -> CategoryReadDTO:
         parent_dto = None
@@ -125,17 +138,55 @@ class CategoryReadRepository:
     async def get_tree(self) -> List[CategoryReadDTO]:
         """
         Получить все категории в виде плоского списка с данными для построения дерева.
-        Загружает все категории с изображениями, родителями и производителями.
+        Данные берутся из снимка дерева категорий воркера, без запросов категорий к БД.
         """
-        stmt = select(Category).options(
-            selectinload(Category.images).selectinload(CategoryImage.upload),
-            selectinload(Category.parent),
-            selectinload(Category.manufacturer),
-            selectinload(Category.device_type),
-            selectinload(Category.children),
-        ).order_by(Category.id)
+        tree = await self.category_tree.get(self.db)
+        return [self._node_to_read_dto(tree, node) for node in tree.nodes.values()]
 
-        result = await self.db.execute(stmt)
-        categories = result.scalars().all()
+    def _node_to_read_dto(self, tree: CategoryTree, node: CategoryNode) -> CategoryReadDTO:
+        parent_dto = None
+        parent = tree.nodes.get(node.parent_id) if node.parent_id else None
+        if parent:
+            parent_dto = CategoryAggregate(
+                category_id=parent.id,
+                name=parent.name,
+                description=parent.description,
+                parent_id=parent.parent_id,
+                manufacturer_id=parent.manufacturer_id,
+                device_type_id=parent.device_type_id,
+            )
+
+        manufacturer_dto = None
+        if node.manufacturer_id and node.manufacturer_name:
+            manufacturer_dto = ManufacturerAggregate(
+                manufacturer_id=node.manufacturer_id,
+                name=node.manufacturer_name,
+                description=node.manufacturer_description,
+            )
+
+        device_type_dto = None
+        if node.device_type_id and node.device_type_name:
+            device_type_dto = ProductTypeAggregate(
+                product_type_id=node.device_type_id,
+                name=node.device_type_name,
+                parent_id=node.device_type_parent_id,
+            )
 
-        return [self._to_read_dto(model) for model in categories]
+        image_dto = None
+        if node.image_key:
+            image_dto = CategoryImageReadDTO(
+                image_key=node.image_key,
+                image_url=self.image_storage.build_public_url(node.image_key),
+                upload_id=node.image_upload_id,
+            )
+
+        return CategoryReadDTO(
+            id=node.id,
+            name=node.name,
+            description=node.description,
+            image=image_dto,
+            parent_id=node.parent_id,
+            parent=parent_dto,
+            manufacturer=manufacturer_dto,
+            device_type=device_type_dto,
+        )
@@ -1,6 +1,10 @@
+import io
+from datetime import datetime
+from gzip import GzipFile
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, File, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.catalog.product.api.schemas.audit import (
@@ -10,18 +14,36 @@ from src.catalog.product.api.schemas.audit import (
 from src.catalog.product.api.schemas.export import (
     ExportCatalogResponse,
     ExportCategorySchema,
+    ExportFormatEnum,
     ExportParentCategorySchema,
     ExportProductSchema,
     ExportRegionSchema,
     ExportSupplierSchema,
+    ExportTombstoneSchema,
+)
+from src.catalog.product.api.schemas.product_import import (
+    ImportFormatEnum,
+    ProductImportResponse,
 )
 from src.catalog.product.api.schemas.product_type import (
     ProductTypeAuditListResponse,
     ProductTypeAuditReadSchema,
 )
+from src.catalog.product.application.services.catalog_export import (
+    export_watermark,
+    final_prices,
+    gzip_stream,
+    iter_csv,
+    iter_ndjson,
+)
+from src.catalog.product.application.services.product_import import (
+    iter_import_rows,
+)
 from src.catalog.product.composition import ProductComposition
 from src.core.api.responses import api_response
-from src.core.auth.dependencies import require_permissions
+from src.core.auth.dependencies import get_current_user, require_permissions
+from src.core.auth.schemas.user import User
+from src.core.conf.settings import get_settings
 from src.core.db.database import get_db
 
 admin_product_router = APIRouter(
@@ -179,14 +201,30 @@ async def get_product_type_audit_logs(
     dependencies=[Depends(require_permissions("product:export"))],
 )
 async def export_catalog(
+    updated_since: Optional[datetime] = Query(
+        None,
+        description="Только товары, изменённые или удалённые с этого момента (watermark прошлой выгрузки)",
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     repo = ProductComposition.build_queries(db)
-    rows = await repo.read_repository.export_full_catalog()
+    watermark = export_watermark(
+        await repo.read_repository.get_export_watermark(),
+        get_settings().CATALOG_EXPORT_DELTA_OVERLAP_SECONDS,
+    )
+    rows = await repo.read_repository.export_full_catalog(updated_since=updated_since)
+    prices = final_prices(rows, await repo.read_repository.get_price_formulas())
+
+    deleted = []
+    if updated_since is not None:
+        deleted = [
+            ExportTombstoneSchema(id=row["product_id"], deleted_at=row["deleted_at"])
+            for row in await repo.read_repository.get_deleted_product_ids(updated_since)
+        ]
 
     items = []
 
-    for r in rows:
+    for r, final_price in zip(rows, prices):
         parent_cats = []
         if r.get("parent_categories"):
             for pc in r["parent_categories"]:
@@ -202,6 +240,7 @@ async def export_catalog(
                 id=r["id"],
                 name=r["name"],
                 price=r["price"],
+                final_price=final_price,
                 description=r.get("description"),
                 category=ExportCategorySchema(
                     id=r["category_id"],
@@ -224,5 +263,157 @@ async def export_catalog(
         ExportCatalogResponse(
             total=len(items),
             items=items,
+            deleted=deleted,
+            watermark=watermark,
         )
-    )
\ No newline at end of file
+    )
+
+
+@admin_product_router.get(
+    "/catalog/export/stream",
+    summary="Потоковая выгрузка каталога",
+    description="""
+    Выгружает весь каталог потоком в формате NDJSON или CSV.
+
+    Строки читаются из БД серверным курсором пачками и сразу отправляются
+    клиенту, поэтому память сервера не зависит от размера каталога.
+
+    Права:
+    - Требуется permission: `product:export`
+
+    Параметры:
+    - `format` — `ndjson` (один товар в строке) или `csv`
+    - `gzip` — сжать поток (файл `.gz`)
+    - `updated_since` — инкрементальная выгрузка: только товары, изменённые
+      с этого момента, и в конце — удалённые товары (`deleted: true`)
+
+    Заголовок `X-Export-Watermark` — значение `updated_since` для следующей выгрузки.
+    """,
+    response_description="Файл выгрузки каталога",
+    response_class=StreamingResponse,
+    dependencies=[Depends(require_permissions("product:export"))],
+)
+async def export_catalog_stream(
+    format: ExportFormatEnum = Query(ExportFormatEnum.NDJSON, description="Формат выгрузки"),
+    gzip: bool = Query(False, description="Сжать выгрузку gzip"),
+    updated_since: Optional[datetime] = Query(
+        None,
+        description="Только товары, изменённые или удалённые с этого момента (watermark прошлой выгрузки)",
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    settings = get_settings()
+    repo = ProductComposition.build_queries(db)
+
+    # Отметку и удалённые товары читаем до начала потока, в той же транзакции
+    watermark = export_watermark(
+        await repo.read_repository.get_export_watermark(),
+        settings.CATALOG_EXPORT_DELTA_OVERLAP_SECONDS,
+    )
+    tombstones = []
+    if updated_since is not None:
+        tombstones = await repo.read_repository.get_deleted_product_ids(updated_since)
+
+    formulas = await repo.read_repository.get_price_formulas()
+
+    chunks = repo.read_repository.stream_full_catalog(
+        chunk_size=settings.CATALOG_EXPORT_CHUNK_SIZE,
+        updated_since=updated_since,
+    )
+
+    if format == ExportFormatEnum.CSV:
+        body = iter_csv(chunks, tombstones, formulas)
+        media_type = "text/csv; charset=utf-8"
+    else:
+        body = iter_ndjson(chunks, tombstones, formulas)
+        media_type = "application/x-ndjson"
+
+    filename = f"catalog.{format.value}"
+    if gzip:
+        body = gzip_stream(body)
+        media_type = "application/gzip"
+        filename += ".gz"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Export-Watermark": watermark.isoformat(),
+        },
+    )
+
+
+@admin_product_router.post(
+    "/import",
+    summary="Массовый импорт товаров",
+    description="""
+    Создаёт и обновляет товары из файла NDJSON или CSV (формат строк —
+    как у потоковой выгрузки `/product/admin/catalog/export/stream`).
+
+    Строка с `id` обновляет товар, без `id` — создаёт новый. Атрибуты,
+    изображения и теги заменяются целиком, если заданы в строке,
+    и не меняются, если их нет (в CSV — пустая ячейка).
+
+    Строки с ошибками пропускаются и перечисляются в `errors` с номером
+    строки файла, остальные импортируются одной транзакцией.
+
+    Файл не больше `PRODUCT_IMPORT_HTTP_MAX_ROWS` строк (иначе 413);
+    большие файлы импортируются скриптом `scripts.import_products`.
+
+    Права:
+    - Требуется permission: `product:import`
+
+    Параметры:
+    - `format` — `ndjson` или `csv`
+    - `gzip` — файл сжат gzip
+    """,
+    response_description="Итог импорта",
+    responses={
+        200: {
+            "description": "Импорт выполнен",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "success": True,
+                        "data": {
+                            "import_id": 12,
+                            "format": "csv",
+                            "total": 3,
+                            "created": 1,
+                            "updated": 1,
+                            "unchanged": 0,
+                            "failed": 1,
+                            "errors": [
+                                {"row": 4, "reason": "category_not_found", "category_id": 999}
+                            ],
+                        },
+                    }
+                }
+            },
+        },
+        403: {"description": "Недостаточно прав"},
+        413: {"description": "Файл больше PRODUCT_IMPORT_HTTP_MAX_ROWS строк"},
+    },
+    dependencies=[Depends(require_permissions("product:import"))],
+)
+async def import_products(
+    file: UploadFile = File(..., description="Файл импорта"),
+    format: ImportFormatEnum = Query(ImportFormatEnum.NDJSON, description="Формат файла"),
+    gzip: bool = Query(False, description="Файл сжат gzip"),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    raw = GzipFile(fileobj=file.file) if gzip else file.file
+    # utf-8-sig: CSV из Excel начинается с BOM
+    lines = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+
+    command = ProductComposition.build_import_command(db)
+    result = await command.execute(
+        iter_import_rows(lines, format.value),
+        format=format.value,
+        user=user,
+        max_rows=get_settings().PRODUCT_IMPORT_HTTP_MAX_ROWS,
+    )
+
+    return api_response(ProductImportResponse.model_validate(result))
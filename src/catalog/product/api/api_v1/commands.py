@@ -5,6 +5,10 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Form
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.catalog.product.api.schemas.product_bulk_update import (
+    ProductBulkUpdateRequest,
+    ProductBulkUpdateResponse,
+)
 from src.catalog.product.api.schemas.schemas import ProductReadSchema
 from src.catalog.product.application.dto.product import (
     ProductAttributeInputDTO,
@@ -13,6 +17,7 @@ from src.catalog.product.application.dto.product import (
     ProductImageOperationDTO,
     ProductUpdateDTO,
 )
+from src.catalog.product.application.dto.product_bulk_update import ProductPatchDTO
 from src.catalog.product.composition import ProductComposition
 from src.catalog.product.domain.exceptions import ProductInvalidPayload
 from src.core.api.normalizers import normalize_optional_fk
@@ -300,6 +305,71 @@ async def create(
     return api_response(ProductReadSchema.model_validate(dto))
 
 
+@product_commands_router.patch(
+    "/bulk",
+    summary="Пакетно изменить поля товаров",
+    description="""
+    Меняет цену, название, описание, категорию и регион у многих товаров
+    одним запросом. В каждом элементе передаются `id` и только меняемые поля;
+    `null` в `description`, `category_id`, `region_id` очищает поле.
+
+    Элементы с ошибками (товар, категория или регион не найдены, неверная
+    цена или название, повтор `id`) пропускаются и перечисляются в `errors`,
+    остальные применяются одной транзакцией.
+
+    Права:
+    - Требуется permission: `product:update`
+
+    Сценарии:
+    - Переоценка ассортимента.
+    - Перенос товаров в другую категорию или регион.
+    """,
+    response_description="Итог пакетного обновления",
+    responses={
+        200: {
+            "description": "Обновление выполнено",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "success": True,
+                        "data": {
+                            "total": 3,
+                            "updated": 1,
+                            "unchanged": 1,
+                            "failed": 1,
+                            "errors": [
+                                {"index": 2, "id": 3003, "reason": "category_not_found", "category_id": 999}
+                            ],
+                        },
+                    }
+                }
+            },
+        },
+        400: {"description": "Слишком много элементов в запросе"},
+        403: {"description": "Недостаточно прав"},
+    },
+    dependencies=[Depends(require_permissions("product:update"))],
+)
+async def bulk_update(
+    payload: ProductBulkUpdateRequest,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    command = ProductComposition.build_bulk_update_command(db)
+    result = await command.execute(
+        [
+            ProductPatchDTO(
+                product_id=item.id,
+                changes=item.model_dump(include=item.model_fields_set - {"id"}),
+            )
+            for item in payload.items
+        ],
+        user=user,
+    )
+
+    return api_response(ProductBulkUpdateResponse.model_validate(result))
+
+
 @product_commands_router.put(
     "/{product_id}",
     summary="Обновить товар",
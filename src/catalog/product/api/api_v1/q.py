@@ -10,14 +10,22 @@ from src.catalog.product.api.schemas.product_type import (
     ProductTypeTreeResponse,
 )
 from src.catalog.product.api.schemas.schemas import (
+    CountModeEnum,
+    ProductBatchRequest,
+    ProductBatchResponse,
+    ProductCardSchema,
+    ProductFacetedResponse,
     ProductListResponse,
+    ProductPageResponse,
     ProductReadSchema,
+    ProductViewEnum,
     CatalogFiltersResponse,
     CatalogFiltersRequestSchema,
     FilterSchema,
     FilterOptionSchema,
     SortTypeEnum,
     ProductSearchResponse,
+    ProductSuggestResponse,
     SearchSuggestionSchema,
 )
 from src.catalog.product.composition import ProductComposition
@@ -28,6 +36,15 @@ product_q_router = APIRouter(
     tags=["Товары"],
 )
 
+VIEW_DESCRIPTION = (
+    "Состав полей товара: full (все поля), card (карточка: название, цены, "
+    "рейтинг и главное изображение; связи не загружаются)"
+)
+
+
+def _item_schema(view: ProductViewEnum):
+    return ProductCardSchema if view is ProductViewEnum.CARD else ProductReadSchema
+
 
 @product_q_router.get(
     "/related/variants",
@@ -110,6 +127,76 @@ async def related_products(
     )
 
 
+@product_q_router.post(
+    "/batch",
+    summary="Получить товары по списку id",
+    description="""
+    Возвращает товары по списку `ids` в порядке запроса (повторы id
+    отбрасываются). Id, которых нет в каталоге, перечисляются в `missing_ids`.
+
+    Товары отдаются из кэша read-модели, недостающие дочитываются одним
+    пакетом запросов; total и фильтры каталога не считаются.
+    С `view=card` возвращаются карточки товаров (название, цены, рейтинг,
+    главное изображение).
+
+    Права:
+    - Не требуются (доступно авторизованным и публичным клиентам по политике окружения).
+
+    Сценарии:
+    - Корзина и избранное.
+    - Виджеты рекомендаций.
+    """,
+    response_description="Товары в порядке запроса в стандартной обёртке API",
+    responses={
+        200: {
+            "description": "Товары получены",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "success": True,
+                        "data": {
+                            "items": [
+                                {
+                                    "id": 1001,
+                                    "name": "Смартфон Apple iPhone 15 Pro 256GB",
+                                    "description": "Флагманский смартфон",
+                                    "price": "129990.00",
+                                    "final_price": "129990.00",
+                                    "rating": {"value": 4.8, "count": 125},
+                                    "images": [],
+                                    "attributes": [],
+                                    "tags": [],
+                                    "category": None,
+                                    "supplier": None,
+                                    "region": None,
+                                }
+                            ],
+                            "missing_ids": [1002],
+                        },
+                    }
+                }
+            },
+        },
+        400: {"description": "Слишком много id в запросе"},
+    },
+)
+async def get_batch(
+    payload: ProductBatchRequest,
+    view: ProductViewEnum = Query(ProductViewEnum.FULL, description=VIEW_DESCRIPTION),
+    db: AsyncSession = Depends(get_db),
+):
+    queries = ProductComposition.build_queries(db)
+    result = await queries.get_many(payload.ids, view=view.value)
+
+    schema = _item_schema(view)
+    return api_response(
+        ProductBatchResponse(
+            items=[schema.model_validate(item) for item in result.items],
+            missing_ids=result.missing_ids,
+        )
+    )
+
+
 @product_q_router.get(
     "/search",
     summary="Поиск товаров",
@@ -119,6 +206,7 @@ async def related_products(
     Возвращает:
     - Список найденных товаров (с пагинацией limit/offset, по умолчанию 10)
     - Подсказки следующихих слов (топ-5) для автодополнения поиска
+    - С `view=card` — карточки товаров без загрузки связей
     
     Пример:
     - Ввели "iPhone" → вернулись первые 10 товаров + подсказки: "15", "16", "17", "Red", "Pro"
@@ -194,6 +282,7 @@ async def search_products(
     query: str = Query(..., min_length=1, description="Поисковый запрос"),
     limit: int = Query(10, ge=1, le=100, description="Количество товаров (по умолчанию 10)"),
     offset: int = Query(0, ge=0, description="Смещение для пагинации"),
+    view: ProductViewEnum = Query(ProductViewEnum.FULL, description=VIEW_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
 ):
     queries = ProductComposition.build_queries(db)
@@ -201,12 +290,14 @@ async def search_products(
         query=query,
         limit=limit,
         offset=offset,
+        view=view.value,
     )
 
+    schema = _item_schema(view)
     return api_response(
         ProductSearchResponse(
             total=result.total,
-            items=[ProductReadSchema.model_validate(item) for item in result.items],
+            items=[schema.model_validate(item) for item in result.items],
             suggestions=[
                 SearchSuggestionSchema(word=s.word, count=s.count)
                 for s in result.suggestions
@@ -215,6 +306,63 @@ async def search_products(
     )
 
 
+@product_q_router.get(
+    "/search/suggest",
+    summary="Подсказки для строки поиска",
+    description="""
+    Возвращает подсказки следующего слова для автодополнения без поиска товаров.
+
+    Подсказки строятся по названиям и значениям атрибутов всего каталога:
+    последний введённый термин считается началом слова, остальные термины
+    сужают набор товаров. `count` — количество товаров с такой подсказкой.
+
+    Пример:
+    - Ввели "iPhone 15" → подсказки: "Pro", "Max"
+
+    Права:
+    - Не требуются (доступно авторизованным и публичным клиентам по политике окружения).
+
+    Сценарии:
+    - Автодополнение в строке поиска при каждом нажатии клавиши
+    """,
+    response_description="Подсказки следующего слова",
+    responses={
+        200: {
+            "description": "Подсказки получены",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "success": True,
+                        "data": {
+                            "suggestions": [
+                                {"word": "Pro", "count": 30},
+                                {"word": "Max", "count": 12}
+                            ]
+                        }
+                    }
+                }
+            },
+        }
+    },
+)
+async def suggest_products(
+    query: str = Query(..., min_length=1, description="Введённая часть запроса"),
+    limit: int = Query(5, ge=1, le=20, description="Количество подсказок (по умолчанию 5)"),
+    db: AsyncSession = Depends(get_db),
+):
+    queries = ProductComposition.build_queries(db)
+    suggestions = await queries.suggest(query=query, limit=limit)
+
+    return api_response(
+        ProductSuggestResponse(
+            suggestions=[
+                SearchSuggestionSchema(word=s.word, count=s.count)
+                for s in suggestions
+            ],
+        )
+    )
+
+
 @product_q_router.get(
     "/{product_id}",
     summary="Получить товар по ID",
@@ -303,6 +451,11 @@ async def get_by_id(product_id: int, db: AsyncSession = Depends(get_db)):
     - фильтрации по списку ID товаров (product_ids)
     - фильтрации по атрибутам (query параметр `attributes` в формате JSON, где значения - массивы)
     - пагинации (limit, offset)
+    - keyset-пагинации (cursor): в ответе next_cursor, его передают в cursor
+      для следующей страницы; offset при этом игнорируется, сортировка должна совпадать
+    - режима подсчёта total (count): exact, estimate (оценка планировщика), none (не считать)
+    - состава полей (view): full — все поля, card — карточка для сетки (название,
+      цены, рейтинг, главное изображение) без загрузки связей
 
     Пример attributes: {"RAM": ["8 GB", "16 GB"], "Color": ["Black", "White"]}
 
@@ -320,6 +473,8 @@ async def get_by_id(product_id: int, db: AsyncSession = Depends(get_db)):
                         "success": True,
                         "data": {
                             "total": 2,
+                            "total_is_estimate": False,
+                            "next_cursor": None,
                             "items": [
                                 {
                                     "id": 3001,
@@ -411,6 +566,12 @@ async def filter_products(
     ),
     limit: int = Query(10),
     offset: int = Query(0),
+    cursor: str | None = Query(None, description="Курсор следующей страницы (next_cursor из предыдущего ответа)"),
+    count: CountModeEnum = Query(
+        CountModeEnum.EXACT,
+        description="Подсчёт total: exact (точно), estimate (оценка), none (не считать)"
+    ),
+    view: ProductViewEnum = Query(ProductViewEnum.FULL, description=VIEW_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
 ):
 
@@ -423,7 +584,7 @@ async def filter_products(
             raise ProductInvalidPayload(details={"reason": "invalid_attributes_json"})
 
     queries = ProductComposition.build_queries(db)
-    items, total = await queries.filter(
+    page = await queries.filter_page(
         name=name,
         category_id=category_id,
         product_type_id=product_type_id,
@@ -433,12 +594,18 @@ async def filter_products(
         offset=offset,
         attributes=attributes_dict,
         sort_type=sort_type.value,
+        cursor=cursor,
+        count_mode=count.value,
+        view=view.value,
     )
 
+    schema = _item_schema(view)
     return api_response(
-        ProductListResponse(
-            total=total,
-            items=[ProductReadSchema.model_validate(item) for item in items],
+        ProductPageResponse(
+            total=page.total,
+            total_is_estimate=page.total_is_estimate,
+            next_cursor=page.next_cursor,
+            items=[schema.model_validate(item) for item in page.items],
         )
     )
 
@@ -545,6 +712,88 @@ async def get_catalog_filters(
     )
 
 
+@product_q_router.get(
+    "/catalog/faceted",
+    summary="Товары каталога вместе с фильтрами",
+    description="""
+    Возвращает страницу товаров (как GET /product) и фильтры каталога
+    (как GET /product/catalog/filters) за один запрос.
+
+    Счётчики фильтров учитывают выбор пользователя: значения каждого
+    атрибута считаются по товарам, прошедшим все остальные выбранные
+    фильтры (выбор в самом атрибуте не сужает его варианты). Выбранные
+    значения без товаров возвращаются с count = 0.
+
+    Права:
+    - Не требуются (доступно авторизованным и публичным клиентам по политике окружения).
+
+    Сценарии:
+    - Клик по фильтру в каталоге: новая страница товаров и обновлённые счётчики
+      одним запросом.
+    """,
+    response_description="Страница товаров и фильтры в стандартной обёртке API",
+)
+async def faceted_search(
+    category_id: int | None = Query(None),
+    product_type_id: int | None = Query(None),
+    attributes: str | None = Query(
+        None,
+        description="JSON-объект с выбранными значениями атрибутов, например: {\"RAM\": [\"8 GB\", \"16 GB\"], \"Color\": [\"Black\"]}"
+    ),
+    sort_type: SortTypeEnum = Query(
+        SortTypeEnum.DEFAULT,
+        description="Тип сортировки: default (по умолчанию), price_asc (цена ниже), price_desc (цена выше)"
+    ),
+    limit: int = Query(10),
+    offset: int = Query(0),
+    cursor: str | None = Query(None, description="Курсор следующей страницы (next_cursor из предыдущего ответа)"),
+    count: CountModeEnum = Query(
+        CountModeEnum.EXACT,
+        description="Подсчёт total: exact (точно), estimate (оценка), none (не считать)"
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    attributes_dict = None
+    if attributes:
+        try:
+            attributes_dict = loads(attributes)
+        except Exception:
+            from src.catalog.product.domain.exceptions import ProductInvalidPayload
+            raise ProductInvalidPayload(details={"reason": "invalid_attributes_json"})
+
+    queries = ProductComposition.build_queries(db)
+    result = await queries.faceted_search(
+        category_id=category_id,
+        product_type_id=product_type_id,
+        limit=limit,
+        offset=offset,
+        attributes=attributes_dict,
+        sort_type=sort_type.value,
+        cursor=cursor,
+        count_mode=count.value,
+    )
+
+    return api_response(
+        ProductFacetedResponse(
+            total=result.page.total,
+            total_is_estimate=result.page.total_is_estimate,
+            next_cursor=result.page.next_cursor,
+            items=[ProductReadSchema.model_validate(item) for item in result.page.items],
+            filters=[
+                FilterSchema(
+                    name=f.name,
+                    is_filterable=f.is_filterable,
+                    options=[
+                        FilterOptionSchema(value=opt.value, count=opt.count)
+                        for opt in f.options
+                    ],
+                )
+                for f in result.filters
+            ],
+        )
+    )
+
+
 # ==================== ProductType ====================
 
 product_type_q_router = APIRouter(
@@ -1,4 +1,6 @@
+from datetime import datetime
 from decimal import Decimal
+from enum import Enum
 from typing import List, Optional
 
 from pydantic import BaseModel
@@ -37,6 +39,8 @@ class ExportProductSchema(BaseModel):
     id: int
     name: str
     price: Decimal
+    # Цена по политике ценообразования категории
+    final_price: Decimal
     description: Optional[str] = None
     category: Optional[ExportCategorySchema]
     supplier: Optional[ExportSupplierSchema]
@@ -44,6 +48,21 @@ class ExportProductSchema(BaseModel):
     attributes: List[ExportAttributeSchema]
 
 
+class ExportTombstoneSchema(BaseModel):
+    id: int
+    deleted_at: datetime
+
+
 class ExportCatalogResponse(BaseModel):
     total: int
-    items: List[ExportProductSchema]
\ No newline at end of file
+    items: List[ExportProductSchema]
+    # Только для инкрементальной выгрузки (updated_since)
+    deleted: List[ExportTombstoneSchema] = []
+    # Передать как updated_since в следующую выгрузку
+    watermark: Optional[datetime] = None
+
+
+class ExportFormatEnum(str, Enum):
+    """Формат потоковой выгрузки каталога."""
+    NDJSON = "ndjson"  # Один товар в строке, JSON
+    CSV = "csv"  # Вложенные структуры — JSON в ячейке
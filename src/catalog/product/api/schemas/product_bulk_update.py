@@ -0,0 +1,34 @@
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ProductPatchItemSchema(BaseModel):
+    """
+    Изменение одного товара: передаются только меняемые поля.
+    null в description, category_id, region_id — очистить поле.
+    """
+    model_config = ConfigDict(extra="forbid")
+
+    id: int = Field(..., gt=0)
+    name: Optional[str] = None
+    description: Optional[str] = None
+    price: Optional[Decimal] = None
+    category_id: Optional[int] = Field(None, gt=0)
+    region_id: Optional[int] = Field(None, gt=0)
+
+
+class ProductBulkUpdateRequest(BaseModel):
+    items: List[ProductPatchItemSchema] = Field(..., min_length=1)
+
+
+class ProductBulkUpdateResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    total: int
+    updated: int
+    unchanged: int
+    failed: int
+    # Отклонённые элементы: {"index": позиция в items, "id", "reason", ...}
+    errors: List[Dict[str, Any]]
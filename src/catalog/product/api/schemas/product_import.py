@@ -0,0 +1,24 @@
+from enum import Enum
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ImportFormatEnum(str, Enum):
+    """Формат файла массового импорта товаров."""
+    NDJSON = "ndjson"  # Один товар в строке, JSON
+    CSV = "csv"  # Вложенные структуры — JSON в ячейке
+
+
+class ProductImportResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    import_id: int
+    format: str
+    total: int
+    created: int
+    updated: int
+    unchanged: int
+    failed: int
+    # Первые ошибки строк: {"row": номер строки файла, "reason": код, ...}
+    errors: List[Dict[str, Any]]
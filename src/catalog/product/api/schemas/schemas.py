@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import List, Literal, Optional
+from typing import List, Literal, Optional, Union
 
 from fastapi import UploadFile
 from pydantic import BaseModel, ConfigDict, Field
@@ -13,6 +13,19 @@ class SortTypeEnum(str, Enum):
     PRICE_DESC = "price_desc"  # Цена выше
 
 
+class CountModeEnum(str, Enum):
+    """Режим подсчёта total для списка товаров."""
+    EXACT = "exact"  # Точный COUNT(*)
+    ESTIMATE = "estimate"  # Оценка планировщика Postgres
+    NONE = "none"  # Не считать
+
+
+class ProductViewEnum(str, Enum):
+    """Состав полей товара в выдаче."""
+    FULL = "full"  # Все поля и связи
+    CARD = "card"  # Карточка для сетки: название, цены, рейтинг, главное изображение
+
+
 class FilterOptionSchema(BaseModel):
     """Вариант значения для фильтра."""
     value: str
@@ -224,6 +237,23 @@ class ProductReadSchema(BaseModel):
     category: Optional[CategoryNestedSchema] = None
     supplier: Optional[SupplierNestedSchema] = None
     region: Optional[RegionNestedSchema] = None
+    final_price: Optional[Decimal] = None
+
+
+class ProductCardSchema(BaseModel):
+    """Карточка товара (view=card); images — только главное изображение."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    price: Decimal
+    final_price: Optional[Decimal] = None
+    rating: Optional[ProductRatingSchema] = None
+    images: List[ProductImageReadSchema] = []
+
+
+# Элемент выдачи в зависимости от view
+ProductItemSchema = Union[ProductReadSchema, ProductCardSchema]
 
 
 class ProductListResponse(BaseModel):
@@ -231,6 +261,32 @@ class ProductListResponse(BaseModel):
     items: List[ProductReadSchema]
 
 
+class ProductBatchRequest(BaseModel):
+    """Запрос товаров по списку id."""
+    ids: List[int] = Field(..., min_length=1)
+
+
+class ProductBatchResponse(BaseModel):
+    """Товары в порядке запроса и id, которых нет в каталоге."""
+    model_config = ConfigDict(from_attributes=True)
+
+    items: List[ProductItemSchema]
+    missing_ids: List[int]
+
+
+class ProductPageResponse(BaseModel):
+    """Страница товаров с курсором на следующую страницу."""
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
+    items: List[ProductItemSchema]
+
+
+class ProductFacetedResponse(ProductPageResponse):
+    """Страница товаров вместе с фасетами каталога с учётом выбранных фильтров."""
+    filters: List[FilterSchema] = Field(default_factory=list)
+
+
 # ==================== ProductRelation ====================
 
 class RelationTypeEnum(str, Enum):
@@ -306,5 +362,10 @@ class SearchSuggestionSchema(BaseModel):
 class ProductSearchResponse(BaseModel):
     """Ответ с результатами поиска товаров."""
     total: int
-    items: List[ProductReadSchema]
+    items: List[ProductItemSchema]
+    suggestions: List[SearchSuggestionSchema]
+
+
+class ProductSuggestResponse(BaseModel):
+    """Ответ с подсказками следующего слова для автодополнения."""
     suggestions: List[SearchSuggestionSchema]
@@ -21,6 +21,24 @@ from src.catalog.product.api.api_v1.product_type_commands import (
 from src.catalog.product.api.api_v1.q import product_q_router, product_type_q_router
 from src.catalog.product.api.api_v1.tag_commands import tag_commands_router
 from src.catalog.product.api.api_v1.tag_q import tag_q_router
+from src.catalog.product.application.services.bitmap_index import (
+    ProductBitmapIndexUpdater,
+    get_product_bitmap_index,
+)
+from src.catalog.product.application.services.suggestion_index import (
+    SuggestionIndexUpdater,
+    get_suggestion_index,
+)
+from src.catalog.product.infrastructure.orm.cache.cached_product_read import (
+    ProductReadCacheInvalidator,
+)
+from src.catalog.product.infrastructure.orm.product_read_model import (
+    ProductReadModelUpdater,
+)
+from src.core.cache.factory import get_shared_cache
+from src.core.conf.settings import get_settings
+from src.core.db.database import get_sessionmaker
+from src.core.events import get_event_bus
 
 
 class ProductApiModule:
@@ -44,3 +62,18 @@ class ProductApiModule:
         app.include_router(product_commands_router, prefix="/product")
         app.include_router(admin_product_router, prefix="/product/admin")
         app.include_router(admin_product_type_router, prefix="/product/admin")
+
+        # Сброс кэша read-модели товаров по событиям всех модулей каталога
+        get_event_bus().subscribe(ProductReadCacheInvalidator(get_shared_cache()).handle)
+        # Пометка изменившихся товаров в индексе подсказок поиска
+        get_event_bus().subscribe(SuggestionIndexUpdater(get_suggestion_index()).handle)
+        # Пометка изменившихся товаров в индексе товаров (фасеты и фильтрация)
+        get_event_bus().subscribe(ProductBitmapIndexUpdater(get_product_bitmap_index()).handle)
+        # Проекция product_read_model поддерживается, только пока из неё читают:
+        # перед включением её заполняет scripts/rebuild_product_read_model.py
+        if get_settings().PRODUCT_READ_MODEL_ENABLED:
+            updater = ProductReadModelUpdater(
+                get_sessionmaker(),
+                catch_up_interval=get_settings().PRODUCT_READ_MODEL_CATCH_UP_SECONDS,
+            )
+            get_event_bus().subscribe(updater.handle)
@@ -0,0 +1,202 @@
+from typing import Any
+
+from src.catalog.product.application.dto.audit import ProductAuditDTO
+from src.catalog.product.application.dto.product_bulk_update import (
+    ProductBulkUpdateResultDTO,
+    ProductPatchDTO,
+)
+from src.catalog.product.domain.exceptions import ProductInvalidPayload
+from src.catalog.product.domain.repository.audit import ProductAuditRepository
+from src.catalog.product.domain.repository.product_bulk_update import (
+    ProductBulkUpdateRepository,
+)
+from src.catalog.product.domain.value_objects import (
+    MAX_PRICE,
+    InvalidProductName,
+    Money,
+    MoneyError,
+    ProductName,
+)
+from src.core.auth.schemas.user import User
+from src.core.db.unit_of_work import UnitOfWork
+from src.core.events import AsyncEventBus, build_event
+
+# Поле -> причина ошибки, если id не найден в БД
+_MISSING_REFERENCE_REASONS = {
+    "category_id": "category_not_found",
+    "region_id": "region_not_found",
+}
+
+
+class _PatchError(Exception):
+
+    def __init__(self, reason: str, **details: Any):
+        super().__init__(reason)
+        self.reason = reason
+        self.details = details
+
+
+class BulkUpdateProductsCommand:
+    """
+    Пакетное изменение скалярных полей товаров (цена, название, описание,
+    категория, регион).
+
+    На весь пакет — один запрос текущих значений с блокировкой строк,
+    по одному запросу существования категорий и регионов, один UPDATE
+    с новыми значениями и один INSERT аудита. Ошибочные элементы
+    пропускаются и попадают в отчёт, остальные применяются.
+
+    После коммита публикуется одно событие на пакет
+    (entity="product_bulk_update", data.product_ids), а не событие на товар.
+    """
+
+    def __init__(
+        self,
+        repository: ProductBulkUpdateRepository,
+        audit_repository: ProductAuditRepository,
+        uow: UnitOfWork,
+        event_bus: AsyncEventBus,
+        max_items: int,
+    ):
+        self.repository = repository
+        self.audit_repository = audit_repository
+        self.uow = uow
+        self.event_bus = event_bus
+        self.max_items = max_items
+
+    async def execute(
+        self,
+        patches: list[ProductPatchDTO],
+        user: User,
+    ) -> ProductBulkUpdateResultDTO:
+        if len(patches) > self.max_items:
+            raise ProductInvalidPayload(
+                details={"reason": "too_many_items", "max_items": self.max_items}
+            )
+
+        errors: list[dict[str, Any]] = []
+        # id товара -> (позиция в запросе, проверенные изменения)
+        valid: dict[int, tuple[int, dict[str, Any]]] = {}
+        for index, patch in enumerate(patches):
+            try:
+                if patch.product_id in valid:
+                    raise _PatchError("duplicate_id")
+                valid[patch.product_id] = (index, self._validate(patch.changes))
+            except _PatchError as error:
+                errors.append(
+                    {"index": index, "id": patch.product_id, "reason": error.reason, **error.details}
+                )
+
+        new_values: dict[int, dict[str, Any]] = {}
+        audit: list[ProductAuditDTO] = []
+        changed_fields: set[str] = set()
+
+        async with self.uow:
+            current = await self.repository.lock_fields(list(valid))
+            missing = await self.repository.find_missing_references({
+                field: {
+                    changes[field]
+                    for _, changes in valid.values()
+                    if changes.get(field) is not None
+                }
+                for field in _MISSING_REFERENCE_REASONS
+            })
+
+            for product_id, (index, changes) in valid.items():
+                error = self._missing_reference(product_id, changes, current, missing)
+                if error is not None:
+                    errors.append({"index": index, "id": product_id, **error})
+                    continue
+
+                old = current[product_id]
+                diff = [field for field, value in changes.items() if old[field] != value]
+                if not diff:
+                    continue
+
+                new_values[product_id] = {**old, **changes}
+                changed_fields.update(diff)
+                audit.append(
+                    ProductAuditDTO(
+                        product_id=product_id,
+                        action="update",
+                        old_data=self._audit_data(old, diff),
+                        new_data=self._audit_data(changes, diff),
+                        user_id=user.id,
+                        fio=user.fio,
+                    )
+                )
+
+            await self.repository.apply(new_values)
+            await self.audit_repository.log_many(audit)
+
+        if new_values:
+            self.event_bus.publish_many_nowait([
+                build_event(
+                    event_type="crud",
+                    method="update",
+                    app="products",
+                    entity="product_bulk_update",
+                    entity_id=None,
+                    data={
+                        "product_ids": sorted(new_values),
+                        "fields": sorted(changed_fields),
+                    },
+                )
+            ])
+
+        errors.sort(key=lambda error: error["index"])
+        return ProductBulkUpdateResultDTO(
+            total=len(patches),
+            updated=len(new_values),
+            unchanged=len(patches) - len(new_values) - len(errors),
+            failed=len(errors),
+            errors=errors,
+        )
+
+    @staticmethod
+    def _validate(changes: dict[str, Any]) -> dict[str, Any]:
+        """Проверки без БД: те же правила, что у названия и цены при обновлении товара."""
+        validated = dict(changes)
+
+        if "name" in changes:
+            if changes["name"] is None:
+                raise _PatchError("name_required")
+            try:
+                validated["name"] = ProductName.create(changes["name"]).value
+            except InvalidProductName as exc:
+                raise _PatchError(exc.code)
+
+        if "price" in changes:
+            if changes["price"] is None:
+                raise _PatchError("price_required")
+            try:
+                price = Money.from_decimal(changes["price"]).to_decimal()
+            except (MoneyError, ArithmeticError):
+                raise _PatchError("invalid_price", price=str(changes["price"]))
+            if price > MAX_PRICE:
+                raise _PatchError("invalid_price", price=str(changes["price"]))
+            validated["price"] = price
+
+        return validated
+
+    @staticmethod
+    def _missing_reference(
+        product_id: int,
+        changes: dict[str, Any],
+        current: dict[int, dict[str, Any]],
+        missing: dict[str, set[int]],
+    ) -> dict[str, Any] | None:
+        if product_id not in current:
+            return {"reason": "product_not_found"}
+        for field, reason in _MISSING_REFERENCE_REASONS.items():
+            value = changes.get(field)
+            if value is not None and value in missing.get(field, ()):
+                return {"reason": reason, field: value}
+        return None
+
+    @staticmethod
+    def _audit_data(values: dict[str, Any], fields: list[str]) -> dict[str, Any]:
+        return {
+            field: str(values[field]) if field == "price" else values[field]
+            for field in fields
+        }
@@ -18,7 +18,6 @@ from src.catalog.product.domain.aggregates.product import (
 from src.catalog.product.domain.events.product_events import (
     DomainEvent,
     ProductAttributeAddedEvent,
-    ProductCreatedEvent,
     ProductImageAddedEvent,
 )
 from src.catalog.product.domain.repository.audit import ProductAuditRepository
@@ -162,12 +161,12 @@ class CreateProductCommand:
         domain_events: list[DomainEvent],
     ) -> list[dict[str, Any]]:
         """Преобразовать доменные события в события для публикации."""
-        events: list[dict[str, Any]] = []
+        # Агрегат не записывает ProductCreatedEvent, поэтому событие создания
+        # публикуется всегда: по нему индексы и кэши узнают о новом товаре
+        events: list[dict[str, Any]] = self._build_product_created_events(aggregate)
 
         for event in domain_events:
-            if isinstance(event, ProductCreatedEvent):
-                events.extend(self._build_product_created_events(aggregate))
-            elif isinstance(event, ProductImageAddedEvent):
+            if isinstance(event, ProductImageAddedEvent):
                 events.append(self._build_image_event("create", aggregate.id, event.upload_id))
             elif isinstance(event, ProductAttributeAddedEvent):
                 pass  # Атрибуты не имеют отдельных событий в текущей реализации
@@ -31,7 +31,7 @@ class DeleteProductCommand:
         aggregate = None
 
         async with self.uow:
-            aggregate = await self.repository.get(product_id)
+            aggregate = await self.repository.get(product_id, for_update=True)
 
             if not aggregate:
                 raise ProductNotFound()
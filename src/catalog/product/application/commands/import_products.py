@@ -0,0 +1,221 @@
+import asyncio
+from typing import Any, Iterable, Iterator, Optional
+
+from src.catalog.product.application.dto.audit import ProductImportAuditDTO
+from src.catalog.product.application.dto.product_import import (
+    ProductImportMergeDTO,
+    ProductImportResultDTO,
+    ProductImportRowDTO,
+)
+from src.catalog.product.application.services.product_import import (
+    ProductImportRowError,
+    iter_batches,
+)
+from src.catalog.product.domain.exceptions import ProductImportTooLarge
+from src.catalog.product.domain.repository.audit import ProductAuditRepository
+from src.catalog.product.domain.repository.product_import import (
+    ProductImportRepository,
+)
+from src.core.auth.schemas.user import User
+from src.core.db.unit_of_work import UnitOfWork
+from src.core.events import AsyncEventBus, build_event
+
+# Поле строки -> причина ошибки, если id не найден в БД
+_MISSING_REFERENCE_REASONS = {
+    "id": "product_not_found",
+    "category_id": "category_not_found",
+    "supplier_id": "supplier_not_found",
+    "region_id": "region_not_found",
+    "upload_id": "upload_not_found",
+    "tag_id": "tag_not_found",
+}
+
+
+class ImportProductsCommand:
+    """
+    Массовый импорт товаров (NDJSON/CSV).
+
+    Строки проверяются и копируются в staging пачками по batch_size: на пачку —
+    по одному запросу существования категорий, поставщиков, регионов, загрузок,
+    тегов и обновляемых товаров и по одному COPY на staging-таблицу. Слияние
+    с каталогом, сводная запись аудита и коммит — одна транзакция на весь файл.
+    Ошибочные строки пропускаются и попадают в отчёт, остальные импортируются.
+
+    События публикуются после коммита пачками по batch_size id товаров
+    (entity="product_import", data.product_ids), а не по событию на товар.
+
+    Чтение файла (в том числе распаковка gzip) и разбор строк идут в пуле
+    потоков по пачке за раз и не блокируют event loop. max_rows ограничивает
+    размер файла (HTTP-импорт): при превышении транзакция откатывается.
+    """
+
+    def __init__(
+        self,
+        repository: ProductImportRepository,
+        audit_repository: ProductAuditRepository,
+        uow: UnitOfWork,
+        event_bus: AsyncEventBus,
+        batch_size: int,
+        max_reported_errors: int,
+    ):
+        self.repository = repository
+        self.audit_repository = audit_repository
+        self.uow = uow
+        self.event_bus = event_bus
+        self.batch_size = batch_size
+        self.max_reported_errors = max_reported_errors
+
+    async def execute(
+        self,
+        rows: Iterable[ProductImportRowDTO | ProductImportRowError],
+        format: str,
+        user: User,
+        max_rows: Optional[int] = None,
+    ) -> ProductImportResultDTO:
+        total = 0
+        failed = 0
+        errors: list[dict[str, Any]] = []
+        seen_product_ids: set[int] = set()
+
+        async with self.uow:
+            await self.repository.prepare()
+
+            batches = iter_batches(rows, self.batch_size)
+            while batch := await self._next_batch(batches):
+                total += len(batch)
+                if max_rows is not None and total > max_rows:
+                    raise ProductImportTooLarge(details={"max_rows": max_rows})
+                valid, rejected = await self._validate_batch(batch, seen_product_ids)
+                await self.repository.stage(valid)
+
+                failed += len(rejected)
+                errors.extend(
+                    error.to_dict()
+                    for error in rejected[: max(self.max_reported_errors - len(errors), 0)]
+                )
+
+            merged = await self.repository.merge()
+
+            import_id = await self.audit_repository.log_product_import(
+                ProductImportAuditDTO(
+                    format=format,
+                    total=total,
+                    created=len(merged.created_ids),
+                    updated=len(merged.updated_ids),
+                    unchanged=merged.unchanged,
+                    failed=failed,
+                    errors=errors or None,
+                    user_id=user.id,
+                    fio=user.fio,
+                )
+            )
+
+        events = self._build_events(import_id, merged)
+        if events:
+            self.event_bus.publish_many_nowait(events)
+
+        return ProductImportResultDTO(
+            import_id=import_id,
+            format=format,
+            total=total,
+            created=len(merged.created_ids),
+            updated=len(merged.updated_ids),
+            unchanged=merged.unchanged,
+            failed=failed,
+            errors=errors,
+        )
+
+    @staticmethod
+    async def _next_batch(
+        batches: Iterator[list[ProductImportRowDTO | ProductImportRowError]],
+    ) -> list[ProductImportRowDTO | ProductImportRowError]:
+        """Следующая пачка строк (пустая — файл кончился), прочитанная в пуле потоков."""
+        return await asyncio.get_running_loop().run_in_executor(None, next, batches, [])
+
+    async def _validate_batch(
+        self,
+        batch: list[ProductImportRowDTO | ProductImportRowError],
+        seen_product_ids: set[int],
+    ) -> tuple[list[ProductImportRowDTO], list[ProductImportRowError]]:
+        """Отсеять ошибочные строки пачки: разбор, повтор id в файле, ссылки на несуществующие записи."""
+        rejected: list[ProductImportRowError] = []
+        rows: list[ProductImportRowDTO] = []
+
+        for item in batch:
+            if isinstance(item, ProductImportRowError):
+                rejected.append(item)
+            elif item.product_id is not None and item.product_id in seen_product_ids:
+                rejected.append(ProductImportRowError(item.row, "duplicate_id", id=item.product_id))
+            else:
+                if item.product_id is not None:
+                    seen_product_ids.add(item.product_id)
+                rows.append(item)
+
+        missing = await self.repository.find_missing_references(rows)
+        if not missing:
+            return rows, sorted(rejected, key=lambda error: error.row)
+
+        valid: list[ProductImportRowDTO] = []
+        for row in rows:
+            error = self._missing_reference(row, missing)
+            if error is None:
+                valid.append(row)
+            else:
+                rejected.append(error)
+        return valid, sorted(rejected, key=lambda error: error.row)
+
+    @staticmethod
+    def _missing_reference(
+        row: ProductImportRowDTO,
+        missing: dict[str, set[int]],
+    ) -> ProductImportRowError | None:
+        values = {
+            "id": [row.product_id],
+            "category_id": [row.category_id],
+            "supplier_id": [row.supplier_id],
+            "region_id": [row.region_id],
+            "upload_id": [image.upload_id for image in row.images or ()],
+            "tag_id": row.tag_ids or [],
+        }
+        for field, ids in values.items():
+            for value in ids:
+                if value is not None and value in missing.get(field, ()):
+                    return ProductImportRowError(
+                        row.row,
+                        _MISSING_REFERENCE_REASONS[field],
+                        **{field: value},
+                    )
+        return None
+
+    def _build_events(
+        self,
+        import_id: int,
+        merged: ProductImportMergeDTO,
+    ) -> list[dict[str, Any]]:
+        events = [
+            build_event(
+                event_type="crud",
+                method="update",
+                app="products",
+                entity="product_attribute",
+                entity_id=attribute_id,
+                data={"import_id": import_id},
+            )
+            for attribute_id in merged.updated_attribute_ids
+        ]
+        for method, product_ids in (
+            ("create", merged.created_ids),
+            ("update", merged.updated_ids),
+        ):
+            events.extend(
+                build_event(
+                    event_type="crud",
+                    method=method,
+                    app="products",
+                    entity="product_import",
+                    entity_id=import_id,
+                    data={"import_id": import_id, "product_ids": chunk},
+                )
+                for chunk in iter_batches(product_ids, self.batch_size)
+            )
+        return events
@@ -56,7 +56,7 @@ class UpdateProductCommand:
 
     async def execute(self, product_id: int, dto, user: User) -> ProductReadDTO:
         async with self.uow:
-            aggregate = await self.repository.get(product_id)
+            aggregate = await self.repository.get(product_id, for_update=True)
 
             if not aggregate:
                 raise ProductNotFound()
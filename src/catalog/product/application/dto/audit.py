@@ -30,3 +30,16 @@ class ProductAttributeAuditDTO:
     new_data: Optional[Dict[str, Any]]
     user_id: int
     fio: Optional[str] = None
+
+
+@dataclass
+class ProductImportAuditDTO:
+    format: str
+    total: int
+    created: int
+    updated: int
+    unchanged: int
+    failed: int
+    errors: Optional[list[Dict[str, Any]]]
+    user_id: int
+    fio: Optional[str] = None
@@ -144,6 +144,59 @@ class ProductReadDTO:
     category: Optional['CategoryAggregate'] = None
     supplier: Optional['SupplierAggregate'] = None
     region: Optional['RegionAggregate'] = None
+    # Цена по политике ценообразования категории; проставляется при выдаче
+    final_price: Optional[Decimal] = None
+
+    @property
+    def category_id(self) -> Optional[int]:
+        return self.category.id if self.category else None
+
+
+@dataclass
+class ProductCardDTO:
+    """
+    Карточка товара для сеток каталога (view=card): без описания, атрибутов,
+    тегов и вложенных категории, поставщика и региона. images — только
+    главное изображение; category_id нужен для конечной цены.
+    """
+    id: int
+    name: str
+    price: Decimal
+    category_id: Optional[int] = None
+    rating: Optional[ProductRatingDTO] = None
+    images: list[ProductImageReadDTO] = field(default_factory=list)
+    final_price: Optional[Decimal] = None
+
+
+@dataclass
+class ProductBatchDTO:
+    """Товары по списку id в порядке запроса и id, которых нет в каталоге."""
+    items: list[ProductReadDTO]
+    missing_ids: list[int]
+
+
+@dataclass
+class ProductCursorDTO:
+    """Позиция keyset-пагинации: ключ сортировки последнего товара страницы."""
+    sort_type: str
+    id: int
+    price: Optional[Decimal] = None
+
+
+@dataclass
+class ProductPageDTO:
+    """Страница товаров; total = None, если подсчёт отключён."""
+    items: list[ProductReadDTO]
+    total: Optional[int]
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
+
+
+@dataclass
+class ProductFacetedPageDTO:
+    """Страница товаров вместе с фасетами, посчитанными с учётом выбранных фильтров."""
+    page: ProductPageDTO
+    filters: list[FilterDTO] = field(default_factory=list)
 
 
 @dataclass
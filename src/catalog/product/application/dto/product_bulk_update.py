@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+# Поля товара, которые меняет пакетное обновление (PATCH /product/bulk)
+BULK_UPDATE_FIELDS = ("name", "description", "price", "category_id", "region_id")
+
+
+@dataclass
+class ProductPatchDTO:
+    """
+    Изменение скалярных полей одного товара в пакетном обновлении.
+
+    В changes только переданные поля: отсутствие ключа — не менять,
+    None — очистить (для необязательных полей).
+    """
+    product_id: int
+    changes: dict[str, Any]
+
+
+@dataclass
+class ProductBulkUpdateResultDTO:
+    total: int
+    updated: int
+    unchanged: int
+    failed: int
+    # Отклонённые элементы: {"index": позиция в запросе, "id", "reason", ...}
+    errors: list[dict[str, Any]] = field(default_factory=list)
@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class ProductImportAttributeDTO:
+    name: str
+    value: str
+    # None — флаг не задан: новый атрибут получает значение по умолчанию,
+    # у существующего флаг не меняется
+    is_filterable: Optional[bool] = None
+    is_groupable: Optional[bool] = None
+
+
+@dataclass(frozen=True)
+class ProductImportImageDTO:
+    upload_id: int
+    is_main: bool = False
+    ordering: int = 0
+
+
+@dataclass
+class ProductImportRowDTO:
+    """
+    Проверенная строка файла импорта.
+
+    attributes/images/tag_ids = None — в строке их нет, у существующего
+    товара они не меняются; пустой список — удалить все.
+    """
+    row: int  # Номер строки в файле (для отчёта об ошибках)
+    name: str
+    price: Decimal
+    product_id: Optional[int] = None  # None — новый товар
+    description: Optional[str] = None
+    category_id: Optional[int] = None
+    supplier_id: Optional[int] = None
+    region_id: Optional[int] = None
+    attributes: Optional[list[ProductImportAttributeDTO]] = None
+    images: Optional[list[ProductImportImageDTO]] = None
+    tag_ids: Optional[list[int]] = None
+
+
+@dataclass
+class ProductImportMergeDTO:
+    """Итог слияния staging-таблиц с каталогом."""
+    created_ids: list[int] = field(default_factory=list)
+    # Существующие товары, у которых изменилось хоть что-то
+    updated_ids: list[int] = field(default_factory=list)
+    unchanged: int = 0
+    # Атрибуты справочника, у которых импорт поменял is_filterable/is_groupable
+    updated_attribute_ids: list[int] = field(default_factory=list)
+
+
+@dataclass
+class ProductImportResultDTO:
+    import_id: int
+    format: str
+    total: int
+    created: int
+    updated: int
+    unchanged: int
+    failed: int
+    # Первые PRODUCT_IMPORT_MAX_REPORTED_ERRORS ошибок: {"row", "reason", ...}
+    errors: list[dict[str, Any]]
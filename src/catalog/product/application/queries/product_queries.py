@@ -1,14 +1,34 @@
+from datetime import datetime
 from typing import List, Optional
 
-from src.catalog.product.application.dto.product import ProductReadDTO, CatalogFiltersDTO, ProductSearchDTO
+from src.catalog.product.application.dto.product import (
+    CatalogFiltersDTO,
+    ProductBatchDTO,
+    ProductFacetedPageDTO,
+    ProductPageDTO,
+    ProductReadDTO,
+    ProductSearchDTO,
+    SearchSuggestionDTO,
+)
 from src.catalog.product.application.read_models.product_read_repository import (
     ProductReadRepository,
 )
+from src.catalog.product.application.services.catalog_export import export_watermark
+from src.catalog.product.application.services.product_cursor import (
+    build_cursor,
+    decode_cursor,
+    encode_cursor,
+)
+from src.catalog.product.application.services.suggestion_index import (
+    SuggestionIndex,
+)
 from src.catalog.product.domain.exceptions import (
+    ProductInvalidPayload,
     ProductNotFound,
     ProductRelatedLookupRequired,
 )
 from src.catalog.product.domain.repository.product import ProductRepository
+from src.core.conf.settings import get_settings
 from src.core.services.images import ImageStorageService
 
 
@@ -19,22 +39,60 @@ class ProductQueries:
         read_repository: ProductReadRepository,
         repository: ProductRepository,
         image_storage: ImageStorageService,
+        suggestion_index: SuggestionIndex,
+        batch_max_ids: int,
     ):
         self.read_repository = read_repository
         self.repository = repository
         self.image_storage = image_storage
+        self.suggestion_index = suggestion_index
+        self.batch_max_ids = batch_max_ids
 
     def _attach_image_url(self, dto: ProductReadDTO) -> ProductReadDTO:
         for image in dto.images:
             image.image_url = self.image_storage.build_public_url(image.image_key)
         return dto
 
+    async def _apply_final_prices(self, items: List[ProductReadDTO]) -> None:
+        """Проставить конечные цены по политикам категорий (один проход на страницу)."""
+        if not items:
+            return None
+        formulas = await self.read_repository.get_price_formulas()
+        prices = formulas.final_prices((item.price, item.category_id) for item in items)
+        for item, price in zip(items, prices):
+            item.final_price = price
+
     async def get_by_id(self, product_id: int) -> ProductReadDTO:
         dto = await self.read_repository.get_by_id(product_id)
         if not dto:
             raise ProductNotFound()
+        await self._apply_final_prices([dto])
         return self._attach_image_url(dto)
 
+    async def get_many(self, product_ids: List[int], view: str = "full") -> ProductBatchDTO:
+        """
+        Товары по списку id (корзина, избранное, виджеты рекомендаций).
+
+        Попадания отдаются из кэша read-модели, промахи дочитываются одним
+        пакетом; порядок — как в запросе, повторы id отбрасываются.
+        Без подсчёта total и прочих запросов выдачи каталога.
+        view=card — карточки товаров (ProductCardDTO).
+        """
+        if len(product_ids) > self.batch_max_ids:
+            raise ProductInvalidPayload(
+                details={"reason": "too_many_ids", "max_ids": self.batch_max_ids}
+            )
+
+        unique_ids = list(dict.fromkeys(product_ids))
+        items = await self.read_repository.get_many(unique_ids, view=view)
+        await self._apply_final_prices(items)
+
+        found = {item.id for item in items}
+        return ProductBatchDTO(
+            items=[self._attach_image_url(item) for item in items],
+            missing_ids=[product_id for product_id in unique_ids if product_id not in found],
+        )
+
     async def filter(
         self,
         name: Optional[str],
@@ -58,18 +116,114 @@ class ProductQueries:
             product_ids=product_ids,
             region_id=region_id,
         )
+        await self._apply_final_prices(items)
         return [self._attach_image_url(item) for item in items], total
 
+    async def filter_page(
+        self,
+        name: Optional[str],
+        category_id: Optional[int],
+        product_type_id: Optional[int],
+        limit: int,
+        offset: int,
+        attributes: Optional[dict[str, list[str]]] = None,
+        sort_type: str = "default",
+        product_ids: Optional[List[int]] = None,
+        region_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
+        view: str = "full",
+    ) -> ProductPageDTO:
+        """
+        Страница товаров с курсором на следующую страницу.
+
+        Если передан cursor, страница строится keyset-методом от позиции
+        курсора и offset игнорируется. Запрашиваем на один товар больше,
+        чтобы знать, есть ли следующая страница, без подсчёта total.
+        view=card — карточки товаров: репозиторий не загружает описание,
+        атрибуты, теги, категорию, поставщика, регион и неглавные изображения.
+        """
+        after = decode_cursor(cursor, sort_type) if cursor else None
+
+        items, total = await self.read_repository.filter(
+            name=name,
+            category_id=category_id,
+            product_type_id=product_type_id,
+            limit=limit + 1,
+            offset=offset,
+            attributes=attributes,
+            sort_type=sort_type,
+            product_ids=product_ids,
+            region_id=region_id,
+            after=after,
+            count_mode=count_mode,
+            view=view,
+        )
+
+        has_more = len(items) > limit
+        items = items[:limit]
+        # Курсор сортировки по цене строится по конечной цене
+        await self._apply_final_prices(items)
+
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(build_cursor(items[-1], sort_type))
+
+        return ProductPageDTO(
+            items=[self._attach_image_url(item) for item in items],
+            total=total,
+            next_cursor=next_cursor,
+            total_is_estimate=count_mode == "estimate",
+        )
+
     async def get_catalog_filters(
         self,
         category_id: Optional[int] = None,
         device_type_id: Optional[int] = None,
+        selected: Optional[dict[str, list[str]]] = None,
     ) -> CatalogFiltersDTO:
         return await self.read_repository.get_catalog_filters(
             category_id=category_id,
             device_type_id=device_type_id,
+            selected=selected,
         )
 
+    async def faceted_search(
+        self,
+        category_id: Optional[int],
+        product_type_id: Optional[int],
+        limit: int,
+        offset: int,
+        attributes: Optional[dict[str, list[str]]] = None,
+        sort_type: str = "default",
+        cursor: Optional[str] = None,
+        count_mode: str = "exact",
+    ) -> ProductFacetedPageDTO:
+        """
+        Страница товаров и фасеты каталога за один вызов.
+
+        Товары отбираются как в filter_page, фасеты — как в get_catalog_filters,
+        но с учётом выбранных attributes: значения каждого атрибута считаются
+        по товарам, прошедшим остальные выбранные фильтры.
+        """
+        page = await self.filter_page(
+            name=None,
+            category_id=category_id,
+            product_type_id=product_type_id,
+            limit=limit,
+            offset=offset,
+            attributes=attributes,
+            sort_type=sort_type,
+            cursor=cursor,
+            count_mode=count_mode,
+        )
+        filters = await self.get_catalog_filters(
+            category_id=category_id,
+            device_type_id=product_type_id,
+            selected=attributes,
+        )
+        return ProductFacetedPageDTO(page=page, filters=filters.filters)
+
     async def related(
         self,
         product_id: Optional[int],
@@ -94,27 +248,58 @@ class ProductQueries:
             category_id=aggregate.category_id,
         )
 
-        items = []
-        for related in related_aggregates:
-            dto = await self.read_repository.get_by_id(related.id)
-            if dto:
-                items.append(self._attach_image_url(dto))
-
-        return items
+        # Один пакетный запрос на все товары семейства, порядок сохраняется
+        items = await self.read_repository.get_many(
+            [related.id for related in related_aggregates]
+        )
+        await self._apply_final_prices(items)
+        return [self._attach_image_url(item) for item in items]
 
     async def search(
         self,
         query: str,
         limit: int = 10,
         offset: int = 0,
+        view: str = "full",
     ) -> ProductSearchDTO:
         result = await self.read_repository.search(
             query=query,
             limit=limit,
             offset=offset,
+            view=view,
         )
-        
+
+        await self._apply_final_prices(result.items)
+
         # Прикрепляем URL изображений
         result.items = [self._attach_image_url(item) for item in result.items]
-        
+
+        if result.total:
+            result.suggestions = await self.suggest(query)
+
         return result
+
+    async def suggest(self, query: str, limit: int = 5) -> list[SearchSuggestionDTO]:
+        """Подсказки следующего слова по всему каталогу."""
+        await self._sync_suggestion_index()
+        return self.suggestion_index.suggest(query.split(), limit=limit)
+
+    async def _sync_suggestion_index(self) -> None:
+        """Перечитать из БД товары, изменившиеся с прошлого обращения к индексу."""
+        await self.suggestion_index.sync(
+            self.read_repository.get_suggestion_documents,
+            self._get_deleted_ids,
+            self._get_watermark,
+        )
+
+    async def _get_deleted_ids(self, since: datetime) -> list[int]:
+        return [
+            row["product_id"]
+            for row in await self.read_repository.get_deleted_product_ids(since)
+        ]
+
+    async def _get_watermark(self) -> datetime:
+        return export_watermark(
+            await self.read_repository.get_export_watermark(),
+            get_settings().CATALOG_EXPORT_DELTA_OVERLAP_SECONDS,
+        )
@@ -1,6 +1,13 @@
-from typing import List, Optional, Tuple
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 
-from src.catalog.product.application.dto.product import ProductReadDTO, CatalogFiltersDTO, ProductSearchDTO
+from src.catalog.category.application.read_models.pricing import PriceFormulas
+from src.catalog.product.application.dto.product import (
+    CatalogFiltersDTO,
+    ProductCursorDTO,
+    ProductReadDTO,
+    ProductSearchDTO,
+)
 from src.catalog.product.domain.repository.product_read import (
     ProductReadRepositoryInterface,
 )
@@ -21,6 +28,13 @@ class ProductReadRepository:
     async def get_by_name(self, name: str) -> Optional[ProductReadDTO]:
         return await self._repository.get_by_name(name)
 
+    async def get_many(
+        self,
+        product_ids: list[int],
+        view: str = "full",
+    ) -> list[ProductReadDTO]:
+        return await self._repository.get_many(product_ids, view=view)
+
     async def filter(
         self,
         name: Optional[str],
@@ -32,7 +46,10 @@ class ProductReadRepository:
         sort_type: str = "default",
         product_ids: Optional[List[int]] = None,
         region_id: Optional[int] = None,
-    ) -> Tuple[List[ProductReadDTO], int]:
+        after: Optional[ProductCursorDTO] = None,
+        count_mode: str = "exact",
+        view: str = "full",
+    ) -> Tuple[List[ProductReadDTO], Optional[int]]:
         return await self._repository.filter(
             name=name,
             category_id=category_id,
@@ -43,29 +60,61 @@ class ProductReadRepository:
             sort_type=sort_type,
             product_ids=product_ids,
             region_id=region_id,
+            after=after,
+            count_mode=count_mode,
+            view=view,
         )
 
     async def get_catalog_filters(
         self,
         category_id: Optional[int] = None,
         device_type_id: Optional[int] = None,
+        selected: Optional[dict[str, list[str]]] = None,
     ) -> CatalogFiltersDTO:
         return await self._repository.get_catalog_filters(
             category_id=category_id,
             device_type_id=device_type_id,
+            selected=selected,
         )
 
-    async def export_full_catalog(self):
-        return await self._repository.export_full_catalog()
+    async def export_full_catalog(self, updated_since: Optional[datetime] = None):
+        return await self._repository.export_full_catalog(updated_since=updated_since)
+
+    def stream_full_catalog(
+        self,
+        chunk_size: int = 1000,
+        updated_since: Optional[datetime] = None,
+    ) -> AsyncIterator[list]:
+        return self._repository.stream_full_catalog(
+            chunk_size=chunk_size,
+            updated_since=updated_since,
+        )
+
+    async def get_deleted_product_ids(self, since: datetime) -> list:
+        return await self._repository.get_deleted_product_ids(since)
+
+    async def get_export_watermark(self) -> datetime:
+        return await self._repository.get_export_watermark()
 
     async def search(
         self,
         query: str,
         limit: int = 10,
         offset: int = 0,
+        view: str = "full",
     ) -> ProductSearchDTO:
         return await self._repository.search(
             query=query,
             limit=limit,
             offset=offset,
-        )
\ No newline at end of file
+            view=view,
+        )
+    async def get_suggestion_documents(
+        self,
+        product_ids: Optional[list[int]] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> dict[int, list[str]]:
+        return await self._repository.get_suggestion_documents(product_ids, updated_since)
+
+    async def get_price_formulas(self) -> PriceFormulas:
+        return await self._repository.get_price_formulas()
@@ -0,0 +1,112 @@
+"""
+JSON-совместимый снимок ProductReadDTO.
+
+Общий формат для кэша read-модели (CachedProductReadRepository) и
+проекции product_read_model: снимок из любого источника
+восстанавливается в тот же ProductReadDTO. Из того же снимка строится
+и карточка товара (ProductCardDTO) для view=card.
+"""
+from dataclasses import asdict
+from decimal import Decimal
+from typing import Any
+
+from src.catalog.category.domain.aggregates.category import CategoryAggregate
+from src.catalog.product.application.dto.product import (
+    ProductAttributeReadDTO,
+    ProductCardDTO,
+    ProductImageReadDTO,
+    ProductRatingDTO,
+    ProductReadDTO,
+    TagReadDTO,
+)
+from src.catalog.suppliers.domain.aggregates.supplier import SupplierAggregate
+from src.regions.domain.aggregates.region import RegionAggregate
+
+
+def product_to_snapshot(dto: ProductReadDTO) -> dict[str, Any]:
+    category = dto.category
+    supplier = dto.supplier
+    region = dto.region
+    return {
+        "id": dto.id,
+        "name": dto.name,
+        "description": dto.description,
+        "price": str(dto.price),
+        "rating": asdict(dto.rating) if dto.rating else None,
+        "images": [asdict(image) for image in dto.images],
+        "attributes": [asdict(attribute) for attribute in dto.attributes],
+        "tags": [asdict(tag) for tag in dto.tags],
+        "category": {
+            "id": category.id,
+            "name": category.name,
+            "description": category.description,
+            "parent_id": category.parent_id,
+            "manufacturer_id": category.manufacturer_id,
+            "device_type_id": category.device_type_id,
+        } if category else None,
+        "supplier": {
+            "id": supplier.id,
+            "name": supplier.name,
+            "contact_email": supplier.contact_email,
+            "phone": supplier.phone,
+        } if supplier else None,
+        "region": {
+            "id": region.id,
+            "name": region.name,
+            "parent_id": region.parent_id,
+        } if region else None,
+    }
+
+
+def product_from_snapshot(data: dict[str, Any]) -> ProductReadDTO:
+    category = data["category"]
+    supplier = data["supplier"]
+    region = data["region"]
+    return ProductReadDTO(
+        id=data["id"],
+        name=data["name"],
+        description=data["description"],
+        price=Decimal(data["price"]),
+        rating=ProductRatingDTO(**data["rating"]) if data["rating"] else None,
+        images=[ProductImageReadDTO(**image) for image in data["images"]],
+        attributes=[
+            ProductAttributeReadDTO(**attribute)
+            for attribute in data["attributes"]
+        ],
+        tags=[TagReadDTO(**tag) for tag in data["tags"]],
+        category=CategoryAggregate(
+            category_id=category["id"],
+            name=category["name"],
+            description=category["description"],
+            parent_id=category["parent_id"],
+            manufacturer_id=category["manufacturer_id"],
+            device_type_id=category["device_type_id"],
+        ) if category else None,
+        supplier=SupplierAggregate(
+            supplier_id=supplier["id"],
+            name=supplier["name"],
+            contact_email=supplier["contact_email"],
+            phone=supplier["phone"],
+        ) if supplier else None,
+        region=RegionAggregate(
+            region_id=region["id"],
+            name=region["name"],
+            parent_id=region["parent_id"],
+        ) if region else None,
+    )
+
+
+def product_card_from_snapshot(data: dict[str, Any]) -> ProductCardDTO:
+    category = data["category"]
+    return ProductCardDTO(
+        id=data["id"],
+        name=data["name"],
+        price=Decimal(data["price"]),
+        category_id=category["id"] if category else None,
+        rating=ProductRatingDTO(**data["rating"]) if data["rating"] else None,
+        images=[
+            ProductImageReadDTO(**image)
+            for image in data["images"]
+            if image["is_main"]
+        ][:1],
+    )
@@ -0,0 +1,417 @@
+import heapq
+from bisect import bisect_left, insort
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from itertools import dropwhile, groupby, islice
+from typing import Any, Iterable, Iterator, Optional
+
+from src.catalog.category.application.read_models.pricing import (
+    PriceFormula,
+    PriceFormulas,
+)
+from src.catalog.product.application.dto.product import ProductCursorDTO
+from src.catalog.product.application.services.incremental_index import (
+    IncrementalIndex,
+    IncrementalIndexUpdater,
+)
+from src.core.conf.settings import get_settings
+
+# Номера установленных битов для каждого значения байта
+_BYTE_BITS = tuple(
+    tuple(bit for bit in range(8) if byte >> bit & 1)
+    for byte in range(256)
+)
+
+
+def iter_bits(bitmap: int) -> Iterator[int]:
+    """Номера установленных битов по возрастанию (id товаров)."""
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for offset, byte in enumerate(data):
+        if byte:
+            base = offset * 8
+            for bit in _BYTE_BITS[byte]:
+                yield base + bit
+
+
+def bitmap_of(ids: Iterable[int]) -> int:
+    """
+    Битовая карта из id за один проход: биты ставятся в bytearray, целое
+    собирается один раз. Цикл bitmap |= 1 << id копировал бы всю карту
+    на каждом id.
+    """
+    ids = list(ids)
+    if not ids:
+        return 0
+    data = bytearray((max(ids) >> 3) + 1)
+    for product_id in ids:
+        data[product_id >> 3] |= 1 << (product_id & 7)
+    return int.from_bytes(data, "little")
+
+
+@dataclass(frozen=True)
+class ProductIndexDocument:
+    """Данные товара, по которым индекс отвечает на фильтры и фасеты."""
+    category_id: Optional[int]
+    region_id: Optional[int]
+    price: Decimal
+    # Все пары (атрибут, значение) товара
+    attributes: frozenset[tuple[str, str]]
+
+
+class ProductBitmapIndex(IncrementalIndex):
+    """
+    Инвертированный индекс товаров на битовых картах (в памяти воркера).
+
+    Битовая карта — целое число, где бит N установлен, если товар с id N
+    подходит под ключ. Ключи: категория, регион, пара (атрибут, значение).
+    Фильтр — AND/OR карт, total — число установленных битов, страница —
+    первые биты результата в порядке сортировки (по id или по цене).
+    Для фасетов без выбранных фильтров дополнительно хранятся готовые
+    счётчики пар по категориям. В фасеты попадают атрибуты из set_filterable:
+    флаг is_filterable принадлежит атрибуту справочника, а не товару, поэтому
+    его смена не требует перечитывать товары.
+
+    Изменения применяются пачкой: для каждой затронутой карты снятые
+    и поставленные биты собираются в две карты и применяются одной
+    операцией, поэтому и полная сборка линейна по числу товаров.
+
+    Для сортировки по цене поддерживается список (цена, id) по возрастанию:
+    страница по цене — проход списка с отбором id результата, без сортировки
+    всех подходящих товаров на каждый запрос.
+
+    Синхронизация с БД (пометки событий и опрос изменений других
+    воркеров) — см. IncrementalIndex.
+    """
+
+    def __init__(self, poll_interval: float):
+        super().__init__(poll_interval)
+        self._documents: dict[int, ProductIndexDocument] = {}
+        # Все товары индекса — основа фильтра без категорий
+        self._all = 0
+        self._by_category: dict[int, int] = {}
+        self._by_region: dict[int, int] = {}
+        self._by_attribute: dict[tuple[str, str], int] = {}
+        # Счётчики пар по категориям — фасеты без выбранных фильтров
+        self._counts: dict[int, dict[tuple[str, str], int]] = defaultdict(lambda: defaultdict(int))
+        self._filterable: frozenset[str] = frozenset()
+        # (исходная цена, id) всех товаров по возрастанию — порядок price_asc
+        self._by_price: list[tuple[Decimal, int]] = []
+
+    def _install(self, fresh: "ProductBitmapIndex") -> None:
+        self._documents = fresh._documents
+        self._all = fresh._all
+        self._by_price = fresh._by_price
+        self._by_category = fresh._by_category
+        self._by_region = fresh._by_region
+        self._by_attribute = fresh._by_attribute
+        self._counts = fresh._counts
+
+    def set_filterable(self, names: Iterable[str]) -> None:
+        """Имена filterable-атрибутов справочника (попадают в фасеты)."""
+        self._filterable = frozenset(names)
+
+    # ---------- изменение ----------
+
+    def apply(
+        self,
+        documents: dict[int, ProductIndexDocument],
+        removed: Iterable[int],
+        watermark: Optional[datetime] = None,
+    ) -> None:
+        cleared: dict[tuple[str, Any], list[int]] = defaultdict(list)
+        added: dict[tuple[str, Any], list[int]] = defaultdict(list)
+        unpriced: list[tuple[Decimal, int]] = []
+
+        for product_id in (*removed, *documents):
+            document = self._documents.pop(product_id, None)
+            if document is None:
+                continue
+            unpriced.append((document.price, product_id))
+            cleared[("_all", None)].append(product_id)
+            for key in self._keys(document):
+                cleared[key].append(product_id)
+            self._count(document, -1)
+
+        for product_id, document in documents.items():
+            self._documents[product_id] = document
+            added[("_all", None)].append(product_id)
+            for key in self._keys(document):
+                added[key].append(product_id)
+            self._count(document, 1)
+
+        for name, key in cleared.keys() | added.keys():
+            mask = ~bitmap_of(cleared.get((name, key), ()))
+            bits = bitmap_of(added.get((name, key), ()))
+            if name == "_all":
+                self._all = self._all & mask | bits
+                continue
+            bitmaps = getattr(self, name)
+            bitmap = bitmaps.get(key, 0) & mask | bits
+            if bitmap:
+                bitmaps[key] = bitmap
+            else:
+                bitmaps.pop(key, None)
+
+        self._reprice(unpriced, documents)
+        self._synced(watermark)
+
+    def _reprice(
+        self,
+        unpriced: list[tuple[Decimal, int]],
+        documents: dict[int, ProductIndexDocument],
+    ) -> None:
+        """
+        Обновление списка по цене: точечно (bisect) для небольшой пачки,
+        одной сортировкой — для крупной и полной сборки.
+        """
+        if (len(unpriced) + len(documents)) * 8 > len(self._by_price):
+            self._by_price = sorted(
+                (document.price, product_id)
+                for product_id, document in self._documents.items()
+            )
+            return None
+        for entry in unpriced:
+            del self._by_price[bisect_left(self._by_price, entry)]
+        for product_id, document in documents.items():
+            insort(self._by_price, (document.price, product_id))
+
+    def upsert(self, product_id: int, document: ProductIndexDocument) -> None:
+        self.apply({product_id: document}, ())
+
+    def remove(self, product_id: int) -> None:
+        self.apply({}, (product_id,))
+
+    @staticmethod
+    def _keys(document: ProductIndexDocument) -> Iterator[tuple[str, Any]]:
+        """Карты товара: (имя словаря карт, ключ)."""
+        if document.category_id is not None:
+            yield "_by_category", document.category_id
+        if document.region_id is not None:
+            yield "_by_region", document.region_id
+        for pair in document.attributes:
+            yield "_by_attribute", pair
+
+    def _count(self, document: ProductIndexDocument, delta: int) -> None:
+        if document.category_id is None:
+            return None
+        counts = self._counts[document.category_id]
+        for pair in document.attributes:
+            counts[pair] += delta
+            if counts[pair] <= 0:
+                del counts[pair]
+        if not counts:
+            del self._counts[document.category_id]
+
+    # ---------- фильтры ----------
+
+    def category_bitmap(self, category_ids: Iterable[int]) -> int:
+        bitmap = 0
+        for category_id in category_ids:
+            bitmap |= self._by_category.get(category_id, 0)
+        return bitmap
+
+    def match(
+        self,
+        category_ids: Optional[Iterable[int]] = None,
+        attributes: Optional[dict[str, list[str]]] = None,
+        product_ids: Optional[Iterable[int]] = None,
+        region_id: Optional[int] = None,
+    ) -> int:
+        """
+        Битовая карта товаров, подходящих под все условия: категория из
+        category_ids, регион, id из product_ids и для каждого атрибута
+        хотя бы одно из значений.
+        """
+        bitmap = self._all if category_ids is None else self.category_bitmap(category_ids)
+        if region_id is not None:
+            bitmap &= self._by_region.get(region_id, 0)
+        if product_ids:
+            bitmap &= bitmap_of(product_ids)
+        for name, values in (attributes or {}).items():
+            if not bitmap:
+                break
+            bitmap &= self._attribute_bitmap(name, values)
+        return bitmap
+
+    def _attribute_bitmap(self, name: str, values: Iterable[str]) -> int:
+        bitmap = 0
+        for value in values:
+            bitmap |= self._by_attribute.get((name, value), 0)
+        return bitmap
+
+    def page(
+        self,
+        bitmap: int,
+        sort_type: str,
+        limit: int,
+        offset: int = 0,
+        after: Optional[ProductCursorDTO] = None,
+        formulas: Optional[PriceFormulas] = None,
+    ) -> list[int]:
+        """
+        Id товаров страницы в том же порядке, что и SQL-фильтр:
+        по id, по (цена, id) или по (цена убыв., id). С after — строго после
+        позиции курсора, offset при этом не используется. С formulas цена
+        сортировки — конечная, по политикам категорий.
+        """
+        if after is not None:
+            offset = 0
+
+        if sort_type not in ("price_asc", "price_desc"):
+            if after is not None:
+                bitmap &= ~((1 << (after.id + 1)) - 1)
+            page = []
+            for position, product_id in enumerate(iter_bits(bitmap)):
+                if position < offset:
+                    continue
+                if len(page) >= limit:
+                    break
+                page.append(product_id)
+            return page
+
+        sign = 1 if sort_type == "price_asc" else -1
+        matched = set(iter_bits(bitmap))
+        if len(matched) * 8 < len(self._by_price):
+            # Малый результат дешевле отсортировать, чем пройти весь список
+            keys = iter(self._sorted_keys(matched, sign, formulas))
+        else:
+            keys = self._listed_keys(matched, sign, formulas)
+        if after is not None:
+            position = (sign * after.price, after.id)
+            keys = dropwhile(lambda key: key <= position, keys)
+        return [product_id for _, product_id in islice(keys, offset, offset + limit)]
+
+    def _sorted_keys(
+        self,
+        matched: set[int],
+        sign: int,
+        formulas: Optional[PriceFormulas],
+    ) -> list[tuple[Decimal, int]]:
+        product_ids = sorted(matched)
+        documents = [self._documents[product_id] for product_id in product_ids]
+        if formulas:
+            prices = formulas.final_prices(
+                (document.price, document.category_id) for document in documents
+            )
+        else:
+            prices = [document.price for document in documents]
+        return sorted(
+            (sign * price, product_id) for price, product_id in zip(prices, product_ids)
+        )
+
+    def _listed_keys(
+        self,
+        matched: set[int],
+        sign: int,
+        formulas: Optional[PriceFormulas],
+    ) -> Iterator[tuple[Decimal, int]]:
+        """
+        Ключи (цена со знаком, id) по порядку из списка по цене. Конечная
+        цена монотонна по исходной в пределах формулы, поэтому список
+        делится на потоки по формулам, а потоки сливаются heapq.merge.
+        """
+        entries = self._by_price if sign > 0 else reversed(self._by_price)
+        if not formulas:
+            return self._ordered(
+                (sign * price, product_id)
+                for price, product_id in entries
+                if product_id in matched
+            )
+
+        streams: dict[PriceFormula, list[tuple[Decimal, int]]] = defaultdict(list)
+        for price, product_id in entries:
+            if product_id in matched:
+                formula = formulas.for_category(self._documents[product_id].category_id)
+                streams[formula].append((price, product_id))
+        return heapq.merge(*(
+            self._ordered(self._final_keys(stream, formula, sign))
+            for formula, stream in streams.items()
+        ))
+
+    @staticmethod
+    def _final_keys(
+        stream: list[tuple[Decimal, int]],
+        formula: PriceFormula,
+        sign: int,
+    ) -> Iterator[tuple[Decimal, int]]:
+        for price, product_id in stream:
+            yield sign * (price if formula.is_identity else formula.apply(price)), product_id
+
+    @staticmethod
+    def _ordered(keys: Iterator[tuple[Decimal, int]]) -> Iterator[tuple[Decimal, int]]:
+        """
+        Равные цены — по возрастанию id: при обратном проходе id идут
+        по убыванию, а округление сводит разные исходные цены к одной.
+        """
+        for _, group in groupby(keys, key=lambda key: key[0]):
+            yield from sorted(group)
+
+    # ---------- фасеты ----------
+
+    def facets(
+        self,
+        category_ids: Iterable[int],
+        selected: Optional[dict[str, list[str]]] = None,
+    ) -> dict[str, dict[str, int]]:
+        """
+        Число товаров по filterable-атрибуту и значению среди товаров
+        указанных категорий.
+
+        С selected (выбранные пользователем значения: внутри атрибута — ИЛИ,
+        между атрибутами — И) счётчики «дизъюнктивные»: значения каждого
+        атрибута считаются по товарам, прошедшим все остальные выбранные
+        фильтры, а выбор в самом атрибуте не учитывается. Выбранные значения
+        без товаров возвращаются с нулём.
+        """
+        category_ids = list(category_ids)
+        result: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+        pairs: set[tuple[str, str]] = set()
+        for category_id in category_ids:
+            for pair, count in self._counts.get(category_id, {}).items():
+                if pair[0] not in self._filterable:
+                    continue
+                result[pair[0]][pair[1]] += count
+                pairs.add(pair)
+        if not selected:
+            return result
+
+        scope = self.category_bitmap(category_ids)
+        matches = {
+            name: self._attribute_bitmap(name, values) & scope
+            for name, values in selected.items()
+        }
+
+        bases: dict[str, int] = {}
+        for name in {pair[0] for pair in pairs} | set(selected):
+            base = scope
+            for other, matched in matches.items():
+                if other != name:
+                    base &= matched
+            bases[name] = base
+
+        result.clear()
+        for name, value in pairs:
+            count = (self._by_attribute[(name, value)] & bases[name]).bit_count()
+            if count:
+                result[name][value] = count
+        for name, values in selected.items():
+            counts = result[name]
+            for value in values:
+                counts.setdefault(value, 0)
+        return result
+
+
+class ProductBitmapIndexUpdater(IncrementalIndexUpdater):
+    """
+    Пометка изменений индекса товаров по событиям шины: товар перечитывается
+    при изменении категории, региона, цены, атрибутов или удалении.
+    """
+
+
+@lru_cache
+def get_product_bitmap_index() -> ProductBitmapIndex:
+    return ProductBitmapIndex(poll_interval=get_settings().PRODUCT_INDEX_POLL_SECONDS)
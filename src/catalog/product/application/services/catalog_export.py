@@ -0,0 +1,178 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, AsyncIterator, Iterable, Mapping, Optional
+
+from src.catalog.category.application.read_models.pricing import PriceFormulas
+
+EXPORT_CSV_COLUMNS = (
+    "id",
+    "name",
+    "price",
+    "final_price",
+    "description",
+    "category_id",
+    "category_name",
+    "parent_categories",
+    "supplier_id",
+    "supplier_name",
+    "region_id",
+    "region_name",
+    "attributes",
+    "tags",
+    "deleted",
+)
+
+
+def export_watermark(db_now: datetime, overlap_seconds: int) -> datetime:
+    """
+    Отметка для следующей инкрементальной выгрузки (updated_since).
+
+    Сдвигаем назад на overlap_seconds: транзакции, начатые до выгрузки
+    и закоммиченные после неё, попадут в следующую выгрузку. Повтор
+    товара в двух выгрузках безопасен — потребитель делает upsert по id.
+    """
+    return db_now - timedelta(seconds=overlap_seconds)
+
+
+def tombstone_to_dict(row: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "id": row["product_id"],
+        "deleted": True,
+        "deleted_at": row["deleted_at"].isoformat(),
+    }
+
+
+def final_prices(
+    rows: Iterable[Mapping[str, Any]],
+    formulas: Optional[PriceFormulas] = None,
+) -> list[Decimal]:
+    """Конечные цены строк выгрузки (без политик — исходные цены)."""
+    if not formulas:
+        return [row["price"] for row in rows]
+    return formulas.final_prices((row["price"], row["category_id"]) for row in rows)
+
+
+def export_row_to_dict(
+    row: Mapping[str, Any],
+    final_price: Optional[Decimal] = None,
+) -> dict[str, Any]:
+    """
+    Строка выгрузки в JSON-совместимый словарь той же формы,
+    что ExportProductSchema в обычной (не потоковой) выгрузке.
+    """
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "price": str(row["price"]),
+        "final_price": str(row["price"] if final_price is None else final_price),
+        "description": row.get("description"),
+        "category": {
+            "id": row["category_id"],
+            "name": row["category_name"],
+            "parent_categories": row.get("parent_categories") or [],
+        } if row["category_id"] else None,
+        "supplier": {
+            "id": row["supplier_id"],
+            "name": row["supplier_name"],
+        } if row["supplier_id"] else None,
+        "region": {
+            "id": row["region_id"],
+            "name": row["region_name"],
+        } if row["region_id"] and row.get("region_name") else None,
+        "attributes": row.get("attributes") or [],
+        "tags": row.get("tags") or [],
+    }
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+async def iter_ndjson(
+    chunks: AsyncIterator[list],
+    tombstones: Iterable[Mapping[str, Any]] = (),
+    formulas: Optional[PriceFormulas] = None,
+) -> AsyncIterator[bytes]:
+    """
+    NDJSON: один товар на строку, один блок байт на пачку строк.
+    Удалённые товары идут в конце строками {"id", "deleted": true, "deleted_at"}.
+    Конечные цены (formulas) считаются на всю пачку сразу.
+    """
+    async for chunk in chunks:
+        lines = [
+            json.dumps(export_row_to_dict(row, price), ensure_ascii=False, default=_json_default)
+            for row, price in zip(chunk, final_prices(chunk, formulas))
+        ]
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+    lines = [json.dumps(tombstone_to_dict(row)) for row in tombstones]
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def iter_csv(
+    chunks: AsyncIterator[list],
+    tombstones: Iterable[Mapping[str, Any]] = (),
+    formulas: Optional[PriceFormulas] = None,
+) -> AsyncIterator[bytes]:
+    """
+    CSV с заголовком. Вложенные структуры (атрибуты, теги, родительские
+    категории) пишутся в ячейку как JSON. Удалённые товары идут в конце
+    строками, где заполнены только id и deleted.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(EXPORT_CSV_COLUMNS)
+    yield buffer.getvalue().encode("utf-8")
+
+    async for chunk in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        for row, price in zip(chunk, final_prices(chunk, formulas)):
+            writer.writerow(
+                (
+                    row["id"],
+                    row["name"],
+                    row["price"],
+                    price,
+                    row.get("description") or "",
+                    row["category_id"] or "",
+                    row["category_name"] or "",
+                    json.dumps(row.get("parent_categories") or [], ensure_ascii=False),
+                    row["supplier_id"] or "",
+                    row["supplier_name"] or "",
+                    row["region_id"] or "",
+                    row["region_name"] or "",
+                    json.dumps(row.get("attributes") or [], ensure_ascii=False),
+                    json.dumps(row.get("tags") or [], ensure_ascii=False),
+                    "false",
+                )
+            )
+        if chunk:
+            yield buffer.getvalue().encode("utf-8")
+
+    buffer.seek(0)
+    buffer.truncate()
+    empty = ("",) * (len(EXPORT_CSV_COLUMNS) - 2)
+    for row in tombstones:
+        writer.writerow((row["product_id"], *empty, "true"))
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def gzip_stream(stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Сжатие потока в gzip на лету, без накопления всего файла в памяти."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    async for block in stream:
+        compressed = compressor.compress(block)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,195 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+
+class IncrementalIndex:
+    """
+    Основа индексов товаров в памяти воркера, которые обновляются
+    инкрементально.
+
+    События шины только помечают товары изменёнными (mark_dirty) или
+    требуют полную перестройку (mark_stale); перечитывает их тот, кто
+    следующим обращается к индексу (sync), в своей сессии БД. Изменения,
+    сделанные другими воркерами, подбираются опросом products.updated_at
+    и product_tombstones не чаще раза в poll_interval секунд.
+
+    Наследники реализуют apply(documents, removed) и _install(fresh).
+    Полная перестройка собирает индекс в новом экземпляре (в sync — в пуле
+    потоков, не блокируя event loop) и подменяет структуры целиком, так что
+    запросы не видят пустой или недостроенный индекс.
+    """
+
+    def __init__(self, poll_interval: float):
+        self._poll_interval = poll_interval
+        self._dirty: set[int] = set()
+        self._stale = True
+        self._watermark: Optional[datetime] = None
+        self._polled_at: Optional[float] = None
+        self.lock = asyncio.Lock()
+
+    # ---------- синхронизация с БД ----------
+
+    def mark_dirty(self, product_ids: Iterable[int]) -> None:
+        self._dirty.update(product_ids)
+
+    def mark_stale(self) -> None:
+        """Потребовать полную перестройку при следующем обращении."""
+        self._stale = True
+
+    def take_pending(self) -> tuple[bool, set[int], Optional[datetime]]:
+        """
+        Забрать накопленные изменения: (нужна полная перестройка, id товаров,
+        отметка для опроса изменений других воркеров или None, если опрос
+        ещё не нужен).
+
+        Вызывается без await между чтением и сбросом, поэтому два запроса
+        не перечитают одни и те же изменения дважды.
+        """
+        stale, dirty = self._stale, self._dirty
+        self._stale = False
+        self._dirty = set()
+
+        since = None
+        now = time.monotonic()
+        if (
+            not stale
+            and self._watermark is not None
+            and (self._polled_at is None or now - self._polled_at >= self._poll_interval)
+        ):
+            since = self._watermark
+            self._polled_at = now
+        return stale, dirty, since
+
+    def restore_pending(self, stale: bool, dirty: set[int], since: Optional[datetime]) -> None:
+        """Вернуть забранные изменения после неудачной синхронизации."""
+        if stale:
+            self._stale = True
+        self._dirty.update(dirty)
+        if since is not None:
+            self._polled_at = None
+
+    def reset(self) -> None:
+        self._clear()
+        self._dirty.clear()
+        self._stale = True
+        self._watermark = None
+        self._polled_at = None
+        self.lock = asyncio.Lock()
+
+    async def sync(
+        self,
+        load_documents: Callable[..., Awaitable[dict[int, Any]]],
+        load_deleted_ids: Callable[[datetime], Awaitable[Iterable[int]]],
+        load_watermark: Callable[[], Awaitable[datetime]],
+    ) -> None:
+        """
+        Применить к индексу изменения товаров: помеченные событиями этого
+        воркера и (по опросу) изменённые или удалённые другими воркерами.
+
+        load_documents(product_ids=None, updated_since=None) — документы
+        товаров (без аргументов — весь каталог), load_deleted_ids(since) —
+        id удалённых с since товаров, load_watermark() — отметка, с которой
+        начнётся следующий опрос.
+        """
+        async with self.lock:
+            stale, dirty, since = self.take_pending()
+            if not stale and not dirty and since is None:
+                return None
+
+            try:
+                watermark = None
+                if stale or since is not None:
+                    watermark = await load_watermark()
+
+                if stale:
+                    documents = await load_documents()
+                else:
+                    documents = {}
+                    removed: set[int] = set()
+                    if dirty:
+                        documents.update(await load_documents(product_ids=sorted(dirty)))
+                        # Помеченных, но не найденных товаров больше нет
+                        removed |= dirty - documents.keys()
+                    if since is not None:
+                        documents.update(await load_documents(updated_since=since))
+                        removed |= set(await load_deleted_ids(since))
+            except Exception:
+                # Не теряем изменения: их подберёт следующий запрос
+                self.restore_pending(stale, dirty, since)
+                raise
+
+            if stale:
+                fresh = await asyncio.get_running_loop().run_in_executor(
+                    None, self._build, documents
+                )
+                self._install(fresh)
+                self._synced(watermark, rebuilt=True)
+            else:
+                self.apply(documents, removed, watermark)
+
+    def _synced(self, watermark: Optional[datetime], rebuilt: bool = False) -> None:
+        """Запомнить отметку, с которой опрашивать изменения других воркеров."""
+        if watermark is not None:
+            self._watermark = watermark
+        if rebuilt:
+            self._polled_at = time.monotonic()
+
+    # ---------- изменение ----------
+
+    def rebuild(self, documents: dict[int, Any], watermark: Optional[datetime] = None) -> None:
+        self._install(self._build(documents))
+        self._synced(watermark, rebuilt=True)
+
+    def apply(
+        self,
+        documents: dict[int, Any],
+        removed: Iterable[int],
+        watermark: Optional[datetime] = None,
+    ) -> None:
+        """Заменить документы пачки товаров и удалить removed."""
+        raise NotImplementedError
+
+    def _build(self, documents: dict[int, Any]) -> "IncrementalIndex":
+        """Собрать индекс по всем документам в новом экземпляре (self не меняется)."""
+        fresh = type(self)(self._poll_interval)
+        fresh.apply(documents, ())
+        return fresh
+
+    def _install(self, fresh: "IncrementalIndex") -> None:
+        """Подменить структуры индекса собранными в fresh."""
+        raise NotImplementedError
+
+    def _clear(self) -> None:
+        self._install(type(self)(self._poll_interval))
+
+
+class IncrementalIndexUpdater:
+    """
+    Пометка изменений индекса по событиям шины.
+
+    - изменения товара — товар перечитывается
+    - массовый импорт и пакетное обновление — перечитываются товары пачки (data.product_ids)
+    - изменения справочника атрибутов (имя, is_filterable) — полная перестройка
+    """
+
+    PRODUCT_ENTITIES = {"product"}
+    PRODUCT_BATCH_ENTITIES = {"product_import", "product_bulk_update"}
+    GLOBAL_ENTITIES = {"product_attribute"}
+
+    def __init__(self, index: IncrementalIndex):
+        self._index = index
+
+    async def handle(self, message: dict[str, Any]) -> None:
+        entity = message.get("entity")
+
+        if entity in self.GLOBAL_ENTITIES:
+            self._index.mark_stale()
+            return None
+
+        if entity in self.PRODUCT_ENTITIES and message.get("entity_id"):
+            self._index.mark_dirty([message["entity_id"]])
+
+        if entity in self.PRODUCT_BATCH_ENTITIES:
+            self._index.mark_dirty((message.get("data") or {}).get("product_ids") or [])
@@ -0,0 +1,55 @@
+import base64
+import binascii
+import json
+from decimal import Decimal, InvalidOperation
+from typing import Optional
+
+from src.catalog.product.application.dto.product import ProductCursorDTO, ProductReadDTO
+from src.catalog.product.domain.exceptions import ProductInvalidPayload
+
+PRICE_SORT_TYPES = ("price_asc", "price_desc")
+
+
+def build_cursor(item: ProductReadDTO, sort_type: str) -> ProductCursorDTO:
+    """
+    Построить позицию курсора по последнему товару страницы.
+
+    Сортировка по цене идёт по конечной цене (политики категорий),
+    поэтому в курсор попадает она, если уже проставлена.
+    """
+    price = None
+    if sort_type in PRICE_SORT_TYPES:
+        price = item.price if item.final_price is None else item.final_price
+    return ProductCursorDTO(sort_type=sort_type, id=item.id, price=price)
+
+
+def encode_cursor(cursor: ProductCursorDTO) -> str:
+    """
+    Закодировать курсор в непрозрачную строку.
+
+    Для сортировки по цене в курсор входит пара (price, id), иначе только id.
+    """
+    payload = {"s": cursor.sort_type, "i": cursor.id}
+    if cursor.price is not None:
+        payload["p"] = str(cursor.price)
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, sort_type: str) -> ProductCursorDTO:
+    """Раскодировать курсор; курсор от другой сортировки недействителен."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor_sort = payload["s"]
+        product_id = int(payload["i"])
+        price: Optional[Decimal] = Decimal(payload["p"]) if "p" in payload else None
+    except (binascii.Error, ValueError, TypeError, KeyError, InvalidOperation):
+        raise ProductInvalidPayload(details={"reason": "invalid_cursor"})
+
+    if cursor_sort != sort_type:
+        raise ProductInvalidPayload(details={"reason": "cursor_sort_mismatch"})
+    if sort_type in PRICE_SORT_TYPES and price is None:
+        raise ProductInvalidPayload(details={"reason": "invalid_cursor"})
+
+    return ProductCursorDTO(sort_type=sort_type, id=product_id, price=price)
@@ -0,0 +1,266 @@
+"""
+Разбор и построчная проверка файла массового импорта товаров.
+
+Строка файла — товар в той же форме, что и в потоковой выгрузке
+(catalog_export.py), поэтому выгрузку можно загрузить обратно:
+- id — обновить товар; без id — создать новый
+- name, price — обязательны
+- description, category_id, supplier_id, region_id (или category/supplier/region
+  как {"id": ...}, как в NDJSON-выгрузке) — необязательны
+- attributes — [{"name", "value", "is_filterable"?, "is_groupable"?}]
+- images — [{"upload_id", "is_main"?, "ordering"?}]
+- tags — [tag_id, ...] или [{"tag_id", ...}]
+
+В CSV вложенные списки — JSON в ячейке. Пустая ячейка (или отсутствие
+ключа в NDJSON) для attributes/images/tags — оставить как есть,
+пустой список — удалить все.
+
+Здесь только проверки без БД. Существование категорий, поставщиков,
+регионов, загрузок, тегов и обновляемых товаров команда проверяет
+пачками (ImportProductsCommand).
+"""
+import csv
+import json
+from decimal import Decimal
+from itertools import islice
+from typing import Any, Iterable, Iterator, TypeVar
+
+from src.catalog.product.application.dto.product_import import (
+    ProductImportAttributeDTO,
+    ProductImportImageDTO,
+    ProductImportRowDTO,
+)
+from src.catalog.product.domain.value_objects import (
+    MAX_PRICE,
+    InvalidProductName,
+    Money,
+    MoneyError,
+    ProductName,
+)
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+# String(100) / String(255) в product_attributes / product_attribute_values
+MAX_ATTRIBUTE_NAME_LENGTH = 100
+MAX_ATTRIBUTE_VALUE_LENGTH = 255
+
+T = TypeVar("T")
+
+
+class ProductImportRowError(Exception):
+    """Строка файла не прошла проверку и не импортируется."""
+
+    def __init__(self, row: int, reason: str, **details: Any):
+        super().__init__(f"row {row}: {reason}")
+        self.row = row
+        self.reason = reason
+        self.details = details
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"row": self.row, "reason": self.reason, **self.details}
+
+
+def iter_batches(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def iter_import_rows(
+    lines: Iterable[str],
+    format: str,
+) -> Iterator[ProductImportRowDTO | ProductImportRowError]:
+    """
+    Строки файла по одной: проверенная строка или ошибка с её номером.
+    Ошибка строки не прерывает разбор остальных.
+    """
+    if format == "csv":
+        return _iter_csv_rows(lines)
+    if format == "ndjson":
+        return _iter_ndjson_rows(lines)
+    raise ValueError(f"Unsupported import format: {format}")
+
+
+def _iter_ndjson_rows(lines: Iterable[str]) -> Iterator[ProductImportRowDTO | ProductImportRowError]:
+    for row, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield ProductImportRowError(row, "invalid_json", error=str(exc))
+            continue
+        try:
+            yield parse_import_record(row, record)
+        except ProductImportRowError as error:
+            yield error
+
+
+def _iter_csv_rows(lines: Iterable[str]) -> Iterator[ProductImportRowDTO | ProductImportRowError]:
+    reader = csv.DictReader(lines)
+    for record in reader:
+        # Номер строки файла, на которой закончилась запись (заголовок — строка 1)
+        row = reader.line_num
+        try:
+            yield parse_import_record(
+                row,
+                {key: value for key, value in record.items() if key is not None and value != ""},
+            )
+        except ProductImportRowError as error:
+            yield error
+
+
+def parse_import_record(row: int, record: Any) -> ProductImportRowDTO:
+    """Проверить запись файла (разобранную строку NDJSON или CSV) без обращений к БД."""
+    if not isinstance(record, dict):
+        raise ProductImportRowError(row, "record_must_be_object")
+
+    name = record.get("name")
+    if not isinstance(name, str):
+        raise ProductImportRowError(row, "name_required")
+    try:
+        name = ProductName.create(name).value
+    except InvalidProductName as exc:
+        raise ProductImportRowError(row, exc.code)
+
+    description = record.get("description")
+    if description is not None and not isinstance(description, str):
+        raise ProductImportRowError(row, "invalid_description")
+
+    return ProductImportRowDTO(
+        row=row,
+        name=name,
+        price=_price(row, record.get("price")),
+        product_id=_optional_id(row, record.get("id"), "id"),
+        description=description,
+        category_id=_reference(row, record, "category"),
+        supplier_id=_reference(row, record, "supplier"),
+        region_id=_reference(row, record, "region"),
+        attributes=_attributes(row, record.get("attributes")),
+        images=_images(row, record.get("images")),
+        tag_ids=_tag_ids(row, record.get("tags")),
+    )
+
+
+def _price(row: int, value: Any) -> Decimal:
+    if value is None or isinstance(value, bool):
+        raise ProductImportRowError(row, "price_required")
+    try:
+        # NaN/Infinity не проходят сравнение и quantize внутри Money
+        amount = Money.from_decimal(value).to_decimal()
+    except (MoneyError, ArithmeticError):
+        raise ProductImportRowError(row, "invalid_price", price=str(value))
+    if amount > MAX_PRICE:
+        raise ProductImportRowError(row, "invalid_price", price=str(value))
+    return amount
+
+
+def _optional_id(row: int, value: Any, field: str) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value)
+    if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+        raise ProductImportRowError(row, f"invalid_{field}", value=value)
+    return value
+
+
+def _reference(row: int, record: dict[str, Any], entity: str) -> int | None:
+    """category_id или category: {"id": ...} (форма NDJSON-выгрузки)."""
+    field = f"{entity}_id"
+    if field in record:
+        return _optional_id(row, record[field], field)
+    nested = record.get(entity)
+    if isinstance(nested, dict):
+        return _optional_id(row, nested.get("id"), field)
+    if nested is not None:
+        raise ProductImportRowError(row, f"invalid_{field}")
+    return None
+
+
+def _json_list(row: int, value: Any, field: str) -> list | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError as exc:
+            raise ProductImportRowError(row, f"invalid_{field}_json", error=str(exc))
+    if not isinstance(value, list):
+        raise ProductImportRowError(row, f"{field}_must_be_list")
+    return value
+
+
+def _optional_bool(row: int, value: Any, field: str) -> bool | None:
+    if value is None or isinstance(value, bool):
+        return value
+    raise ProductImportRowError(row, f"invalid_{field}", value=value)
+
+
+def _attributes(row: int, value: Any) -> list[ProductImportAttributeDTO] | None:
+    items = _json_list(row, value, "attributes")
+    if items is None:
+        return None
+
+    # Повтор имени в строке — побеждает последнее значение, как при обновлении товара
+    attributes: dict[str, ProductImportAttributeDTO] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            raise ProductImportRowError(row, "attribute_item_must_be_object")
+        name = item.get("name")
+        attribute_value = item.get("value")
+        if isinstance(attribute_value, (int, float, Decimal)) and not isinstance(attribute_value, bool):
+            attribute_value = str(attribute_value)
+        if isinstance(name, str):
+            # Как _replace_attributes при обычном обновлении товара
+            name = name.strip()
+        if not isinstance(name, str) or not name or len(name) > MAX_ATTRIBUTE_NAME_LENGTH:
+            raise ProductImportRowError(row, "invalid_attribute_name", name=name)
+        if not isinstance(attribute_value, str) or len(attribute_value) > MAX_ATTRIBUTE_VALUE_LENGTH:
+            raise ProductImportRowError(row, "invalid_attribute_value", name=name)
+        attributes[name] = ProductImportAttributeDTO(
+            name=name,
+            value=attribute_value,
+            is_filterable=_optional_bool(row, item.get("is_filterable"), "is_filterable"),
+            is_groupable=_optional_bool(row, item.get("is_groupable"), "is_groupable"),
+        )
+    return list(attributes.values())
+
+
+def _images(row: int, value: Any) -> list[ProductImportImageDTO] | None:
+    items = _json_list(row, value, "images")
+    if items is None:
+        return None
+
+    images: dict[int, ProductImportImageDTO] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            raise ProductImportRowError(row, "image_item_must_be_object")
+        upload_id = _optional_id(row, item.get("upload_id"), "upload_id")
+        if upload_id is None:
+            raise ProductImportRowError(row, "upload_id_required")
+        ordering = item.get("ordering", 0)
+        if not isinstance(ordering, int) or isinstance(ordering, bool):
+            raise ProductImportRowError(row, "invalid_ordering", value=ordering)
+        images[upload_id] = ProductImportImageDTO(
+            upload_id=upload_id,
+            is_main=bool(_optional_bool(row, item.get("is_main"), "is_main")),
+            ordering=ordering,
+        )
+    return list(images.values())
+
+
+def _tag_ids(row: int, value: Any) -> list[int] | None:
+    items = _json_list(row, value, "tags")
+    if items is None:
+        return None
+
+    tag_ids: dict[int, None] = {}
+    for item in items:
+        if isinstance(item, dict):
+            item = item.get("tag_id")
+        tag_id = _optional_id(row, item, "tag_id")
+        if tag_id is None:
+            raise ProductImportRowError(row, "tag_id_required")
+        tag_ids[tag_id] = None
+    return list(tag_ids)
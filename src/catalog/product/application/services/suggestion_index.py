@@ -0,0 +1,190 @@
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from heapq import merge
+from typing import Iterable, Optional
+
+from src.catalog.product.application.dto.product import SearchSuggestionDTO
+from src.catalog.product.application.services.incremental_index import (
+    IncrementalIndex,
+    IncrementalIndexUpdater,
+)
+from src.core.conf.settings import get_settings
+
+_WORD_RE = re.compile(r"\S+")
+
+
+class SuggestionIndex(IncrementalIndex):
+    """
+    Индекс подсказок следующего слова по всему каталогу (в памяти воркера).
+
+    Документ товара — его название и значения атрибутов. Для каждого слова
+    храним множество товаров, где оно встречается, и для каждой пары
+    «слово → следующее слово» — множество товаров с этой парой. Подсказка
+    для запроса: следующие слова после слов, начинающихся с последнего
+    термина, среди товаров, содержащих остальные термины; count — число
+    товаров.
+
+    Синхронизация с БД (пометки событий и опрос изменений других
+    воркеров) — см. IncrementalIndex.
+    """
+
+    def __init__(self, poll_interval: float = 5.0):
+        super().__init__(poll_interval)
+        self._documents: dict[int, list[list[str]]] = {}
+        self._postings: dict[str, set[int]] = defaultdict(set)
+        self._next: dict[str, dict[str, set[int]]] = defaultdict(lambda: defaultdict(set))
+        self._display: dict[str, str] = {}
+        # Отсортированные слова — для поиска по префиксу
+        self._words: list[str] = []
+
+    def _install(self, fresh: "SuggestionIndex") -> None:
+        self._documents = fresh._documents
+        self._postings = fresh._postings
+        self._next = fresh._next
+        self._display = fresh._display
+        self._words = fresh._words
+
+    # ---------- изменение ----------
+
+    def apply(
+        self,
+        documents: dict[int, list[str]],
+        removed: Iterable[int],
+        watermark: Optional[datetime] = None,
+    ) -> None:
+        touched: set[str] = set()
+        for product_id in removed:
+            touched |= self._discard(product_id)
+        for product_id, texts in documents.items():
+            touched |= self._discard(product_id)
+            touched |= self._add(product_id, texts)
+        self._reindex_words(touched)
+        self._synced(watermark)
+
+    def upsert(self, product_id: int, texts: Iterable[str]) -> None:
+        self.apply({product_id: list(texts)}, ())
+
+    def remove(self, product_id: int) -> None:
+        self.apply({}, (product_id,))
+
+    def _reindex_words(self, touched: set[str]) -> None:
+        """
+        Обновить отсортированный список слов после пачки изменений: один
+        проход по списку и слияние с новыми словами вместо insort на каждое
+        слово.
+        """
+        if not touched:
+            return None
+        kept = (word for word in self._words if word not in touched)
+        added = sorted(word for word in touched if word in self._postings)
+        self._words = list(merge(kept, added))
+
+    def _add(self, product_id: int, texts: Iterable[str]) -> set[str]:
+        """Добавить документ товара; вернуть его слова."""
+        document = [_WORD_RE.findall(text) for text in texts if text]
+        self._documents[product_id] = document
+
+        keys: set[str] = set()
+        for words in document:
+            for position, word in enumerate(words):
+                key = word.lower()
+                keys.add(key)
+                self._display.setdefault(key, word)
+                self._postings[key].add(product_id)
+
+                if position + 1 < len(words):
+                    next_word = words[position + 1]
+                    next_key = next_word.lower()
+                    self._display.setdefault(next_key, next_word)
+                    self._next[key][next_key].add(product_id)
+        return keys
+
+    def _discard(self, product_id: int) -> set[str]:
+        """Убрать документ товара; вернуть его слова."""
+        document = self._documents.pop(product_id, None)
+        if document is None:
+            return set()
+
+        keys: set[str] = set()
+        for words in document:
+            for position, word in enumerate(words):
+                key = word.lower()
+                keys.add(key)
+                postings = self._postings.get(key)
+                if postings is not None:
+                    postings.discard(product_id)
+                    if not postings:
+                        del self._postings[key]
+
+                if position + 1 < len(words):
+                    followers = self._next.get(key)
+                    if followers is None:
+                        continue
+                    next_key = words[position + 1].lower()
+                    product_ids = followers.get(next_key)
+                    if product_ids is not None:
+                        product_ids.discard(product_id)
+                        if not product_ids:
+                            del followers[next_key]
+                    if not followers:
+                        del self._next[key]
+        return keys
+
+    # ---------- запросы ----------
+
+    def suggest(self, terms: list[str], limit: int = 5) -> list[SearchSuggestionDTO]:
+        terms = [term.lower() for term in terms if term]
+        if not terms:
+            return []
+
+        # Товары, содержащие все термины, кроме последнего
+        scope: Optional[set[int]] = None
+        for term in terms[:-1]:
+            matched = self._products_with_prefix(term)
+            scope = matched if scope is None else scope & matched
+            if not scope:
+                return []
+
+        counts: dict[str, set[int]] = defaultdict(set)
+        for word in self._words_with_prefix(terms[-1]):
+            for next_key, product_ids in self._next.get(word, {}).items():
+                counts[next_key] |= product_ids if scope is None else product_ids & scope
+
+        ranked = sorted(
+            ((len(product_ids), next_key) for next_key, product_ids in counts.items() if product_ids),
+            key=lambda item: (-item[0], item[1]),
+        )
+        return [
+            SearchSuggestionDTO(word=self._display[next_key], count=count)
+            for count, next_key in ranked[:limit]
+        ]
+
+    def _words_with_prefix(self, prefix: str) -> list[str]:
+        start = bisect_left(self._words, prefix)
+        words = []
+        for word in self._words[start:]:
+            if not word.startswith(prefix):
+                break
+            words.append(word)
+        return words
+
+    def _products_with_prefix(self, prefix: str) -> set[int]:
+        products: set[int] = set()
+        for word in self._words_with_prefix(prefix):
+            products |= self._postings[word]
+        return products
+
+
+class SuggestionIndexUpdater(IncrementalIndexUpdater):
+    """
+    Пометка изменений индекса подсказок по событиям шины: товар
+    перечитывается при изменении названия, атрибутов или удалении.
+    """
+
+
+@lru_cache
+def get_suggestion_index() -> SuggestionIndex:
+    return SuggestionIndex(poll_interval=get_settings().PRODUCT_INDEX_POLL_SECONDS)
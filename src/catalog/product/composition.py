@@ -1,3 +1,6 @@
+from src.catalog.product.application.commands.bulk_update_products import (
+    BulkUpdateProductsCommand,
+)
 from src.catalog.product.application.commands.create_product import CreateProductCommand
 from src.catalog.product.application.commands.create_product_attribute import (
     CreateProductAttributeCommand,
@@ -18,6 +21,7 @@ from src.catalog.product.application.commands.delete_product_relation import (
 from src.catalog.product.application.commands.delete_product_type import (
     DeleteProductTypeCommand,
 )
+from src.catalog.product.application.commands.import_products import ImportProductsCommand
 from src.catalog.product.application.commands.update_product import UpdateProductCommand
 from src.catalog.product.application.commands.update_product_attribute import (
     UpdateProductAttributeCommand,
@@ -72,6 +76,16 @@ class ProductComposition:
         scope = container.create_scope()
         return scope.resolve(DeleteProductCommand, db=db)
 
+    @staticmethod
+    def build_bulk_update_command(db):
+        scope = container.create_scope()
+        return scope.resolve(BulkUpdateProductsCommand, db=db)
+
+    @staticmethod
+    def build_import_command(db):
+        scope = container.create_scope()
+        return scope.resolve(ImportProductsCommand, db=db)
+
     @staticmethod
     def build_queries(db):
         scope = container.create_scope()
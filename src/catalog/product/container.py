@@ -4,6 +4,9 @@ from src.catalog.category.domain.repository.category import CategoryRepository
 from src.catalog.category.infrastructure.orm.category import (
     SqlAlchemyCategoryRepository,
 )
+from src.catalog.product.application.commands.bulk_update_products import (
+    BulkUpdateProductsCommand,
+)
 from src.catalog.product.application.commands.create_product import CreateProductCommand
 from src.catalog.product.application.commands.create_product_attribute import (
     CreateProductAttributeCommand,
@@ -24,6 +27,7 @@ from src.catalog.product.application.commands.delete_product_relation import (
 from src.catalog.product.application.commands.delete_product_type import (
     DeleteProductTypeCommand,
 )
+from src.catalog.product.application.commands.import_products import ImportProductsCommand
 from src.catalog.product.application.commands.update_product import UpdateProductCommand
 from src.catalog.product.application.commands.update_product_attribute import (
     UpdateProductAttributeCommand,
@@ -76,6 +80,10 @@ from src.catalog.product.application.read_models.product_type_read_repository im
 from src.catalog.product.application.services.related_entity_loader import (
     RelatedEntityLoader,
 )
+from src.catalog.product.application.services.suggestion_index import (
+    SuggestionIndex,
+    get_suggestion_index,
+)
 from src.catalog.product.domain.repository.audit import ProductAuditRepository
 from src.catalog.product.domain.repository.product import ProductRepository
 from src.catalog.product.domain.repository.product_attribute import (
@@ -87,6 +95,12 @@ from src.catalog.product.domain.repository.product_attribute_read import (
 from src.catalog.product.domain.repository.product_audit_query import (
     ProductAuditQueryRepository,
 )
+from src.catalog.product.domain.repository.product_bulk_update import (
+    ProductBulkUpdateRepository,
+)
+from src.catalog.product.domain.repository.product_import import (
+    ProductImportRepository,
+)
 from src.catalog.product.domain.repository.product_read import (
     ProductReadRepositoryInterface,
 )
@@ -99,8 +113,13 @@ from src.catalog.product.domain.repository.product_type_read import (
     ProductTypeReadRepositoryInterface,
 )
 from src.catalog.product.infrastructure.orm.cache.cached_product import (
+    CachedProductBulkUpdateRepository,
+    CachedProductImportRepository,
     CachedProductRepository,
 )
+from src.catalog.product.infrastructure.orm.cache.cached_product_read import (
+    CachedProductReadRepository,
+)
 from src.catalog.product.infrastructure.orm.product import SqlAlchemyProductRepository
 from src.catalog.product.infrastructure.orm.product_attribute import (
     SqlAlchemyProductAttributeRepository,
@@ -114,6 +133,12 @@ from src.catalog.product.infrastructure.orm.product_audit import (
 from src.catalog.product.infrastructure.orm.product_audit_query import (
     SqlAlchemyProductAuditQueryRepository,
 )
+from src.catalog.product.infrastructure.orm.product_bulk_update import (
+    SqlAlchemyProductBulkUpdateRepository,
+)
+from src.catalog.product.infrastructure.orm.product_import import (
+    SqlAlchemyProductImportRepository,
+)
 from src.catalog.product.infrastructure.orm.product_read import (
     SqlAlchemyProductReadRepository,
 )
@@ -134,9 +159,9 @@ from src.catalog.suppliers.infrastructure.orm.supplier import (
     SqlAlchemySupplierRepository,
 )
 from src.core.cache.base import Cache
-from src.core.cache.memory import InMemoryCache
-from src.core.cache.redis import RedisCache
+from src.core.cache.factory import get_shared_cache
 from src.core.cache.redis_client import RedisClientFactory
+from src.core.conf.settings import get_settings
 from src.core.db.unit_of_work import UnitOfWork
 from src.core.di.container import ServiceContainer
 from src.core.events import AsyncEventBus, get_event_bus
@@ -161,12 +186,7 @@ container.register(
 
 container.register(
     Cache,
-    lambda scope, db: (
-        InMemoryCache()
-        # RedisCache(scope.resolve(Redis, db=db))
-        # if settings.REDIS_ENABLED
-        # else InMemoryCache()
-    ),
+    lambda scope, db: get_shared_cache(),
 )
 
 container.register(
@@ -174,6 +194,7 @@ container.register(
     lambda scope, db: CachedProductRepository(
         db_repository=SqlAlchemyProductRepository(db),
         cache=scope.resolve(Cache, db=db),
+        session=db,
         ttl=300,
     ),
 )
@@ -209,7 +230,11 @@ container.register(
 
 container.register(
     ProductReadRepositoryInterface,
-    lambda scope, db: SqlAlchemyProductReadRepository(db),
+    lambda scope, db: CachedProductReadRepository(
+        db_repository=SqlAlchemyProductReadRepository(db),
+        cache=scope.resolve(Cache, db=db),
+        ttl=300,
+    ),
 )
 
 container.register(
@@ -261,12 +286,19 @@ container.register(
 )
 
 
+container.register(
+    SuggestionIndex,
+    lambda scope, db: get_suggestion_index(),
+)
+
 container.register(
     ProductQueries,
     lambda scope, db: ProductQueries(
         read_repository=scope.resolve(ProductReadRepository, db=db),
         repository=scope.resolve(ProductRepository, db=db),
         image_storage=scope.resolve(ImageStorageService, db=db),
+        suggestion_index=scope.resolve(SuggestionIndex, db=db),
+        batch_max_ids=get_settings().PRODUCT_BATCH_MAX_IDS,
     ),
 )
 
@@ -335,6 +367,47 @@ container.register(
     ),
 )
 
+container.register(
+    ProductImportRepository,
+    lambda scope, db: CachedProductImportRepository(
+        db_repository=SqlAlchemyProductImportRepository(db),
+        cache=scope.resolve(Cache, db=db),
+        session=db,
+    ),
+)
+
+container.register(
+    ImportProductsCommand,
+    lambda scope, db: ImportProductsCommand(
+        repository=scope.resolve(ProductImportRepository, db=db),
+        audit_repository=scope.resolve(ProductAuditRepository, db=db),
+        uow=scope.resolve(UnitOfWork, db=db),
+        event_bus=scope.resolve(AsyncEventBus, db=db),
+        batch_size=get_settings().PRODUCT_IMPORT_BATCH_SIZE,
+        max_reported_errors=get_settings().PRODUCT_IMPORT_MAX_REPORTED_ERRORS,
+    ),
+)
+
+container.register(
+    ProductBulkUpdateRepository,
+    lambda scope, db: CachedProductBulkUpdateRepository(
+        db_repository=SqlAlchemyProductBulkUpdateRepository(db),
+        cache=scope.resolve(Cache, db=db),
+        session=db,
+    ),
+)
+
+container.register(
+    BulkUpdateProductsCommand,
+    lambda scope, db: BulkUpdateProductsCommand(
+        repository=scope.resolve(ProductBulkUpdateRepository, db=db),
+        audit_repository=scope.resolve(ProductAuditRepository, db=db),
+        uow=scope.resolve(UnitOfWork, db=db),
+        event_bus=scope.resolve(AsyncEventBus, db=db),
+        max_items=get_settings().PRODUCT_BULK_UPDATE_MAX_ITEMS,
+    ),
+)
+
 container.register(
     UpdateProductCommand,
     lambda scope, db: UpdateProductCommand(
@@ -44,6 +44,17 @@ class ProductInvalidPayload(BaseServiceError):
         super().__init__(message=msg, code=code, status_code=status_code, details=details)
 
 
+class ProductImportTooLarge(BaseServiceError):
+    def __init__(
+        self,
+        msg: str = "Слишком большой файл импорта, используйте scripts.import_products",
+        code: str = "product_import_too_large",
+        status_code: int = 413,
+        details: dict | None = None,
+    ):
+        super().__init__(message=msg, code=code, status_code=status_code, details=details)
+
+
 class ProductTypeNotFound(BaseServiceError):
     def __init__(
         self,
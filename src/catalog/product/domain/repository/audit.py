@@ -2,6 +2,8 @@ from abc import ABC
 from dataclasses import dataclass
 from typing import Any
 
+from src.catalog.product.application.dto.audit import ProductImportAuditDTO
+
 
 @dataclass
 class ProductAuditDTO:
@@ -48,6 +50,10 @@ class ProductAuditRepository(ABC):
     async def log(self, dto: ProductAuditDTO):
         ...
 
+    async def log_many(self, dtos: list[ProductAuditDTO]) -> None:
+        """Записи аудита пакета товаров одним INSERT."""
+        ...
+
     async def log_product_type(self, dto: ProductTypeAuditDTO):
         ...
 
@@ -56,3 +62,7 @@ class ProductAuditRepository(ABC):
 
     async def log_product_relation(self, dto: ProductRelationAuditDTO):
         ...
+
+    async def log_product_import(self, dto: ProductImportAuditDTO) -> int:
+        """Сводная запись о массовом импорте, возвращает её id."""
+        ...
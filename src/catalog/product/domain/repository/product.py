@@ -7,7 +7,11 @@ from src.catalog.product.domain.events.product_events import DomainEvent
 
 class ProductRepository(ABC):
 
-    async def get(self, product_id: int) -> Optional[ProductAggregate]:
+    async def get(self, product_id: int, for_update: bool = False) -> Optional[ProductAggregate]:
+        """
+        for_update=True — для команд, которые изменяют товар: агрегат читается
+        из БД (не из кэша) и строка товара блокируется до конца транзакции.
+        """
         ...
 
     async def get_by_name(self, name: str) -> Optional[ProductAggregate]:
@@ -0,0 +1,28 @@
+from abc import ABC
+from typing import Any
+
+
+class ProductBulkUpdateRepository(ABC):
+    """
+    Пакетное обновление скалярных полей товаров (BULK_UPDATE_FIELDS):
+    чтение, проверка ссылок и запись — по одному запросу на весь пакет.
+    Все методы работают в транзакции вызывающего кода.
+    """
+
+    async def lock_fields(self, product_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """
+        Текущие значения полей товаров, строки блокируются до конца транзакции.
+        Товаров, которых нет в БД, в ответе нет.
+        """
+        ...
+
+    async def find_missing_references(
+        self,
+        wanted: dict[str, set[int]],
+    ) -> dict[str, set[int]]:
+        """id из wanted ({"category_id": ids, "region_id": ids}), которых нет в БД."""
+        ...
+
+    async def apply(self, values_by_id: dict[int, dict[str, Any]]) -> None:
+        """Записать новые значения всех полей товаров одним запросом."""
+        ...
@@ -0,0 +1,36 @@
+from abc import ABC
+
+from src.catalog.product.application.dto.product_import import (
+    ProductImportMergeDTO,
+    ProductImportRowDTO,
+)
+
+
+class ProductImportRepository(ABC):
+    """
+    Массовый импорт товаров: строки копируются в staging-таблицы сессии
+    и одним набором запросов сливаются с каталогом. Все методы работают
+    в транзакции вызывающего кода.
+    """
+
+    async def prepare(self) -> None:
+        """Создать staging-таблицы (живут до конца транзакции)."""
+        ...
+
+    async def find_missing_references(
+        self,
+        rows: list[ProductImportRowDTO],
+    ) -> dict[str, set[int]]:
+        """
+        id, на которые ссылаются строки пачки, но которых нет в БД:
+        {"id", "category_id", "supplier_id", "region_id", "upload_id", "tag_id"}.
+        """
+        ...
+
+    async def stage(self, rows: list[ProductImportRowDTO]) -> None:
+        """Скопировать проверенные строки пачки в staging-таблицы."""
+        ...
+
+    async def merge(self) -> ProductImportMergeDTO:
+        """Слить накопленные строки с товарами, атрибутами, изображениями и тегами."""
+        ...
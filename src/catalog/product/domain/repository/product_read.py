@@ -1,7 +1,14 @@
 from abc import ABC
-from typing import List, Optional, Tuple
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 
-from src.catalog.product.application.dto.product import ProductReadDTO, CatalogFiltersDTO, ProductSearchDTO
+from src.catalog.category.application.read_models.pricing import PriceFormulas
+from src.catalog.product.application.dto.product import (
+    CatalogFiltersDTO,
+    ProductCursorDTO,
+    ProductReadDTO,
+    ProductSearchDTO,
+)
 
 
 class ProductReadRepositoryInterface(ABC):
@@ -14,6 +21,17 @@ class ProductReadRepositoryInterface(ABC):
         """Получить товар по названию."""
         raise NotImplementedError
 
+    async def get_many(
+        self,
+        product_ids: list[int],
+        view: str = "full",
+    ) -> list[ProductReadDTO]:
+        """
+        Товары по списку ID в порядке product_ids (несуществующие пропускаются).
+        view=card — ProductCardDTO без связей, которые не нужны карточке.
+        """
+        raise NotImplementedError
+
     async def filter(
         self,
         name: Optional[str],
@@ -25,20 +43,49 @@ class ProductReadRepositoryInterface(ABC):
         sort_type: str = "default",
         product_ids: Optional[List[int]] = None,
         region_id: Optional[int] = None,
-    ) -> Tuple[List[ProductReadDTO], int]:
-        """Фильтрация товаров с пагинацией и сортировкой."""
+        after: Optional[ProductCursorDTO] = None,
+        count_mode: str = "exact",
+        view: str = "full",
+    ) -> Tuple[List[ProductReadDTO], Optional[int]]:
+        """
+        Фильтрация товаров с пагинацией и сортировкой.
+
+        Если передан after, страница начинается строго после этой позиции
+        (keyset-пагинация), offset игнорируется.
+        count_mode: exact — точный total, estimate — оценка планировщика,
+        none — total не считается (None).
+        view: full — ProductReadDTO, card — ProductCardDTO (связи, не нужные
+        карточке, не загружаются).
+        """
         raise NotImplementedError
 
     async def get_catalog_filters(
         self,
         category_id: Optional[int] = None,
         device_type_id: Optional[int] = None,
+        selected: Optional[dict[str, list[str]]] = None,
     ) -> CatalogFiltersDTO:
-        """Получить фильтры для каталога."""
+        """Получить фильтры для каталога (с selected — с учётом выбранных значений)."""
+        raise NotImplementedError
+
+    async def export_full_catalog(self, updated_since: Optional[datetime] = None):
+        """Выгрузка каталога (с updated_since — только изменившиеся товары)."""
+        raise NotImplementedError
+
+    def stream_full_catalog(
+        self,
+        chunk_size: int = 1000,
+        updated_since: Optional[datetime] = None,
+    ) -> AsyncIterator[list]:
+        """Выгрузка каталога пачками по chunk_size строк (серверный курсор)."""
         raise NotImplementedError
 
-    async def export_full_catalog(self):
-        """Полная выгрузка каталога."""
+    async def get_deleted_product_ids(self, since: datetime) -> list:
+        """Удалённые с момента since товары: строки (product_id, deleted_at)."""
+        raise NotImplementedError
+
+    async def get_export_watermark(self) -> datetime:
+        """Отметка времени БД, с которой следующая выгрузка продолжит инкремент."""
         raise NotImplementedError
 
     async def search(
@@ -46,6 +93,7 @@ class ProductReadRepositoryInterface(ABC):
         query: str,
         limit: int = 10,
         offset: int = 0,
+        view: str = "full",
     ) -> ProductSearchDTO:
         """
         Полнотекстовый поиск товаров с подсказками следующих слов.
@@ -54,12 +102,34 @@ class ProductReadRepositoryInterface(ABC):
             query: Поисковый запрос
             limit: Количество товаров в ответе (по умолчанию 10)
             offset: Смещение для пагинации
+            view: full — ProductReadDTO, card — ProductCardDTO
 
         Returns:
             ProductSearchDTO с товарами и подсказками
         """
         raise NotImplementedError
 
+    async def get_suggestion_documents(
+        self,
+        product_ids: Optional[list[int]] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> dict[int, list[str]]:
+        """
+        Тексты товаров (название и значения атрибутов) для индекса подсказок.
+
+        Args:
+            product_ids: Товары для перечитывания; None — весь каталог
+            updated_since: Только товары, изменившиеся с этого момента
+
+        Returns:
+            dict: {product_id: [name, *attribute_values]} только для существующих товаров
+        """
+        raise NotImplementedError
+
+    async def get_price_formulas(self) -> PriceFormulas:
+        """Формулы конечных цен по политикам ценообразования категорий."""
+        raise NotImplementedError
+
     async def get_review_counts_by_product_ids(
         self,
         product_ids: list[int],
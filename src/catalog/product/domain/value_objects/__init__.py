@@ -4,6 +4,7 @@ from src.catalog.product.domain.value_objects.ids import (
     ProductTypeId,
 )
 from src.catalog.product.domain.value_objects.money import (
+    MAX_PRICE,
     InvalidMoneyAmount,
     Money,
     MoneyError,
@@ -18,6 +19,7 @@ from src.catalog.product.domain.value_objects.product_name import (
 
 __all__ = [
     "Money",
+    "MAX_PRICE",
     "MoneyError",
     "InvalidMoneyAmount",
     "ProductName",
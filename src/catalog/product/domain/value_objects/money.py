@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
 
+# Наибольшая цена товара: products.price — Numeric(12, 2)
+MAX_PRICE = Decimal("9999999999.99")
+
 
 class MoneyError(ValueError):
     """Базовое исключение для ошибок Money."""
@@ -1,11 +1,15 @@
+from . import product_search  # noqa: F401  (DDL поискового индекса)
+from . import product_variant_signature  # noqa: F401  (DDL сигнатуры вариантов)
 from .product import Product
 from .product_attribute import ProductAttribute
 from .product_attribute_value import ProductAttributeValue
-from .product_audit_logs import ProductAuditLog
+from .product_audit_logs import ProductAuditLog, ProductImportLog
 from .product_image import ProductImage
+from .product_read_model import ProductReadModel
 from .product_relation import ProductRelation
 from .product_relation_audit_logs import ProductRelationAuditLog
 from .product_tag import ProductTag
+from .product_tombstone import ProductTombstone
 from .product_type import ProductType
 from .product_type_image import ProductTypeImage
 from .tag import Tag
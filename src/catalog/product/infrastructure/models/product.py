@@ -7,7 +7,8 @@ from sqlalchemy import (
     String,
     Text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from src.core.db.database import Base
 from src.core.db.mixins import TimestampMixin
@@ -19,6 +20,15 @@ class Product(TimestampMixin, Base):
         Index("ix_products_category_id", "category_id"),
         Index("ix_products_supplier_id", "supplier_id"),
         Index("ix_products_region_id", "region_id"),
+        Index("ix_products_updated_at", "updated_at"),
+        Index("ix_products_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_products_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("ix_products_category_variant_signature", "category_id", "variant_signature"),
     )
     id = Column(BigInteger, primary_key=True, autoincrement=True)
 
@@ -26,6 +36,14 @@ class Product(TimestampMixin, Base):
     description = Column(Text, nullable=True)
     price = Column(Numeric(12, 2), nullable=False)
 
+    # Поисковый документ: название + значения атрибутов (поддерживается триггерами,
+    # см. product_search.py). deferred — не грузим в обычных выборках
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+
+    # Сигнатура семейства вариантов: md5 groupable-атрибутов (поддерживается
+    # триггерами, см. product_variant_signature.py)
+    variant_signature = deferred(Column(String(32), nullable=True))
+
     # Рейтинг товара (среднее значение всех отзывов, 0-5)
     rating = Column(Numeric(2, 1), nullable=True, default=None)
 
@@ -14,7 +14,13 @@ class ProductAttributeValue(TimestampMixin, Base):
             name="uq_product_attribute_value_per_product",
         ),
         Index("ix_pav_product_id", "product_id"),
-        Index("ix_pav_attribute_id", "attribute_id",)
+        Index("ix_pav_attribute_id", "attribute_id",),
+        Index(
+            "ix_pav_value_trgm",
+            "value",
+            postgresql_using="gin",
+            postgresql_ops={"value": "gin_trgm_ops"},
+        ),
     )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
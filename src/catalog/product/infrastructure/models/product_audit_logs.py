@@ -1,4 +1,4 @@
-from sqlalchemy import JSON, BigInteger, Column, ForeignKey, String
+from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Integer, String
 
 from src.core.db.database import Base
 from src.core.db.mixins import TimestampMixin
@@ -50,3 +50,20 @@ class ProductAttributeAuditLog(TimestampMixin, Base):
     new_data = Column(JSON, nullable=True)
     user_id = Column(BigInteger, nullable=False)
     fio = Column(String(255), nullable=True)
+
+
+class ProductImportLog(TimestampMixin, Base):
+    """Одна запись аудита на массовый импорт товаров (не на каждый товар)."""
+    __tablename__ = "product_import_logs"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    format = Column(String(20), nullable=False)
+    total = Column(Integer, nullable=False)
+    created = Column(Integer, nullable=False)
+    updated = Column(Integer, nullable=False)
+    unchanged = Column(Integer, nullable=False)
+    failed = Column(Integer, nullable=False)
+    # Первые ошибки строк: [{"row", "reason", ...}]
+    errors = Column(JSON, nullable=True)
+    user_id = Column(BigInteger, nullable=False)
+    fio = Column(String(255), nullable=True)
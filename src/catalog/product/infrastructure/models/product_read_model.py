@@ -0,0 +1,62 @@
+"""
+Проекция товаров для чтения (product_read_model).
+
+Одна строка на товар: готовый снимок ProductReadDTO в document (формат
+product_snapshot.py) и скалярные колонки для фильтрации и сортировки.
+Строки пишет ProductReadModelProjector по событиям шины; полностью
+таблица перестраивается скриптом scripts/rebuild_product_read_model.py.
+"""
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Numeric,
+    String,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.core.db.database import Base
+
+
+class ProductReadModel(Base):
+    __tablename__ = "product_read_model"
+    __table_args__ = (
+        Index("ix_product_read_model_name", "name"),
+        Index("ix_product_read_model_category_id", "category_id", "product_id"),
+        Index("ix_product_read_model_region_id", "region_id"),
+        Index("ix_product_read_model_price", "price", "product_id"),
+        Index(
+            "ix_product_read_model_attribute_pairs",
+            "attribute_pairs",
+            postgresql_using="gin",
+            postgresql_ops={"attribute_pairs": "jsonb_path_ops"},
+        ),
+    )
+
+    product_id = Column(
+        BigInteger,
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+        autoincrement=False,
+    )
+
+    name = Column(String(200), nullable=False)
+    price = Column(Numeric(12, 2), nullable=False)
+    category_id = Column(BigInteger, nullable=True)
+    supplier_id = Column(BigInteger, nullable=True)
+    region_id = Column(BigInteger, nullable=True)
+
+    # Пары [{"name": ..., "value": ...}] для фильтра по атрибутам (@>)
+    attribute_pairs = Column(JSONB, nullable=False, server_default="[]")
+    # Снимок ProductReadDTO
+    document = Column(JSONB, nullable=False)
+
+    projected_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
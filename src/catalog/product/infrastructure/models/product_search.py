@@ -0,0 +1,130 @@
+"""
+Поисковый индекс товаров в Postgres.
+
+products.search_vector содержит название (вес A) и значения атрибутов (вес B)
+и поддерживается триггерами, поэтому не зависит от того, каким путём
+изменились товар или его атрибуты. Для подстрочного поиска по названию и
+значениям атрибутов используются GIN-индексы pg_trgm.
+
+Внутри транзакции с SET LOCAL catalog.bulk_import = 'on' триггеры ничего
+не делают: массовый импорт (product_import.py) пересчитывает документы
+изменённых товаров одним запросом.
+
+Те же объекты создаёт миграция add_product_search; здесь они навешаны на
+metadata, чтобы create_all (тесты, локальный запуск) давал ту же схему.
+"""
+
+from sqlalchemy import DDL, event
+
+from src.core.db.database import Base
+
+CREATE_TRGM_EXTENSION = "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+
+CREATE_SEARCH_DOCUMENT_FUNCTION = """
+CREATE OR REPLACE FUNCTION product_search_document(p_id BIGINT, p_name TEXT)
+RETURNS tsvector
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        setweight(to_tsvector('simple', coalesce(p_name, '')), 'A')
+        || setweight(
+            to_tsvector(
+                'simple',
+                coalesce(
+                    (SELECT string_agg(value, ' ')
+                     FROM product_attribute_values
+                     WHERE product_id = p_id),
+                    ''
+                )
+            ),
+            'B'
+        )
+$$
+"""
+
+CREATE_PRODUCTS_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION products_search_vector_refresh()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- Массовый импорт пересчитывает документы одним запросом после слияния
+    IF current_setting('catalog.bulk_import', true) = 'on' THEN
+        RETURN NEW;
+    END IF;
+    NEW.search_vector := product_search_document(NEW.id, NEW.name);
+    RETURN NEW;
+END
+$$
+"""
+
+CREATE_PRODUCTS_TRIGGER = """
+CREATE TRIGGER trg_products_search_vector
+    BEFORE INSERT OR UPDATE OF name ON products
+    FOR EACH ROW EXECUTE FUNCTION products_search_vector_refresh()
+"""
+
+CREATE_ATTRIBUTE_VALUES_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION product_attribute_values_search_vector_refresh()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    target_id BIGINT;
+BEGIN
+    IF current_setting('catalog.bulk_import', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        target_id := OLD.product_id;
+    ELSE
+        target_id := NEW.product_id;
+    END IF;
+
+    UPDATE products
+    SET search_vector = product_search_document(id, name)
+    WHERE id = target_id;
+
+    IF TG_OP = 'UPDATE' AND OLD.product_id <> NEW.product_id THEN
+        UPDATE products
+        SET search_vector = product_search_document(id, name)
+        WHERE id = OLD.product_id;
+    END IF;
+
+    RETURN NULL;
+END
+$$
+"""
+
+CREATE_ATTRIBUTE_VALUES_TRIGGER = """
+CREATE TRIGGER trg_pav_search_vector
+    AFTER INSERT OR UPDATE OF value, product_id OR DELETE ON product_attribute_values
+    FOR EACH ROW EXECUTE FUNCTION product_attribute_values_search_vector_refresh()
+"""
+
+# Каждая DDL-команда выполняется отдельно: asyncpg не принимает
+# несколько команд в одном prepared statement
+SEARCH_DDL = (
+    CREATE_SEARCH_DOCUMENT_FUNCTION,
+    CREATE_PRODUCTS_TRIGGER_FUNCTION,
+    "DROP TRIGGER IF EXISTS trg_products_search_vector ON products",
+    CREATE_PRODUCTS_TRIGGER,
+    CREATE_ATTRIBUTE_VALUES_TRIGGER_FUNCTION,
+    "DROP TRIGGER IF EXISTS trg_pav_search_vector ON product_attribute_values",
+    CREATE_ATTRIBUTE_VALUES_TRIGGER,
+)
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL(CREATE_TRGM_EXTENSION).execute_if(dialect="postgresql"),
+)
+
+for _statement in SEARCH_DDL:
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
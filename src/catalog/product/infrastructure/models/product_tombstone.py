@@ -0,0 +1,222 @@
+"""
+Данные для инкрементальной выгрузки каталога.
+
+- products.updated_at поднимается при любом изменении значений атрибутов,
+  изображений и тегов товара (триггеры на дочерних таблицах), а также
+  встроенных в строку выгрузки справочников: категории и её предков,
+  поставщика, региона, атрибута и тега. Поэтому «товар изменился
+  с момента T» — это одно условие по индексу updated_at.
+- Триггеры уровня оператора с таблицами переходов: один UPDATE products
+  на оператор, каждый затронутый товар обновляется один раз.
+- product_tombstones хранит id удалённых товаров (триггер AFTER DELETE),
+  чтобы выгрузка могла сообщить о удалениях.
+
+Как и в product_search.py, DDL навешан на metadata для create_all,
+а в БД его создают миграции add_product_export_delta
+и product_export_touch_statement_triggers.
+"""
+
+from sqlalchemy import DDL, BigInteger, Column, DateTime, Index, event, func
+
+from src.core.db.database import Base
+
+
+class ProductTombstone(Base):
+    __tablename__ = "product_tombstones"
+    __table_args__ = (
+        Index("ix_product_tombstones_deleted_at", "deleted_at"),
+    )
+
+    product_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    deleted_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+CREATE_TOUCH_PRODUCT_FUNCTION = """
+CREATE OR REPLACE FUNCTION product_touch_updated_at()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- Массовый импорт поднимает updated_at одним запросом после слияния
+    IF current_setting('catalog.bulk_import', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        UPDATE products SET updated_at = now()
+        WHERE id IN (SELECT product_id FROM new_rows);
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE products SET updated_at = now()
+        WHERE id IN (SELECT product_id FROM old_rows);
+    ELSE
+        UPDATE products SET updated_at = now()
+        WHERE id IN (
+            SELECT product_id FROM old_rows
+            UNION
+            SELECT product_id FROM new_rows
+        );
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+CREATE_TOMBSTONE_FUNCTION = """
+CREATE OR REPLACE FUNCTION product_write_tombstone()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO product_tombstones (product_id, deleted_at)
+    VALUES (OLD.id, now())
+    ON CONFLICT (product_id) DO UPDATE SET deleted_at = EXCLUDED.deleted_at;
+    RETURN NULL;
+END
+$$
+"""
+
+CREATE_TOMBSTONE_TRIGGER = """
+CREATE TRIGGER trg_products_tombstone
+    AFTER DELETE ON products
+    FOR EACH ROW EXECUTE FUNCTION product_write_tombstone()
+"""
+
+# Дочерние таблицы товара, изменения которых попадают в выгрузку
+TOUCH_PRODUCT_TABLES = ("product_attribute_values", "product_images", "product_tags")
+
+# Таблица переходов каждой операции: триггер с REFERENCING срабатывает
+# только на одну операцию, поэтому на таблицу их три
+TOUCH_OPERATIONS = {
+    "insert": "NEW TABLE AS new_rows",
+    "update": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "delete": "OLD TABLE AS old_rows",
+}
+
+
+def touch_trigger_name(table: str, operation: str) -> str:
+    return f"trg_{table}_touch_product_{operation}"
+
+
+def create_touch_trigger(table: str, operation: str) -> str:
+    return f"""
+CREATE TRIGGER {touch_trigger_name(table, operation)}
+    AFTER {operation.upper()} ON {table}
+    REFERENCING {TOUCH_OPERATIONS[operation]}
+    FOR EACH STATEMENT EXECUTE FUNCTION product_touch_updated_at()
+"""
+
+
+# Справочники, поля которых встроены в строку выгрузки: таблица →
+# (изменившиеся поля, запрос id затронутых товаров по изменённым строкам
+# справочника changed). Категория затрагивает товары всего поддерева:
+# её имя входит в parent_categories потомков, а перенос меняет их предков
+TOUCH_REFERENCE_TABLES = {
+    "categories": (
+        ("name", "device_type_id", "parent_id"),
+        """
+        SELECT p.id
+        FROM changed
+        JOIN category_closure cc ON cc.ancestor_id = changed.id
+        JOIN products p ON p.category_id = cc.descendant_id
+        """,
+    ),
+    "suppliers": (
+        ("name",),
+        "SELECT p.id FROM changed JOIN products p ON p.supplier_id = changed.id",
+    ),
+    "regions": (
+        ("name",),
+        "SELECT p.id FROM changed JOIN products p ON p.region_id = changed.id",
+    ),
+    "product_attributes": (
+        ("name", "is_filterable"),
+        """
+        SELECT v.product_id
+        FROM changed
+        JOIN product_attribute_values v ON v.attribute_id = changed.id
+        """,
+    ),
+    "tags": (
+        ("name", "description", "color"),
+        "SELECT pt.product_id FROM changed JOIN product_tags pt ON pt.tag_id = changed.id",
+    ),
+}
+
+
+def reference_touch_function_name(table: str) -> str:
+    return f"{table}_touch_products"
+
+
+def reference_touch_trigger_name(table: str) -> str:
+    return f"trg_{table}_touch_products"
+
+
+def create_reference_touch_function(table: str) -> str:
+    columns, products = TOUCH_REFERENCE_TABLES[table]
+    changed = " OR ".join(f"n.{column} IS DISTINCT FROM o.{column}" for column in columns)
+    return f"""
+CREATE OR REPLACE FUNCTION {reference_touch_function_name(table)}()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    WITH changed AS (
+        SELECT n.id
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        WHERE {changed}
+    )
+    UPDATE products SET updated_at = now()
+    WHERE id IN ({products});
+    RETURN NULL;
+END
+$$
+"""
+
+
+def create_reference_touch_trigger(table: str) -> str:
+    return f"""
+CREATE TRIGGER {reference_touch_trigger_name(table)}
+    AFTER UPDATE ON {table}
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION {reference_touch_function_name(table)}()
+"""
+
+
+# Каждая DDL-команда выполняется отдельно: asyncpg не принимает
+# несколько команд в одном prepared statement
+EXPORT_DELTA_DDL = (
+    CREATE_TOUCH_PRODUCT_FUNCTION,
+    *(
+        statement
+        for table in TOUCH_PRODUCT_TABLES
+        for operation in TOUCH_OPERATIONS
+        for statement in (
+            f"DROP TRIGGER IF EXISTS {touch_trigger_name(table, operation)} ON {table}",
+            create_touch_trigger(table, operation),
+        )
+    ),
+    *(
+        statement
+        for table in TOUCH_REFERENCE_TABLES
+        for statement in (
+            create_reference_touch_function(table),
+            f"DROP TRIGGER IF EXISTS {reference_touch_trigger_name(table)} ON {table}",
+            create_reference_touch_trigger(table),
+        )
+    ),
+    CREATE_TOMBSTONE_FUNCTION,
+    "DROP TRIGGER IF EXISTS trg_products_tombstone ON products",
+    CREATE_TOMBSTONE_TRIGGER,
+)
+
+for _statement in EXPORT_DELTA_DDL:
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
@@ -0,0 +1,158 @@
+"""
+Сигнатура семейства вариантов товара.
+
+products.variant_signature — md5 от отсортированных по имени пар
+(атрибут, значение) groupable-атрибутов товара; NULL, если таких атрибутов
+нет. Товары одного семейства (related/variants) — товары той же категории
+с той же сигнатурой: поиск семейства — равенство по индексу
+(category_id, variant_signature).
+
+Сигнатура поддерживается триггерами: при изменении значений атрибутов
+товара (уровня оператора — один UPDATE products на оператор) и при смене
+имени или флага is_groupable атрибута справочника.
+Внутри транзакции с SET LOCAL catalog.bulk_import = 'on' триггер значений
+ничего не делает: массовый импорт пересчитывает сигнатуры изменённых
+товаров одним запросом.
+
+Те же объекты создают миграции add_product_variant_signature
+и product_variant_signature_statement_trigger; как и
+в product_search.py, DDL навешан на metadata для create_all.
+"""
+
+from sqlalchemy import DDL, event
+
+from src.catalog.product.infrastructure.models.product_tombstone import (
+    TOUCH_OPERATIONS,
+)
+from src.core.db.database import Base
+
+CREATE_VARIANT_SIGNATURE_FUNCTION = """
+CREATE OR REPLACE FUNCTION product_variant_signature(p_id BIGINT)
+RETURNS TEXT
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT md5(jsonb_agg(jsonb_build_array(a.name, v.value) ORDER BY a.name)::text)
+    FROM product_attribute_values v
+    JOIN product_attributes a ON a.id = v.attribute_id
+    WHERE v.product_id = p_id AND a.is_groupable
+$$
+"""
+
+# Триггер уровня оператора: по таблицам переходов собираются различные
+# id затронутых товаров, и сигнатура каждого считается один раз
+# (MATERIALIZED — чтобы SET и сравнение не вызывали функцию дважды).
+# UPDATE учитывает только строки, где поменялись товар, атрибут или значение
+CREATE_ATTRIBUTE_VALUES_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION product_attribute_values_variant_signature_refresh()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    changed_ids BIGINT[];
+BEGIN
+    IF current_setting('catalog.bulk_import', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        changed_ids := ARRAY(SELECT DISTINCT product_id FROM new_rows);
+    ELSIF TG_OP = 'DELETE' THEN
+        changed_ids := ARRAY(SELECT DISTINCT product_id FROM old_rows);
+    ELSE
+        changed_ids := ARRAY(
+            SELECT DISTINCT unnest(ARRAY[o.product_id, n.product_id])
+            FROM old_rows o
+            JOIN new_rows n ON n.id = o.id
+            WHERE (o.product_id, o.attribute_id, o.value)
+                  IS DISTINCT FROM (n.product_id, n.attribute_id, n.value)
+        );
+    END IF;
+
+    IF cardinality(changed_ids) = 0 THEN
+        RETURN NULL;
+    END IF;
+
+    WITH signatures AS MATERIALIZED (
+        SELECT t.id, product_variant_signature(t.id) AS signature
+        FROM unnest(changed_ids) AS t(id)
+    )
+    UPDATE products p
+    SET variant_signature = s.signature
+    FROM signatures s
+    WHERE p.id = s.id
+      AND p.variant_signature IS DISTINCT FROM s.signature;
+
+    RETURN NULL;
+END
+$$
+"""
+
+
+def variant_signature_trigger_name(operation: str) -> str:
+    return f"trg_pav_variant_signature_{operation}"
+
+
+def create_variant_signature_trigger(operation: str) -> str:
+    return f"""
+CREATE TRIGGER {variant_signature_trigger_name(operation)}
+    AFTER {operation.upper()} ON product_attribute_values
+    REFERENCING {TOUCH_OPERATIONS[operation]}
+    FOR EACH STATEMENT EXECUTE FUNCTION product_attribute_values_variant_signature_refresh()
+"""
+
+
+# Флаг и имя атрибута справочника меняют сигнатуры всех товаров с этим
+# атрибутом. Без проверки bulk_import: импорт пересчитывает только свои товары
+CREATE_ATTRIBUTES_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION product_attributes_variant_signature_refresh()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF OLD.is_groupable IS DISTINCT FROM NEW.is_groupable
+       OR (NEW.is_groupable AND OLD.name <> NEW.name) THEN
+        UPDATE products
+        SET variant_signature = product_variant_signature(id)
+        WHERE id IN (
+            SELECT product_id
+            FROM product_attribute_values
+            WHERE attribute_id = NEW.id
+        );
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+CREATE_ATTRIBUTES_TRIGGER = """
+CREATE TRIGGER trg_product_attributes_variant_signature
+    AFTER UPDATE OF name, is_groupable ON product_attributes
+    FOR EACH ROW EXECUTE FUNCTION product_attributes_variant_signature_refresh()
+"""
+
+# Каждая DDL-команда выполняется отдельно: asyncpg не принимает
+# несколько команд в одном prepared statement
+VARIANT_SIGNATURE_DDL = (
+    CREATE_VARIANT_SIGNATURE_FUNCTION,
+    CREATE_ATTRIBUTE_VALUES_TRIGGER_FUNCTION,
+    *(
+        statement
+        for operation in TOUCH_OPERATIONS
+        for statement in (
+            f"DROP TRIGGER IF EXISTS {variant_signature_trigger_name(operation)} "
+            "ON product_attribute_values",
+            create_variant_signature_trigger(operation),
+        )
+    ),
+    CREATE_ATTRIBUTES_TRIGGER_FUNCTION,
+    "DROP TRIGGER IF EXISTS trg_product_attributes_variant_signature ON product_attributes",
+    CREATE_ATTRIBUTES_TRIGGER,
+)
+
+for _statement in VARIANT_SIGNATURE_DDL:
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
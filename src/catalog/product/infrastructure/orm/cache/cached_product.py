@@ -1,35 +1,93 @@
-from typing import Optional
+from decimal import Decimal
+from typing import Any, Optional
 
-from src.catalog.product.domain.aggregates.product import ProductAggregate
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.catalog.product.application.dto.product_import import (
+    ProductImportMergeDTO,
+    ProductImportRowDTO,
+)
+from src.catalog.product.domain.aggregates.product import (
+    ProductAggregate,
+    ProductAttributeAggregate,
+    ProductImageAggregate,
+)
 from src.catalog.product.domain.repository.product import ProductRepository
+from src.catalog.product.domain.repository.product_bulk_update import (
+    ProductBulkUpdateRepository,
+)
+from src.catalog.product.domain.repository.product_import import (
+    ProductImportRepository,
+)
+from src.catalog.product.infrastructure.orm.cache.cached_product_read import (
+    ProductReadCacheInvalidator,
+)
 from src.core.cache.base import Cache
+from src.core.db.unit_of_work import after_commit
+
+
+def product_cache_key(product_id: int) -> str:
+    return f"product:{product_id}"
 
 
 class CachedProductRepository(ProductRepository):
+    """
+    Кэширующий декоратор над ProductRepository.
+
+    Кэш общий для всех запросов процесса, поэтому в нём хранится
+    JSON-совместимый снимок агрегата, а не сам объект: каждый get
+    возвращает новый агрегат, и изменения одного запроса не протекают
+    в другой. Связанные category/supplier в снимок не входят.
+
+    Кэш — только для чтения: команды читают агрегат через
+    get(..., for_update=True) мимо кэша, иначе устаревший снимок
+    перезаписал бы чужие изменения.
+
+    Изменённый товар сбрасывается сразу (чтения этой же транзакции) и ещё
+    раз после коммита: иначе параллельный get между сбросом и коммитом
+    вернул бы в кэш старый снимок на весь TTL.
+
+    После коммита сбрасывается и снимок read-модели (GET /product/{id}):
+    UnitOfWork выполняет сброс до ответа, а задача шины — уже после него.
+    """
 
     def __init__(
         self,
         db_repository: ProductRepository,
         cache: Cache,
+        session: AsyncSession,
         ttl: int = 300,
     ):
         self._repo = db_repository
         self._cache = cache
+        self._session = session
         self._ttl = ttl
+        self._read_cache = ProductReadCacheInvalidator(cache)
 
     def _key(self, product_id: int) -> str:
-        return f"product:{product_id}"
+        return product_cache_key(product_id)
+
+    async def _evict(self, product_id: int) -> None:
+        key = self._key(product_id)
+        await self._cache.delete(key)
+        after_commit(self._session, lambda: self._cache.delete(key))
+        after_commit(self._session, lambda: self._read_cache.invalidate_product(product_id))
+
+    async def get(self, product_id: int, for_update: bool = False) -> Optional[ProductAggregate]:
+        if for_update:
+            # Команды изменяют то, что прочитали: снимок мог устареть
+            # (изменение в другом воркере, SET NULL при удалении категории)
+            return await self._repo.get(product_id, for_update=True)
 
-    async def get(self, product_id: int) -> Optional[ProductAggregate]:
         key = self._key(product_id)
 
         cached = await self._cache.get(key)
         if cached:
-            return cached
+            return self._from_snapshot(cached)
 
         product = await self._repo.get(product_id)
         if product:
-            await self._cache.set(key, product, ttl=self._ttl)
+            await self._cache.set(key, self._to_snapshot(product), ttl=self._ttl)
 
         return product
 
@@ -38,19 +96,143 @@ class CachedProductRepository(ProductRepository):
         return await self._repo.get_by_name(name)
 
     async def create(self, aggregate: ProductAggregate) -> ProductAggregate:
-        product = await self._repo.create(aggregate)
-        await self._cache.set(self._key(product.id), product, ttl=self._ttl)
-        return product
+        # Не кэшируем до коммита: при откате в кэше остался бы несуществующий товар
+        return await self._repo.create(aggregate)
 
     async def update(self, aggregate: ProductAggregate) -> ProductAggregate:
         product = await self._repo.update(aggregate)
-        await self._cache.delete(self._key(product.id))
+        await self._evict(product.id)
         return product
 
     async def delete(self, product_id: int) -> bool:
         result = await self._repo.delete(product_id)
-        await self._cache.delete(self._key(product_id))
+        await self._evict(product_id)
         return result
 
     async def get_related_by_filterable_attributes(self, product_id: int, category_id: Optional[int]):
         return await self._repo.get_related_by_filterable_attributes(product_id, category_id)
+
+    @staticmethod
+    def _to_snapshot(aggregate: ProductAggregate) -> dict[str, Any]:
+        return {
+            "id": aggregate.id,
+            "name": aggregate.name,
+            "description": aggregate.description,
+            "price": str(aggregate.price),
+            "category_id": aggregate.category_id,
+            "supplier_id": aggregate.supplier_id,
+            "region_id": aggregate.region_id,
+            "images": [
+                {
+                    "upload_id": image.upload_id,
+                    "is_main": image.is_main,
+                    "ordering": image.ordering,
+                    "object_key": image.object_key,
+                }
+                for image in aggregate.images
+            ],
+            "attributes": [
+                {
+                    "name": attribute.name,
+                    "value": attribute.value,
+                    "is_filterable": attribute.is_filterable,
+                    "is_groupable": attribute.is_groupable,
+                }
+                for attribute in aggregate.attributes
+            ],
+        }
+
+    @staticmethod
+    def _from_snapshot(data: dict[str, Any]) -> ProductAggregate:
+        return ProductAggregate(
+            product_id=data["id"],
+            name=data["name"],
+            description=data["description"],
+            price=Decimal(data["price"]),
+            category_id=data["category_id"],
+            supplier_id=data["supplier_id"],
+            region_id=data["region_id"],
+            images=[ProductImageAggregate(**image) for image in data["images"]],
+            attributes=[
+                ProductAttributeAggregate(**attribute)
+                for attribute in data["attributes"]
+            ],
+        )
+
+
+class CachedProductImportRepository(ProductImportRepository):
+    """
+    Сброс кэшированных агрегатов товаров, изменённых массовым импортом,
+    — как CachedProductRepository.update для одного товара: сразу и ещё
+    раз после коммита. Кэш read-модели после коммита сбрасывается сменой
+    поколения.
+    """
+
+    def __init__(
+        self,
+        db_repository: ProductImportRepository,
+        cache: Cache,
+        session: AsyncSession,
+    ):
+        self._repo = db_repository
+        self._cache = cache
+        self._session = session
+        self._read_cache = ProductReadCacheInvalidator(cache)
+
+    async def prepare(self) -> None:
+        await self._repo.prepare()
+
+    async def find_missing_references(
+        self,
+        rows: list[ProductImportRowDTO],
+    ) -> dict[str, set[int]]:
+        return await self._repo.find_missing_references(rows)
+
+    async def stage(self, rows: list[ProductImportRowDTO]) -> None:
+        await self._repo.stage(rows)
+
+    async def merge(self) -> ProductImportMergeDTO:
+        merged = await self._repo.merge()
+        keys = [product_cache_key(product_id) for product_id in merged.updated_ids]
+        if keys:
+            await self._cache.delete_many(keys)
+            after_commit(self._session, lambda: self._cache.delete_many(keys))
+        after_commit(self._session, self._read_cache.invalidate_all)
+        return merged
+
+
+class CachedProductBulkUpdateRepository(ProductBulkUpdateRepository):
+    """
+    Сброс кэшированных агрегатов товаров пакетного обновления
+    одним delete_many на пакет — сразу и ещё раз после коммита, вместе
+    со снимками read-модели этих товаров.
+    """
+
+    def __init__(
+        self,
+        db_repository: ProductBulkUpdateRepository,
+        cache: Cache,
+        session: AsyncSession,
+    ):
+        self._repo = db_repository
+        self._cache = cache
+        self._session = session
+        self._read_cache = ProductReadCacheInvalidator(cache)
+
+    async def lock_fields(self, product_ids: list[int]) -> dict[int, dict[str, Any]]:
+        return await self._repo.lock_fields(product_ids)
+
+    async def find_missing_references(
+        self,
+        wanted: dict[str, set[int]],
+    ) -> dict[str, set[int]]:
+        return await self._repo.find_missing_references(wanted)
+
+    async def apply(self, values_by_id: dict[int, dict[str, Any]]) -> None:
+        await self._repo.apply(values_by_id)
+        product_ids = list(values_by_id)
+        keys = [product_cache_key(product_id) for product_id in product_ids]
+        if keys:
+            await self._cache.delete_many(keys)
+            after_commit(self._session, lambda: self._cache.delete_many(keys))
+            after_commit(self._session, lambda: self._read_cache.invalidate_products(product_ids))
@@ -0,0 +1,293 @@
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from src.catalog.category.application.read_models.pricing import PriceFormulas
+from src.catalog.product.application.dto.product import (
+    CatalogFiltersDTO,
+    ProductCursorDTO,
+    ProductReadDTO,
+    ProductSearchDTO,
+)
+from src.catalog.product.application.read_models.product_snapshot import (
+    product_card_from_snapshot,
+    product_from_snapshot,
+    product_to_snapshot,
+)
+from src.catalog.product.domain.repository.product_read import (
+    ProductReadRepositoryInterface,
+)
+from src.core.cache.base import NO_EXPIRY, Cache
+
+# Поколение хранится без срока жизни: истечение по ttl кэша по умолчанию
+# означало бы незаметный сброс всего кэша чтения каждые несколько минут.
+GENERATION_KEY = "product_read:generation"
+
+
+async def _current_generation(cache: Cache) -> str:
+    generation = await cache.get(GENERATION_KEY)
+    if generation is None:
+        generation = uuid.uuid4().hex
+        await cache.set(GENERATION_KEY, generation, ttl=NO_EXPIRY)
+    return generation
+
+
+class CachedProductReadRepository(ProductReadRepositoryInterface):
+    """
+    Кэширующий декоратор над ProductReadRepositoryInterface.
+
+    Кэшируются get_by_id, get_by_name и get_many (related читает товары
+    через get_many: снимки читаются одним cache.get_many, промахи
+    дочитываются одним вызовом).
+    В кэше лежит JSON-совместимый снимок ProductReadDTO, поэтому он подходит
+    и для общего LRU, и для Redis. Ключи содержат поколение: сброс всего
+    кэша (изменение категории, поставщика, тега и т.п.) — это смена поколения,
+    а не перебор ключей. Остальные методы делегируются без кэширования.
+
+    get_many с view=card строит карточки из тех же полных снимков; промахи
+    дочитываются облегчённым запросом и в кэш не пишутся (там только
+    полные снимки).
+    """
+
+    def __init__(
+        self,
+        db_repository: ProductReadRepositoryInterface,
+        cache: Cache,
+        ttl: int = 300,
+    ):
+        self._repo = db_repository
+        self._cache = cache
+        self._ttl = ttl
+
+    async def get_by_id(self, product_id: int) -> Optional[ProductReadDTO]:
+        generation = await _current_generation(self._cache)
+        key = ProductReadCacheInvalidator.id_key(generation, product_id)
+
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return product_from_snapshot(cached)
+
+        dto = await self._repo.get_by_id(product_id)
+        if dto:
+            await self._cache.set(key, product_to_snapshot(dto), ttl=self._ttl)
+        return dto
+
+    async def get_by_name(self, name: str) -> Optional[ProductReadDTO]:
+        generation = await _current_generation(self._cache)
+        name_key = ProductReadCacheInvalidator.name_key(generation, name)
+
+        # По имени храним только id: снимок товара один, а после
+        # переименования старая запись просто не пройдёт проверку имени
+        product_id = await self._cache.get(name_key)
+        if product_id is not None:
+            dto = await self.get_by_id(product_id)
+            if dto and dto.name == name:
+                return dto
+
+        dto = await self._repo.get_by_name(name)
+        if dto:
+            await self._cache.set(name_key, dto.id, ttl=self._ttl)
+            await self._cache.set(
+                ProductReadCacheInvalidator.id_key(generation, dto.id),
+                product_to_snapshot(dto),
+                ttl=self._ttl,
+            )
+        return dto
+
+    async def get_many(
+        self,
+        product_ids: list[int],
+        view: str = "full",
+    ) -> list[ProductReadDTO]:
+        generation = await _current_generation(self._cache)
+        from_snapshot = product_card_from_snapshot if view == "card" else product_from_snapshot
+
+        keys = {
+            product_id: ProductReadCacheInvalidator.id_key(generation, product_id)
+            for product_id in product_ids
+        }
+        cached = await self._cache.get_many(keys.values())
+
+        found: dict[int, ProductReadDTO] = {}
+        missing: list[int] = []
+        for product_id, key in keys.items():
+            if key in cached:
+                found[product_id] = from_snapshot(cached[key])
+            else:
+                missing.append(product_id)
+
+        loaded = await self._repo.get_many(missing, view=view) if missing else []
+        for dto in loaded:
+            found[dto.id] = dto
+            if view == "card":
+                continue
+            await self._cache.set(
+                ProductReadCacheInvalidator.id_key(generation, dto.id),
+                product_to_snapshot(dto),
+                ttl=self._ttl,
+            )
+
+        return [found[product_id] for product_id in product_ids if product_id in found]
+
+    async def filter(
+        self,
+        name: Optional[str],
+        category_id: Optional[int],
+        product_type_id: Optional[int],
+        limit: int,
+        offset: int,
+        attributes: Optional[dict[str, list[str]]] = None,
+        sort_type: str = "default",
+        product_ids: Optional[List[int]] = None,
+        region_id: Optional[int] = None,
+        after: Optional[ProductCursorDTO] = None,
+        count_mode: str = "exact",
+        view: str = "full",
+    ) -> Tuple[List[ProductReadDTO], Optional[int]]:
+        return await self._repo.filter(
+            name=name,
+            category_id=category_id,
+            product_type_id=product_type_id,
+            limit=limit,
+            offset=offset,
+            attributes=attributes,
+            sort_type=sort_type,
+            product_ids=product_ids,
+            region_id=region_id,
+            after=after,
+            count_mode=count_mode,
+            view=view,
+        )
+
+    async def get_catalog_filters(
+        self,
+        category_id: Optional[int] = None,
+        device_type_id: Optional[int] = None,
+        selected: Optional[dict[str, list[str]]] = None,
+    ) -> CatalogFiltersDTO:
+        return await self._repo.get_catalog_filters(
+            category_id=category_id,
+            device_type_id=device_type_id,
+            selected=selected,
+        )
+
+    async def export_full_catalog(self, updated_since: Optional[datetime] = None):
+        return await self._repo.export_full_catalog(updated_since=updated_since)
+
+    def stream_full_catalog(
+        self,
+        chunk_size: int = 1000,
+        updated_since: Optional[datetime] = None,
+    ) -> AsyncIterator[list]:
+        return self._repo.stream_full_catalog(
+            chunk_size=chunk_size,
+            updated_since=updated_since,
+        )
+
+    async def get_deleted_product_ids(self, since: datetime) -> list:
+        return await self._repo.get_deleted_product_ids(since)
+
+    async def get_export_watermark(self) -> datetime:
+        return await self._repo.get_export_watermark()
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        view: str = "full",
+    ) -> ProductSearchDTO:
+        return await self._repo.search(query=query, limit=limit, offset=offset, view=view)
+
+    async def get_suggestion_documents(
+        self,
+        product_ids: Optional[list[int]] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> dict[int, list[str]]:
+        return await self._repo.get_suggestion_documents(product_ids, updated_since)
+
+    async def get_price_formulas(self) -> PriceFormulas:
+        return await self._repo.get_price_formulas()
+
+    async def get_review_counts_by_product_ids(
+        self,
+        product_ids: list[int],
+    ) -> dict[int, int]:
+        return await self._repo.get_review_counts_by_product_ids(product_ids)
+
+
+class ProductReadCacheInvalidator:
+    """
+    Сброс кэша read-модели товаров по событиям шины.
+
+    - изменения товара, его изображений, тегов и отзывов — сброс одного товара
+    - изменения категорий, поставщиков, регионов, тегов и атрибутов,
+      которые встраиваются во многие товары, — смена поколения (сброс всего)
+    - массовый импорт (пачки по тысячам товаров) — тоже смена поколения
+    - пакетное обновление полей — сброс товаров пакета одним delete_many
+
+    Изменения товара (update/delete, импорт, пакетное обновление) командные
+    репозитории сбрасывают ещё и через after_commit — до ответа клиенту;
+    задачи шины выполняются уже после ответа и покрывают остальные модули.
+
+    Сброс действует на общий кэш процесса: в нескольких воркерах он доходит
+    до остальных только с CACHE_REDIS_L2_ENABLED (рассылка через Redis),
+    иначе другие воркеры отдают старые снимки до истечения TTL.
+    """
+
+    PRODUCT_ENTITIES = {"product", "product_images"}
+    PRODUCT_DATA_ENTITIES = {"product_tag", "review"}
+    PRODUCT_BATCH_ENTITIES = {"product_bulk_update"}
+    GLOBAL_ENTITIES = {
+        "category",
+        "category_images",
+        "supplier",
+        "region",
+        "tag",
+        "product_attribute",
+        "product_import",
+    }
+
+    def __init__(self, cache: Cache):
+        self._cache = cache
+
+    @staticmethod
+    def id_key(generation: str, product_id: int) -> str:
+        return f"product_read:{generation}:id:{product_id}"
+
+    @staticmethod
+    def name_key(generation: str, name: str) -> str:
+        return f"product_read:{generation}:name:{name}"
+
+    async def invalidate_product(self, product_id: int) -> None:
+        generation = await _current_generation(self._cache)
+        await self._cache.delete(self.id_key(generation, product_id))
+
+    async def invalidate_products(self, product_ids: list[int]) -> None:
+        generation = await _current_generation(self._cache)
+        await self._cache.delete_many(
+            self.id_key(generation, product_id) for product_id in product_ids
+        )
+
+    async def invalidate_all(self) -> None:
+        await self._cache.replace(GENERATION_KEY, uuid.uuid4().hex, ttl=NO_EXPIRY)
+
+    async def handle(self, message: dict[str, Any]) -> None:
+        entity = message.get("entity")
+
+        if entity in self.GLOBAL_ENTITIES:
+            await self.invalidate_all()
+            return None
+
+        if entity in self.PRODUCT_BATCH_ENTITIES:
+            await self.invalidate_products((message.get("data") or {}).get("product_ids") or [])
+            return None
+
+        product_id = None
+        if entity in self.PRODUCT_ENTITIES:
+            product_id = message.get("entity_id")
+        elif entity in self.PRODUCT_DATA_ENTITIES:
+            product_id = (message.get("data") or {}).get("product_id")
+
+        if product_id:
+            await self.invalidate_product(product_id)
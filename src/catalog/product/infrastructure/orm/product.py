@@ -1,6 +1,7 @@
 from typing import Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -31,7 +32,7 @@ class SqlAlchemyProductRepository(ProductRepository):
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get(self, product_id: int) -> Optional[ProductAggregate]:
+    async def get(self, product_id: int, for_update: bool = False) -> Optional[ProductAggregate]:
         stmt = (
             select(Product)
             .options(
@@ -42,6 +43,9 @@ class SqlAlchemyProductRepository(ProductRepository):
             )
             .where(Product.id == product_id)
         )
+        if for_update:
+            # FOR NO KEY UPDATE: id не меняется, вставки ссылок на товар не блокируются
+            stmt = stmt.with_for_update(of=Product, key_share=True)
         result = await self.db.execute(stmt)
         model = result.scalar_one_or_none()
 
@@ -204,66 +208,10 @@ class SqlAlchemyProductRepository(ProductRepository):
             base = await self.get(product_id)
             return [base] if base else []
 
-        # Получаем groupable-атрибуты исходного товара (имя + значение)
-        groupable_attrs_stmt = (
-            select(ProductAttribute.name, ProductAttributeValue.value)
-            .join(ProductAttributeValue, ProductAttribute.id == ProductAttributeValue.attribute_id)
-            .where(
-                ProductAttributeValue.product_id == product_id,
-                ProductAttribute.is_groupable.is_(True),
-            )
-        )
-        groupable_attrs_result = await self.db.execute(groupable_attrs_stmt)
-        groupable_attrs = list(groupable_attrs_result.all())
-
-        if not groupable_attrs:
-            # Если нет groupable-атрибутов, возвращаем все товары категории
-            stmt = (
-                select(Product)
-                .options(
-                    selectinload(Product.images).selectinload(ProductImage.upload),
-                    selectinload(Product.attributes).selectinload(ProductAttributeValue.attribute),
-                    selectinload(Product.category),
-                    selectinload(Product.supplier),
-                )
-                .where(Product.category_id == category_id)
-                .order_by(Product.id)
-            )
-            result = await self.db.execute(stmt)
-            return [self._to_aggregate(model) for model in result.scalars().all()]
-
-        # Находим товары, у которых ВСЕ groupable-атрибуты исходного товара
-        # совпадают по имени И значению, и при этом у связанного товара
-        # эти атрибуты тоже имеют is_groupable = true
-        #
-        # Стратегия: считаем количество (имя, значение) пар, которые совпали.
-        # Товар подходит, если количество совпадений == количеству groupable-атрибутов.
-
-        # Создаём условия для каждого атрибута — каждое условие проверяет
-        # конкретную пару (имя, значение)
-        match_conditions = [
-            (ProductAttribute.name == attr.name) & (ProductAttributeValue.value == attr.value)
-            for attr in groupable_attrs
-        ]
-
-        # Суммируем совпадения через case — SQLAlchemy 2.x синтаксис
-        # Каждая строка product_attribute_values может дать 0..N совпадений
-        # (по одному за каждое условие, которое выполняется для этой строки)
-        # Но одна строка может совпасть только с одним условием (т.к. name unique)
-        # Поэтому мы считаем строки, для которых хотя бы одно условие совпало
-        combined_condition = match_conditions[0]
-        for cond in match_conditions[1:]:
-            combined_condition = combined_condition | cond
-
-        subquery = (
-            select(ProductAttributeValue.product_id)
-            .join(ProductAttribute, ProductAttribute.id == ProductAttributeValue.attribute_id)
-            .where(
-                ProductAttribute.is_groupable.is_(True),
-                combined_condition,
-            )
-            .group_by(ProductAttributeValue.product_id)
-            .having(func.count() == len(groupable_attrs))
+        # Сигнатура groupable-атрибутов исходного товара (поддерживается
+        # триггерами, см. product_variant_signature.py)
+        signature = await self.db.scalar(
+            select(Product.variant_signature).where(Product.id == product_id)
         )
 
         stmt = (
@@ -274,13 +222,16 @@ class SqlAlchemyProductRepository(ProductRepository):
                 selectinload(Product.category),
                 selectinload(Product.supplier),
             )
-            .where(
-                Product.category_id == category_id,
-                Product.id.in_(subquery),
-            )
+            .where(Product.category_id == category_id)
             .order_by(Product.id)
         )
 
+        # Нет groupable-атрибутов — семейство вся категория. Иначе семейство —
+        # товары категории с теми же парами (имя, значение) groupable-атрибутов:
+        # равенство сигнатур по индексу (category_id, variant_signature)
+        if signature is not None:
+            stmt = stmt.where(Product.variant_signature == signature)
+
         result = await self.db.execute(stmt)
         return [self._to_aggregate(model) for model in result.scalars().all()]
 
@@ -289,38 +240,115 @@ class SqlAlchemyProductRepository(ProductRepository):
         product_id: int,
         attributes: list[ProductAttributeAggregate],
     ):
-        existing_values = await self.db.execute(
-            select(ProductAttributeValue).where(ProductAttributeValue.product_id == product_id)
+        """
+        Привести атрибуты товара к списку attributes набором запросов.
+
+        Справочник атрибутов: один SELECT по всем именам, один
+        INSERT ... ON CONFLICT для недостающих и UPDATE только для атрибутов
+        со сменившимися флагами. Значения: один SELECT текущих, один DELETE
+        исчезнувших и один INSERT ... ON CONFLICT для новых и изменившихся.
+        Неизменённые строки не трогаются, поэтому триггеры updated_at
+        срабатывают только на реальные изменения.
+        """
+        # Повтор имени в запросе — берём последнее значение
+        desired = {attribute.name.strip(): attribute for attribute in attributes}
+        attribute_ids = await self._ensure_attributes(desired)
+        desired_values = {
+            attribute_ids[name]: attribute.value
+            for name, attribute in desired.items()
+        }
+
+        result = await self.db.execute(
+            select(ProductAttributeValue.attribute_id, ProductAttributeValue.value)
+            .where(ProductAttributeValue.product_id == product_id)
         )
-        for attr_value in existing_values.scalars().all():
-            await self.db.delete(attr_value)
-
-        for attribute in attributes:
-            attribute_name = attribute.name.strip()
-            stmt = select(ProductAttribute).where(ProductAttribute.name == attribute_name)
-            attr_result = await self.db.execute(stmt)
-            attr_model = attr_result.scalar_one_or_none()
-
-            if not attr_model:
-                attr_model = ProductAttribute(
-                    name=attribute_name,
-                    is_filterable=attribute.is_filterable,
-                    is_groupable=attribute.is_groupable,
+        current_values = dict(result.all())
+
+        removed = current_values.keys() - desired_values.keys()
+        if removed:
+            await self.db.execute(
+                delete(ProductAttributeValue).where(
+                    ProductAttributeValue.product_id == product_id,
+                    ProductAttributeValue.attribute_id.in_(removed),
                 )
-                self.db.add(attr_model)
-                await self.db.flush()
-            else:
-                attr_model.is_filterable = attribute.is_filterable
-                attr_model.is_groupable = attribute.is_groupable
-
-            self.db.add(
-                ProductAttributeValue(
-                    product_id=product_id,
-                    attribute_id=attr_model.id,
-                    value=attribute.value,
+            )
+
+        changed = [
+            {"product_id": product_id, "attribute_id": attribute_id, "value": value}
+            for attribute_id, value in desired_values.items()
+            if current_values.get(attribute_id) != value
+        ]
+        if changed:
+            stmt = insert(ProductAttributeValue).values(changed)
+            await self.db.execute(
+                stmt.on_conflict_do_update(
+                    constraint="uq_product_attribute_value_per_product",
+                    set_={"value": stmt.excluded.value, "updated_at": func.now()},
                 )
             )
 
+    async def _ensure_attributes(
+        self,
+        attributes: dict[str, ProductAttributeAggregate],
+    ) -> dict[str, int]:
+        """
+        id атрибутов справочника по именам: недостающие создаются,
+        у существующих обновляются is_filterable/is_groupable.
+        """
+        if not attributes:
+            return {}
+
+        result = await self.db.execute(
+            select(
+                ProductAttribute.id,
+                ProductAttribute.name,
+                ProductAttribute.is_filterable,
+                ProductAttribute.is_groupable,
+            ).where(ProductAttribute.name.in_(attributes))
+        )
+        existing = {row.name: row for row in result}
+
+        missing = [name for name in attributes if name not in existing]
+        attribute_ids = {name: row.id for name, row in existing.items()}
+        if missing:
+            # DO NOTHING: имя мог одновременно создать другой запрос
+            inserted = await self.db.execute(
+                insert(ProductAttribute)
+                .values([
+                    {
+                        "name": name,
+                        "is_filterable": attributes[name].is_filterable,
+                        "is_groupable": attributes[name].is_groupable,
+                    }
+                    for name in missing
+                ])
+                .on_conflict_do_nothing(index_elements=[ProductAttribute.name])
+                .returning(ProductAttribute.id, ProductAttribute.name)
+            )
+            attribute_ids.update({row.name: row.id for row in inserted})
+
+            raced = [name for name in missing if name not in attribute_ids]
+            if raced:
+                result = await self.db.execute(
+                    select(ProductAttribute.id, ProductAttribute.name)
+                    .where(ProductAttribute.name.in_(raced))
+                )
+                attribute_ids.update({row.name: row.id for row in result})
+
+        for name, row in existing.items():
+            attribute = attributes[name]
+            if (row.is_filterable, row.is_groupable) != (attribute.is_filterable, attribute.is_groupable):
+                await self.db.execute(
+                    update(ProductAttribute)
+                    .where(ProductAttribute.id == row.id)
+                    .values(
+                        is_filterable=attribute.is_filterable,
+                        is_groupable=attribute.is_groupable,
+                    )
+                )
+
+        return attribute_ids
+
     @staticmethod
     def _to_aggregate(model: Product) -> ProductAggregate:
         category = None
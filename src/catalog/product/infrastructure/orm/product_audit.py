@@ -1,14 +1,18 @@
 import json
 
+from sqlalchemy import insert
+
 from src.catalog.product.application.dto.audit import (
     ProductAttributeAuditDTO,
     ProductAuditDTO,
+    ProductImportAuditDTO,
     ProductTypeAuditDTO,
 )
 from src.catalog.product.domain.repository.audit import ProductRelationAuditDTO
 from src.catalog.product.infrastructure.models.product_audit_logs import (
     ProductAttributeAuditLog,
     ProductAuditLog,
+    ProductImportLog,
     ProductTypeAuditLog,
 )
 from src.catalog.product.infrastructure.models.product_relation_audit_logs import (
@@ -33,6 +37,23 @@ class SqlAlchemyProductAuditRepository:
         self.db.add(model)
         await self.db.flush()
 
+    async def log_many(self, dtos: list[ProductAuditDTO]) -> None:
+        if not dtos:
+            return None
+        await self.db.execute(
+            insert(ProductAuditLog).values([
+                {
+                    "product_id": dto.product_id,
+                    "action": dto.action,
+                    "old_data": dto.old_data,
+                    "new_data": dto.new_data,
+                    "user_id": dto.user_id,
+                    "fio": dto.fio,
+                }
+                for dto in dtos
+            ])
+        )
+
     async def log_product_type(self, dto: ProductTypeAuditDTO):
         model = ProductTypeAuditLog(
             product_type_id=dto.product_type_id,
@@ -68,3 +89,19 @@ class SqlAlchemyProductAuditRepository:
         )
         self.db.add(model)
         await self.db.flush()
+
+    async def log_product_import(self, dto: ProductImportAuditDTO) -> int:
+        model = ProductImportLog(
+            format=dto.format,
+            total=dto.total,
+            created=dto.created,
+            updated=dto.updated,
+            unchanged=dto.unchanged,
+            failed=dto.failed,
+            errors=dto.errors,
+            user_id=dto.user_id,
+            fio=dto.fio,
+        )
+        self.db.add(model)
+        await self.db.flush()
+        return model.id
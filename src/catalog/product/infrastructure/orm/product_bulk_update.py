@@ -0,0 +1,87 @@
+"""
+Пакетное обновление скалярных полей товаров.
+
+Новые значения всех товаров пакета записываются одним
+UPDATE products ... FROM (VALUES ...), а не запросом на товар.
+Построчные триггеры (поисковый документ при смене названия, updated_at)
+срабатывают как при обычном обновлении; в пакет попадают только товары,
+у которых значения действительно отличаются.
+"""
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    Numeric,
+    String,
+    Text,
+    cast,
+    column,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.catalog.product.application.dto.product_bulk_update import BULK_UPDATE_FIELDS
+from src.catalog.product.domain.repository.product_bulk_update import (
+    ProductBulkUpdateRepository,
+)
+from src.catalog.product.infrastructure.models.product import Product
+from src.catalog.product.infrastructure.orm.product_references import find_missing_ids
+
+
+class SqlAlchemyProductBulkUpdateRepository(ProductBulkUpdateRepository):
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def lock_fields(self, product_ids: list[int]) -> dict[int, dict[str, Any]]:
+        if not product_ids:
+            return {}
+        # FOR NO KEY UPDATE: id не меняется, вставки ссылок на товары не блокируются.
+        # Порядок по id — одинаковый порядок блокировок у параллельных пакетов
+        stmt = (
+            select(Product.id, *(getattr(Product, field) for field in BULK_UPDATE_FIELDS))
+            .where(Product.id.in_(product_ids))
+            .order_by(Product.id)
+            .with_for_update(key_share=True)
+        )
+        result = await self.db.execute(stmt)
+        return {
+            row.id: {field: getattr(row, field) for field in BULK_UPDATE_FIELDS}
+            for row in result
+        }
+
+    async def find_missing_references(
+        self,
+        wanted: dict[str, set[int]],
+    ) -> dict[str, set[int]]:
+        return await find_missing_ids(self.db, wanted)
+
+    async def apply(self, values_by_id: dict[int, dict[str, Any]]) -> None:
+        if not values_by_id:
+            return None
+
+        # Типы колонок задают приведения параметров в VALUES. None попадает
+        # в VALUES литералом NULL без типа, поэтому в SET значения приводятся явно
+        v = values(
+            column("id", BigInteger),
+            column("name", String(200)),
+            column("description", Text),
+            column("price", Numeric(12, 2)),
+            column("category_id", BigInteger),
+            column("region_id", BigInteger),
+            name="v",
+        ).data([
+            (product_id, *(fields[field] for field in BULK_UPDATE_FIELDS))
+            for product_id, fields in sorted(values_by_id.items())
+        ])
+
+        await self.db.execute(
+            update(Product)
+            .where(Product.id == v.c.id)
+            .values({
+                field: cast(v.c[field], Product.__table__.c[field].type)
+                for field in BULK_UPDATE_FIELDS
+            })
+        )
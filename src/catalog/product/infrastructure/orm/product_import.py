@@ -0,0 +1,412 @@
+"""
+Массовый импорт товаров через staging-таблицы.
+
+Проверенные строки пачками копируются (asyncpg COPY) во временные таблицы
+транзакции, затем слияние с каталогом выполняется несколькими запросами
+на весь импорт, а не запросами на каждый товар:
+- новые товары получают id из последовательности products заранее,
+  чтобы их атрибуты, изображения и теги ссылались на них так же, как у существующих
+- у существующих товаров меняются только строки, которые действительно отличаются
+- на время слияния триггеры поискового документа, сигнатуры
+  вариантов и updated_at отключены (catalog.bulk_import, см. product_search.py,
+  product_variant_signature.py и product_tombstone.py); они пересчитываются
+  для изменённых товаров одним запросом
+"""
+from typing import Any, Iterable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.catalog.product.application.dto.product_import import (
+    ProductImportMergeDTO,
+    ProductImportRowDTO,
+)
+from src.catalog.product.domain.repository.product_import import (
+    ProductImportRepository,
+)
+from src.catalog.product.infrastructure.orm.product_references import (
+    REFERENCE_TABLES,
+    find_missing_ids,
+)
+
+# Каждая DDL-команда выполняется отдельно: asyncpg не принимает
+# несколько команд в одном prepared statement
+_STAGING_DDL = (
+    """
+    CREATE TEMP TABLE product_import_rows (
+        row_no integer PRIMARY KEY,
+        product_id bigint,
+        is_new boolean NOT NULL DEFAULT false,
+        name varchar(200) NOT NULL,
+        description text,
+        price numeric(12, 2) NOT NULL,
+        category_id bigint,
+        supplier_id bigint,
+        region_id bigint,
+        has_attributes boolean NOT NULL,
+        has_images boolean NOT NULL,
+        has_tags boolean NOT NULL
+    ) ON COMMIT DROP
+    """,
+    """
+    CREATE TEMP TABLE product_import_attributes (
+        row_no integer NOT NULL,
+        name varchar(100) NOT NULL,
+        value varchar(255) NOT NULL,
+        is_filterable boolean,
+        is_groupable boolean
+    ) ON COMMIT DROP
+    """,
+    """
+    CREATE TEMP TABLE product_import_images (
+        row_no integer NOT NULL,
+        upload_id bigint NOT NULL,
+        is_main boolean NOT NULL,
+        ordering integer NOT NULL
+    ) ON COMMIT DROP
+    """,
+    """
+    CREATE TEMP TABLE product_import_tags (
+        row_no integer NOT NULL,
+        tag_id bigint NOT NULL
+    ) ON COMMIT DROP
+    """,
+)
+
+_STAGING_TABLES = (
+    "product_import_rows",
+    "product_import_attributes",
+    "product_import_images",
+    "product_import_tags",
+)
+
+_ASSIGN_NEW_IDS = """
+    UPDATE product_import_rows
+    SET product_id = nextval(pg_get_serial_sequence('products', 'id')),
+        is_new = true
+    WHERE product_id IS NULL
+"""
+
+_INSERT_PRODUCTS = """
+    INSERT INTO products (id, name, description, price, category_id, supplier_id, region_id)
+    SELECT product_id, name, description, price, category_id, supplier_id, region_id
+    FROM product_import_rows
+    WHERE is_new
+    ORDER BY row_no
+    RETURNING id AS product_id
+"""
+
+_UPDATE_PRODUCTS = """
+    UPDATE products p
+    SET name = s.name,
+        description = s.description,
+        price = s.price,
+        category_id = s.category_id,
+        supplier_id = s.supplier_id,
+        region_id = s.region_id,
+        updated_at = now()
+    FROM product_import_rows s
+    WHERE s.product_id = p.id
+      AND NOT s.is_new
+      AND (p.name, p.description, p.price, p.category_id, p.supplier_id, p.region_id)
+          IS DISTINCT FROM
+          (s.name, s.description, s.price, s.category_id, s.supplier_id, s.region_id)
+    RETURNING p.id AS product_id
+"""
+
+# Флаги атрибута из последней строки файла, где они заданы
+_ATTRIBUTE_FLAGS = """
+    SELECT DISTINCT ON (name) name, is_filterable, is_groupable
+    FROM product_import_attributes
+    WHERE is_filterable IS NOT NULL OR is_groupable IS NOT NULL
+    ORDER BY name, row_no DESC
+"""
+
+_UPDATE_ATTRIBUTE_FLAGS = f"""
+    UPDATE product_attributes pa
+    SET is_filterable = COALESCE(f.is_filterable, pa.is_filterable),
+        is_groupable = COALESCE(f.is_groupable, pa.is_groupable),
+        updated_at = now()
+    FROM ({_ATTRIBUTE_FLAGS}) f
+    WHERE pa.name = f.name
+      AND (pa.is_filterable, pa.is_groupable) IS DISTINCT FROM
+          (COALESCE(f.is_filterable, pa.is_filterable), COALESCE(f.is_groupable, pa.is_groupable))
+    RETURNING pa.id
+"""
+
+# Значения по умолчанию — как у ProductAttributeInputDTO в POST /product
+_INSERT_ATTRIBUTES = f"""
+    INSERT INTO product_attributes (name, is_filterable, is_groupable)
+    SELECT n.name, COALESCE(f.is_filterable, false), COALESCE(f.is_groupable, false)
+    FROM (SELECT DISTINCT name FROM product_import_attributes) n
+    LEFT JOIN ({_ATTRIBUTE_FLAGS}) f ON f.name = n.name
+    ORDER BY n.name
+    ON CONFLICT (name) DO NOTHING
+"""
+
+_DELETE_ATTRIBUTE_VALUES = """
+    DELETE FROM product_attribute_values v
+    USING product_import_rows s
+    WHERE s.has_attributes
+      AND NOT s.is_new
+      AND v.product_id = s.product_id
+      AND NOT EXISTS (
+          SELECT 1
+          FROM product_import_attributes a
+          JOIN product_attributes pa ON pa.name = a.name
+          WHERE a.row_no = s.row_no AND pa.id = v.attribute_id
+      )
+    RETURNING v.product_id
+"""
+
+_UPSERT_ATTRIBUTE_VALUES = """
+    INSERT INTO product_attribute_values (product_id, attribute_id, value)
+    SELECT s.product_id, pa.id, a.value
+    FROM product_import_attributes a
+    JOIN product_import_rows s ON s.row_no = a.row_no
+    JOIN product_attributes pa ON pa.name = a.name
+    ON CONFLICT ON CONSTRAINT uq_product_attribute_value_per_product
+    DO UPDATE SET value = EXCLUDED.value, updated_at = now()
+    WHERE product_attribute_values.value IS DISTINCT FROM EXCLUDED.value
+    RETURNING product_id
+"""
+
+_DELETE_IMAGES = """
+    DELETE FROM product_images i
+    USING product_import_rows s
+    WHERE s.has_images
+      AND NOT s.is_new
+      AND i.product_id = s.product_id
+      AND NOT EXISTS (
+          SELECT 1
+          FROM product_import_images n
+          WHERE n.row_no = s.row_no AND n.upload_id = i.upload_id
+      )
+    RETURNING i.product_id
+"""
+
+_UPDATE_IMAGES = """
+    UPDATE product_images i
+    SET is_main = n.is_main,
+        ordering = n.ordering,
+        updated_at = now()
+    FROM product_import_images n
+    JOIN product_import_rows s ON s.row_no = n.row_no
+    WHERE i.product_id = s.product_id
+      AND i.upload_id = n.upload_id
+      AND (i.is_main, i.ordering) IS DISTINCT FROM (n.is_main, n.ordering)
+    RETURNING i.product_id
+"""
+
+_INSERT_IMAGES = """
+    INSERT INTO product_images (product_id, upload_id, is_main, ordering)
+    SELECT s.product_id, n.upload_id, n.is_main, n.ordering
+    FROM product_import_images n
+    JOIN product_import_rows s ON s.row_no = n.row_no
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM product_images i
+        WHERE i.product_id = s.product_id AND i.upload_id = n.upload_id
+    )
+    RETURNING product_id
+"""
+
+_DELETE_TAGS = """
+    DELETE FROM product_tags t
+    USING product_import_rows s
+    WHERE s.has_tags
+      AND NOT s.is_new
+      AND t.product_id = s.product_id
+      AND NOT EXISTS (
+          SELECT 1
+          FROM product_import_tags n
+          WHERE n.row_no = s.row_no AND n.tag_id = t.tag_id
+      )
+    RETURNING t.product_id
+"""
+
+_INSERT_TAGS = """
+    INSERT INTO product_tags (product_id, tag_id)
+    SELECT s.product_id, n.tag_id
+    FROM product_import_tags n
+    JOIN product_import_rows s ON s.row_no = n.row_no
+    ON CONFLICT ON CONSTRAINT uq_product_tags_unique DO NOTHING
+    RETURNING product_id
+"""
+
+# То, что при обычных изменениях делают триггеры
+_REFRESH_PRODUCTS = """
+    UPDATE products
+    SET search_vector = product_search_document(id, name),
+        variant_signature = product_variant_signature(id),
+        updated_at = now()
+    WHERE id = ANY(:product_ids)
+"""
+
+
+class SqlAlchemyProductImportRepository(ProductImportRepository):
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def prepare(self) -> None:
+        for statement in _STAGING_DDL:
+            await self.db.execute(text(statement))
+
+    async def find_missing_references(
+        self,
+        rows: list[ProductImportRowDTO],
+    ) -> dict[str, set[int]]:
+        wanted: dict[str, set[int]] = {field: set() for field in REFERENCE_TABLES}
+        for row in rows:
+            for field, value in (
+                ("id", row.product_id),
+                ("category_id", row.category_id),
+                ("supplier_id", row.supplier_id),
+                ("region_id", row.region_id),
+            ):
+                if value is not None:
+                    wanted[field].add(value)
+            wanted["upload_id"].update(image.upload_id for image in row.images or ())
+            wanted["tag_id"].update(row.tag_ids or ())
+
+        return await find_missing_ids(self.db, wanted)
+
+    async def stage(self, rows: list[ProductImportRowDTO]) -> None:
+        if not rows:
+            return None
+
+        await self._copy(
+            "product_import_rows",
+            (
+                "row_no",
+                "product_id",
+                "name",
+                "description",
+                "price",
+                "category_id",
+                "supplier_id",
+                "region_id",
+                "has_attributes",
+                "has_images",
+                "has_tags",
+            ),
+            (
+                (
+                    row.row,
+                    row.product_id,
+                    row.name,
+                    row.description,
+                    row.price,
+                    row.category_id,
+                    row.supplier_id,
+                    row.region_id,
+                    row.attributes is not None,
+                    row.images is not None,
+                    row.tag_ids is not None,
+                )
+                for row in rows
+            ),
+        )
+        await self._copy(
+            "product_import_attributes",
+            ("row_no", "name", "value", "is_filterable", "is_groupable"),
+            (
+                (row.row, attribute.name, attribute.value, attribute.is_filterable, attribute.is_groupable)
+                for row in rows
+                for attribute in row.attributes or ()
+            ),
+        )
+        await self._copy(
+            "product_import_images",
+            ("row_no", "upload_id", "is_main", "ordering"),
+            (
+                (row.row, image.upload_id, image.is_main, image.ordering)
+                for row in rows
+                for image in row.images or ()
+            ),
+        )
+        await self._copy(
+            "product_import_tags",
+            ("row_no", "tag_id"),
+            (
+                (row.row, tag_id)
+                for row in rows
+                for tag_id in row.tag_ids or ()
+            ),
+        )
+
+    async def merge(self) -> ProductImportMergeDTO:
+        # Временные таблицы не анализирует autovacuum, а без статистики
+        # планировщик считает их почти пустыми
+        for table in _STAGING_TABLES:
+            await self.db.execute(text(f"ANALYZE {table}"))
+
+        await self._set_bulk_import(True)
+
+        await self.db.execute(text(_ASSIGN_NEW_IDS))
+        created_ids = await self._product_ids(_INSERT_PRODUCTS)
+        changed_ids = await self._product_ids(_UPDATE_PRODUCTS)
+
+        result = await self.db.execute(text(_UPDATE_ATTRIBUTE_FLAGS))
+        updated_attribute_ids = sorted(result.scalars().all())
+        await self.db.execute(text(_INSERT_ATTRIBUTES))
+
+        for statement in (
+            _DELETE_ATTRIBUTE_VALUES,
+            _UPSERT_ATTRIBUTE_VALUES,
+            _DELETE_IMAGES,
+            _UPDATE_IMAGES,
+            _INSERT_IMAGES,
+            _DELETE_TAGS,
+            _INSERT_TAGS,
+        ):
+            changed_ids |= await self._product_ids(statement)
+
+        updated_ids = changed_ids - created_ids
+        touched = sorted(created_ids | updated_ids)
+        if touched:
+            await self.db.execute(text(_REFRESH_PRODUCTS), {"product_ids": touched})
+
+        await self._set_bulk_import(False)
+
+        existing = await self.db.scalar(
+            text("SELECT count(*) FROM product_import_rows WHERE NOT is_new")
+        )
+        return ProductImportMergeDTO(
+            created_ids=sorted(created_ids),
+            updated_ids=sorted(updated_ids),
+            unchanged=existing - len(updated_ids),
+            updated_attribute_ids=updated_attribute_ids,
+        )
+
+    async def _product_ids(self, statement: str) -> set[int]:
+        """id товаров из RETURNING product_id, без повторов на стороне БД."""
+        result = await self.db.execute(
+            text(f"WITH changed AS ({statement}) SELECT DISTINCT product_id FROM changed")
+        )
+        return set(result.scalars().all())
+
+    async def _set_bulk_import(self, enabled: bool) -> None:
+        await self.db.execute(
+            text("SELECT set_config('catalog.bulk_import', :value, true)"),
+            {"value": "on" if enabled else "off"},
+        )
+
+    async def _copy(
+        self,
+        table: str,
+        columns: tuple[str, ...],
+        records: Iterable[tuple[Any, ...]],
+    ) -> None:
+        records = list(records)
+        if not records:
+            return None
+        # COPY идёт через соединение asyncpg той же транзакции, что и сессия
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table,
+            records=records,
+            columns=columns,
+        )
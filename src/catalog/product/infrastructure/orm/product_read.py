@@ -1,23 +1,65 @@
-from typing import List, Optional, Tuple
-
-from sqlalchemy import and_, func, or_, select, text
+import json
+import re
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Numeric,
+    RowMapping,
+    Select,
+    and_,
+    bindparam,
+    column,
+    func,
+    literal_column,
+    or_,
+    select,
+    text,
+    true,
+    values,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
 
 from src.catalog.category.domain.aggregates.category import CategoryAggregate
+from src.catalog.category.application.read_models.pricing import PriceFormulas
+from src.catalog.category.infrastructure.services.category_tree import (
+    CategoryTreeProvider,
+    get_category_tree_provider,
+)
+from src.catalog.category.infrastructure.services.pricing import (
+    PriceFormulaProvider,
+    get_price_formula_provider,
+)
 from src.regions.domain.aggregates.region import RegionAggregate
 from src.catalog.product.application.dto.product import (
     ProductAttributeReadDTO,
+    ProductCardDTO,
     ProductImageReadDTO,
     ProductRatingDTO,
     ProductReadDTO,
     CatalogFiltersDTO,
     FilterDTO,
+    ProductCursorDTO,
     FilterOptionDTO,
     ProductSearchDTO,
-    SearchSuggestionDTO,
     TagReadDTO,
 )
+from src.catalog.product.application.services.bitmap_index import (
+    ProductBitmapIndex,
+    ProductIndexDocument,
+    get_product_bitmap_index,
+)
+from src.catalog.product.application.read_models.product_snapshot import (
+    product_from_snapshot,
+)
+from src.catalog.product.application.services.catalog_export import export_watermark
 from src.catalog.product.domain.repository.product_read import (
     ProductReadRepositoryInterface,
 )
@@ -27,18 +69,148 @@ from src.catalog.product.infrastructure.models.product_attribute_value import (
     ProductAttributeValue,
 )
 from src.catalog.product.infrastructure.models.product_image import ProductImage
+from src.catalog.product.infrastructure.models.product_read_model import ProductReadModel
 from src.catalog.product.infrastructure.models.product_tag import ProductTag
+from src.catalog.product.infrastructure.models.product_tombstone import ProductTombstone
 from src.catalog.review.infrastructure.models.review import Review
 from src.catalog.suppliers.domain.aggregates.supplier import SupplierAggregate
 from src.core.conf.settings import get_settings
 from src.core.services.images.storage import S3ImageStorageService
+from src.uploads.infrastructure.models.upload_history import UploadHistory
+
+
+# Выгрузка каталога: одна строка на товар, атрибуты/теги/родительские
+# категории собраны в jsonb. Типы jsonb-колонок указаны явно, чтобы драйвер
+# возвращал уже разобранные значения, а не строки.
+_EXPORT_CATALOG_SQL_TEMPLATE = """
+    WITH parent_categories_agg AS (
+        -- Предки каждой категории из таблицы замыкания, от ближайшего
+        SELECT
+            cc.descendant_id AS category_id,
+            jsonb_agg(
+                jsonb_build_object(
+                    'id', a.id,
+                    'name', a.name
+                )
+                ORDER BY cc.depth
+            ) AS parent_categories
+        FROM category_closure cc
+        JOIN categories a ON a.id = cc.ancestor_id
+        WHERE cc.depth > 0
+        GROUP BY cc.descendant_id
+    )
+    SELECT
+        p.id,
+        p.name,
+        p.description,
+        p.price,
+        p.category_id,
+        c.name as category_name,
+        c.device_type_id as category_device_type_id,
+        p.supplier_id,
+        s.name as supplier_name,
+        p.region_id,
+        r.name as region_name,
+        COALESCE(
+            jsonb_agg(
+                DISTINCT jsonb_build_object(
+                    'id', pa.id,
+                    'name', pa.name,
+                    'value', pav.value,
+                    'is_filterable', pa.is_filterable
+                )
+            ) FILTER (WHERE pa.id IS NOT NULL),
+            '[]'
+        ) as attributes,
+        COALESCE(
+            jsonb_agg(
+                DISTINCT jsonb_build_object(
+                    'tag_id', t.id,
+                    'name', t.name,
+                    'description', t.description,
+                    'color', t.color
+                )
+            ) FILTER (WHERE t.id IS NOT NULL),
+            '[]'
+        ) as tags,
+        COALESCE(pca.parent_categories, '[]') as parent_categories
+    FROM products p
+    LEFT JOIN categories c ON c.id = p.category_id
+    LEFT JOIN suppliers s ON s.id = p.supplier_id
+    LEFT JOIN regions r ON r.id = p.region_id
+    LEFT JOIN product_attribute_values pav ON pav.product_id = p.id
+    LEFT JOIN product_attributes pa ON pa.id = pav.attribute_id
+    LEFT JOIN product_tags pt ON pt.product_id = p.id
+    LEFT JOIN tags t ON t.id = pt.tag_id
+    LEFT JOIN parent_categories_agg pca ON pca.category_id = p.category_id
+    {where}
+    GROUP BY
+        p.id,
+        c.name,
+        c.device_type_id,
+        s.name,
+        p.region_id,
+        r.name,
+        pca.parent_categories
+    ORDER BY p.id
+"""
+
+# Инкрементальная выгрузка — одно условие по индексу ix_products_updated_at:
+# updated_at товара поднимают триггеры и при изменении его атрибутов,
+# изображений и тегов, и при изменении встроенных в строку справочников
+# (категория и её предки, поставщик, регион, атрибут, тег) — см. product_tombstone.py
+_EXPORT_DELTA_WHERE = """
+    WHERE p.updated_at >= :since
+"""
+
+
+def _export_catalog_statement(where: str = "", *bind_params):
+    return text(
+        _EXPORT_CATALOG_SQL_TEMPLATE.format(where=where.strip())
+    ).bindparams(*bind_params).columns(
+        attributes=JSONB,
+        tags=JSONB,
+        parent_categories=JSONB,
+    )
+
+
+EXPORT_CATALOG_SQL = _export_catalog_statement()
+EXPORT_CATALOG_DELTA_SQL = _export_catalog_statement(
+    _EXPORT_DELTA_WHERE,
+    bindparam("since", type_=DateTime(timezone=True)),
+)
+
+
+class _ExplainJson(Executable, ClauseElement):
+    """
+    EXPLAIN (FORMAT JSON) над запросом: запрос компилируется обычным
+    образом, значения уходят связанными параметрами, а не литералами.
+    """
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_ExplainJson)
+def _compile_explain_json(element: _ExplainJson, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
 
 
 class SqlAlchemyProductReadRepository(ProductReadRepositoryInterface):
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        category_tree: Optional[CategoryTreeProvider] = None,
+        product_index: Optional[ProductBitmapIndex] = None,
+        price_formulas: Optional[PriceFormulaProvider] = None,
+    ):
         self.db = db
         self.image_storage = S3ImageStorageService.from_settings()
+        self.category_tree = category_tree or get_category_tree_provider()
+        self.product_index = product_index or get_product_bitmap_index()
+        self.price_formulas = price_formulas or get_price_formula_provider()
 
     def _sort_filters(self, filters: list[FilterDTO]) -> list[FilterDTO]:
         """
@@ -140,7 +312,98 @@ class SqlAlchemyProductReadRepository(ProductReadRepositoryInterface):
             region=region_dto,
         )
 
+    @staticmethod
+    def _card_statement():
+        """
+        Колонки карточки товара (view=card) из нормализованных таблиц:
+        без описания и связей, главное изображение — LATERAL-подзапросом
+        по одной строке на товар.
+        """
+        main_image = (
+            select(
+                ProductImage.upload_id,
+                ProductImage.ordering,
+                UploadHistory.file_path,
+            )
+            .join(UploadHistory, UploadHistory.id == ProductImage.upload_id)
+            .where(ProductImage.product_id == Product.id, ProductImage.is_main.is_(True))
+            .order_by(ProductImage.ordering, ProductImage.id)
+            .limit(1)
+            .lateral("main_image")
+        )
+        return (
+            select(
+                Product.id,
+                Product.name,
+                Product.price,
+                Product.category_id,
+                Product.rating,
+                main_image.c.upload_id.label("image_upload_id"),
+                main_image.c.ordering.label("image_ordering"),
+                main_image.c.file_path.label("image_key"),
+            )
+            .select_from(Product)
+            .outerjoin(main_image, true())
+        )
+
+    def _to_card_dto(self, row) -> ProductCardDTO:
+        images = []
+        if row.image_upload_id is not None:
+            images.append(
+                ProductImageReadDTO(
+                    upload_id=row.image_upload_id,
+                    image_key=row.image_key,
+                    image_url=self.image_storage.build_public_url(row.image_key),
+                    is_main=True,
+                    ordering=row.image_ordering,
+                )
+            )
+        return ProductCardDTO(
+            id=row.id,
+            name=row.name,
+            price=row.price,
+            category_id=row.category_id,
+            rating=ProductRatingDTO(
+                value=float(row.rating) if row.rating else None,
+                count=0,  # будет заполнено после
+            ),
+            images=images,
+        )
+
+    @staticmethod
+    def _projected_card_columns() -> tuple:
+        """Колонки карточки из проекции: из снимка — только рейтинг и главное изображение."""
+        model = ProductReadModel
+        return (
+            model.product_id,
+            model.name,
+            model.price,
+            model.category_id,
+            model.document["rating"].label("rating"),
+            func.jsonb_path_query_first(
+                model.document,
+                literal_column("'$.images[*] ? (@.is_main == true)'"),
+                type_=JSONB,
+            ).label("main_image"),
+        )
+
+    @staticmethod
+    def _projected_card_dto(row) -> ProductCardDTO:
+        return ProductCardDTO(
+            id=row.product_id,
+            name=row.name,
+            price=row.price,
+            category_id=row.category_id,
+            rating=ProductRatingDTO(**row.rating) if row.rating else None,
+            images=[ProductImageReadDTO(**row.main_image)] if row.main_image else [],
+        )
+
     async def get_by_id(self, product_id: int) -> Optional[ProductReadDTO]:
+        if get_settings().PRODUCT_READ_MODEL_ENABLED:
+            dto = await self._get_projected(ProductReadModel.product_id == product_id)
+            if dto:
+                return dto
+
         stmt = (
             select(Product)
             .options(
@@ -167,6 +430,11 @@ class SqlAlchemyProductReadRepository(ProductReadRepositoryInterface):
         return dto
 
     async def get_by_name(self, name: str) -> Optional[ProductReadDTO]:
+        if get_settings().PRODUCT_READ_MODEL_ENABLED:
+            dto = await self._get_projected(ProductReadModel.name == name)
+            if dto:
+                return dto
+
         stmt = (
             select(Product)
             .options(
@@ -192,18 +460,27 @@ class SqlAlchemyProductReadRepository(ProductReadRepositoryInterface):
             dto.rating.count = counts.get(model.id, 0)
         return dto
 
-    async def filter(
+    async def get_many(
         self,
-        name: Optional[str],
-        category_id: Optional[int],
-        product_type_id: Optional[int],
-        limit: int,
-        offset: int,
-        attributes: Optional[dict[str, str]] = None,
-        sort_type: str = "default",
-        product_ids: Optional[List[int]] = None,
-        region_id: Optional[int] = None,
-    ) -> Tuple[List[ProductReadDTO], int]:
+        product_ids: list[int],
+        view: str = "full",
+    ) -> list[ProductReadDTO]:
+        return await self._load_page(product_ids, view)
+
+    async def _get_projected(self, condition) -> Optional[ProductReadDTO]:
+        """Товар из проекции product_read_model (None, если строки ещё нет)."""
+        result = await self.db.execute(select(ProductReadModel.document).where(condition))
+        document = result.scalars().first()
+        return product_from_snapshot(document) if document is not None else None
+
+    async def build_read_dtos(self, product_ids: list[int]) -> list[ProductReadDTO]:
+        """
+        ProductReadDTO товаров из нормализованных таблиц (вместе с числом
+        отзывов) в порядке product_ids. Источник снимков для проекции.
+        """
+        if not product_ids:
+            return []
+
         stmt = (
             select(Product)
             .options(
@@ -214,12 +491,141 @@ class SqlAlchemyProductReadRepository(ProductReadRepositoryInterface):
                 selectinload(Product.supplier),
                 selectinload(Product.region),
             )
+            .where(Product.id.in_(product_ids))
+        )
+        result = await self.db.execute(stmt)
+        models = {model.id: model for model in result.scalars().all()}
+        items = [self._to_read_dto(models[product_id]) for product_id in product_ids if product_id in models]
+
+        await self._fill_review_counts(items)
+        return items
+
+    async def build_card_dtos(self, product_ids: list[int]) -> list[ProductCardDTO]:
+        """Карточки товаров из нормализованных таблиц в порядке product_ids."""
+        if not product_ids:
+            return []
+
+        result = await self.db.execute(
+            self._card_statement().where(Product.id.in_(product_ids))
         )
-        count_stmt = select(func.count()).select_from(Product)
+        cards = {row.id: self._to_card_dto(row) for row in result}
+        items = [cards[product_id] for product_id in product_ids if product_id in cards]
+
+        await self._fill_review_counts(items)
+        return items
+
+    async def _load_page(
+        self,
+        product_ids: list[int],
+        view: str = "full",
+    ) -> list[ProductReadDTO]:
+        """
+        Товары страницы в порядке product_ids: из проекции, если она включена
+        (товары без строки проекции дочитываются из таблиц), иначе из таблиц.
+        view=card — только колонки карточки (см. _card_statement).
+        """
+        if not product_ids:
+            return []
+        build = self.build_card_dtos if view == "card" else self.build_read_dtos
+        if not get_settings().PRODUCT_READ_MODEL_ENABLED:
+            return await build(product_ids)
+
+        condition = ProductReadModel.product_id.in_(product_ids)
+        if view == "card":
+            result = await self.db.execute(select(*self._projected_card_columns()).where(condition))
+            items = {row.product_id: self._projected_card_dto(row) for row in result}
+        else:
+            result = await self.db.execute(
+                select(ProductReadModel.product_id, ProductReadModel.document).where(condition)
+            )
+            items = {product_id: product_from_snapshot(document) for product_id, document in result}
+
+        missing = [product_id for product_id in product_ids if product_id not in items]
+        for dto in await build(missing):
+            items[dto.id] = dto
+        return [items[product_id] for product_id in product_ids if product_id in items]
+
+    async def _category_scope(
+        self,
+        category_id: Optional[int],
+        product_type_id: Optional[int],
+        category_has_products: bool,
+    ) -> Optional[set[int]]:
+        """
+        Категории, товары которых попадают в filter (None — без ограничения).
+
+        Те же правила, что и у SQL-фильтра: пустая категория заменяется
+        поддеревом родителя, product_type_id — категориями с этим
+        device_type_id (с учётом наследования), оба условия пересекаются.
+        """
+        if category_id is None and product_type_id is None:
+            return None
+
+        tree = await self.category_tree.get(self.db)
+        category_ids: Optional[set[int]] = None
+
+        if category_id is not None:
+            category_ids = {category_id}
+            node = tree.nodes.get(category_id)
+            if not category_has_products and node and node.parent_id:
+                category_ids = set(tree.descendants_of(node.parent_id))
+
+        if product_type_id is not None:
+            by_type = tree.categories_with_device_type(product_type_id)
+            category_ids = set(by_type) if category_ids is None else category_ids & by_type
+
+        return category_ids
+
+    async def filter(
+        self,
+        name: Optional[str],
+        category_id: Optional[int],
+        product_type_id: Optional[int],
+        limit: int,
+        offset: int,
+        attributes: Optional[dict[str, str]] = None,
+        sort_type: str = "default",
+        product_ids: Optional[List[int]] = None,
+        region_id: Optional[int] = None,
+        after: Optional[ProductCursorDTO] = None,
+        count_mode: str = "exact",
+        view: str = "full",
+    ) -> Tuple[List[ProductReadDTO], Optional[int]]:
+        settings = get_settings()
+        if not name and settings.PRODUCT_INDEX_FILTER_ENABLED:
+            return await self._filter_by_index(
+                category_id=category_id,
+                product_type_id=product_type_id,
+                limit=limit,
+                offset=offset,
+                attributes=attributes,
+                sort_type=sort_type,
+                product_ids=product_ids,
+                region_id=region_id,
+                after=after,
+                count_mode=count_mode,
+                view=view,
+            )
+        if settings.PRODUCT_READ_MODEL_ENABLED:
+            return await self._filter_read_model(
+                name=name,
+                category_id=category_id,
+                product_type_id=product_type_id,
+                limit=limit,
+                offset=offset,
+                attributes=attributes,
+                sort_type=sort_type,
+                product_ids=product_ids,
+                region_id=region_id,
+                after=after,
+                count_mode=count_mode,
+                view=view,
+            )
+
+        conditions = []
 
         if name:
-            stmt = stmt.where(Product.name.ilike(f"%{name}%"))
-            count_stmt = count_stmt.where(Product.name.ilike(f"%{name}%"))
+            conditions.append(Product.name.ilike(f"%{name}%"))
 
         if category_id is not None:
             # Сначала считаем количество товаров в указанной категории
@@ -229,97 +635,43 @@ class SqlAlchemyProductReadRepository(ProductReadRepositoryInterface):
 
             if count_in_category > 0:
                 # Товары есть в указанной категории — ищем только в ней
-                stmt = stmt.where(Product.category_id == category_id)
-                count_stmt = count_stmt.where(Product.category_id == category_id)
+                conditions.append(Product.category_id == category_id)
             else:
-                # Товаров нет — ищем родительскую категорию и все её дочерние
-                # Сначала найдём parent_id указанной категории
-                parent_query = text("""
-                    SELECT parent_id FROM categories WHERE id = :category_id
-                """)
-                parent_result = await self.db.execute(parent_query, {"category_id": category_id})
-                parent_row = parent_result.fetchone()
-
-                if parent_row and parent_row[0]:
-                    parent_id = parent_row[0]
-                    # Получаем все дочерние категории родителя (siblings + сама категория)
-                    cte_stmt = text("""
-                        WITH RECURSIVE category_tree AS (
-                            SELECT id
-                            FROM categories
-                            WHERE id = :parent_id
-                            UNION ALL
-                            SELECT c.id
-                            FROM categories c
-                            INNER JOIN category_tree ct ON c.parent_id = ct.id
-                        )
-                        SELECT id FROM category_tree
-                    """)
-                    result = await self.db.execute(cte_stmt, {"parent_id": parent_id})
-                    category_ids = [row[0] for row in result.fetchall()]
-
-                    if category_ids:
-                        stmt = stmt.where(Product.category_id.in_(category_ids))
-                        count_stmt = count_stmt.where(Product.category_id.in_(category_ids))
-                    else:
-                        stmt = stmt.where(Product.id == -1)
-                        count_stmt = count_stmt.where(Product.id == -1)
+                # Товаров нет — ищем по поддереву родительской категории
+                # (siblings + сама категория), родителя берём из снимка дерева
+                tree = await self.category_tree.get(self.db)
+                node = tree.nodes.get(category_id)
+
+                if node and node.parent_id:
+                    conditions.append(
+                        Product.category_id.in_(sorted(tree.descendants_of(node.parent_id)))
+                    )
                 else:
                     # Нет родительской категории — возвращаем только товары из указанной категории (их нет)
-                    stmt = stmt.where(Product.category_id == category_id)
-                    count_stmt = count_stmt.where(Product.category_id == category_id)
+                    conditions.append(Product.category_id == category_id)
 
-        # product_type_id фильтрует товары через category.device_type_id
-        # (с учётом наследования от родительских категорий)
+        # product_type_id фильтрует товары по категориям с этим device_type_id
+        # (с учётом наследования от родительских категорий, из снимка дерева)
         if product_type_id is not None:
-            # Используем CTE для получения всех категорий с нужным device_type_id
-            cte_stmt = text("""
-                WITH RECURSIVE category_chain AS (
-                    SELECT
-                        c.id
-                    FROM categories c
-                    WHERE c.device_type_id = :product_type_id
-
-                    UNION ALL
-
-                    SELECT
-                        c.id
-                    FROM categories c
-                    INNER JOIN category_chain cc ON c.parent_id = cc.id
-                    WHERE c.device_type_id IS NULL
-                )
-                SELECT id FROM category_chain
-            """)
-            result = await self.db.execute(cte_stmt, {"product_type_id": product_type_id})
-            category_ids = [row[0] for row in result.fetchall()]
-
-            # Отладка
-            print(f"filter: product_type_id={product_type_id}, category_ids={category_ids}")
-
-            if category_ids:
-                stmt = stmt.where(Product.category_id.in_(category_ids))
-                count_stmt = count_stmt.where(Product.category_id.in_(category_ids))
-            else:
-                # Если категорий не найдено, возвращаем пустой результат
-                stmt = stmt.where(Product.id == -1)
-                count_stmt = count_stmt.where(Product.id == -1)
+            tree = await self.category_tree.get(self.db)
+            conditions.append(
+                Product.category_id.in_(sorted(tree.categories_with_device_type(product_type_id)))
+            )
 
         # Фильтрация по списку ID товаров
         if product_ids:
-            stmt = stmt.where(Product.id.in_(product_ids))
-            count_stmt = count_stmt.where(Product.id.in_(product_ids))
+            conditions.append(Product.id.in_(product_ids))
 
         # Фильтрация по региону
         if region_id is not None:
-            stmt = stmt.where(Product.region_id == region_id)
-            count_stmt = count_stmt.where(Product.region_id == region_id)
+            conditions.append(Product.region_id == region_id)
 
         # Фильтрация по атрибутам
         if attributes:
             for attr_name, attr_values in attributes.items():
                 # Поддерживаем множественные значения для одного атрибута
                 # Товар должен соответствовать хотя бы одному значению из списка
-                stmt = stmt.where(
+                conditions.append(
                     Product.attributes.any(
                         and_(
                             ProductAttributeValue.attribute.has(
@@ -329,47 +681,271 @@ class SqlAlchemyProductReadRepository(ProductReadRepositoryInterface):
                         )
                     )
                 )
-                count_stmt = count_stmt.where(
-                    Product.attributes.any(
-                        and_(
-                            ProductAttributeValue.attribute.has(
-                                ProductAttribute.name == attr_name
-                            ),
-                            ProductAttributeValue.value.in_(attr_values),
-                        )
-                    )
+
+        if view == "card":
+            stmt = self._card_statement().where(*conditions)
+        else:
+            stmt = (
+                select(Product)
+                .options(
+                    selectinload(Product.images).selectinload(ProductImage.upload),
+                    selectinload(Product.attributes).selectinload(ProductAttributeValue.attribute),
+                    selectinload(Product.product_tags).selectinload(ProductTag.tag),
+                    selectinload(Product.category),
+                    selectinload(Product.supplier),
+                    selectinload(Product.region),
                 )
+                .where(*conditions)
+            )
+
+        # Сортировка по цене — по конечной цене (политики категорий)
+        price = Product.price
+        if sort_type in ("price_asc", "price_desc"):
+            stmt, price = await self._with_final_price(stmt, Product.price, Product.category_id)
+
+        # Keyset-пагинация: продолжаем строго после последнего товара
+        # в порядке сортировки, offset при этом не используется
+        if after is not None:
+            stmt = stmt.where(self._keyset_condition(after, sort_type, price))
 
         # Сортировка
         if sort_type == "price_asc":
-            stmt = stmt.order_by(Product.price.asc(), Product.id)
+            stmt = stmt.order_by(price.asc(), Product.id)
         elif sort_type == "price_desc":
-            stmt = stmt.order_by(Product.price.desc(), Product.id)
+            stmt = stmt.order_by(price.desc(), Product.id)
         else:  # default
             stmt = stmt.order_by(Product.id)
 
-        stmt = stmt.limit(limit).offset(offset)
+        stmt = stmt.limit(limit)
+        if after is None:
+            stmt = stmt.offset(offset)
 
         result = await self.db.execute(stmt)
-        count_result = await self.db.execute(count_stmt)
+        if view == "card":
+            items = [self._to_card_dto(row) for row in result]
+        else:
+            items = [self._to_read_dto(model) for model in result.scalars().all()]
+        total = await self._count(conditions, count_mode)
 
-        items = [self._to_read_dto(model) for model in result.scalars().all()]
-        total = count_result.scalar() or 0
+        await self._fill_review_counts(items)
+        return items, total
+
+    async def _filter_by_index(
+        self,
+        category_id: Optional[int],
+        product_type_id: Optional[int],
+        limit: int,
+        offset: int,
+        attributes: Optional[dict[str, list[str]]],
+        sort_type: str,
+        product_ids: Optional[List[int]],
+        region_id: Optional[int],
+        after: Optional[ProductCursorDTO],
+        count_mode: str,
+        view: str = "full",
+    ) -> Tuple[List[ProductReadDTO], Optional[int]]:
+        """
+        filter по индексу товаров в памяти (PRODUCT_INDEX_FILTER_ENABLED).
+
+        Условия те же, что у SQL-варианта, но id страницы и total считаются
+        битовыми картами ProductBitmapIndex; из БД читаются только товары
+        страницы, одним запросом по первичному ключу.
+        """
+        await self._sync_product_index()
+        index = self.product_index
+
+        # Товаров в категории нет — ищем по поддереву родительской категории
+        category_ids = await self._category_scope(
+            category_id,
+            product_type_id,
+            category_has_products=category_id is not None and bool(index.category_bitmap([category_id])),
+        )
+
+        bitmap = index.match(
+            category_ids=category_ids,
+            attributes=attributes,
+            product_ids=product_ids,
+            region_id=region_id,
+        )
+        formulas = None
+        if sort_type in ("price_asc", "price_desc"):
+            formulas = await self.get_price_formulas()
+        page_ids = index.page(bitmap, sort_type, limit, offset, after, formulas)
+        # estimate по индексу не нужен: точный total дешевле EXPLAIN
+        total = None if count_mode == "none" else bitmap.bit_count()
+
+        # Порядок страницы задаёт индекс; товары, удалённые после синхронизации, пропускаем
+        return await self._load_page(page_ids, view), total
+
+    async def _filter_read_model(
+        self,
+        name: Optional[str],
+        category_id: Optional[int],
+        product_type_id: Optional[int],
+        limit: int,
+        offset: int,
+        attributes: Optional[dict[str, list[str]]],
+        sort_type: str,
+        product_ids: Optional[List[int]],
+        region_id: Optional[int],
+        after: Optional[ProductCursorDTO],
+        count_mode: str,
+        view: str = "full",
+    ) -> Tuple[List[ProductReadDTO], Optional[int]]:
+        """
+        filter по проекции product_read_model (PRODUCT_READ_MODEL_ENABLED).
+
+        Условия те же, что у SQL-варианта, но страница — один запрос к одной
+        таблице: готовые снимки товаров без подгрузки связей и отзывов.
+        Атрибуты проверяются через attribute_pairs @> (GIN-индекс).
+        Для view=card снимок целиком не читается (_projected_card_columns).
+        """
+        model = ProductReadModel
+        conditions = []
+
+        if name:
+            conditions.append(model.name.ilike(f"%{name}%"))
+
+        category_has_products = False
+        if category_id is not None:
+            category_has_products = bool(
+                await self.db.scalar(
+                    select(select(model.product_id).where(model.category_id == category_id).exists())
+                )
+            )
+        category_ids = await self._category_scope(category_id, product_type_id, category_has_products)
+        if category_ids is not None:
+            conditions.append(model.category_id.in_(sorted(category_ids)))
 
-        # Заполняем количество отзывов
-        if items:
-            product_ids = [item.id for item in items]
-            counts = await self.get_review_counts_by_product_ids(product_ids)
-            for item in items:
-                if item.rating:
-                    item.rating.count = counts.get(item.id, 0)
+        if product_ids:
+            conditions.append(model.product_id.in_(product_ids))
 
+        if region_id is not None:
+            conditions.append(model.region_id == region_id)
+
+        for attr_name, attr_values in (attributes or {}).items():
+            # Хотя бы одно из значений атрибута
+            conditions.append(
+                or_(*[
+                    model.attribute_pairs.contains([{"name": attr_name, "value": value}])
+                    for value in attr_values
+                ])
+            )
+
+        columns = self._projected_card_columns() if view == "card" else (model.document,)
+        stmt = select(*columns).where(*conditions)
+        price = model.price
+        if sort_type in ("price_asc", "price_desc"):
+            stmt, price = await self._with_final_price(stmt, model.price, model.category_id)
+        if after is not None:
+            stmt = stmt.where(self._keyset_condition(after, sort_type, price, model.product_id))
+
+        if sort_type == "price_asc":
+            stmt = stmt.order_by(price.asc(), model.product_id)
+        elif sort_type == "price_desc":
+            stmt = stmt.order_by(price.desc(), model.product_id)
+        else:  # default
+            stmt = stmt.order_by(model.product_id)
+
+        stmt = stmt.limit(limit)
+        if after is None:
+            stmt = stmt.offset(offset)
+
+        result = await self.db.execute(stmt)
+        if view == "card":
+            items = [self._projected_card_dto(row) for row in result]
+        else:
+            items = [product_from_snapshot(document) for document in result.scalars().all()]
+        total = await self._count(conditions, count_mode, key=model.product_id)
         return items, total
 
+    async def _fill_review_counts(self, items: List[ProductReadDTO]) -> None:
+        """Заполнить количество отзывов в рейтинге товаров."""
+        if not items:
+            return None
+        counts = await self.get_review_counts_by_product_ids([item.id for item in items])
+        for item in items:
+            if item.rating:
+                item.rating.count = counts.get(item.id, 0)
+
+    async def get_price_formulas(self) -> PriceFormulas:
+        return await self.price_formulas.get(self.db)
+
+    async def _with_final_price(self, stmt, price, category_id):
+        """
+        Присоединить к запросу коэффициенты формул категорий (VALUES)
+        и вернуть выражение конечной цены для ORDER BY и keyset-условия.
+        Без политик — исходная цена без присоединения.
+        """
+        formulas = await self.get_price_formulas()
+        if not formulas:
+            return stmt, price
+
+        coefficients = values(
+            column("category_id", BigInteger),
+            column("factor", Numeric),
+            column("addend", Numeric),
+            name="price_formulas",
+        ).data([
+            (formula_category_id, formula.factor, formula.addend)
+            for formula_category_id, formula in formulas.items()
+        ])
+        stmt = stmt.outerjoin(coefficients, coefficients.c.category_id == category_id)
+        final_price = func.round(
+            price * func.coalesce(coefficients.c.factor, 1)
+            + func.coalesce(coefficients.c.addend, 0),
+            2,
+            type_=Numeric(12, 2),
+        )
+        return stmt, final_price
+
+    @staticmethod
+    def _keyset_condition(
+        after: ProductCursorDTO,
+        sort_type: str,
+        price=Product.price,
+        key=Product.id,
+    ):
+        if sort_type == "price_asc":
+            return or_(
+                price > after.price,
+                and_(price == after.price, key > after.id),
+            )
+        if sort_type == "price_desc":
+            return or_(
+                price < after.price,
+                and_(price == after.price, key > after.id),
+            )
+        return key > after.id
+
+    async def _count(self, conditions: list, count_mode: str, key=Product.id) -> Optional[int]:
+        """
+        Подсчёт total для filter.
+
+        - exact: точный COUNT(*)
+        - estimate: оценка планировщика (EXPLAIN), без сканирования
+        - none: не считать
+        """
+        if count_mode == "none":
+            return None
+
+        if count_mode == "estimate":
+            # Значения фильтра передаются параметрами, как и в самом запросе
+            result = await self.db.execute(_ExplainJson(select(key).where(*conditions)))
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+
+        count_stmt = select(func.count()).select_from(key.table).where(*conditions)
+        count_result = await self.db.execute(count_stmt)
+        return count_result.scalar() or 0
+
     async def get_catalog_filters(
         self,
         category_id: Optional[int] = None,
         device_type_id: Optional[int] = None,
+        selected: Optional[dict[str, list[str]]] = None,
     ) -> CatalogFiltersDTO:
         """
         Получить фильтры для каталога.
@@ -377,258 +953,186 @@ class SqlAlchemyProductReadRepository(ProductReadRepositoryInterface):
         Логика:
         1. Если указан product_type_id (device_type_id), используем его напрямую
         2. Если указана category_id:
-           - Если у категории есть дочерние категории — берем атрибуты всех дочерних категорий (рекурсивно)
+           - Если у категории есть дочерние категории — берем атрибуты всех категорий
+             с её device_type_id (с учётом наследования)
            - Если у категории нет дочерних категорий (конечная категория) — берем атрибуты только этой категории
-        3. Получаем все filterable атрибуты и группируем уникальные значения
+        3. Число товаров по каждому значению filterable-атрибутов берётся из
+           индекса товаров (ProductBitmapIndex), без агрегирующих запросов
+        4. Если переданы selected (выбранные значения атрибутов), счётчики каждого
+           атрибута считаются с учётом выбора во всех остальных атрибутах
         """
-        # Определяем device_type_id для фильтрации
-        target_device_type_id = device_type_id
-        target_category_id = None
-        use_category_directly = False
+        tree = await self.category_tree.get(self.db)
 
-        if category_id is not None:
-            # Проверяем, есть ли у категории дочерние категории
-            has_children_stmt = text("""
-                SELECT EXISTS(
-                    SELECT 1 FROM categories WHERE parent_id = :category_id
-                ) as has_children
-            """)
-            result = await self.db.execute(has_children_stmt, {"category_id": category_id})
-            row = result.fetchone()
-
-            if row and not row.has_children:
-                # У категории нет дочерних — это конечная категория
-                # Используем только эту категорию напрямую
-                target_category_id = category_id
-                use_category_directly = True
-            else:
-                # У категории есть дочерние — это родительская категория
-                # Нужно найти device_type_id и взять все дочерние категории
-                category_stmt = text("""
-                    WITH RECURSIVE category_chain AS (
-                        SELECT id, parent_id, device_type_id
-                        FROM categories
-                        WHERE id = :category_id
-                        UNION ALL
-                        SELECT c.id, c.parent_id, c.device_type_id
-                        FROM categories c
-                        INNER JOIN category_chain cc ON c.id = cc.parent_id
-                        WHERE cc.device_type_id IS NULL
-                    )
-                    SELECT device_type_id
-                    FROM category_chain
-                    WHERE device_type_id IS NOT NULL
-                    LIMIT 1
-                """)
-
-                result = await self.db.execute(category_stmt, {"category_id": category_id})
-                row = result.fetchone()
-
-                if row and row.device_type_id:
-                    target_device_type_id = row.device_type_id
-
-        # Формируем запрос для получения атрибутов
-        if use_category_directly and target_category_id:
-            # Режим: выбрана конечная категория (нет дочерних)
-            # Берем атрибуты только товаров этой категории
-            filter_stmt = text("""
-                SELECT
-                    pa.name as attribute_name,
-                    pa.is_filterable,
-                    pav.value as attribute_value,
-                    COUNT(DISTINCT p.id) as product_count
-                FROM product_attribute_values pav
-                JOIN product_attributes pa ON pa.id = pav.attribute_id
-                JOIN products p ON p.id = pav.product_id
-                WHERE pa.is_filterable = true
-                  AND p.category_id = :target_category_id
-                GROUP BY pa.name, pa.is_filterable, pav.value
-                ORDER BY pa.name, pav.value
-            """)
-            filter_params = {"target_category_id": target_category_id}
-        elif target_device_type_id:
-            # Режим: выбрана родительская категория или product_type_id
-            # Используем CTE для получения всех категорий с нужным effective device_type_id
-            filter_stmt = text("""
-                WITH RECURSIVE category_chain AS (
-                    -- Находим все категории, у которых effective device_type_id = target
-                    SELECT
-                        c.id,
-                        c.device_type_id,
-                        c.device_type_id as effective_device_type_id
-                    FROM categories c
-                    WHERE c.device_type_id = :target_device_type_id
-
-                    UNION ALL
-
-                    -- Добавляем дочерние категории, которые наследуют device_type_id
-                    SELECT
-                        c.id,
-                        c.device_type_id,
-                        cc.effective_device_type_id
-                    FROM categories c
-                    INNER JOIN category_chain cc ON c.parent_id = cc.id
-                    WHERE c.device_type_id IS NULL
-                )
-                SELECT
-                    pa.name as attribute_name,
-                    pa.is_filterable,
-                    pav.value as attribute_value,
-                    COUNT(DISTINCT p.id) as product_count
-                FROM product_attribute_values pav
-                JOIN product_attributes pa ON pa.id = pav.attribute_id
-                JOIN products p ON p.id = pav.product_id
-                JOIN category_chain cc ON cc.id = p.category_id
-                WHERE pa.is_filterable = true
-                GROUP BY pa.name, pa.is_filterable, pav.value
-                ORDER BY pa.name, pav.value
-            """)
-            filter_params = {"target_device_type_id": target_device_type_id}
+        # Определяем категории, по товарам которых считаются фасеты
+        if category_id is not None and not tree.children_of(category_id):
+            # Конечная категория — только её товары
+            category_ids = [category_id]
         else:
-            # Нет ни category_id, ни device_type_id — возвращаем пустой результат
-            return CatalogFiltersDTO(filters=[])
-        
-        result = await self.db.execute(filter_stmt, filter_params)
-        rows = result.fetchall()
-        
-        # Группируем результаты по атрибутам
-        filters_dict = {}
-        for row in rows:
-            attr_name = row.attribute_name
-            if attr_name not in filters_dict:
-                filters_dict[attr_name] = FilterDTO(
-                    name=attr_name,
-                    is_filterable=row.is_filterable,
-                    options=[]
-                )
-            filters_dict[attr_name].options.append(
-                FilterOptionDTO(
-                    value=row.attribute_value,
-                    count=row.product_count
-                )
+            target_device_type_id = device_type_id
+            if category_id is not None:
+                # Родительская категория — её device_type_id с учётом наследования
+                target_device_type_id = tree.effective_device_type(category_id) or device_type_id
+            if not target_device_type_id:
+                # Нет ни category_id, ни device_type_id — возвращаем пустой результат
+                return CatalogFiltersDTO(filters=[])
+            category_ids = tree.categories_with_device_type(target_device_type_id)
+
+        await self._sync_product_index()
+        facets = self.product_index.facets(category_ids, selected)
+
+        filters = [
+            FilterDTO(
+                name=name,
+                is_filterable=True,
+                options=[
+                    FilterOptionDTO(value=value, count=count)
+                    for value, count in sorted(options.items())
+                ],
             )
-
-        # Сортируем фильтры
-        sorted_filters = self._sort_filters(list(filters_dict.values()))
+            for name, options in sorted(facets.items())
+        ]
 
         return CatalogFiltersDTO(
-            filters=sorted_filters
+            filters=self._sort_filters(filters)
         )
 
-    async def export_full_catalog(self):
-        sql = text("""
-            WITH RECURSIVE category_ancestors AS (
-                -- Начальная категория товара
-                SELECT
-                    c.id AS root_id,
-                    c.id AS ancestor_id,
-                    c.name AS ancestor_name,
-                    0 AS depth
-                FROM categories c
-
-                UNION ALL
-
-                -- Рекурсивно поднимаемся к родителям
-                SELECT
-                    ca.root_id,
-                    p.id AS ancestor_id,
-                    p.name AS ancestor_name,
-                    ca.depth + 1
-                FROM category_ancestors ca
-                JOIN categories p ON p.id = (
-                    SELECT c2.parent_id FROM categories c2 WHERE c2.id = ca.ancestor_id
-                )
-            ),
-            parent_categories_agg AS (
-                SELECT
-                    root_id AS category_id,
-                    COALESCE(
-                        jsonb_agg(
-                            jsonb_build_object(
-                                'id', ancestor_id,
-                                'name', ancestor_name
-                            )
-                            ORDER BY depth
-                        ) FILTER (WHERE depth > 0),
-                        '[]'
-                    ) AS parent_categories
-                FROM category_ancestors
-                GROUP BY root_id
+    async def _sync_product_index(self) -> None:
+        """Применить к индексу товаров изменения товаров (см. IncrementalIndex.sync)."""
+        index = self.product_index
+
+        async def load_documents(**kwargs) -> dict[int, ProductIndexDocument]:
+            # Флаги is_filterable перечитываются вместе с товарами: их смена
+            # поднимает updated_at товаров с этим атрибутом (см. product_tombstone.py)
+            index.set_filterable(await self._get_filterable_attribute_names())
+            return await self._get_index_documents(**kwargs)
+
+        await index.sync(load_documents, self._get_deleted_ids, self._get_index_watermark)
+
+    async def _get_filterable_attribute_names(self) -> list[str]:
+        result = await self.db.execute(
+            select(ProductAttribute.name).where(ProductAttribute.is_filterable.is_(True))
+        )
+        return list(result.scalars())
+
+    async def _get_deleted_ids(self, since: datetime) -> list[int]:
+        return [row["product_id"] for row in await self.get_deleted_product_ids(since)]
+
+    async def _get_index_watermark(self) -> datetime:
+        return export_watermark(
+            await self.get_export_watermark(),
+            get_settings().CATALOG_EXPORT_DELTA_OVERLAP_SECONDS,
+        )
+
+    async def _get_index_documents(
+        self,
+        product_ids: Optional[list[int]] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> dict[int, ProductIndexDocument]:
+        """Категория, регион, цена и пары (атрибут, значение) по товарам."""
+        stmt = (
+            select(
+                Product.id,
+                Product.category_id,
+                Product.region_id,
+                Product.price,
+                ProductAttribute.name,
+                ProductAttributeValue.value,
             )
-            SELECT
-                p.id,
-                p.name,
-                p.description,
-                p.price,
-                p.category_id,
-                c.name as category_name,
-                c.device_type_id as category_device_type_id,
-                p.supplier_id,
-                s.name as supplier_name,
-                p.region_id,
-                r.name as region_name,
-                COALESCE(
-                    jsonb_agg(
-                        DISTINCT jsonb_build_object(
-                            'id', pa.id,
-                            'name', pa.name,
-                            'value', pav.value,
-                            'is_filterable', pa.is_filterable
-                        )
-                    ) FILTER (WHERE pa.id IS NOT NULL),
-                    '[]'
-                ) as attributes,
-                COALESCE(
-                    jsonb_agg(
-                        DISTINCT jsonb_build_object(
-                            'tag_id', t.id,
-                            'name', t.name,
-                            'description', t.description,
-                            'color', t.color
-                        )
-                    ) FILTER (WHERE t.id IS NOT NULL),
-                    '[]'
-                ) as tags,
-                COALESCE(pca.parent_categories, '[]') as parent_categories
-            FROM products p
-            LEFT JOIN categories c ON c.id = p.category_id
-            LEFT JOIN suppliers s ON s.id = p.supplier_id
-            LEFT JOIN regions r ON r.id = p.region_id
-            LEFT JOIN product_attribute_values pav ON pav.product_id = p.id
-            LEFT JOIN product_attributes pa ON pa.id = pav.attribute_id
-            LEFT JOIN product_tags pt ON pt.product_id = p.id
-            LEFT JOIN tags t ON t.id = pt.tag_id
-            LEFT JOIN parent_categories_agg pca ON pca.category_id = p.category_id
-            GROUP BY
-                p.id,
-                c.name,
-                c.device_type_id,
-                s.name,
-                p.region_id,
-                r.name,
-                pca.parent_categories
-            ORDER BY p.id
-        """)
-
-        result = await self.db.execute(sql)
+            .outerjoin(ProductAttributeValue, ProductAttributeValue.product_id == Product.id)
+            .outerjoin(ProductAttribute, ProductAttribute.id == ProductAttributeValue.attribute_id)
+        )
+        if product_ids is not None:
+            stmt = stmt.where(Product.id.in_(product_ids))
+        if updated_since is not None:
+            stmt = stmt.where(Product.updated_at >= updated_since)
+
+        result = await self.db.execute(stmt)
+
+        rows: dict[int, tuple] = {}
+        pairs: dict[int, set[tuple[str, str]]] = {}
+        for product_id, category_id, region_id, price, attribute_name, value in result:
+            rows.setdefault(product_id, (category_id, region_id, price))
+            pairs.setdefault(product_id, set())
+            if attribute_name is not None and value is not None:
+                pairs[product_id].add((attribute_name, value))
+
+        return {
+            product_id: ProductIndexDocument(
+                category_id=category_id,
+                region_id=region_id,
+                price=price,
+                attributes=frozenset(pairs[product_id]),
+            )
+            for product_id, (category_id, region_id, price) in rows.items()
+        }
+
+    async def export_full_catalog(self, updated_since: Optional[datetime] = None):
+        result = await self.db.execute(*self._export_statement(updated_since))
         rows = result.mappings().all()
 
         return rows
 
+    async def stream_full_catalog(
+        self,
+        chunk_size: int = 1000,
+        updated_since: Optional[datetime] = None,
+    ) -> AsyncIterator[list[RowMapping]]:
+        """
+        Выгрузка каталога пачками через серверный курсор.
+
+        В памяти одновременно держится не больше chunk_size строк,
+        поэтому объём выгрузки не ограничен памятью процесса.
+        С updated_since — только товары, изменившиеся с этого момента.
+        """
+        statement, params = self._export_statement(updated_since)
+        result = await self.db.stream(
+            statement.execution_options(yield_per=chunk_size),
+            params,
+        )
+        async for chunk in result.mappings().partitions(chunk_size):
+            yield chunk
+
+    async def get_deleted_product_ids(self, since: datetime) -> list[RowMapping]:
+        """Удалённые с момента since товары: строки (product_id, deleted_at)."""
+        stmt = (
+            select(ProductTombstone.product_id, ProductTombstone.deleted_at)
+            .where(ProductTombstone.deleted_at >= since)
+            .order_by(ProductTombstone.product_id)
+        )
+        result = await self.db.execute(stmt)
+        return result.mappings().all()
+
+    async def get_export_watermark(self) -> datetime:
+        """Время начала текущей транзакции БД — отметка для следующей выгрузки."""
+        return await self.db.scalar(select(func.now()))
+
+    @staticmethod
+    def _export_statement(updated_since: Optional[datetime]):
+        if updated_since is None:
+            return EXPORT_CATALOG_SQL, {}
+        return EXPORT_CATALOG_DELTA_SQL, {"since": updated_since}
+
     async def search(
         self,
         query: str,
         limit: int = 10,
         offset: int = 0,
+        view: str = "full",
     ) -> ProductSearchDTO:
         """
-        Полнотекстовый поиск товаров с подсказками следующих слов.
+        Полнотекстовый поиск товаров.
+
+        Подсказки следующих слов здесь не считаются: их по всему каталогу
+        добавляет ProductQueries.search из SuggestionIndex.
 
         Логика поиска:
         1. Разбиваем запрос на отдельные слова
         2. Каждое слово ищем в названии ИЛИ в атрибутах (ILIKE)
         3. Товар должен содержать ВСЕ слова из запроса (AND логика)
-        
+
+        При PRODUCT_SEARCH_FULLTEXT_ENABLED вместо ILIKE используется
+        search_vector + pg_trgm с ранжированием (см. _fulltext_search_clauses).
+
         Пример: "iPhone 256" найдёт "iPhone 17 Pro Max 256GB"
         """
         # Разбиваем запрос на слова
@@ -636,31 +1140,28 @@ class SqlAlchemyProductReadRepository(ProductReadRepositoryInterface):
         if not search_terms:
             return ProductSearchDTO(items=[], total=0, suggestions=[])
 
-        # Строим условия для каждого слова: name ILIKE '%word%' OR any attribute ILIKE '%word%'
-        word_conditions = []
-        for term in search_terms:
-            word_conditions.append(
-                or_(
-                    Product.name.ilike(f"%{term}%"),
-                    Product.attributes.any(
-                        ProductAttributeValue.value.ilike(f"%{term}%")
-                    ),
-                )
-            )
+        if get_settings().PRODUCT_SEARCH_FULLTEXT_ENABLED:
+            word_conditions, order_by = self._fulltext_search_clauses(search_terms)
+        else:
+            word_conditions, order_by = self._ilike_search_clauses(search_terms)
 
-        # Запрос для поиска товаров (все слова должны совпасть — AND)
-        stmt = (
-            select(Product)
-            .options(
-                selectinload(Product.images).selectinload(ProductImage.upload),
-                selectinload(Product.attributes).selectinload(ProductAttributeValue.attribute),
-                selectinload(Product.product_tags).selectinload(ProductTag.tag),
-                selectinload(Product.category),
-                selectinload(Product.supplier),
-                selectinload(Product.region),
+        # Запрос для поиска товаров (все слова должны совпасть — AND);
+        # карточкам (view=card) связи не нужны
+        if view == "card":
+            stmt = self._card_statement().where(and_(*word_conditions))
+        else:
+            stmt = (
+                select(Product)
+                .options(
+                    selectinload(Product.images).selectinload(ProductImage.upload),
+                    selectinload(Product.attributes).selectinload(ProductAttributeValue.attribute),
+                    selectinload(Product.product_tags).selectinload(ProductTag.tag),
+                    selectinload(Product.category),
+                    selectinload(Product.supplier),
+                    selectinload(Product.region),
+                )
+                .where(and_(*word_conditions))
             )
-            .where(and_(*word_conditions))
-        )
 
         # Запрос для подсчета общего количества
         count_stmt = (
@@ -669,93 +1170,109 @@ class SqlAlchemyProductReadRepository(ProductReadRepositoryInterface):
         )
 
         # Добавляем пагинацию
-        stmt = stmt.order_by(Product.id).limit(limit).offset(offset)
+        stmt = stmt.order_by(*order_by).limit(limit).offset(offset)
 
         # Выполняем запросы
         result = await self.db.execute(stmt)
         count_result = await self.db.execute(count_stmt)
 
-        products = result.scalars().all()
         total = count_result.scalar() or 0
 
         # Конвертируем в DTO
-        items = [self._to_read_dto(product) for product in products]
-
-        # Извлекаем следующиеие слова из названий товаров
-        suggestions = self._extract_next_word_suggestions(products, search_terms)
+        if view == "card":
+            items = [self._to_card_dto(row) for row in result]
+        else:
+            items = [self._to_read_dto(product) for product in result.scalars().all()]
 
+        # Подсказки по всему каталогу добавляет ProductQueries из SuggestionIndex
         return ProductSearchDTO(
             items=items,
             total=total,
-            suggestions=suggestions,
+            suggestions=[],
         )
 
-    def _extract_next_word_suggestions(
+    @staticmethod
+    def _ilike_search_clauses(search_terms: list[str]) -> tuple[list, list]:
+        """Каждое слово: name ILIKE '%word%' OR any attribute ILIKE '%word%'."""
+        word_conditions = [
+            or_(
+                Product.name.ilike(f"%{term}%"),
+                Product.attributes.any(
+                    ProductAttributeValue.value.ilike(f"%{term}%")
+                ),
+            )
+            for term in search_terms
+        ]
+        return word_conditions, [Product.id]
+
+    @staticmethod
+    def _fulltext_search_clauses(search_terms: list[str]) -> tuple[list, list]:
+        """
+        Условия поиска по products.search_vector (GIN) и pg_trgm.
+
+        Каждое слово ищется как префикс слова в названии/значениях атрибутов
+        (tsquery 'word:*') или как подстрока названия (ILIKE по trgm-индексу).
+        Результаты ранжируются по ts_rank_cd и похожести названия на запрос.
+        """
+        word_conditions = []
+        all_lexemes = []
+        for term in search_terms:
+            # В tsquery передаём только буквы/цифры — остальное синтаксис tsquery
+            lexemes = re.findall(r"\w+", term)
+            all_lexemes.extend(lexemes)
+
+            condition = Product.name.ilike(f"%{term}%")
+            if lexemes:
+                term_query = func.to_tsquery(
+                    "simple",
+                    " & ".join(f"{lexeme}:*" for lexeme in lexemes),
+                )
+                condition = or_(Product.search_vector.op("@@")(term_query), condition)
+            word_conditions.append(condition)
+
+        order_by = []
+        if all_lexemes:
+            full_query = func.to_tsquery(
+                "simple",
+                " & ".join(f"{lexeme}:*" for lexeme in all_lexemes),
+            )
+            order_by.append(func.ts_rank_cd(Product.search_vector, full_query).desc())
+        order_by.append(func.similarity(Product.name, " ".join(search_terms)).desc())
+        order_by.append(Product.id)
+
+        return word_conditions, order_by
+
+    async def get_suggestion_documents(
         self,
-        products: list[Product],
-        search_terms: list[str],
-    ) -> list[SearchSuggestionDTO]:
+        product_ids: Optional[list[int]] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> dict[int, list[str]]:
         """
-        Извлекает следующиеие слова после введённых пользователем слов.
-        
-        Например, если пользователь ввел "iPhone 15", и есть товары:
-        - "iPhone 15 Pro"
-        - "iPhone 15 Max"
-        - "iPhone 15 Red Edition"
-        
-        Вернет: ["Pro", "Max", "Red"]
+        Тексты товаров для индекса подсказок: название и значения атрибутов.
+
+        Без product_ids и updated_since — весь каталог (полная перестройка
+        индекса). Удалённых товаров в результате нет.
         """
-        import re
-        from collections import Counter
-
-        terms_lower = [t.lower() for t in search_terms]
-        word_counter = Counter()
-
-        for product in products:
-            name = product.name
-            name_lower = name.lower()
-            
-            # Для каждого поискового термина ищем его в названии
-            # и берём слово после него
-            matched_positions = []  # (start, end) positions of matched terms
-            for term in terms_lower:
-                for match in re.finditer(re.escape(term), name_lower):
-                    matched_positions.append((match.start(), match.end()))
-            
-            # Сортируем позиции и берём самую последнюю
-            if matched_positions:
-                matched_positions.sort(key=lambda x: x[1], reverse=True)
-                last_end = matched_positions[0][1]
-                after_search = name[last_end:].strip()
-                next_word_match = re.match(r'^(\S+)', after_search)
-                if next_word_match:
-                    next_word = next_word_match.group(1)
-                    word_counter[next_word] += 1
-
-            # Также ищем в атрибутах товаров
-            for attr_value in product.attributes:
-                value = attr_value.value
-                value_lower = value.lower()
-                
-                attr_positions = []
-                for term in terms_lower:
-                    for match in re.finditer(re.escape(term), value_lower):
-                        attr_positions.append((match.start(), match.end()))
-                
-                if attr_positions:
-                    attr_positions.sort(key=lambda x: x[1], reverse=True)
-                    last_end = attr_positions[0][1]
-                    after_search = value[last_end:].strip()
-                    next_word_match = re.match(r'^(\S+)', after_search)
-                    if next_word_match:
-                        next_word = next_word_match.group(1)
-                        word_counter[next_word] += 1
-
-        # Возвращаем топ-5 слов
-        return [
-            SearchSuggestionDTO(word=word, count=count)
-            for word, count in word_counter.most_common(5)
-        ]
+        name_stmt = select(Product.id, Product.name)
+        value_stmt = select(ProductAttributeValue.product_id, ProductAttributeValue.value)
+        if product_ids is not None:
+            if not product_ids:
+                return {}
+            name_stmt = name_stmt.where(Product.id.in_(product_ids))
+            value_stmt = value_stmt.where(ProductAttributeValue.product_id.in_(product_ids))
+        if updated_since is not None:
+            changed = select(Product.id).where(Product.updated_at >= updated_since)
+            name_stmt = name_stmt.where(Product.updated_at >= updated_since)
+            value_stmt = value_stmt.where(ProductAttributeValue.product_id.in_(changed))
+
+        documents: dict[int, list[str]] = {
+            row.id: [row.name] for row in (await self.db.execute(name_stmt)).all()
+        }
+        for row in (await self.db.execute(value_stmt)).all():
+            if row.product_id in documents:
+                documents[row.product_id].append(row.value)
+
+        return documents
 
     async def get_review_counts_by_product_ids(
         self,
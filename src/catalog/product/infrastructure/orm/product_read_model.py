@@ -0,0 +1,311 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy import delete, func, select, union
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.catalog.product.application.dto.product import ProductReadDTO
+from src.catalog.product.application.read_models.product_snapshot import (
+    product_to_snapshot,
+)
+from src.catalog.product.application.services.catalog_export import export_watermark
+from src.catalog.product.infrastructure.models.product import Product
+from src.catalog.product.infrastructure.models.product_attribute_value import (
+    ProductAttributeValue,
+)
+from src.catalog.product.infrastructure.models.product_read_model import (
+    ProductReadModel,
+)
+from src.catalog.product.infrastructure.models.product_tag import ProductTag
+from src.catalog.product.infrastructure.orm.product_read import (
+    SqlAlchemyProductReadRepository,
+)
+from src.core.conf.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Ключ advisory-блокировки догоняющей проекции: за период её выполняет
+# один воркер, остальные пропускают
+CATCH_UP_LOCK_KEY = 0x70726D63
+
+
+class ProductReadModelProjector:
+    """
+    Запись проекции product_read_model в сессии вызывающего кода.
+
+    Снимок товара собирается тем же кодом, что и обычное чтение
+    (SqlAlchemyProductReadRepository.build_read_dtos), поэтому проекция
+    и нормализованные таблицы отдают одинаковый ProductReadDTO.
+    Коммит — на вызывающем коде.
+
+    Строки пишутся пачками по CHUNK_SIZE товаров: один INSERT на пачку
+    укладывается в лимит asyncpg на число параметров. projected_at — время
+    начала транзакции проектора; строку не перезаписывает снимок из
+    транзакции, начатой раньше уже записанной (он мог прочитать старые данные).
+    """
+
+    CHUNK_SIZE = 500
+
+    # Сущности, встроенные в снимок многих товаров: колонка товара
+    # и колонка проекции, по которым ищутся затронутые товары
+    OWNER_COLUMNS = {
+        "category": (Product.category_id, ProductReadModel.category_id),
+        "supplier": (Product.supplier_id, ProductReadModel.supplier_id),
+        "region": (Product.region_id, ProductReadModel.region_id),
+    }
+
+    PRODUCT_ENTITIES = {"product", "product_images"}
+    PRODUCT_DATA_ENTITIES = {"product_tag", "review"}
+    PRODUCT_BATCH_ENTITIES = {"product_import", "product_bulk_update"}
+    HANDLED_ENTITIES = (
+        PRODUCT_ENTITIES
+        | PRODUCT_DATA_ENTITIES
+        | PRODUCT_BATCH_ENTITIES
+        | {"category", "supplier", "region", "tag", "product_attribute"}
+    )
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._read_repository = SqlAlchemyProductReadRepository(db)
+
+    async def project(self, product_ids: Iterable[int]) -> int:
+        """
+        Пересобрать строки проекции указанных товаров. Строки товаров,
+        которых больше нет, удаляются. Возвращает число записанных строк.
+        """
+        product_ids = sorted(set(product_ids))
+        projected = 0
+        for start in range(0, len(product_ids), self.CHUNK_SIZE):
+            projected += await self._project_chunk(product_ids[start:start + self.CHUNK_SIZE])
+        return projected
+
+    async def _project_chunk(self, product_ids: list[int]) -> int:
+        dtos = await self._read_repository.build_read_dtos(product_ids)
+        if dtos:
+            stmt = insert(ProductReadModel).values([self._row(dto) for dto in dtos])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ProductReadModel.product_id],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in (
+                        "name",
+                        "price",
+                        "category_id",
+                        "supplier_id",
+                        "region_id",
+                        "attribute_pairs",
+                        "document",
+                        "projected_at",
+                    )
+                },
+                where=ProductReadModel.projected_at <= stmt.excluded.projected_at,
+            )
+            await self.db.execute(stmt)
+
+        missing = set(product_ids) - {dto.id for dto in dtos}
+        if missing:
+            await self.db.execute(
+                delete(ProductReadModel).where(ProductReadModel.product_id.in_(missing))
+            )
+        return len(dtos)
+
+    async def rebuild(self, chunk_size: int = 500) -> int:
+        """
+        Полная перестройка: все товары пачками по chunk_size, затем удаление
+        строк товаров, которых нет в products.
+        """
+        projected = await self._project_where(chunk_size)
+
+        await self.db.execute(
+            delete(ProductReadModel).where(
+                ~select(Product.id)
+                .where(Product.id == ProductReadModel.product_id)
+                .exists()
+            )
+        )
+        return projected
+
+    async def catch_up(self, since: datetime, chunk_size: int = 500) -> int:
+        """
+        Пересобрать строки товаров, изменённых с since (products.updated_at).
+
+        Подбирает изменения, событие о которых потерялось (сбой обработчика,
+        падение процесса между коммитом и публикацией). Строки удалённых
+        товаров удаляет каскад внешнего ключа.
+        """
+        return await self._project_where(chunk_size, Product.updated_at >= since)
+
+    async def _project_where(self, chunk_size: int, *conditions) -> int:
+        projected = 0
+        last_id = 0
+        while True:
+            result = await self.db.execute(
+                select(Product.id)
+                .where(Product.id > last_id, *conditions)
+                .order_by(Product.id)
+                .limit(chunk_size)
+            )
+            product_ids = list(result.scalars().all())
+            if not product_ids:
+                break
+            projected += await self.project(product_ids)
+            last_id = product_ids[-1]
+        return projected
+
+    async def affected_product_ids(self, message: dict[str, Any]) -> list[int]:
+        """
+        Товары, чей снимок меняет событие шины.
+
+        Для категорий, поставщиков, регионов, тегов и атрибутов товары ищутся
+        и по текущим таблицам, и по самой проекции: после удаления сущности
+        связь в таблицах уже разорвана, а в снимке ещё осталась.
+        """
+        entity = message.get("entity")
+        entity_id = message.get("entity_id")
+        data = message.get("data") or {}
+
+        if entity in self.PRODUCT_ENTITIES:
+            return [entity_id] if entity_id else []
+
+        if entity in self.PRODUCT_DATA_ENTITIES:
+            product_id = data.get("product_id") if isinstance(data, dict) else None
+            return [product_id] if product_id else []
+
+        if entity in self.PRODUCT_BATCH_ENTITIES:
+            product_ids = data.get("product_ids") if isinstance(data, dict) else None
+            return list(product_ids or [])
+
+        if not entity_id:
+            return []
+
+        if entity in self.OWNER_COLUMNS:
+            product_column, projection_column = self.OWNER_COLUMNS[entity]
+            stmt = union(
+                select(Product.id).where(product_column == entity_id),
+                select(ProductReadModel.product_id).where(projection_column == entity_id),
+            )
+        elif entity == "tag":
+            stmt = union(
+                select(ProductTag.product_id).where(ProductTag.tag_id == entity_id),
+                select(ProductReadModel.product_id).where(
+                    ProductReadModel.document["tags"].contains([{"tag_id": entity_id}])
+                ),
+            )
+        elif entity == "product_attribute":
+            stmt = union(
+                select(ProductAttributeValue.product_id)
+                .where(ProductAttributeValue.attribute_id == entity_id),
+                select(ProductReadModel.product_id).where(
+                    ProductReadModel.document["attributes"].contains([{"id": entity_id}])
+                ),
+            )
+        else:
+            return []
+
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _row(dto: ProductReadDTO) -> dict[str, Any]:
+        return {
+            "product_id": dto.id,
+            "name": dto.name,
+            "price": dto.price,
+            "category_id": dto.category.id if dto.category else None,
+            "supplier_id": dto.supplier.id if dto.supplier else None,
+            "region_id": dto.region.id if dto.region else None,
+            "attribute_pairs": [
+                {"name": attribute.name, "value": attribute.value}
+                for attribute in dto.attributes
+            ],
+            "document": product_to_snapshot(dto),
+            "projected_at": func.now(),
+        }
+
+
+class ProductReadModelUpdater:
+    """
+    Обновление проекции product_read_model по событиям шины.
+
+    Каждое событие обрабатывается в собственной сессии и транзакции:
+    события публикуются после коммита команды, поэтому проекция видит
+    уже зафиксированные данные.
+
+    С catch_up_interval раз в столько секунд запускается догоняющая
+    проекция товаров, изменённых с прошлого запуска (см. catch_up).
+    Задача стартует лениво при первом событии в работающем event loop.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        catch_up_interval: Optional[float] = None,
+    ):
+        self._session_factory = session_factory
+        self._catch_up_interval = catch_up_interval
+        self._catch_up_task: Optional[asyncio.Task] = None
+        self._since: Optional[datetime] = None
+
+    async def handle(self, message: dict[str, Any]) -> None:
+        self._ensure_catch_up()
+        if message.get("entity") not in ProductReadModelProjector.HANDLED_ENTITIES:
+            return None
+
+        async with self._session_factory() as db:
+            projector = ProductReadModelProjector(db)
+            product_ids = await projector.affected_product_ids(message)
+            if not product_ids:
+                return None
+            await projector.project(product_ids)
+            await db.commit()
+
+    async def catch_up(self) -> int:
+        """
+        Пересобрать строки товаров, изменённых с прошлого запуска. Первый
+        запуск в процессе начинает с самой свежей строки проекции.
+        Возвращает число записанных строк (0, если сейчас догоняет другой воркер).
+        """
+        async with self._session_factory() as db:
+            locked = await db.scalar(select(func.pg_try_advisory_xact_lock(CATCH_UP_LOCK_KEY)))
+            if not locked:
+                return 0
+
+            watermark = export_watermark(
+                await db.scalar(select(func.now())),
+                get_settings().CATALOG_EXPORT_DELTA_OVERLAP_SECONDS,
+            )
+            since = self._since
+            if since is None:
+                since = await db.scalar(select(func.max(ProductReadModel.projected_at)))
+
+            projected = 0
+            if since is not None:
+                projected = await ProductReadModelProjector(db).catch_up(since)
+            await db.commit()
+
+        self._since = watermark
+        return projected
+
+    def _ensure_catch_up(self) -> None:
+        if not self._catch_up_interval:
+            return None
+        if self._catch_up_task is not None and not self._catch_up_task.done():
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        self._catch_up_task = loop.create_task(self._catch_up_loop())
+
+    async def _catch_up_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._catch_up_interval)
+            try:
+                await self.catch_up()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("product read model catch-up failed")
@@ -70,14 +70,8 @@ class OptimizedProductReadRepository(ProductReadRepositoryInterface):
         if not row:
             return None
 
-        # Загружаем изображения
-        images = await self._load_images(product_id)
-
-        # Загружаем атрибуты
-        attributes = await self._load_attributes(product_id)
-
-        # Собираем DTO
-        return self._row_to_dto(row, images, attributes)
+        products = await self._hydrate([row])
+        return products[0]
 
     async def get_by_name(self, name: str) -> Optional[ProductReadDTO]:
         query = text("""
@@ -108,10 +102,8 @@ class OptimizedProductReadRepository(ProductReadRepositoryInterface):
         if not row:
             return None
 
-        images = await self._load_images(row.id)
-        attributes = await self._load_attributes(row.id)
-
-        return self._row_to_dto(row, images, attributes)
+        products = await self._hydrate([row])
+        return products[0]
 
     async def filter(
         self,
@@ -148,15 +140,21 @@ class OptimizedProductReadRepository(ProductReadRepositoryInterface):
                     effective_category_id = parent_row[0]
                 # Если parent_id нет, оставляем original category_id (вернёт пустой результат)
 
+        is_fallback = category_id is not None and effective_category_id != category_id
+        where_clause = self._build_where_clause(
+            name, effective_category_id, product_type_id, attributes, product_ids, is_fallback=is_fallback
+        )
+
         # Базовый запрос для подсчёта total
-        count_query = text("""
+        count_query = text(f"""
             SELECT COUNT(*)
             FROM products p
             WHERE 1=1
-            """ + self._build_where_clause(name, effective_category_id, product_type_id, attributes, product_ids, is_fallback=(category_id is not None and effective_category_id != category_id)))
+            {where_clause}
+        """)
 
         count_params = self._build_params(name, effective_category_id, product_type_id, attributes, product_ids)
-        count_result = await self.db.execute(text(count_query), count_params)
+        count_result = await self.db.execute(count_query, count_params)
         total = count_result.scalar() or 0
 
         if total == 0:
@@ -183,7 +181,7 @@ class OptimizedProductReadRepository(ProductReadRepositoryInterface):
             LEFT JOIN categories c ON c.id = p.category_id
             LEFT JOIN suppliers s ON s.id = p.supplier_id
             WHERE 1=1
-            {self._build_where_clause(name, effective_category_id, product_type_id, attributes, product_ids, is_fallback=(category_id is not None and effective_category_id != category_id))}
+            {where_clause}
             ORDER BY p.id
             LIMIT :limit OFFSET :offset
         """)
@@ -192,26 +190,10 @@ class OptimizedProductReadRepository(ProductReadRepositoryInterface):
         params["limit"] = limit
         params["offset"] = offset
 
-        result = await self.db.execute(text(query), params)
+        result = await self.db.execute(query, params)
         rows = result.fetchall()
 
-        # Параллельно загружаем изображения и атрибуты для всех продуктов
-        import asyncio
-        products = []
-        for row in rows:
-            images, attributes_data = await asyncio.gather(
-                self._load_images(row.id),
-                self._load_attributes(row.id),
-            )
-            products.append(self._row_to_dto(row, images, attributes_data))
-
-        # Заполняем количество отзывов
-        if products:
-            product_ids = [p.id for p in products]
-            counts = await self.get_review_counts_by_product_ids(product_ids)
-            for p in products:
-                if p.rating:
-                    p.rating.count = counts.get(p.id, 0)
+        products = await self._hydrate(rows)
 
         return products, total
 
@@ -231,42 +213,24 @@ class OptimizedProductReadRepository(ProductReadRepositoryInterface):
             if is_fallback:
                 # При fallback ищем во всех дочерних категориях родителя
                 conditions.append("""
-                    AND (
-                        p.category_id IN (
-                            WITH RECURSIVE category_tree AS (
-                                SELECT id
-                                FROM categories
-                                WHERE id = :category_id
-                                UNION ALL
-                                SELECT c.id
-                                FROM categories c
-                                INNER JOIN category_tree ct ON c.parent_id = ct.id
-                            )
-                            SELECT id FROM category_tree
-                        )
+                    AND p.category_id IN (
+                        SELECT descendant_id
+                        FROM category_closure
+                        WHERE ancestor_id = :category_id
                     )
                 """)
             else:
                 # Обычный случай — ищем только в указанной категории
                 conditions.append("AND p.category_id = :category_id")
 
-        # product_type_id фильтрует через category.device_type_id (с наследованием)
+        # product_type_id фильтрует через categories.effective_device_type_id
+        # (device_type_id с наследованием, поддерживается при изменении категорий)
         if product_type_id is not None:
             conditions.append("""
-                AND (
-                    EXISTS (
-                        WITH RECURSIVE category_chain AS (
-                            SELECT id, parent_id, device_type_id
-                            FROM categories
-                            WHERE id = p.category_id
-                            UNION ALL
-                            SELECT c.id, c.parent_id, c.device_type_id
-                            FROM categories c
-                            INNER JOIN category_chain cc ON c.id = cc.parent_id
-                            WHERE cc.device_type_id IS NULL
-                        )
-                        SELECT 1 FROM category_chain WHERE device_type_id = :product_type_id
-                    )
+                AND p.category_id IN (
+                    SELECT id
+                    FROM categories
+                    WHERE effective_device_type_id = :product_type_id
                 )
             """)
 
@@ -277,12 +241,13 @@ class OptimizedProductReadRepository(ProductReadRepositoryInterface):
         # Добавляем условия для атрибутов
         if attributes:
             for attr_name in attributes.keys():
+                safe_name = attr_name.replace(" ", "_").replace("-", "_")
                 conditions.append(f"AND EXISTS (")
                 conditions.append(f"    SELECT 1 FROM product_attribute_values pav ")
                 conditions.append(f"    JOIN product_attributes pa ON pa.id = pav.attribute_id ")
                 conditions.append(f"    WHERE pav.product_id = p.id ")
-                conditions.append(f"    AND pa.name = :attr_{attr_name}_name ")
-                conditions.append(f"    AND pav.value = ANY(:attr_{attr_name}_values)")
+                conditions.append(f"    AND pa.name = :attr_{safe_name}_name ")
+                conditions.append(f"    AND pav.value = ANY(:attr_{safe_name}_values)")
                 conditions.append(f")")
 
         return " ".join(conditions)
@@ -315,36 +280,74 @@ class OptimizedProductReadRepository(ProductReadRepositoryInterface):
 
         return params
 
-    async def _load_images(self, product_id: int) -> list[ProductImageReadDTO]:
+    async def _hydrate(self, rows) -> list[ProductReadDTO]:
+        """
+        Собрать DTO для страницы товаров.
+
+        Изображения, атрибуты и количество отзывов загружаются одним запросом
+        на всю страницу, поэтому число запросов не зависит от размера страницы.
+        """
+        if not rows:
+            return []
+
+        product_ids = [row.id for row in rows]
+
+        images_by_product = await self._load_images(product_ids)
+        attributes_by_product = await self._load_attributes(product_ids)
+        review_counts = await self.get_review_counts_by_product_ids(product_ids)
+
+        products = []
+        for row in rows:
+            dto = self._row_to_dto(
+                row,
+                images_by_product.get(row.id, []),
+                attributes_by_product.get(row.id, []),
+            )
+            if dto.rating:
+                dto.rating.count = review_counts.get(row.id, 0)
+            products.append(dto)
+
+        return products
+
+    async def _load_images(
+        self,
+        product_ids: list[int],
+    ) -> dict[int, list[ProductImageReadDTO]]:
         query = text("""
             SELECT
+                pi.product_id,
                 pi.upload_id,
                 pi.is_main,
                 pi.ordering,
                 uh.file_path
             FROM product_images pi
             LEFT JOIN upload_history uh ON uh.id = pi.upload_id
-            WHERE pi.product_id = :product_id
-            ORDER BY pi.ordering, pi.id
+            WHERE pi.product_id = ANY(:product_ids)
+            ORDER BY pi.product_id, pi.ordering, pi.id
         """)
 
-        result = await self.db.execute(query, {"product_id": product_id})
-        rows = result.fetchall()
-
-        return [
-            ProductImageReadDTO(
-                upload_id=row.upload_id,
-                image_key=row.file_path or "",
-                image_url=self.image_storage.build_public_url(row.file_path or ""),
-                is_main=row.is_main,
-                ordering=row.ordering,
+        result = await self.db.execute(query, {"product_ids": product_ids})
+
+        images: dict[int, list[ProductImageReadDTO]] = {}
+        for row in result.fetchall():
+            images.setdefault(row.product_id, []).append(
+                ProductImageReadDTO(
+                    upload_id=row.upload_id,
+                    image_key=row.file_path or "",
+                    image_url=self.image_storage.build_public_url(row.file_path or ""),
+                    is_main=row.is_main,
+                    ordering=row.ordering,
+                )
             )
-            for row in rows
-        ]
+        return images
 
-    async def _load_attributes(self, product_id: int) -> list[ProductAttributeReadDTO]:
+    async def _load_attributes(
+        self,
+        product_ids: list[int],
+    ) -> dict[int, list[ProductAttributeReadDTO]]:
         query = text("""
             SELECT
+                pav.product_id,
                 pa.id,
                 pa.name,
                 pav.value,
@@ -352,23 +355,24 @@ class OptimizedProductReadRepository(ProductReadRepositoryInterface):
                 pa.is_groupable
             FROM product_attribute_values pav
             JOIN product_attributes pa ON pa.id = pav.attribute_id
-            WHERE pav.product_id = :product_id
-            ORDER BY pa.name
+            WHERE pav.product_id = ANY(:product_ids)
+            ORDER BY pav.product_id, pa.name
         """)
 
-        result = await self.db.execute(query, {"product_id": product_id})
-        rows = result.fetchall()
+        result = await self.db.execute(query, {"product_ids": product_ids})
 
-        return [
-            ProductAttributeReadDTO(
-                id=row.id,
-                name=row.name,
-                value=row.value,
-                is_filterable=row.is_filterable,
-                is_groupable=row.is_groupable,
+        attributes: dict[int, list[ProductAttributeReadDTO]] = {}
+        for row in result.fetchall():
+            attributes.setdefault(row.product_id, []).append(
+                ProductAttributeReadDTO(
+                    id=row.id,
+                    name=row.name,
+                    value=row.value,
+                    is_filterable=row.is_filterable,
+                    is_groupable=row.is_groupable,
+                )
             )
-            for row in rows
-        ]
+        return attributes
 
     def _row_to_dto(
         self,
@@ -432,22 +436,11 @@ class OptimizedProductReadRepository(ProductReadRepositoryInterface):
         target_device_type_id = device_type_id
 
         if category_id is not None:
-            # Запрос для получения device_type_id из категории (с учётом наследования)
+            # device_type_id категории с учётом наследования
             category_stmt = text("""
-                WITH RECURSIVE category_chain AS (
-                    SELECT id, parent_id, device_type_id
-                    FROM categories
-                    WHERE id = :category_id
-                    UNION ALL
-                    SELECT c.id, c.parent_id, c.device_type_id
-                    FROM categories c
-                    INNER JOIN category_chain cc ON c.id = cc.parent_id
-                    WHERE cc.device_type_id IS NULL
-                )
-                SELECT device_type_id
-                FROM category_chain
-                WHERE device_type_id IS NOT NULL
-                LIMIT 1
+                SELECT effective_device_type_id AS device_type_id
+                FROM categories
+                WHERE id = :category_id
             """)
 
             result = await self.db.execute(category_stmt, {"category_id": category_id})
@@ -455,30 +448,10 @@ class OptimizedProductReadRepository(ProductReadRepositoryInterface):
 
             if row and row.device_type_id:
                 target_device_type_id = row.device_type_id
-        
+
         # Формируем запрос для получения атрибутов
-        # Используем CTE для получения всех категорий с нужным effective device_type_id
+        # по всем категориям с нужным effective device_type_id
         filter_stmt = text("""
-            WITH RECURSIVE category_chain AS (
-                -- Находим все категории, у которых effective device_type_id = target
-                SELECT 
-                    c.id,
-                    c.device_type_id,
-                    c.device_type_id as effective_device_type_id
-                FROM categories c
-                WHERE c.device_type_id = :target_device_type_id
-                
-                UNION ALL
-                
-                -- Добавляем дочерние категории, которые наследуют device_type_id
-                SELECT 
-                    c.id,
-                    c.device_type_id,
-                    cc.effective_device_type_id
-                FROM categories c
-                INNER JOIN category_chain cc ON c.parent_id = cc.id
-                WHERE c.device_type_id IS NULL
-            )
             SELECT
                 pa.name as attribute_name,
                 pa.is_filterable,
@@ -487,8 +460,9 @@ class OptimizedProductReadRepository(ProductReadRepositoryInterface):
             FROM product_attribute_values pav
             JOIN product_attributes pa ON pa.id = pav.attribute_id
             JOIN products p ON p.id = pav.product_id
-            JOIN category_chain cc ON cc.id = p.category_id
+            JOIN categories c ON c.id = p.category_id
             WHERE pa.is_filterable = true
+              AND c.effective_device_type_id = :target_device_type_id
             GROUP BY pa.name, pa.is_filterable, pav.value
             ORDER BY pa.name, pav.value
         """)
@@ -522,41 +496,20 @@ class OptimizedProductReadRepository(ProductReadRepositoryInterface):
     async def export_full_catalog(self):
         """Экспорт всего каталога — используется raw SQL для производительности."""
         query = text("""
-            WITH RECURSIVE category_ancestors AS (
+            WITH parent_categories_agg AS (
                 SELECT
-                    c.id AS root_id,
-                    c.id AS ancestor_id,
-                    c.name AS ancestor_name,
-                    0 AS depth
-                FROM categories c
-
-                UNION ALL
-
-                SELECT
-                    ca.root_id,
-                    p.id AS ancestor_id,
-                    p.name AS ancestor_name,
-                    ca.depth + 1
-                FROM category_ancestors ca
-                JOIN categories p ON p.id = (
-                    SELECT c2.parent_id FROM categories c2 WHERE c2.id = ca.ancestor_id
-                )
-            ),
-            parent_categories_agg AS (
-                SELECT
-                    root_id AS category_id,
-                    COALESCE(
-                        jsonb_agg(
-                            jsonb_build_object(
-                                'id', ancestor_id,
-                                'name', ancestor_name
-                            )
-                            ORDER BY depth
-                        ) FILTER (WHERE depth > 0),
-                        '[]'
+                    cc.descendant_id AS category_id,
+                    jsonb_agg(
+                        jsonb_build_object(
+                            'id', a.id,
+                            'name', a.name
+                        )
+                        ORDER BY cc.depth
                     ) AS parent_categories
-                FROM category_ancestors
-                GROUP BY root_id
+                FROM category_closure cc
+                JOIN categories a ON a.id = cc.ancestor_id
+                WHERE cc.depth > 0
+                GROUP BY cc.descendant_id
             )
             SELECT
                 p.id,
@@ -0,0 +1,42 @@
+"""
+Проверка существования связанных записей пачкой id — общая для массового
+импорта и пакетного обновления товаров.
+"""
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Поле строки импорта / пакета -> таблица, в которой ищется id
+REFERENCE_TABLES = {
+    "id": "products",
+    "category_id": "categories",
+    "supplier_id": "suppliers",
+    "region_id": "regions",
+    "upload_id": "upload_history",
+    "tag_id": "tags",
+}
+
+
+async def find_missing_ids(
+    db: AsyncSession,
+    wanted: dict[str, set[int]],
+) -> dict[str, set[int]]:
+    """
+    id из wanted ({поле: id}, поля — ключи REFERENCE_TABLES), которых нет в БД.
+    Один запрос на таблицу. Найденные строки блокируются FOR KEY SHARE:
+    их нельзя удалить до конца транзакции, и вставка ссылок на них не упадёт.
+    """
+    missing: dict[str, set[int]] = {}
+    for field, ids in wanted.items():
+        if not ids:
+            continue
+        result = await db.execute(
+            text(
+                f"SELECT id FROM {REFERENCE_TABLES[field]} "
+                "WHERE id = ANY(:ids) FOR KEY SHARE"
+            ),
+            {"ids": list(ids)},
+        )
+        absent = ids - set(result.scalars().all())
+        if absent:
+            missing[field] = absent
+    return missing
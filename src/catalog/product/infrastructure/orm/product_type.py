@@ -4,6 +4,9 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.catalog.category.infrastructure.orm.category_hierarchy import (
+    refresh_effective_device_types,
+)
 from src.catalog.product.domain.aggregates.product_type import ProductTypeAggregate
 from src.catalog.product.domain.aggregates.product_type_image import ProductTypeImageAggregate
 from src.catalog.product.domain.exceptions import ProductTypeNotFound
@@ -105,6 +108,10 @@ class SqlAlchemyProductTypeRepository(ProductTypeRepository):
         if not model:
             return False
         await self.db.delete(model)
+        await self.db.flush()
+
+        # У категорий этого типа device_type_id обнулился — они снова наследуют от предков
+        await refresh_effective_device_types(self.db)
         return True
 
     @staticmethod
@@ -16,7 +16,7 @@ from src.catalog.review.domain.repository.review import ReviewRepository
 from src.catalog.review.domain.repository.review_audit import ReviewAuditRepository
 from src.core.auth.schemas.user import User
 from src.core.db.unit_of_work import UnitOfWork
-from src.core.events import AsyncEventBus
+from src.core.events import AsyncEventBus, build_event
 from src.core.services.images.storage import S3ImageStorageService
 from src.uploads.domain.repository.upload_history import UploadHistoryRepository
 
@@ -78,6 +78,17 @@ class CreateReviewCommand:
             # Обновляем рейтинг товара
             await self._update_product_rating(aggregate.product_id)
 
+        self.event_bus.publish_nowait(
+            build_event(
+                event_type="crud",
+                method="create",
+                app="reviews",
+                entity="review",
+                entity_id=aggregate.id,
+                data={"product_id": aggregate.product_id},
+            )
+        )
+
         return self._to_read_dto(aggregate)
 
     async def _map_images(
@@ -11,7 +11,7 @@ from src.catalog.review.infrastructure.models.review import Review
 from src.catalog.review.infrastructure.models.review_image import ReviewImage
 from src.core.auth.schemas.user import User
 from src.core.db.unit_of_work import UnitOfWork
-from src.core.events import AsyncEventBus
+from src.core.events import AsyncEventBus, build_event
 
 
 class DeleteReviewCommand:
@@ -71,6 +71,17 @@ class DeleteReviewCommand:
             # Обновляем рейтинг товара (может стать None если отзывов больше нет)
             await self._update_product_rating(aggregate.product_id)
 
+        self.event_bus.publish_nowait(
+            build_event(
+                event_type="crud",
+                method="delete",
+                app="reviews",
+                entity="review",
+                entity_id=review_id,
+                data={"product_id": aggregate.product_id},
+            )
+        )
+
         return True
 
     def _capture_state(self, aggregate) -> dict:
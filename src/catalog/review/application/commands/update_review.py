@@ -21,7 +21,7 @@ from src.catalog.review.infrastructure.models.review import Review
 from src.catalog.review.infrastructure.models.review_image import ReviewImage
 from src.core.auth.schemas.user import User
 from src.core.db.unit_of_work import UnitOfWork
-from src.core.events import AsyncEventBus
+from src.core.events import AsyncEventBus, build_event
 from src.core.services.images.storage import S3ImageStorageService
 from src.uploads.domain.repository.upload_history import UploadHistoryRepository
 
@@ -117,6 +117,18 @@ class UpdateReviewCommand:
             # Обновляем рейтинг товара
             await self._update_product_rating(aggregate.product_id)
 
+        if old_data != new_data:
+            self.event_bus.publish_nowait(
+                build_event(
+                    event_type="crud",
+                    method="update",
+                    app="reviews",
+                    entity="review",
+                    entity_id=aggregate.id,
+                    data={"product_id": aggregate.product_id},
+                )
+            )
+
         return self._to_read_dto(aggregate)
 
     async def _apply_image_operations(
@@ -1,8 +1,38 @@
+from typing import Any
+
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+from pydantic_core import to_json
 
 from src.core.exceptions.base import BaseServiceError
 
+_SUCCESS_PREFIX = b'{"success":true,"data":'
+_SUCCESS_SUFFIX = b"}"
+
+
+class ApiModelResponse(Response):
+    """
+    Успешный ответ {"success": true, "data": ...}, где data — Pydantic-схема
+    (или список схем).
+
+    data сериализуется pydantic-core за один проход сразу в байты, без
+    промежуточного dict из jsonable_encoder и повторного json.dumps.
+    Результат тот же, что у jsonable_encoder: by_alias, Decimal — строкой,
+    даты — ISO 8601.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return _SUCCESS_PREFIX + to_json(content, by_alias=True) + _SUCCESS_SUFFIX
+
+
+def _is_model_payload(result: Any) -> bool:
+    if isinstance(result, BaseModel):
+        return True
+    return isinstance(result, list) and all(isinstance(item, BaseModel) for item in result)
+
 
 def api_response(result):
     if isinstance(result, BaseServiceError):
@@ -18,6 +48,10 @@ def api_response(result):
             },
         )
 
+    if _is_model_payload(result):
+        return ApiModelResponse(content=result)
+
+    # Словари и прочие значения: Decimal и даты в них кодирует jsonable_encoder
     return JSONResponse(
         status_code=200,
         content=jsonable_encoder(
@@ -27,4 +61,3 @@ def api_response(result):
             }
         ),
     )
-
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
+
+# ttl для ключей, которые не должны истекать (LRU всё равно может их вытеснить)
+NO_EXPIRY = 0
 
 
 class Cache(ABC):
@@ -14,4 +17,31 @@ class Cache(ABC):
 
     @abstractmethod
     async def delete(self, key: str) -> None:
-        ...
\ No newline at end of file
+        ...
+
+    async def replace(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """
+        Записать новое значение ключа, которое должны увидеть все процессы.
+
+        set — заполнение кэша прочитанным значением, replace — изменение
+        (например, смена поколения). Кэши с рассылкой инвалидаций публикуют
+        только replace/delete; по умолчанию это обычный set.
+        """
+        await self.set(key, value, ttl=ttl)
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """
+        Значения нескольких ключей; промахов в результате нет.
+        Реализации с сетевым хранилищем читают их одним запросом.
+        """
+        values = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """Удалить несколько ключей. Реализации с сетевым хранилищем делают это одним запросом."""
+        for key in keys:
+            await self.delete(key)
\ No newline at end of file
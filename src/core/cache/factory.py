@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from src.core.cache.base import Cache
+from src.core.cache.lru import LRUCache
+from src.core.cache.redis import RedisCache
+from src.core.cache.redis_client import RedisClientFactory
+from src.core.cache.tiered import TieredCache
+from src.core.conf.settings import get_settings
+
+
+@lru_cache
+def get_shared_cache() -> Cache:
+    """
+    Общий для процесса кэш.
+
+    L1 — ограниченный LRU+TTL кэш в памяти воркера.
+    Если включён CACHE_REDIS_L2_ENABLED, L1 работает поверх RedisCache (L2),
+    а изменения рассылаются остальным воркерам через CACHE_INVALIDATION_CHANNEL.
+    Без него кэш и его сбросы локальны для воркера — при нескольких воркерах
+    (gunicorn -w N) CACHE_REDIS_L2_ENABLED обязателен.
+    """
+    settings = get_settings()
+    local = LRUCache(
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        max_bytes=settings.CACHE_MAX_BYTES,
+        default_ttl=settings.CACHE_DEFAULT_TTL_SECONDS,
+    )
+
+    if not settings.CACHE_REDIS_L2_ENABLED:
+        return local
+
+    redis_client = RedisClientFactory.get_client()
+    return TieredCache(
+        l1=local,
+        l2=RedisCache(redis_client),
+        redis_client=redis_client,
+        channel=settings.CACHE_INVALIDATION_CHANNEL,
+        l1_ttl=settings.CACHE_L1_TTL_SECONDS,
+    )
@@ -0,0 +1,65 @@
+from typing import Any, Iterable, Optional
+
+from src.core.cache.base import Cache
+
+
+class LayeredCache(Cache):
+    """
+    Двухуровневый кэш: L1 (in-process) поверх L2 (общий, например Redis).
+
+    - get/get_many: сначала L1, промахи — из L2 (одним запросом) с прогревом L1
+    - set/delete/delete_many: применяются к обоим уровням
+    """
+
+    def __init__(self, l1: Cache, l2: Cache, l1_ttl: int | None = None):
+        self.l1 = l1
+        self.l2 = l2
+        self._l1_ttl = l1_ttl
+
+    def _local_ttl(self, ttl: int | None) -> int | None:
+        if self._l1_ttl is None:
+            return ttl
+        if not ttl:
+            # Без срока (None/NO_EXPIRY) в L2 — в L1 всё равно не дольше l1_ttl
+            return self._l1_ttl
+        return min(ttl, self._l1_ttl)
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = await self.l1.get(key)
+        if value is not None:
+            return value
+
+        value = await self.l2.get(key)
+        if value is not None:
+            await self.l1.set(key, value, ttl=self._local_ttl(None))
+        return value
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(keys)
+        values = await self.l1.get_many(keys)
+        missing = [key for key in keys if key not in values]
+        if not missing:
+            return values
+
+        found = await self.l2.get_many(missing)
+        for key, value in found.items():
+            await self.l1.set(key, value, ttl=self._local_ttl(None))
+        values.update(found)
+        return values
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        await self.l2.set(key, value, ttl=ttl)
+        await self.l1.set(key, value, ttl=self._local_ttl(ttl))
+
+    async def delete(self, key: str) -> None:
+        await self.l2.delete(key)
+        await self.l1.delete(key)
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        await self.l2.delete_many(keys)
+        await self.l1.delete_many(keys)
+
+    async def clear(self) -> None:
+        """Очистить только локальный уровень (L2 общий для всех процессов)."""
+        await self.l1.clear()
@@ -0,0 +1,109 @@
+import json
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from src.core.cache.base import Cache
+
+
+def estimate_size(value: Any) -> int:
+    """Оценить размер значения в байтах (по JSON-представлению)."""
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+class LRUCache(Cache):
+    """
+    Ограниченный in-memory кэш с вытеснением LRU и TTL.
+
+    Ограничения:
+    - max_entries — максимальное количество записей
+    - max_bytes — максимальный суммарный размер значений (оценка через sizeof)
+
+    При превышении любого из лимитов вытесняются самые давно использованные записи.
+    Просроченные записи удаляются лениво при чтении и при вытеснении.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: int | None = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._default_ttl = default_ttl
+        self._sizeof = sizeof
+        # key -> (value, expires_at, size)
+        self._store: OrderedDict[str, tuple[Any, float | None, int]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._store.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at, _ = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._store.move_to_end(key)
+        self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        ttl = ttl if ttl is not None else self._default_ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        size = self._sizeof(value)
+
+        if size > self._max_bytes:
+            # Значение больше всего кэша — не кэшируем, но и не оставляем старое
+            self._remove(key)
+            return
+
+        self._remove(key)
+        self._store[key] = (value, expires_at, size)
+        self._bytes += size
+        self._evict()
+
+    async def delete(self, key: str) -> None:
+        self._remove(key)
+
+    async def clear(self) -> None:
+        self._store.clear()
+        self._bytes = 0
+
+    async def get_stats(self) -> dict:
+        return {
+            "entries": len(self._store),
+            "bytes": self._bytes,
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._store.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        while len(self._store) > self._max_entries or self._bytes > self._max_bytes:
+            key, (_, expires_at, size) = self._store.popitem(last=False)
+            self._bytes -= size
+            # Просроченные записи не считаем вытеснением
+            if expires_at is None or expires_at >= now:
+                self.evictions += 1
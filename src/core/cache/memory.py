@@ -1,5 +1,5 @@
 import time
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 
 class InMemoryCache:
@@ -24,5 +24,17 @@ class InMemoryCache:
         expires_at = time.time() + ttl if ttl else None
         self._store[key] = (value, expires_at)
 
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        values = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
     async def delete(self, key: str):
-        self._store.pop(key, None)
\ No newline at end of file
+        self._store.pop(key, None)
+
+    async def delete_many(self, keys: Iterable[str]):
+        for key in keys:
+            self._store.pop(key, None)
\ No newline at end of file
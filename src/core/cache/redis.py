@@ -1,5 +1,5 @@
 import json
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 
 class RedisCache:
@@ -13,9 +13,22 @@ class RedisCache:
             return None
         return json.loads(data)
 
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        payloads = await self.redis.mget(keys)
+        return {key: json.loads(data) for key, data in zip(keys, payloads) if data}
+
     async def set(self, key: str, value: Any, ttl: int | None = None):
         payload = json.dumps(value)
-        await self.redis.set(key, payload, ex=ttl)
+        # ttl=0 (NO_EXPIRY) — ключ без срока жизни
+        await self.redis.set(key, payload, ex=ttl or None)
 
     async def delete(self, key: str):
-        await self.redis.delete(key)
\ No newline at end of file
+        await self.redis.delete(key)
+
+    async def delete_many(self, keys: Iterable[str]):
+        keys = list(keys)
+        if keys:
+            await self.redis.delete(*keys)
\ No newline at end of file
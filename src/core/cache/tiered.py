@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Iterable
+
+from src.core.cache.base import Cache
+from src.core.cache.layered import LayeredCache
+
+logger = logging.getLogger(__name__)
+
+
+class TieredCache(LayeredCache):
+    """
+    L1/L2 кэш с рассылкой инвалидаций между воркерами через Redis pub/sub.
+
+    Каждый replace/delete, помимо записи в оба уровня, публикует в канал
+    сообщение с ключами; остальные воркеры удаляют эти ключи из своего L1.
+    set — заполнение кэша после промаха — ничего не публикует: значение
+    прочитано из источника, и чужие копии в L1 от него не устаревают.
+    Подписка запускается лениво при первом обращении к кэшу в работающем
+    event loop. Если подписка оборвалась, после переподключения L1
+    очищается целиком — пропущенные сообщения восстановить нельзя.
+    """
+
+    RECONNECT_DELAY_SECONDS = 1.0
+
+    def __init__(
+        self,
+        l1: Cache,
+        l2: Cache,
+        redis_client,
+        channel: str,
+        l1_ttl: int | None = None,
+    ):
+        super().__init__(l1=l1, l2=l2, l1_ttl=l1_ttl)
+        self.redis = redis_client
+        self.channel = channel
+        self.instance_id = uuid.uuid4().hex
+        self._listener: asyncio.Task | None = None
+
+    async def get(self, key: str) -> Any:
+        self._ensure_listener()
+        return await super().get(key)
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        self._ensure_listener()
+        return await super().get_many(keys)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        self._ensure_listener()
+        await super().set(key, value, ttl=ttl)
+
+    async def replace(self, key: str, value: Any, ttl: int | None = None) -> None:
+        self._ensure_listener()
+        await super().set(key, value, ttl=ttl)
+        await self._broadcast("delete", [key])
+
+    async def delete(self, key: str) -> None:
+        self._ensure_listener()
+        await super().delete(key)
+        await self._broadcast("delete", [key])
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """Удаление пачки ключей — одно сообщение в канал на всю пачку."""
+        keys = list(keys)
+        if not keys:
+            return None
+        self._ensure_listener()
+        await super().delete_many(keys)
+        await self._broadcast("delete", keys)
+
+    async def clear(self) -> None:
+        """Очистить L1 во всех воркерах (L2 не трогаем)."""
+        await super().clear()
+        await self._broadcast("clear", [])
+
+    async def close(self) -> None:
+        if self._listener is None:
+            return None
+        self._listener.cancel()
+        try:
+            await self._listener
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._listener = None
+
+    # ---------- pub/sub ----------
+
+    async def _broadcast(self, op: str, keys: Iterable[str]) -> None:
+        payload = json.dumps(
+            {"origin": self.instance_id, "op": op, "keys": list(keys)}
+        )
+        try:
+            await self.redis.publish(self.channel, payload)
+        except Exception:
+            logger.exception("failed to publish cache invalidation")
+
+    async def _handle_message(self, data: str) -> None:
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning("invalid cache invalidation message: %r", data)
+            return None
+
+        if message.get("origin") == self.instance_id:
+            return None
+
+        if message.get("op") == "clear":
+            await self.l1.clear()
+            return None
+
+        for key in message.get("keys") or []:
+            await self.l1.delete(key)
+
+    def _ensure_listener(self) -> None:
+        if self._listener is not None and not self._listener.done():
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        self._listener = loop.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        reconnect = False
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                if reconnect:
+                    await self.l1.clear()
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    await self._handle_message(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("cache invalidation subscriber failed; reconnecting")
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            reconnect = True
+            await asyncio.sleep(self.RECONNECT_DELAY_SECONDS)
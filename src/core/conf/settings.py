@@ -50,6 +50,22 @@ class Settings(BaseSettings):
     REDIS_CONNECT_TIMEOUT_SECONDS: float = 0.2
     REDIS_SOCKET_TIMEOUT_SECONDS: float = 0.2
 
+    # ===============================
+    # CACHE
+    # ===============================
+
+    # Общий для процесса LRU+TTL кэш (L1)
+    CACHE_MAX_ENTRIES: int = 10_000
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    CACHE_DEFAULT_TTL_SECONDS: Optional[int] = 300
+    # Redis как второй уровень (L2) под локальным кэшем. Обязателен при
+    # нескольких воркерах: без него сбросы кэша (в т.ч. read-модели товаров)
+    # видит только воркер, выполнивший изменение
+    CACHE_REDIS_L2_ENABLED: bool = False
+    CACHE_L1_TTL_SECONDS: Optional[int] = 60
+    # Канал Redis для рассылки инвалидаций L1 между воркерами
+    CACHE_INVALIDATION_CHANNEL: str = "cache.invalidation"
+
     # ===============================
     # JWT
     # ===============================
@@ -67,6 +83,82 @@ class Settings(BaseSettings):
     S3_SECRET_ACCESS_KEY: str
     S3_URL: str = 'https://s3.twcstorage.ru'
     S3_REGION: str = 'ru-1'
+    # Размер пула соединений boto3-клиента (параллельные загрузки через asyncio.to_thread)
+    S3_MAX_POOL_CONNECTIONS: int = 32
+
+    # ===============================
+    # SEARCH
+    # ===============================
+
+    # Поиск товаров по tsvector/pg_trgm вместо ILIKE
+    PRODUCT_SEARCH_FULLTEXT_ENABLED: bool = False
+
+    # ===============================
+    # EXPORT
+    # ===============================
+
+    # Размер пачки строк серверного курсора при потоковой выгрузке каталога
+    CATALOG_EXPORT_CHUNK_SIZE: int = 1000
+    # Запас назад для отметки инкрементальной выгрузки (updated_since)
+    CATALOG_EXPORT_DELTA_OVERLAP_SECONDS: int = 60
+
+    # ===============================
+    # IMPORT
+    # ===============================
+
+    # Размер пачки массового импорта товаров: строк на одну проверку
+    # ссылок и один COPY в staging, id товаров на одно событие шины
+    PRODUCT_IMPORT_BATCH_SIZE: int = 5000
+    # Сколько ошибок строк возвращать в ответе и хранить в аудите импорта
+    PRODUCT_IMPORT_MAX_REPORTED_ERRORS: int = 100
+    # Максимум строк файла в POST /product/admin/import; файлы больше —
+    # через scripts.import_products
+    PRODUCT_IMPORT_HTTP_MAX_ROWS: int = 100000
+    # Максимум товаров в одном запросе PATCH /product/bulk
+    PRODUCT_BULK_UPDATE_MAX_ITEMS: int = 1000
+    # Максимум id в одном запросе POST /product/batch
+    PRODUCT_BATCH_MAX_IDS: int = 200
+
+    # ===============================
+    # CATEGORY TREE
+    # ===============================
+
+    # Как часто воркер сверяет версию снимка дерева категорий с БД (секунды).
+    # События категорий своего воркера проверяются сразу
+    CATEGORY_TREE_VERSION_CHECK_SECONDS: float = 5.0
+
+    # ===============================
+    # PRICING
+    # ===============================
+
+    # Как часто воркер сверяет политики ценообразования категорий с БД
+    # (секунды). Изменения политик своего воркера подхватываются сразу
+    PRICING_POLICY_VERSION_CHECK_SECONDS: float = 5.0
+
+    # ===============================
+    # PRODUCT INDEX
+    # ===============================
+
+    # Как часто воркер подбирает изменения товаров других воркеров
+    # в индексе товаров (фасеты и фильтрация, секунды)
+    PRODUCT_INDEX_POLL_SECONDS: float = 5.0
+
+    # Фильтрация каталога по индексу товаров в памяти: страница id и total
+    # считаются битовыми картами, из БД читаются только товары страницы
+    PRODUCT_INDEX_FILTER_ENABLED: bool = False
+
+    # ===============================
+    # PRODUCT READ MODEL
+    # ===============================
+
+    # Чтение товаров (get_by_id, get_by_name, страницы filter) из проекции
+    # product_read_model. Перед включением проекцию нужно заполнить:
+    # python -m scripts.rebuild_product_read_model
+    PRODUCT_READ_MODEL_ENABLED: bool = False
+
+    # Как часто проекция догоняет изменения товаров, событие о которых
+    # потерялось (по products.updated_at, секунды)
+    PRODUCT_READ_MODEL_CATCH_UP_SECONDS: float = 60.0
 
     # ===============================
     # CATALOG FILTERS SORTING
@@ -1,5 +1,18 @@
+from typing import Awaitable, Callable
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+AFTER_COMMIT_KEY = "after_commit"
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    Выполнить callback после коммита UnitOfWork этой сессии (при откате —
+    отбросить). Нужен для сброса общих кэшей: сброс до коммита может
+    перезаполниться параллельным чтением ещё старых данных.
+    """
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
 
 class UnitOfWork:
 
@@ -11,6 +24,9 @@ class UnitOfWork:
 
     async def __aexit__(self, exc_type, exc, tb):
         if exc:
+            self.session.info.pop(AFTER_COMMIT_KEY, None)
             await self.session.rollback()
         else:
-            await self.session.commit()
\ No newline at end of file
+            await self.session.commit()
+            for callback in self.session.info.pop(AFTER_COMMIT_KEY, []):
+                await callback()
@@ -2,26 +2,62 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Iterable
+from typing import Any, Awaitable, Callable, Iterable
 
 from src.core.events.publisher import EventPublisher
 
 logger = logging.getLogger(__name__)
 
+EventHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
 
 class AsyncEventBus:
 
     def __init__(self, publisher: EventPublisher):
         self.publisher = publisher
+        self._handlers: list[EventHandler] = []
+        # Ссылки на задачи публикации: без них задачу может собрать GC до завершения
+        self._pending: set[asyncio.Task] = set()
+
+    def subscribe(self, handler: EventHandler) -> None:
+        """
+        Подписать внутрипроцессный обработчик на все публикуемые события.
+
+        Обработчики вызываются до отправки во внешний publisher,
+        их ошибки логируются и не мешают публикации.
+        """
+        if handler not in self._handlers:
+            self._handlers.append(handler)
 
     def publish_nowait(self, message: dict[str, Any]) -> None:
-        asyncio.create_task(self._publish_safe(message))
+        self._spawn(message)
 
     def publish_many_nowait(self, messages: Iterable[dict[str, Any]]) -> None:
         for message in messages:
-            asyncio.create_task(self._publish_safe(message))
+            self._spawn(message)
+
+    async def drain(self) -> None:
+        """
+        Дождаться публикации всех уже отправленных событий.
+
+        Нужен скриптам: процесс не должен завершиться раньше,
+        чем события дойдут до обработчиков и publisher.
+        """
+        while self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def _spawn(self, message: dict[str, Any]) -> None:
+        task = asyncio.create_task(self._publish_safe(message))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
 
     async def _publish_safe(self, message: dict[str, Any]) -> None:
+        for handler in self._handlers:
+            try:
+                await handler(message)
+            except Exception:
+                logger.exception("event handler failed")
+
         try:
             await self.publisher.publish(message)
         except Exception:
@@ -1,3 +1,3 @@
-from .storage import ImageStorageService, S3ImageStorageService
+from .storage import ImageStorageService, S3ImageStorageService, build_public_url
 
-__all__ = ["ImageStorageService", "S3ImageStorageService"]
+__all__ = ["ImageStorageService", "S3ImageStorageService", "build_public_url"]
@@ -1,11 +1,10 @@
 import asyncio
 import mimetypes
+import threading
 import uuid
 from abc import ABC, abstractmethod
 from pathlib import Path
 
-import boto3
-
 
 class ImageStorageService(ABC):
 
@@ -26,7 +25,23 @@ class ImageStorageService(ABC):
         ...
 
 
+def build_public_url(endpoint_url: str, bucket_name: str, key: str) -> str:
+    """Публичный URL объекта в бакете (без обращения к S3 и boto3)."""
+    return f"{endpoint_url.rstrip('/')}/{bucket_name}/{key}"
+
+
 class S3ImageStorageService(ImageStorageService):
+    """
+    Хранилище изображений в S3.
+
+    boto3-клиент создаётся лениво при первой загрузке/удалении и переиспользуется:
+    клиент потокобезопасен, а его создание дорогое. Пул соединений клиента
+    (max_pool_connections) должен покрывать число параллельных asyncio.to_thread.
+    from_settings() возвращает один экземпляр на процесс.
+    """
+
+    _instance: "S3ImageStorageService | None" = None
+    _instance_lock = threading.Lock()
 
     def __init__(
         self,
@@ -36,29 +51,57 @@ class S3ImageStorageService(ImageStorageService):
         secret_access_key: str,
         endpoint_url: str,
         region_name: str,
+        max_pool_connections: int = 10,
     ):
         self.bucket_name = bucket_name
         self.endpoint_url = endpoint_url.rstrip("/")
-        self.client = boto3.client(
-            "s3",
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_access_key,
-            endpoint_url=self.endpoint_url,
-            region_name=region_name,
-        )
+        self._access_key = access_key
+        self._secret_access_key = secret_access_key
+        self._region_name = region_name
+        self._max_pool_connections = max_pool_connections
+        self._client = None
+        self._client_lock = threading.Lock()
 
     @classmethod
     def from_settings(cls):
+        if cls._instance is not None:
+            return cls._instance
+
         from src.core.conf.settings import get_settings
 
-        settings = get_settings()
-        return cls(
-            bucket_name=settings.BUCKET_NAME,
-            access_key=settings.S3_ACCESS_KEY,
-            secret_access_key=settings.S3_SECRET_ACCESS_KEY,
-            endpoint_url=settings.S3_URL,
-            region_name=settings.S3_REGION,
-        )
+        with cls._instance_lock:
+            if cls._instance is None:
+                settings = get_settings()
+                cls._instance = cls(
+                    bucket_name=settings.BUCKET_NAME,
+                    access_key=settings.S3_ACCESS_KEY,
+                    secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+                    endpoint_url=settings.S3_URL,
+                    region_name=settings.S3_REGION,
+                    max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                )
+        return cls._instance
+
+    @property
+    def client(self):
+        if self._client is not None:
+            return self._client
+
+        with self._client_lock:
+            if self._client is None:
+                import boto3
+                from botocore.config import Config
+
+                # Сессия по умолчанию в boto3 не потокобезопасна — создаём свою
+                self._client = boto3.session.Session().client(
+                    "s3",
+                    aws_access_key_id=self._access_key,
+                    aws_secret_access_key=self._secret_access_key,
+                    endpoint_url=self.endpoint_url,
+                    region_name=self._region_name,
+                    config=Config(max_pool_connections=self._max_pool_connections),
+                )
+        return self._client
 
     async def upload_bytes(self, *, data: bytes, key: str, content_type: str | None = None) -> None:
         extra_args: dict[str, str] = {}
@@ -85,7 +128,7 @@ class S3ImageStorageService(ImageStorageService):
         return f"{folder.strip('/')}/{uuid.uuid4()}{ext}"
 
     def build_public_url(self, key: str) -> str:
-        return f"{self.endpoint_url}/{self.bucket_name}/{key}"
+        return build_public_url(self.endpoint_url, self.bucket_name, key)
 
 
 
@@ -0,0 +1,100 @@
+"""
+Тесты таблицы замыкания категорий и effective_device_type_id.
+
+Проверяют:
+- Товар подкатегории находится по типу товара, заданному у предка
+- Перенос категории меняет наследуемый тип и родительские категории в выгрузке
+- Изменение device_type_id предка пересчитывает поддерево
+"""
+import pytest
+
+
+async def _category(authorized_client, name: str, **fields) -> int:
+    response = await authorized_client.post("/category", json={"name": name, **fields})
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+async def _product(authorized_client, name: str, category_id: int) -> int:
+    response = await authorized_client.post(
+        "/product",
+        data={"name": name, "price": "100.00", "category_id": str(category_id)},
+    )
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+async def _product_ids_by_type(client, product_type_id: int) -> set[int]:
+    response = await client.get(f"/product?product_type_id={product_type_id}")
+    assert response.status_code == 200
+    return {item["id"] for item in response.json()["data"]["items"]}
+
+
+async def _product_type(authorized_client, name: str) -> int:
+    response = await authorized_client.post("/product/type", json={"name": name})
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+@pytest.mark.asyncio
+async def test_move_category_updates_inherited_type_and_parents(authorized_client, client):
+    """
+    Сценарий:
+    1. Electronics(Smartphones) → Phones → Android; Computers(Laptops)
+    2. Товар в Android находится по типу Smartphones, в выгрузке два предка
+    3. Переносим Phones под Computers — товар находится по Laptops,
+       родительские категории в выгрузке меняются
+    """
+    smartphones = await _product_type(authorized_client, "Smartphones")
+    laptops = await _product_type(authorized_client, "Laptops")
+
+    electronics = await _category(authorized_client, "Electronics", device_type_id=smartphones)
+    phones = await _category(authorized_client, "Phones", parent_id=electronics)
+    android = await _category(authorized_client, "Android", parent_id=phones)
+    computers = await _category(authorized_client, "Computers", device_type_id=laptops)
+
+    product_id = await _product(authorized_client, "Pixel 8", android)
+
+    assert await _product_ids_by_type(client, smartphones) == {product_id}
+    assert await _product_ids_by_type(client, laptops) == set()
+
+    export = (await authorized_client.get("/product/admin/catalog/export")).json()["data"]
+    assert export["items"][0]["category"]["parent_categories"] == [
+        {"id": phones, "name": "Phones"},
+        {"id": electronics, "name": "Electronics"},
+    ]
+
+    update = await authorized_client.put(
+        f"/category/{phones}",
+        json={"name": "Phones", "parent_id": computers},
+    )
+    assert update.status_code == 200
+
+    assert await _product_ids_by_type(client, smartphones) == set()
+    assert await _product_ids_by_type(client, laptops) == {product_id}
+
+    export = (await authorized_client.get("/product/admin/catalog/export")).json()["data"]
+    assert export["items"][0]["category"]["parent_categories"] == [
+        {"id": phones, "name": "Phones"},
+        {"id": computers, "name": "Computers"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ancestor_device_type_change_refreshes_subtree(authorized_client, client):
+    """Смена device_type_id у корня меняет тип товаров во всех подкатегориях"""
+    smartphones = await _product_type(authorized_client, "Smartphones")
+    tablets = await _product_type(authorized_client, "Tablets")
+
+    root = await _category(authorized_client, "Mobile", device_type_id=smartphones)
+    child = await _category(authorized_client, "Apple", parent_id=root)
+    product_id = await _product(authorized_client, "iPad", child)
+
+    update = await authorized_client.put(
+        f"/category/{root}",
+        json={"name": "Mobile", "device_type_id": tablets},
+    )
+    assert update.status_code == 200
+
+    assert await _product_ids_by_type(client, smartphones) == set()
+    assert await _product_ids_by_type(client, tablets) == {product_id}
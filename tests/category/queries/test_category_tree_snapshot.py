@@ -0,0 +1,81 @@
+"""
+Тесты снимка дерева категорий (CategoryTree / CategoryTreeProvider).
+
+Проверяют:
+- Предков, поддеревья и наследуемый device_type_id в снимке
+- Проверку цикла по снимку
+- Что /category/tree видит переименование и перенос категории
+"""
+import pytest
+
+from src.catalog.category.application.read_models.category_tree import (
+    CategoryNode,
+    CategoryTree,
+)
+
+
+def _tree() -> CategoryTree:
+    # 1 Electronics(type 10) → 2 Phones → 3 Android; 4 Laptops(type 20)
+    return CategoryTree.build(
+        version=7,
+        nodes=[
+            CategoryNode(id=3, name="Android", description=None, parent_id=2),
+            CategoryNode(id=1, name="Electronics", description=None, parent_id=None, device_type_id=10),
+            CategoryNode(id=4, name="Laptops", description=None, parent_id=None, device_type_id=20),
+            CategoryNode(id=2, name="Phones", description=None, parent_id=1),
+        ],
+    )
+
+
+def test_category_tree_paths_and_inherited_device_type():
+    """Предки идут от ближайшего, поддерево включает саму категорию"""
+    tree = _tree()
+
+    assert tree.roots == (1, 4)
+    assert tree.children_of(1) == (2,)
+    assert tree.ancestors_of(3) == (2, 1)
+    assert tree.descendants_of(1) == {1, 2, 3}
+    assert tree.effective_device_type(3) == 10
+    assert tree.categories_with_device_type(10) == {1, 2, 3}
+    assert tree.categories_with_device_type(30) == frozenset()
+
+
+def test_category_tree_cycle_check():
+    """Родителем нельзя сделать саму категорию или её потомка"""
+    tree = _tree()
+
+    assert tree.would_create_cycle(1, 1)
+    assert tree.would_create_cycle(1, 3)
+    assert not tree.would_create_cycle(3, 4)
+    assert not tree.would_create_cycle(2, None)
+
+
+@pytest.mark.asyncio
+async def test_category_tree_endpoint_follows_changes(authorized_client, client):
+    """
+    Сценарий:
+    1. Строим снимок запросом дерева
+    2. Переименовываем и переносим категорию
+    3. Дерево отдаёт новое имя и новое положение
+    """
+    first = await authorized_client.post("/category", json={"name": "First"})
+    second = await authorized_client.post("/category", json={"name": "Second"})
+    first_id = first.json()["data"]["id"]
+    second_id = second.json()["data"]["id"]
+
+    before = await client.get("/category/tree")
+    assert before.status_code == 200
+    assert len(before.json()["data"]["items"]) == 2
+
+    update = await authorized_client.put(
+        f"/category/{second_id}",
+        json={"name": "Second renamed", "parent_id": first_id},
+    )
+    assert update.status_code == 200
+
+    after = await client.get("/category/tree")
+    assert after.status_code == 200
+    items = after.json()["data"]["items"]
+
+    assert [item["id"] for item in items] == [first_id]
+    assert [child["name"] for child in items[0]["children"]] == ["Second renamed"]
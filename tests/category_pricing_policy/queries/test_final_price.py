@@ -0,0 +1,180 @@
+"""
+Тесты конечной цены по политикам ценообразования категорий.
+
+Проверяют:
+- Формулу (наценка → комиссия → скидка → НДС, округление в конце)
+- Наследование политики от ближайшего предка
+- Конечную цену и сортировку по ней в выдаче товаров и выгрузке
+- Пересчёт после изменения политики
+"""
+import json
+from decimal import Decimal
+
+import pytest
+
+from src.catalog.category.application.read_models.category_tree import (
+    CategoryNode,
+    CategoryTree,
+)
+from src.catalog.category.application.read_models.pricing import (
+    PriceFormulas,
+    PricingPolicyTerms,
+)
+
+
+def _tree() -> CategoryTree:
+    # 1 Electronics → 2 Phones → 3 Android; 4 Laptops
+    return CategoryTree.build(
+        version=1,
+        nodes=[
+            CategoryNode(id=1, name="Electronics", description=None, parent_id=None),
+            CategoryNode(id=2, name="Phones", description=None, parent_id=1),
+            CategoryNode(id=3, name="Android", description=None, parent_id=2),
+            CategoryNode(id=4, name="Laptops", description=None, parent_id=None),
+        ],
+    )
+
+
+def test_policy_formula_matches_step_by_step_calculation():
+    """Коэффициенты политики дают тот же результат, что и расчёт по шагам"""
+    policy = PricingPolicyTerms(
+        category_id=1,
+        markup_fixed=Decimal("5.00"),
+        markup_percent=Decimal("10.00"),
+        commission_percent=Decimal("3.50"),
+        discount_percent=Decimal("7.25"),
+        tax_rate=Decimal("20.00"),
+    )
+    price = Decimal("99.99")
+
+    expected = (
+        (price * Decimal("1.10") + Decimal("5.00"))
+        * Decimal("1.035")
+        * Decimal("0.9275")
+        * Decimal("1.20")
+    ).quantize(Decimal("0.01"))
+    assert policy.formula().apply(price) == expected == Decimal("132.46")
+
+
+def test_policy_without_optional_steps_applies_tax_only():
+    """Пустые шаги не применяются; НДС 0 — цена не меняется"""
+    assert PricingPolicyTerms(category_id=1).formula().apply(Decimal("10.50")) == Decimal("10.50")
+    assert (
+        PricingPolicyTerms(category_id=1, tax_rate=Decimal("20.00")).formula().apply(Decimal("0.05"))
+        == Decimal("0.06")
+    )
+
+
+def test_formulas_inherit_nearest_ancestor_policy():
+    """Категория без политики берёт политику ближайшего предка целиком"""
+    formulas = PriceFormulas.resolve(
+        [
+            PricingPolicyTerms(category_id=1, tax_rate=Decimal("20.00")),
+            PricingPolicyTerms(category_id=2, discount_percent=Decimal("50.00")),
+        ],
+        _tree(),
+    )
+
+    assert formulas.final_price(Decimal("100.00"), 1) == Decimal("120.00")
+    assert formulas.final_price(Decimal("100.00"), 2) == Decimal("50.00")
+    assert formulas.final_price(Decimal("100.00"), 3) == Decimal("50.00")
+    assert formulas.final_price(Decimal("100.00"), 4) == Decimal("100.00")
+    assert formulas.final_price(Decimal("100.00"), None) == Decimal("100.00")
+    assert [category_id for category_id, _ in formulas.items()] == [1, 2, 3]
+    assert formulas.final_prices(
+        [(Decimal("10.00"), 3), (Decimal("10.00"), 1), (Decimal("10.00"), 4)]
+    ) == [Decimal("5.00"), Decimal("12.00"), Decimal("10.00")]
+
+
+def test_formulas_without_policies_are_empty():
+    """Без политик формул нет: SQL-сортировка идёт по исходной цене"""
+    formulas = PriceFormulas.resolve([], _tree())
+
+    assert not formulas
+    assert formulas.final_price(Decimal("7.77"), 3) == Decimal("7.77")
+
+
+async def _create_product(client, name: str, price: str, category_id: int) -> int:
+    response = await client.post(
+        "/product",
+        data={"name": name, "price": price, "category_id": str(category_id)},
+    )
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+@pytest.mark.asyncio
+async def test_product_final_price_sort_and_policy_update(authorized_client, client):
+    """
+    Сценарий:
+    1. Политика на родительской категории, товары в дочерней и в категории без политики
+    2. Выдача отдаёт final_price и сортирует по нему (и по курсору)
+    3. Выгрузка содержит final_price
+    4. После изменения политики конечная цена пересчитана
+    """
+    parent = await authorized_client.post("/category", json={"name": "Priced Parent"})
+    parent_id = parent.json()["data"]["id"]
+    child = await authorized_client.post(
+        "/category", json={"name": "Priced Child", "parent_id": parent_id}
+    )
+    child_id = child.json()["data"]["id"]
+    plain = await authorized_client.post("/category", json={"name": "Priced Plain"})
+    plain_id = plain.json()["data"]["id"]
+
+    policy = await authorized_client.post(
+        "/category-pricing-policy",
+        json={
+            "category_id": parent_id,
+            "markup_fixed": 5.00,
+            "markup_percent": 10.00,
+            "discount_percent": 10.00,
+            "tax_rate": 20.00,
+        },
+    )
+    assert policy.status_code == 200
+    policy_id = policy.json()["data"]["id"]
+
+    first_id = await _create_product(authorized_client, "Priced A", "100.00", child_id)
+    second_id = await _create_product(authorized_client, "Priced B", "90.00", child_id)
+    third_id = await _create_product(authorized_client, "Priced C", "110.00", plain_id)
+
+    expected = {first_id: "124.20", second_id: "112.32", third_id: "110.00"}
+
+    for query in ("", "name=Priced&"):
+        response = await client.get(f"/product?{query}sort_type=price_asc&limit=10")
+        assert response.status_code == 200
+        items = response.json()["data"]["items"]
+        assert [item["id"] for item in items] == [third_id, second_id, first_id]
+        assert {item["id"]: item["final_price"] for item in items} == expected
+
+        response = await client.get(f"/product?{query}sort_type=price_desc&limit=10")
+        assert [item["id"] for item in response.json()["data"]["items"]] == [
+            first_id, second_id, third_id,
+        ]
+
+        ids = []
+        cursor = None
+        for _ in range(5):
+            url = f"/product?{query}sort_type=price_asc&limit=1&count=none"
+            if cursor:
+                url += f"&cursor={cursor}"
+            data = (await client.get(url)).json()["data"]
+            ids.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+        assert ids == [third_id, second_id, first_id]
+
+    export = await authorized_client.get("/product/admin/catalog/export/stream")
+    assert export.status_code == 200
+    rows = [json.loads(line) for line in export.text.splitlines()]
+    assert {row["id"]: row["final_price"] for row in rows} == expected
+
+    update = await authorized_client.put(
+        f"/category-pricing-policy/{policy_id}",
+        json={"tax_rate": 0.00},
+    )
+    assert update.status_code == 200
+
+    product = await client.get(f"/product/{first_id}")
+    assert product.json()["data"]["final_price"] == "103.50"
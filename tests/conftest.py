@@ -8,14 +8,28 @@ os.environ["TESTING"] = "1"
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
 from testcontainers.postgres import PostgresContainer
 
+from src.catalog.category.infrastructure.services.category_tree import (
+    get_category_tree_provider,
+)
+from src.catalog.category.infrastructure.services.pricing import (
+    get_price_formula_provider,
+)
+from src.catalog.product.application.services.bitmap_index import (
+    get_product_bitmap_index,
+)
+from src.catalog.product.application.services.suggestion_index import (
+    get_suggestion_index,
+)
 from src.core.auth.dependencies import get_current_user
 from src.core.auth.schemas.user import TokenSchema, User, UserPermissionSchema
+from src.core.cache.factory import get_shared_cache
 from src.core.db.database import Base, get_db
 from src.core.services.images.storage import S3ImageStorageService
 from src.mount import app
@@ -54,6 +68,8 @@ def authorized_user():
         'product:create',
         'product:update',
         'product:delete',
+        'product:export',
+        'product:import',
         'product_type:audit',
         'product_type:create',
         'product_type:update',
@@ -120,6 +136,44 @@ async def engine(pg_container):
     await engine.dispose()
 
 
+# ------------------------------
+# SQL STATEMENTS
+# ------------------------------
+
+class StatementLog:
+    """SQL-запросы, выполненные движком внутри блока with."""
+
+    def __init__(self, engine):
+        self._engine = engine.sync_engine
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _on_execute(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
+
+
+@pytest.fixture
+def statement_log(engine):
+    """
+    Подсчёт запросов к БД:
+
+        with statement_log() as log:
+            ...
+        assert log.count == 2
+    """
+    return lambda: StatementLog(engine)
+
+
 # ------------------------------
 # CLIENT
 # ------------------------------
@@ -217,6 +271,14 @@ async def cleanup_test_data(engine, image_storage_mock):
     # Сбрасываем счётчик изображений
     image_storage_mock.reset()
 
+    # Общий кэш, индекс подсказок, индекс товаров, снимок дерева категорий
+    # и формулы цен живут весь процесс, а id в БД между тестами повторяются
+    await get_shared_cache().clear()
+    get_suggestion_index().reset()
+    get_product_bitmap_index().reset()
+    get_category_tree_provider().reset()
+    get_price_formula_provider().reset()
+
     # Очищаем данные ПЕРЕД каждым тестом
     async with engine.begin() as conn:
         await conn.execute(__import__('sqlalchemy').text("DELETE FROM cms_seo CASCADE"))
@@ -228,6 +290,8 @@ async def cleanup_test_data(engine, image_storage_mock):
         await conn.execute(__import__('sqlalchemy').text("DELETE FROM category_pricing_policy_audit_logs CASCADE"))
         await conn.execute(__import__('sqlalchemy').text("DELETE FROM category_audit_logs CASCADE"))
         await conn.execute(__import__('sqlalchemy').text("DELETE FROM category_pricing_policies CASCADE"))
+        await conn.execute(__import__('sqlalchemy').text("DELETE FROM product_read_model CASCADE"))
+        await conn.execute(__import__('sqlalchemy').text("DELETE FROM product_import_logs CASCADE"))
         await conn.execute(__import__('sqlalchemy').text("DELETE FROM product_relations CASCADE"))
         await conn.execute(__import__('sqlalchemy').text("DELETE FROM product_tags CASCADE"))
         await conn.execute(__import__('sqlalchemy').text("DELETE FROM tags CASCADE"))
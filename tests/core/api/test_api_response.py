@@ -0,0 +1,108 @@
+"""Тесты api_response: однопроходная сериализация схем совпадает с jsonable_encoder."""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import List, Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+
+from src.catalog.product.api.schemas.schemas import (
+    CategoryNestedSchema,
+    ProductAttributeReadSchema,
+    ProductCardSchema,
+    ProductImageReadSchema,
+    ProductPageResponse,
+    ProductRatingSchema,
+    ProductReadSchema,
+)
+from src.catalog.product.domain.exceptions import ProductNotFound
+from src.core.api.responses import ApiModelResponse, api_response
+
+
+class _AuditSchema(BaseModel):
+    entity_id: int = Field(serialization_alias="entityId")
+    changed_at: datetime
+    payload: Optional[dict] = None
+
+
+def _encoded(result) -> dict:
+    """Ответ прежним путём: jsonable_encoder + JSONResponse."""
+    response = JSONResponse(content=jsonable_encoder({"success": True, "data": result}))
+    return json.loads(response.body)
+
+
+def _page() -> ProductPageResponse:
+    image = ProductImageReadSchema(
+        upload_id=1, image_url="https://cdn.example.com/a.jpg", is_main=True, ordering=0
+    )
+    return ProductPageResponse(
+        total=2,
+        next_cursor="eyJpZCI6IDJ9",
+        items=[
+            ProductReadSchema(
+                id=1,
+                name="Смартфон «X»",
+                description=None,
+                price=Decimal("59990.00"),
+                final_price=Decimal("71988.00"),
+                rating=ProductRatingSchema(value=4.8, count=125),
+                images=[image],
+                attributes=[ProductAttributeReadSchema(id=10, name="RAM", value="8 GB", is_filterable=True)],
+                category=CategoryNestedSchema(id=101, name="Смартфоны"),
+            ),
+            ProductCardSchema(
+                id=2,
+                name="Card",
+                price=Decimal("10.50"),
+                final_price=Decimal("10.50"),
+                images=[image],
+            ),
+        ],
+    )
+
+
+def test_model_payload_matches_jsonable_encoder():
+    page = _page()
+
+    response = api_response(page)
+
+    assert isinstance(response, ApiModelResponse)
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == _encoded(page)
+
+
+def test_model_list_aliases_and_dates_match_jsonable_encoder():
+    items = [
+        _AuditSchema(
+            entity_id=7,
+            changed_at=datetime(2026, 1, 2, 3, 4, 5, 600000, tzinfo=timezone.utc),
+            payload={"price": "1.00", "tags": ["a"]},
+        ),
+        _AuditSchema(entity_id=8, changed_at=datetime(2026, 1, 2)),
+    ]
+
+    for result in (items, []):
+        response = api_response(result)
+        assert isinstance(response, ApiModelResponse)
+        assert json.loads(response.body) == _encoded(result)
+
+    assert json.loads(api_response(items).body)["data"][0]["entityId"] == 7
+
+
+def test_plain_payloads_keep_jsonable_encoder():
+    response = api_response({"deleted": True, "amount": Decimal("1.50")})
+
+    assert not isinstance(response, ApiModelResponse)
+    assert json.loads(response.body) == {"success": True, "data": {"deleted": True, "amount": 1.5}}
+
+
+def test_error_payload_is_unchanged():
+    response = api_response(ProductNotFound())
+
+    assert response.status_code == 404
+    body = json.loads(response.body)
+    assert body["success"] is False
+    assert body["error"]["code"]
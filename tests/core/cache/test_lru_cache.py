@@ -0,0 +1,174 @@
+"""Тесты для LRUCache и LayeredCache."""
+
+import pytest
+
+from src.core.cache.base import NO_EXPIRY
+from src.core.cache.layered import LayeredCache
+from src.core.cache.lru import LRUCache
+
+
+class TestLRUCache:
+
+    @pytest.mark.asyncio
+    async def test_get_returns_none_and_counts_miss(self):
+        cache = LRUCache()
+
+        assert await cache.get("missing") is None
+
+        stats = await cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_set_and_get_counts_hit(self):
+        cache = LRUCache()
+
+        await cache.set("key", {"value": 1})
+
+        assert await cache.get("key") == {"value": 1}
+        stats = await cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_by_entries(self):
+        cache = LRUCache(max_entries=2)
+
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        # "a" становится самым свежим
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
+        assert await cache.get("c") == 3
+        assert (await cache.get_stats())["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_by_bytes(self):
+        cache = LRUCache(max_entries=100, max_bytes=10, sizeof=lambda value: 4)
+
+        await cache.set("a", "x")
+        await cache.set("b", "x")
+        await cache.set("c", "x")
+
+        stats = await cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["bytes"] == 8
+        assert await cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_value_larger_than_limit_is_not_cached(self):
+        cache = LRUCache(max_bytes=10, sizeof=lambda value: len(value))
+
+        await cache.set("key", "small")
+        await cache.set("key", "x" * 100)
+
+        assert await cache.get("key") is None
+        assert (await cache.get_stats())["bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_miss(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("src.core.cache.lru.time.monotonic", lambda: now[0])
+        cache = LRUCache()
+
+        await cache.set("key", "value", ttl=10)
+        now[0] += 11
+
+        assert await cache.get("key") is None
+        assert (await cache.get_stats())["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_default_ttl_applies(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("src.core.cache.lru.time.monotonic", lambda: now[0])
+        cache = LRUCache(default_ttl=5)
+
+        await cache.set("key", "value")
+        now[0] += 6
+
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_no_expiry_overrides_default_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("src.core.cache.lru.time.monotonic", lambda: now[0])
+        cache = LRUCache(default_ttl=5)
+
+        await cache.set("key", "value", ttl=NO_EXPIRY)
+        now[0] += 3600
+
+        assert await cache.get("key") == "value"
+
+    @pytest.mark.asyncio
+    async def test_delete_and_clear(self):
+        cache = LRUCache()
+
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.delete("a")
+
+        assert await cache.get("a") is None
+        await cache.clear()
+        stats = await cache.get_stats()
+        assert stats["entries"] == 0
+        assert stats["bytes"] == 0
+
+
+class _CountingCache(LRUCache):
+    """LRUCache, который запоминает ключи каждого get_many."""
+
+    def __init__(self):
+        super().__init__()
+        self.get_many_calls: list[list[str]] = []
+
+    async def get_many(self, keys):
+        keys = list(keys)
+        self.get_many_calls.append(keys)
+        return await super().get_many(keys)
+
+
+class TestLayeredCache:
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_warms_l1(self):
+        l1 = LRUCache()
+        l2 = LRUCache()
+        cache = LayeredCache(l1=l1, l2=l2)
+
+        await l2.set("key", "value")
+
+        assert await cache.get("key") == "value"
+        assert await l1.get("key") == "value"
+
+    @pytest.mark.asyncio
+    async def test_set_and_delete_apply_to_both_levels(self):
+        l1 = LRUCache()
+        l2 = LRUCache()
+        cache = LayeredCache(l1=l1, l2=l2)
+
+        await cache.set("key", "value", ttl=30)
+        assert await l1.get("key") == "value"
+        assert await l2.get("key") == "value"
+
+        await cache.delete("key")
+        assert await l1.get("key") is None
+        assert await l2.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_get_many_reads_misses_from_l2_in_one_call(self):
+        l1 = LRUCache()
+        l2 = _CountingCache()
+        cache = LayeredCache(l1=l1, l2=l2)
+
+        await l1.set("a", 1)
+        await l2.set("b", 2)
+
+        assert await cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+        assert l2.get_many_calls == [["b", "c"]]
+        assert await l1.get("b") == 2
+
+        assert await cache.get_many(["a", "b"]) == {"a": 1, "b": 2}
+        assert len(l2.get_many_calls) == 1
@@ -0,0 +1,113 @@
+"""Тесты для TieredCache: рассылка и приём инвалидаций L1."""
+
+import json
+
+import pytest
+
+from src.core.cache.lru import LRUCache
+from src.core.cache.tiered import TieredCache
+
+
+class _RecordingRedis:
+    """Redis-клиент, который только запоминает опубликованные сообщения."""
+
+    def __init__(self):
+        self.published: list[tuple[str, dict]] = []
+
+    async def publish(self, channel: str, payload: str) -> None:
+        self.published.append((channel, json.loads(payload)))
+
+
+def _build_cache(redis_client) -> TieredCache:
+    cache = TieredCache(
+        l1=LRUCache(),
+        l2=LRUCache(),
+        redis_client=redis_client,
+        channel="cache.invalidation",
+    )
+    # Подписку в юнит-тестах не запускаем
+    cache._ensure_listener = lambda: None
+    return cache
+
+
+class TestTieredCache:
+
+    @pytest.mark.asyncio
+    async def test_replace_and_delete_broadcast_invalidation(self):
+        redis_client = _RecordingRedis()
+        cache = _build_cache(redis_client)
+
+        await cache.replace("generation", "b")
+        await cache.delete("product:1")
+
+        assert [message["keys"] for _, message in redis_client.published] == [
+            ["generation"],
+            ["product:1"],
+        ]
+        assert all(channel == "cache.invalidation" for channel, _ in redis_client.published)
+        assert all(
+            message["origin"] == cache.instance_id
+            for _, message in redis_client.published
+        )
+
+    @pytest.mark.asyncio
+    async def test_set_fills_both_levels_without_broadcast(self):
+        redis_client = _RecordingRedis()
+        cache = _build_cache(redis_client)
+
+        await cache.set("product:1", {"price": "10"})
+
+        assert redis_client.published == []
+        assert await cache.l1.get("product:1") == {"price": "10"}
+        assert await cache.l2.get("product:1") == {"price": "10"}
+
+    @pytest.mark.asyncio
+    async def test_delete_many_broadcasts_one_message(self):
+        redis_client = _RecordingRedis()
+        cache = _build_cache(redis_client)
+        await cache.l1.set("product:1", 1)
+        await cache.l2.set("product:2", 2)
+
+        await cache.delete_many(key for key in ("product:1", "product:2"))
+        await cache.delete_many([])
+
+        assert [message["keys"] for _, message in redis_client.published] == [
+            ["product:1", "product:2"],
+        ]
+        assert await cache.get("product:1") is None
+        assert await cache.get("product:2") is None
+
+    @pytest.mark.asyncio
+    async def test_foreign_invalidation_drops_l1_only(self):
+        cache = _build_cache(_RecordingRedis())
+        await cache.set("product:1", {"price": "10"})
+
+        await cache._handle_message(
+            json.dumps({"origin": "other", "op": "delete", "keys": ["product:1"]})
+        )
+
+        assert await cache.l1.get("product:1") is None
+        assert await cache.l2.get("product:1") == {"price": "10"}
+
+    @pytest.mark.asyncio
+    async def test_own_invalidation_is_ignored(self):
+        cache = _build_cache(_RecordingRedis())
+        await cache.set("product:1", {"price": "10"})
+
+        await cache._handle_message(
+            json.dumps({"origin": cache.instance_id, "op": "delete", "keys": ["product:1"]})
+        )
+
+        assert await cache.l1.get("product:1") == {"price": "10"}
+
+    @pytest.mark.asyncio
+    async def test_foreign_clear_drops_whole_l1(self):
+        cache = _build_cache(_RecordingRedis())
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+
+        await cache._handle_message(json.dumps({"origin": "other", "op": "clear", "keys": []}))
+
+        assert await cache.l1.get("a") is None
+        assert await cache.l1.get("b") is None
+        assert await cache.get("a") == 1
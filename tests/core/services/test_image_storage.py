@@ -0,0 +1,42 @@
+"""Тесты для S3ImageStorageService: ленивый клиент и построение URL."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.services.images.storage import S3ImageStorageService, build_public_url
+
+
+def _build_storage() -> S3ImageStorageService:
+    return S3ImageStorageService(
+        bucket_name="bucket",
+        access_key="key",
+        secret_access_key="secret",
+        endpoint_url="https://s3.example.local/",
+        region_name="ru-1",
+        max_pool_connections=4,
+    )
+
+
+class TestS3ImageStorageService:
+
+    def test_build_public_url_does_not_create_client(self):
+        storage = _build_storage()
+
+        url = storage.build_public_url("products/a.jpg")
+
+        assert url == "https://s3.example.local/bucket/products/a.jpg"
+        assert storage._client is None
+
+    def test_build_public_url_function(self):
+        assert (
+            build_public_url("https://s3.example.local/", "bucket", "a.jpg")
+            == "https://s3.example.local/bucket/a.jpg"
+        )
+
+    def test_client_is_created_once_across_threads(self):
+        storage = _build_storage()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: storage.client, range(16)))
+
+        assert all(client is clients[0] for client in clients)
+        assert clients[0].meta.config.max_pool_connections == 4
@@ -0,0 +1,137 @@
+"""
+Тесты пакетного обновления полей товаров (PATCH /product/bulk).
+
+Проверяют:
+- Применение изменений одним пакетом и частичный успех с отчётом об ошибках
+- Сброс кэша: GET после обновления возвращает новые значения
+- Записи аудита только по изменённым полям
+- Ограничение размера пакета и права
+"""
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.catalog.product.infrastructure.models.product_audit_logs import ProductAuditLog
+from src.core.conf.settings import get_settings
+
+
+async def _create_product(client, name: str, price: str) -> int:
+    response = await client.post("/product", data={"name": name, "price": price})
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_applies_changes_and_reports_errors(authorized_client, engine):
+    """
+    Сценарий:
+    1. Два товара прочитаны через GET (попали в кэш)
+    2. Пакет: новая цена и категория первому, то же название второму,
+       несуществующий товар и повторы id
+    3. Первый обновлён, второй без изменений, остальные элементы отклонены
+    """
+    category = await authorized_client.post("/category", json={"name": "Bulk"})
+    category_id = category.json()["data"]["id"]
+    first_id = await _create_product(authorized_client, "Bulk Phone A", "100.00")
+    second_id = await _create_product(authorized_client, "Bulk Phone B", "200.00")
+
+    for product_id in (first_id, second_id):
+        assert (await authorized_client.get(f"/product/{product_id}")).status_code == 200
+
+    response = await authorized_client.patch(
+        "/product/bulk",
+        json={
+            "items": [
+                {"id": first_id, "price": "150", "category_id": category_id},
+                {"id": second_id, "name": "  Bulk Phone B  "},
+                {"id": 999999, "price": "1.00"},
+                {"id": second_id, "price": "1.00"},
+                {"id": first_id, "category_id": 999999},
+                {"id": second_id, "price": "-5"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["total"], data["updated"], data["unchanged"], data["failed"]) == (6, 1, 1, 4)
+    assert [(e["index"], e["reason"]) for e in data["errors"]] == [
+        (2, "product_not_found"),
+        (3, "duplicate_id"),
+        (4, "duplicate_id"),
+        (5, "duplicate_id"),
+    ]
+
+    first = (await authorized_client.get(f"/product/{first_id}")).json()["data"]
+    assert first["price"] == "150.00"
+    assert first["category"]["id"] == category_id
+    second = (await authorized_client.get(f"/product/{second_id}")).json()["data"]
+    assert (second["name"], second["price"]) == ("Bulk Phone B", "200.00")
+
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_factory() as db:
+        logs = (
+            await db.scalars(
+                select(ProductAuditLog).where(
+                    ProductAuditLog.product_id.in_([first_id, second_id]),
+                    ProductAuditLog.action == "update",
+                )
+            )
+        ).all()
+    assert [(log.product_id, log.old_data, log.new_data) for log in logs] == [
+        (
+            first_id,
+            {"price": "100.00", "category_id": None},
+            {"price": "150.00", "category_id": category_id},
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_rejects_invalid_items(authorized_client):
+    """Несуществующие ссылки, неверные цена и название и очистка полей"""
+    first_id = await _create_product(authorized_client, "Bulk Phone C", "10.00")
+    second_id = await _create_product(authorized_client, "Bulk Phone D", "10.00")
+    third_id = await _create_product(authorized_client, "Bulk Phone E", "10.00")
+    fourth_id = await _create_product(authorized_client, "Bulk Phone F", "10.00")
+
+    response = await authorized_client.patch(
+        "/product/bulk",
+        json={
+            "items": [
+                {"id": first_id, "region_id": 999999},
+                {"id": second_id, "price": "-1"},
+                {"id": third_id, "name": None},
+                {"id": fourth_id, "description": None, "category_id": None},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["updated"], data["unchanged"], data["failed"]) == (0, 1, 3)
+    assert [(e["index"], e["reason"]) for e in data["errors"]] == [
+        (0, "region_not_found"),
+        (1, "invalid_price"),
+        (2, "name_required"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_400_too_many_items(authorized_client):
+    """Пакет больше PRODUCT_BULK_UPDATE_MAX_ITEMS отклоняется целиком"""
+    max_items = get_settings().PRODUCT_BULK_UPDATE_MAX_ITEMS
+    response = await authorized_client.patch(
+        "/product/bulk",
+        json={"items": [{"id": index + 1, "price": "1"} for index in range(max_items + 1)]},
+    )
+    assert response.status_code == 400
+    assert response.json()["error"]["details"]["reason"] == "too_many_items"
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_403_without_permission(authorized_client_no_perms):
+    """Пакетное обновление требует product:update"""
+    response = await authorized_client_no_perms.patch(
+        "/product/bulk",
+        json={"items": [{"id": 1, "price": "1"}]},
+    )
+    assert response.status_code == 403
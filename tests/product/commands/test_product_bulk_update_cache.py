@@ -0,0 +1,90 @@
+"""
+Тесты сброса кэшей товаров при пакетном обновлении (PATCH /product/bulk).
+
+Проверяют:
+- Агрегаты товаров пакета сбрасываются сразу и ещё раз после коммита
+- Событие product_bulk_update сбрасывает в кэше чтения только товары пакета
+"""
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.catalog.product.application.dto.product import ProductReadDTO
+from src.catalog.product.infrastructure.orm.cache.cached_product import (
+    CachedProductBulkUpdateRepository,
+    product_cache_key,
+)
+from src.catalog.product.infrastructure.orm.cache.cached_product_read import (
+    CachedProductReadRepository,
+    ProductReadCacheInvalidator,
+)
+from src.core.cache.lru import LRUCache
+from src.core.db.unit_of_work import UnitOfWork
+
+
+class _FakeBulkUpdateRepository:
+
+    async def apply(self, values_by_id):
+        return None
+
+
+class _FakeReadRepository:
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_by_id(self, product_id: int):
+        self.calls += 1
+        return ProductReadDTO(
+            id=product_id, name=f"Phone {product_id}", description=None, price=Decimal("10.00")
+        )
+
+
+@pytest.mark.asyncio
+async def test_bulk_apply_evicts_again_after_commit():
+    """
+    Сценарий:
+    1. apply сбрасывает агрегаты товаров пакета внутри транзакции
+    2. Параллельное чтение до коммита возвращает в кэш старый снимок
+    3. После коммита UnitOfWork снимка в кэше нет
+    """
+    session = AsyncSession()
+    cache = LRUCache()
+    repository = CachedProductBulkUpdateRepository(
+        db_repository=_FakeBulkUpdateRepository(),
+        cache=cache,
+        session=session,
+    )
+    await cache.set(product_cache_key(1), {"id": 1})
+    await cache.set(product_cache_key(3), {"id": 3})
+
+    async with UnitOfWork(session):
+        await repository.apply({1: {"price": Decimal("20.00")}, 2: {"name": "New"}})
+        assert await cache.get(product_cache_key(1)) is None
+
+        await cache.set(product_cache_key(2), {"id": 2})
+
+    assert await cache.get(product_cache_key(2)) is None
+    assert await cache.get(product_cache_key(3)) is not None
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_event_invalidates_only_batch_products():
+    """Событие пакетного обновления перечитывает товары пакета, остальные остаются в кэше"""
+    cache = LRUCache()
+    source = _FakeReadRepository()
+    repository = CachedProductReadRepository(db_repository=source, cache=cache)
+    invalidator = ProductReadCacheInvalidator(cache)
+
+    for product_id in (1, 2, 3):
+        await repository.get_by_id(product_id)
+    assert source.calls == 3
+
+    await invalidator.handle(
+        {"entity": "product_bulk_update", "entity_id": None, "data": {"product_ids": [1, 2]}}
+    )
+    for product_id in (1, 2, 3):
+        await repository.get_by_id(product_id)
+
+    assert source.calls == 5
@@ -0,0 +1,146 @@
+"""
+Тесты сброса кэша агрегатов товаров после коммита.
+
+Проверяют:
+- Снимок, который параллельное чтение вернуло в кэш до коммита, сбрасывается
+  после коммита UnitOfWork
+- При откате отложенные сбросы отбрасываются
+- Товары, обновлённые массовым импортом, сбрасываются и после коммита
+- Команды читают агрегат мимо кэша (get(..., for_update=True))
+- Снимок read-модели товара сбрасывается коммитом, а не задачей шины
+"""
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.catalog.product.application.dto.product_import import ProductImportMergeDTO
+from src.catalog.product.domain.aggregates.product import ProductAggregate
+from src.catalog.product.infrastructure.orm.cache.cached_product import (
+    CachedProductImportRepository,
+    CachedProductRepository,
+    product_cache_key,
+)
+from src.catalog.product.infrastructure.orm.cache.cached_product_read import (
+    ProductReadCacheInvalidator,
+    _current_generation,
+)
+from src.core.cache.lru import LRUCache
+from src.core.db.unit_of_work import UnitOfWork
+
+
+class _FakeProductRepository:
+
+    def __init__(self):
+        self.aggregate = ProductAggregate(product_id=1, name="Old", price=Decimal("10.00"))
+
+    async def get(self, product_id: int, for_update: bool = False):
+        return self.aggregate if product_id == self.aggregate.id else None
+
+    async def update(self, aggregate: ProductAggregate):
+        return aggregate
+
+    async def delete(self, product_id: int) -> bool:
+        return True
+
+
+class _FakeProductImportRepository:
+
+    async def merge(self) -> ProductImportMergeDTO:
+        return ProductImportMergeDTO(created_ids=[3], updated_ids=[1, 2])
+
+
+def _build():
+    session = AsyncSession()
+    cache = LRUCache()
+    repository = CachedProductRepository(
+        db_repository=_FakeProductRepository(),
+        cache=cache,
+        session=session,
+    )
+    return session, cache, repository
+
+
+@pytest.mark.asyncio
+async def test_update_evicts_again_after_commit():
+    """
+    Сценарий:
+    1. update сбрасывает товар внутри транзакции
+    2. Параллельный get до коммита кладёт в кэш старый снимок
+    3. После коммита UnitOfWork снимка в кэше нет
+    """
+    session, cache, repository = _build()
+    await repository.get(1)
+
+    async with UnitOfWork(session):
+        await repository.update(ProductAggregate(product_id=1, name="New", price=Decimal("10.00")))
+        assert await cache.get(product_cache_key(1)) is None
+
+        await repository.get(1)
+        assert await cache.get(product_cache_key(1)) is not None
+
+    assert await cache.get(product_cache_key(1)) is None
+
+
+@pytest.mark.asyncio
+async def test_rollback_drops_pending_evictions():
+    """Откат не выполняет отложенные сбросы и не переносит их в следующую транзакцию"""
+    session, cache, repository = _build()
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(session):
+            await repository.delete(1)
+            raise RuntimeError("rollback")
+
+    await repository.get(1)
+    async with UnitOfWork(session):
+        pass
+
+    assert await cache.get(product_cache_key(1)) is not None
+
+
+@pytest.mark.asyncio
+async def test_import_merge_evicts_again_after_commit():
+    """Снимок товара, возвращённый в кэш до коммита импорта, сбрасывается после коммита"""
+    session, cache, repository = _build()
+    importer = CachedProductImportRepository(
+        db_repository=_FakeProductImportRepository(),
+        cache=cache,
+        session=session,
+    )
+    await cache.set(product_cache_key(2), {"id": 2})
+
+    async with UnitOfWork(session):
+        await importer.merge()
+        assert await cache.get(product_cache_key(2)) is None
+
+        await repository.get(1)
+        assert await cache.get(product_cache_key(1)) is not None
+
+    assert await cache.get(product_cache_key(1)) is None
+
+
+@pytest.mark.asyncio
+async def test_get_for_update_bypasses_cache():
+    """Устаревший снимок в кэше не попадает в команду изменения товара"""
+    session, cache, repository = _build()
+    await repository.get(1)
+    repository._repo.aggregate = ProductAggregate(product_id=1, name="Changed", price=Decimal("20.00"))
+
+    assert (await repository.get(1)).name == "Old"
+    assert (await repository.get(1, for_update=True)).name == "Changed"
+
+
+@pytest.mark.asyncio
+async def test_update_evicts_read_snapshot_after_commit():
+    """Снимок GET /product/{id} сбрасывается при выходе из UnitOfWork, до ответа"""
+    session, cache, repository = _build()
+    generation = await _current_generation(cache)
+    key = ProductReadCacheInvalidator.id_key(generation, 1)
+    await cache.set(key, {"id": 1})
+
+    async with UnitOfWork(session):
+        await repository.update(ProductAggregate(product_id=1, name="New", price=Decimal("10.00")))
+        assert await cache.get(key) is not None
+
+    assert await cache.get(key) is None
@@ -1,8 +1,17 @@
 import json
+from decimal import Decimal
 
 import pytest
 
 from src.catalog.product.api.schemas.schemas import ProductReadSchema
+from src.catalog.product.application.commands.create_product import (
+    CreateProductCommand,
+)
+from src.catalog.product.application.services.bitmap_index import (
+    ProductBitmapIndex,
+    ProductBitmapIndexUpdater,
+)
+from src.catalog.product.domain.aggregates.product import ProductAggregate
 
 JPEG_BYTES = b"\xff\xd8\xff\xe0product-image"
 
@@ -281,3 +290,20 @@ async def test_create_product_200_with_category(authorized_client, image_storage
     assert product.category.id == category_id
     assert len(product.images) == 1
     assert product.images[0].upload_id == upload_id
+
+
+@pytest.mark.asyncio
+async def test_create_product_publishes_product_event():
+    """Создание товара публикует событие product/create — по нему индексы помечают товар"""
+    aggregate = ProductAggregate(product_id=3, name="Phone", price=Decimal("10.00"))
+    command = CreateProductCommand(*(None,) * 7)
+
+    events = command._build_domain_events(aggregate, aggregate.get_events())
+
+    assert [(event["entity"], event["method"]) for event in events][0] == ("product", "create")
+
+    index = ProductBitmapIndex(poll_interval=60)
+    updater = ProductBitmapIndexUpdater(index)
+    for event in events:
+        await updater.handle(event)
+    assert index.take_pending()[1] == {3}
@@ -0,0 +1,183 @@
+"""
+Тесты массового импорта товаров (POST /product/admin/import).
+
+Проверяют:
+- Разбор NDJSON и CSV: ошибки строк не прерывают разбор остальных
+- Создание и обновление товаров с атрибутами и тегами одним импортом
+- Отчёт об ошибках: несуществующие ссылки, повтор id, неверная цена
+- Сводную запись аудита и права
+- Ограничение числа строк HTTP-импорта
+"""
+import json
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.catalog.product.application.services.product_import import (
+    ProductImportRowError,
+    iter_import_rows,
+)
+from src.catalog.product.infrastructure.models.product import Product
+from src.catalog.product.infrastructure.models.product_audit_logs import (
+    ProductImportLog,
+)
+from src.core.conf.settings import get_settings
+
+
+def test_parse_ndjson_rows_and_errors():
+    """Строки NDJSON проверяются по одной, ошибка строки не прерывает разбор"""
+    lines = [
+        json.dumps({
+            "id": 5,
+            "name": "  Phone  ",
+            "price": "10.5",
+            "category": {"id": 3, "name": "Phones"},
+            "attributes": [
+                {"name": "Color", "value": "Black"},
+                {"name": " Color ", "value": "White", "is_filterable": True},
+            ],
+            "tags": [{"tag_id": 7}, 7, 8],
+        }),
+        "",
+        "{broken",
+        json.dumps({"name": "Phone", "price": "-1"}),
+        json.dumps({"name": "Phone", "price": "1", "images": [{"upload_id": 2}, {"upload_id": 2, "is_main": True}]}),
+    ]
+
+    rows = list(iter_import_rows(lines, "ndjson"))
+
+    first = rows[0]
+    assert (first.row, first.product_id, first.name, str(first.price)) == (1, 5, "Phone", "10.50")
+    assert first.category_id == 3
+    assert [(a.name, a.value, a.is_filterable) for a in first.attributes] == [("Color", "White", True)]
+    assert first.tag_ids == [7, 8]
+    assert first.images is None
+
+    assert isinstance(rows[1], ProductImportRowError)
+    assert (rows[1].row, rows[1].reason) == (3, "invalid_json")
+    assert rows[2].to_dict() == {"row": 4, "reason": "invalid_price", "price": "-1"}
+    assert [(i.upload_id, i.is_main) for i in rows[3].images] == [(2, True)]
+
+
+def test_parse_csv_rows():
+    """В CSV пустая ячейка — «не менять», списки — JSON в ячейке"""
+    lines = [
+        "id,name,price,category_id,attributes,tags\r\n",
+        ',Phone,100,,"[{""name"": ""RAM"", ""value"": ""8 GB""}]",\r\n',
+        "12,Phone 2,abc,,,\r\n",
+        "x,Phone 3,1,,,\r\n",
+    ]
+
+    rows = list(iter_import_rows(lines, "csv"))
+
+    assert rows[0].row == 2
+    assert rows[0].product_id is None
+    assert [(a.name, a.value) for a in rows[0].attributes] == [("RAM", "8 GB")]
+    assert rows[0].tag_ids is None
+    assert rows[1].reason == "invalid_price"
+    assert rows[2].reason == "invalid_id"
+
+
+async def _import(client, content: str, format: str):
+    return await client.post(
+        "/product/admin/import",
+        params={"format": format},
+        files={"file": (f"products.{format}", content.encode("utf-8"))},
+    )
+
+
+@pytest.mark.asyncio
+async def test_import_creates_and_updates_products(authorized_client, engine):
+    """
+    Сценарий:
+    1. CSV создаёт два товара с атрибутами и тегом
+    2. NDJSON обновляет первый (цена, атрибуты), второй не меняет,
+       строки с несуществующей категорией, повтором id и неверной ценой отклоняются
+    """
+    category = await authorized_client.post("/category", json={"name": "Phones"})
+    category_id = category.json()["data"]["id"]
+    tag = await authorized_client.post("/product/tags", json={"name": "new"})
+    tag_id = tag.json()["data"]["tag_id"]
+
+    attributes = json.dumps([
+        {"name": "Color", "value": "Black", "is_filterable": True},
+        {"name": "RAM", "value": "8 GB"},
+    ]).replace('"', '""')
+    csv_content = (
+        "name,price,category_id,attributes,tags\n"
+        f'Import Phone A,100.00,{category_id},"{attributes}",[{tag_id}]\n'
+        f"Import Phone B,200.00,{category_id},[],\n"
+    )
+    response = await _import(authorized_client, csv_content, "csv")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["total"], data["created"], data["updated"], data["failed"]) == (2, 2, 0, 0)
+
+    products = await authorized_client.get("/product", params={"category_id": category_id})
+    items = {item["name"]: item for item in products.json()["data"]["items"]}
+    first_id = items["Import Phone A"]["id"]
+    second_id = items["Import Phone B"]["id"]
+
+    first = (await authorized_client.get(f"/product/{first_id}")).json()["data"]
+    assert {(a["name"], a["value"]) for a in first["attributes"]} == {("Color", "Black"), ("RAM", "8 GB")}
+    assert [t["tag_id"] for t in first["tags"]] == [tag_id]
+
+    ndjson_content = "\n".join([
+        json.dumps({
+            "id": first_id,
+            "name": "Import Phone A",
+            "price": "150.00",
+            "category_id": category_id,
+            "attributes": [{"name": "Color", "value": "White"}],
+        }),
+        json.dumps({"id": second_id, "name": "Import Phone B", "price": "200.00", "category_id": category_id}),
+        json.dumps({"name": "Import Phone C", "price": "1.00", "category_id": 999999}),
+        json.dumps({"id": first_id, "name": "Import Phone A", "price": "1.00"}),
+        json.dumps({"name": "Import Phone D", "price": "free"}),
+    ])
+    response = await _import(authorized_client, ndjson_content, "ndjson")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["total"], data["created"], data["updated"], data["unchanged"], data["failed"]) == (5, 0, 1, 1, 3)
+    assert [(e["row"], e["reason"]) for e in data["errors"]] == [
+        (3, "category_not_found"),
+        (4, "duplicate_id"),
+        (5, "invalid_price"),
+    ]
+
+    first = (await authorized_client.get(f"/product/{first_id}")).json()["data"]
+    assert first["price"] == "150.00"
+    assert [(a["name"], a["value"]) for a in first["attributes"]] == [("Color", "White")]
+    # Теги в строке не заданы — остались как были
+    assert [t["tag_id"] for t in first["tags"]] == [tag_id]
+
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_factory() as db:
+        log = await db.scalar(
+            select(ProductImportLog).where(ProductImportLog.id == data["import_id"])
+        )
+    assert (log.format, log.updated, log.failed, log.user_id) == ("ndjson", 1, 3, 1)
+
+
+@pytest.mark.asyncio
+async def test_import_over_http_row_limit_is_rejected(authorized_client, engine, monkeypatch):
+    """Файл длиннее PRODUCT_IMPORT_HTTP_MAX_ROWS отклоняется целиком"""
+    monkeypatch.setattr(get_settings(), "PRODUCT_IMPORT_HTTP_MAX_ROWS", 2)
+    content = "\n".join(
+        json.dumps({"name": f"Phone {i}", "price": "1"}) for i in range(3)
+    )
+
+    response = await _import(authorized_client, content, "ndjson")
+
+    assert response.status_code == 413
+    assert response.json()["error"]["code"] == "product_import_too_large"
+    async with async_sessionmaker(bind=engine)() as db:
+        assert await db.scalar(select(Product.id)) is None
+
+
+@pytest.mark.asyncio
+async def test_import_403_without_permission(authorized_client_no_perms):
+    """Импорт требует product:import"""
+    response = await _import(authorized_client_no_perms, "", "ndjson")
+    assert response.status_code == 403
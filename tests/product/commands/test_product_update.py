@@ -1,6 +1,7 @@
 import json
 
 import pytest
+from sqlalchemy import text
 
 from src.catalog.product.api.schemas.schemas import ProductReadSchema
 
@@ -229,3 +230,59 @@ async def test_update_product_400_name_too_short(authorized_client, image_storag
     body = response.json()
     assert body["success"] is False
     assert body["error"]["code"] == "product_name_too_short"
+
+
+@pytest.mark.asyncio
+async def test_update_product_200_attributes_diff(authorized_client, engine):
+    """Обновление атрибутов трогает только изменившиеся строки значений."""
+    create = await authorized_client.post(
+        "/product",
+        data={
+            "name": "Товар с атрибутами",
+            "price": "100.00",
+            "attributes_json": json.dumps([
+                {"name": "Color", "value": "Black", "is_filterable": True},
+                {"name": "RAM", "value": "8 GB", "is_filterable": True},
+                {"name": "Weight", "value": "200 g"},
+            ]),
+        },
+    )
+    assert create.status_code == 200
+    product_id = create.json()["data"]["id"]
+
+    query = text("""
+        SELECT pa.name, pav.id, pav.value, pav.updated_at
+        FROM product_attribute_values pav
+        JOIN product_attributes pa ON pa.id = pav.attribute_id
+        WHERE pav.product_id = :product_id
+    """)
+    async with engine.connect() as conn:
+        before = {row.name: row for row in await conn.execute(query, {"product_id": product_id})}
+
+    response = await authorized_client.put(
+        f"/product/{product_id}",
+        data={
+            "attributes_json": json.dumps([
+                {"name": "Color", "value": "Black", "is_filterable": True},
+                {"name": "RAM", "value": "16 GB", "is_filterable": True},
+                {"name": "Storage", "value": "256 GB", "is_filterable": True},
+            ]),
+        },
+    )
+    assert response.status_code == 200
+    updated = ProductReadSchema(**response.json()["data"])
+    assert {(a.name, a.value) for a in updated.attributes} == {
+        ("Color", "Black"),
+        ("RAM", "16 GB"),
+        ("Storage", "256 GB"),
+    }
+
+    async with engine.connect() as conn:
+        after = {row.name: row for row in await conn.execute(query, {"product_id": product_id})}
+
+    assert set(after) == {"Color", "RAM", "Storage"}
+    # Неизменённое значение — та же строка без обновления
+    assert (after["Color"].id, after["Color"].updated_at) == (before["Color"].id, before["Color"].updated_at)
+    # Изменённое значение обновлено на месте
+    assert after["RAM"].id == before["RAM"].id
+    assert after["RAM"].value == "16 GB"
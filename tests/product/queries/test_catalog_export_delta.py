@@ -0,0 +1,149 @@
+"""
+Тесты инкрементальной выгрузки каталога (updated_since + tombstones).
+
+Проверяют:
+- В выгрузку попадают только изменённые с момента since товары
+- Изменение атрибутов поднимает updated_at товара
+- Удалённые товары возвращаются отдельным списком
+- Переименование категории-предка попадает в выгрузку через updated_at товара
+"""
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from src.catalog.product.application.services.catalog_export import iter_ndjson
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_ndjson_appends_tombstones_after_products():
+    """Удалённые товары идут после товаров строками с deleted=true"""
+    deleted_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    body = b"".join(
+        [
+            block
+            async for block in iter_ndjson(
+                _chunks([]),
+                [{"product_id": 5, "deleted_at": deleted_at}],
+            )
+        ]
+    )
+
+    assert json.loads(body) == {
+        "id": 5,
+        "deleted": True,
+        "deleted_at": "2026-01-01T00:00:00+00:00",
+    }
+
+
+async def _create(authorized_client, name: str, attributes=None) -> int:
+    data = {"name": name, "price": "100.00"}
+    if attributes is not None:
+        data["attributes_json"] = json.dumps(attributes)
+    response = await authorized_client.post("/product", data=data)
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+@pytest.mark.asyncio
+async def test_export_delta_returns_changed_and_deleted_products(authorized_client):
+    """
+    Сценарий:
+    1. Создаём три товара и запоминаем момент since
+    2. Меняем атрибуты одного, удаляем другой, создаём новый
+    3. Выгрузка с updated_since возвращает изменённый и новый товар,
+       а удалённый — в deleted
+    """
+    untouched_id = await _create(authorized_client, "Untouched")
+    changed_id = await _create(
+        authorized_client,
+        "Changed",
+        [{"name": "Color", "value": "Black", "is_filterable": True}],
+    )
+    deleted_id = await _create(authorized_client, "Deleted")
+
+    await asyncio.sleep(0.05)
+    since = datetime.now(timezone.utc)
+    await asyncio.sleep(0.05)
+
+    update = await authorized_client.put(
+        f"/product/{changed_id}",
+        data={"attributes_json": json.dumps([{"name": "Color", "value": "White", "is_filterable": True}])},
+    )
+    assert update.status_code == 200
+    assert (await authorized_client.delete(f"/product/{deleted_id}")).status_code == 200
+    created_id = await _create(authorized_client, "Created")
+
+    full = await authorized_client.get("/product/admin/catalog/export")
+    assert full.status_code == 200
+    assert full.json()["data"]["total"] == 3
+    assert full.json()["data"]["deleted"] == []
+
+    delta = await authorized_client.get(
+        "/product/admin/catalog/export",
+        params={"updated_since": since.isoformat()},
+    )
+    assert delta.status_code == 200
+    data = delta.json()["data"]
+
+    assert [item["id"] for item in data["items"]] == [changed_id, created_id]
+    assert untouched_id not in [item["id"] for item in data["items"]]
+    assert data["items"][0]["attributes"][0]["value"] == "White"
+    assert [item["id"] for item in data["deleted"]] == [deleted_id]
+    assert data["watermark"] is not None
+
+    stream = await authorized_client.get(
+        "/product/admin/catalog/export/stream",
+        params={"updated_since": since.isoformat()},
+    )
+    assert stream.status_code == 200
+    assert "x-export-watermark" in stream.headers
+
+    lines = [json.loads(line) for line in stream.text.splitlines()]
+    assert [line["id"] for line in lines] == [changed_id, created_id, deleted_id]
+    assert lines[-1]["deleted"] is True
+
+
+@pytest.mark.asyncio
+async def test_export_delta_includes_products_under_renamed_ancestor(authorized_client):
+    """
+    Сценарий:
+    1. Товар в дочерней категории, запоминаем момент since
+    2. Переименовываем родительскую категорию
+    3. Товар попадает в выгрузку с новым именем предка в parent_categories
+    """
+    parent = await authorized_client.post("/category", json={"name": "Delta Parent"})
+    parent_id = parent.json()["data"]["id"]
+    child = await authorized_client.post(
+        "/category",
+        json={"name": "Delta Child", "parent_id": parent_id},
+    )
+    response = await authorized_client.post(
+        "/product",
+        data={"name": "Delta Phone", "price": "100.00", "category_id": child.json()["data"]["id"]},
+    )
+    product_id = response.json()["data"]["id"]
+    await _create(authorized_client, "Delta Other")
+
+    await asyncio.sleep(0.05)
+    since = datetime.now(timezone.utc)
+    await asyncio.sleep(0.05)
+
+    rename = await authorized_client.put(f"/category/{parent_id}", json={"name": "Delta Root"})
+    assert rename.status_code == 200
+
+    delta = await authorized_client.get(
+        "/product/admin/catalog/export",
+        params={"updated_since": since.isoformat()},
+    )
+    assert delta.status_code == 200
+    items = delta.json()["data"]["items"]
+
+    assert [item["id"] for item in items] == [product_id]
+    assert [category["name"] for category in items[0]["category"]["parent_categories"]] == ["Delta Root"]
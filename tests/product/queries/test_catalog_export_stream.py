@@ -0,0 +1,124 @@
+"""
+Тесты потоковой выгрузки каталога (/product/admin/catalog/export/stream).
+
+Проверяют:
+- Кодирование пачек строк в NDJSON, CSV и gzip
+- Выгрузку всех товаров через серверный курсор
+"""
+import csv
+import gzip
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+from src.catalog.product.application.services.catalog_export import (
+    EXPORT_CSV_COLUMNS,
+    gzip_stream,
+    iter_csv,
+    iter_ndjson,
+)
+
+
+def _row(product_id: int, **overrides):
+    row = {
+        "id": product_id,
+        "name": f"Product {product_id}",
+        "description": None,
+        "price": Decimal("10.50"),
+        "category_id": 3,
+        "category_name": "Смартфоны",
+        "category_device_type_id": None,
+        "supplier_id": None,
+        "supplier_name": None,
+        "region_id": None,
+        "region_name": None,
+        "attributes": [{"id": 1, "name": "RAM", "value": "8 GB", "is_filterable": True}],
+        "tags": [],
+        "parent_categories": [{"id": 1, "name": "Электроника"}],
+    }
+    row.update(overrides)
+    return row
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(stream) -> bytes:
+    return b"".join([block async for block in stream])
+
+
+@pytest.mark.asyncio
+async def test_ndjson_writes_one_product_per_line():
+    """Каждый товар — отдельная JSON-строка, пачки склеиваются без потерь"""
+    body = await _collect(iter_ndjson(_chunks([_row(1), _row(2)], [], [_row(3)])))
+
+    lines = body.decode("utf-8").splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+
+    first = json.loads(lines[0])
+    assert first["price"] == "10.50"
+    assert first["category"]["parent_categories"] == [{"id": 1, "name": "Электроника"}]
+    assert first["supplier"] is None
+    assert first["attributes"][0]["value"] == "8 GB"
+
+
+@pytest.mark.asyncio
+async def test_csv_writes_header_and_rows():
+    """CSV содержит заголовок и строку на товар, вложенные поля — JSON"""
+    body = await _collect(iter_csv(_chunks([_row(1)], [_row(2, name='Say "hi", ok')])))
+
+    rows = list(csv.reader(io.StringIO(body.decode("utf-8"))))
+    assert tuple(rows[0]) == EXPORT_CSV_COLUMNS
+    assert [row[0] for row in rows[1:]] == ["1", "2"]
+    assert rows[2][1] == 'Say "hi", ok'
+    assert json.loads(rows[1][EXPORT_CSV_COLUMNS.index("attributes")])[0]["name"] == "RAM"
+
+
+@pytest.mark.asyncio
+async def test_gzip_stream_roundtrip():
+    """gzip-поток распаковывается в исходные данные"""
+    body = await _collect(gzip_stream(iter_ndjson(_chunks([_row(1)], [_row(2)]))))
+
+    lines = gzip.decompress(body).decode("utf-8").splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_export_stream_endpoint_returns_all_products(authorized_client, monkeypatch):
+    """Выгрузка отдаёт все товары, даже когда их больше размера пачки"""
+    from src.core.conf.settings import get_settings
+
+    monkeypatch.setattr(get_settings(), "CATALOG_EXPORT_CHUNK_SIZE", 2)
+
+    for i in range(5):
+        await authorized_client.post(
+            "/product",
+            data={
+                "name": f"Export Product {i}",
+                "price": f"{100 + i}.00",
+                "attributes_json": json.dumps(
+                    [{"name": "Color", "value": "Black", "is_filterable": True}]
+                ),
+            },
+        )
+
+    response = await authorized_client.get("/product/admin/catalog/export/stream")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert [item["name"] for item in items] == [f"Export Product {i}" for i in range(5)]
+    assert items[0]["attributes"][0]["value"] == "Black"
+
+    response = await authorized_client.get(
+        "/product/admin/catalog/export/stream?format=csv&gzip=true"
+    )
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == 'attachment; filename="catalog.csv.gz"'
+
+    rows = list(csv.reader(io.StringIO(gzip.decompress(response.content).decode("utf-8"))))
+    assert len(rows) == 6
@@ -0,0 +1,132 @@
+"""
+Тесты счётчиков фасетов каталога (ProductBitmapIndex.facets).
+
+Проверяют:
+- Инкрементальное изменение счётчиков при upsert/remove товара
+- Сумму по нескольким категориям
+- Что флаг is_filterable берётся у атрибута, а не из документа товара
+- Что /product/catalog/filters видит создание, изменение и удаление товаров
+"""
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.catalog.product.application.services.bitmap_index import (
+    ProductBitmapIndex,
+    ProductIndexDocument,
+)
+
+
+def _document(category_id: int, pairs: list[tuple[str, str]]) -> ProductIndexDocument:
+    return ProductIndexDocument(
+        category_id=category_id,
+        region_id=None,
+        price=Decimal("100"),
+        attributes=frozenset(pairs),
+    )
+
+
+def test_facet_counts_follow_upsert_and_remove():
+    """Повторная пара у товара считается один раз, удаление уменьшает счётчик"""
+    index = ProductBitmapIndex(poll_interval=5)
+    index.rebuild(
+        {
+            1: _document(10, [("Color", "Black"), ("Color", "Black"), ("RAM", "8 GB")]),
+            2: _document(10, [("Color", "Black")]),
+            3: _document(20, [("Color", "White")]),
+        },
+        watermark=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    index.set_filterable({"Color", "RAM"})
+
+    assert index.facets([10]) == {"Color": {"Black": 2}, "RAM": {"8 GB": 1}}
+    assert index.facets([10, 20]) == {"Color": {"Black": 2, "White": 1}, "RAM": {"8 GB": 1}}
+
+    # Товар 1 перенесён в категорию 20 и сменил цвет, товар 2 удалён
+    index.apply({1: _document(20, [("Color", "White")])}, removed=[2])
+
+    assert index.facets([10]) == {}
+    assert index.facets([20]) == {"Color": {"White": 2}}
+
+
+def test_facet_counts_follow_attribute_filterable_flag():
+    """Смена is_filterable атрибута сразу меняет фасеты без перечитывания товаров"""
+    index = ProductBitmapIndex(poll_interval=5)
+    index.rebuild(
+        {1: _document(10, [("Color", "Black"), ("RAM", "8 GB")])},
+        watermark=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+    index.set_filterable({"Color"})
+    assert index.facets([10]) == {"Color": {"Black": 1}}
+
+    index.set_filterable({"Color", "RAM"})
+    assert index.facets([10]) == {"Color": {"Black": 1}, "RAM": {"8 GB": 1}}
+
+
+def test_facet_counts_pending_changes_are_restored_on_failure():
+    """Забранные изменения возвращаются, если синхронизация не удалась"""
+    index = ProductBitmapIndex(poll_interval=5)
+    assert index.take_pending()[0] is True
+    index.rebuild({}, watermark=datetime(2026, 1, 1, tzinfo=timezone.utc))
+    index.mark_dirty([5])
+
+    stale, dirty, _ = index.take_pending()
+    assert (stale, dirty) == (False, {5})
+
+    index.restore_pending(stale, dirty, None)
+    assert index.take_pending()[1] == {5}
+
+
+async def _filters(client, category_id: int) -> dict[str, dict[str, int]]:
+    response = await client.get(f"/product/catalog/filters?category_id={category_id}")
+    assert response.status_code == 200
+    return {
+        item["name"]: {option["value"]: option["count"] for option in item["options"]}
+        for item in response.json()["data"]["filters"]
+    }
+
+
+async def _create(authorized_client, name: str, category_id: int, color: str) -> int:
+    response = await authorized_client.post(
+        "/product",
+        data={
+            "name": name,
+            "price": "100.00",
+            "category_id": str(category_id),
+            "attributes_json": json.dumps(
+                [{"name": "Color", "value": color, "is_filterable": True}]
+            ),
+        },
+    )
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+@pytest.mark.asyncio
+async def test_catalog_filters_follow_product_changes(authorized_client, client):
+    """
+    Сценарий:
+    1. Два товара в категории, фильтры строятся (полная загрузка счётчиков)
+    2. Создаём третий, меняем цвет первого, удаляем второй
+    3. Фильтры отражают все изменения
+    """
+    category = await authorized_client.post("/category", json={"name": "Phones"})
+    category_id = category.json()["data"]["id"]
+
+    first_id = await _create(authorized_client, "Phone A", category_id, "Black")
+    second_id = await _create(authorized_client, "Phone B", category_id, "Black")
+
+    assert await _filters(client, category_id) == {"Color": {"Black": 2}}
+
+    await _create(authorized_client, "Phone C", category_id, "White")
+    update = await authorized_client.put(
+        f"/product/{first_id}",
+        data={"attributes_json": json.dumps([{"name": "Color", "value": "White", "is_filterable": True}])},
+    )
+    assert update.status_code == 200
+    assert (await authorized_client.delete(f"/product/{second_id}")).status_code == 200
+
+    assert await _filters(client, category_id) == {"Color": {"White": 2}}
@@ -0,0 +1,109 @@
+"""
+Тесты GET /product/catalog/faceted и дизъюнктивных счётчиков фасетов.
+
+Проверяют:
+- Выбор в атрибуте не сужает его собственные варианты
+- Остальные атрибуты считаются по товарам, прошедшим выбор
+- Эндпоинт возвращает отфильтрованные товары и фасеты одним ответом
+"""
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.catalog.product.application.services.bitmap_index import (
+    ProductBitmapIndex,
+    ProductIndexDocument,
+)
+
+
+def _document(category_id: int, color: str, ram: str) -> ProductIndexDocument:
+    return ProductIndexDocument(
+        category_id=category_id,
+        region_id=None,
+        price=Decimal("100"),
+        attributes=frozenset({("Color", color), ("RAM", ram)}),
+    )
+
+
+def _index() -> ProductBitmapIndex:
+    index = ProductBitmapIndex(poll_interval=5)
+    index.rebuild(
+        {
+            1: _document(10, "Black", "8 GB"),
+            2: _document(10, "Black", "16 GB"),
+            3: _document(10, "White", "8 GB"),
+            4: _document(20, "White", "8 GB"),
+        },
+        watermark=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    index.set_filterable({"Color", "RAM"})
+    return index
+
+
+def test_disjunctive_facets_keep_selected_attribute_options():
+    """Color=Black: варианты Color по всей категории, RAM — только по чёрным"""
+    facets = _index().facets([10], {"Color": ["Black"]})
+
+    assert facets == {
+        "Color": {"Black": 2, "White": 1},
+        "RAM": {"8 GB": 1, "16 GB": 1},
+    }
+
+
+def test_disjunctive_facets_apply_other_selections():
+    """Color=Black и RAM=8 GB: каждый атрибут сужается только выбором в другом"""
+    facets = _index().facets([10], {"Color": ["Black"], "RAM": ["8 GB", "32 GB"]})
+
+    assert facets == {
+        "Color": {"Black": 1, "White": 1},
+        "RAM": {"8 GB": 1, "16 GB": 1, "32 GB": 0},
+    }
+
+
+@pytest.mark.asyncio
+async def test_faceted_endpoint_returns_products_and_facets(authorized_client, client):
+    """Один запрос отдаёт страницу отфильтрованных товаров и счётчики фильтров"""
+    category = await authorized_client.post("/category", json={"name": "Phones"})
+    category_id = category.json()["data"]["id"]
+
+    for name, color, ram in (
+        ("Phone A", "Black", "8 GB"),
+        ("Phone B", "Black", "16 GB"),
+        ("Phone C", "White", "8 GB"),
+    ):
+        response = await authorized_client.post(
+            "/product",
+            data={
+                "name": name,
+                "price": "100.00",
+                "category_id": str(category_id),
+                "attributes_json": json.dumps(
+                    [
+                        {"name": "Color", "value": color, "is_filterable": True},
+                        {"name": "RAM", "value": ram, "is_filterable": True},
+                    ]
+                ),
+            },
+        )
+        assert response.status_code == 200
+
+    response = await client.get(
+        "/product/catalog/faceted",
+        params={"category_id": category_id, "attributes": json.dumps({"Color": ["Black"]})},
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+
+    assert data["total"] == 2
+    assert {item["name"] for item in data["items"]} == {"Phone A", "Phone B"}
+
+    facets = {
+        item["name"]: {option["value"]: option["count"] for option in item["options"]}
+        for item in data["filters"]
+    }
+    assert facets == {
+        "Color": {"Black": 2, "White": 1},
+        "RAM": {"8 GB": 1, "16 GB": 1},
+    }
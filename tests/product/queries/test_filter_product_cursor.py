@@ -0,0 +1,115 @@
+from decimal import Decimal
+
+import pytest
+
+from src.catalog.product.application.dto.product import ProductCursorDTO
+from src.catalog.product.application.services.product_cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from src.catalog.product.domain.exceptions import ProductInvalidPayload
+
+
+async def _create_products(authorized_client):
+    # Две пары с одинаковой ценой — проверяем стабильность (price, id)
+    for name, price in [
+        ("Cursor A", "300.00"),
+        ("Cursor B", "100.00"),
+        ("Cursor C", "200.00"),
+        ("Cursor D", "100.00"),
+        ("Cursor E", "300.00"),
+    ]:
+        response = await authorized_client.post("/product", data={"name": name, "price": price})
+        assert response.status_code == 200
+
+
+async def _collect_pages(client, sort_type: str) -> list[int]:
+    ids = []
+    cursor = None
+    for _ in range(10):
+        url = f"/product?name=Cursor&sort_type={sort_type}&limit=2&count=none"
+        if cursor:
+            url += f"&cursor={cursor}"
+        response = await client.get(url)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["total"] is None
+        ids.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    return ids
+
+
+def test_cursor_roundtrip():
+    """Курсор кодируется в непрозрачную строку и обратно."""
+    cursor = ProductCursorDTO(sort_type="price_desc", id=42, price=Decimal("199.90"))
+
+    decoded = decode_cursor(encode_cursor(cursor), "price_desc")
+
+    assert decoded == cursor
+
+
+def test_cursor_sort_mismatch_rejected():
+    """Курсор от другой сортировки не принимается."""
+    token = encode_cursor(ProductCursorDTO(sort_type="default", id=1))
+
+    with pytest.raises(ProductInvalidPayload):
+        decode_cursor(token, "price_asc")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort_type", ["default", "price_asc", "price_desc"])
+async def test_filter_products_cursor_matches_offset(authorized_client, client, sort_type):
+    """
+    Keyset-страницы дают тот же порядок, что и выборка целиком.
+
+    Сценарий:
+    1. Создаём 5 товаров, часть с одинаковой ценой
+    2. Листаем по 2 товара через next_cursor
+    3. Сравниваем с одной страницей на все товары
+    """
+    await _create_products(authorized_client)
+
+    full = await client.get(f"/product?name=Cursor&sort_type={sort_type}&limit=10")
+    expected = [item["id"] for item in full.json()["data"]["items"]]
+    assert full.json()["data"]["next_cursor"] is None
+
+    assert await _collect_pages(client, sort_type) == expected
+
+
+@pytest.mark.asyncio
+async def test_filter_products_count_estimate(authorized_client, client):
+    """count=estimate возвращает оценку и помечает её."""
+    await _create_products(authorized_client)
+
+    response = await client.get("/product?name=Cursor&limit=2&count=estimate")
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert isinstance(data["total"], int)
+    assert data["total_is_estimate"] is True
+    assert len(data["items"]) == 2
+    assert data["next_cursor"] is not None
+
+
+@pytest.mark.asyncio
+async def test_filter_products_count_estimate_with_percent_in_name(authorized_client, client):
+    """count=estimate с % и кавычкой в имени: значения уходят параметрами EXPLAIN."""
+    await _create_products(authorized_client)
+
+    response = await client.get("/product?name=50%25 o'ff&limit=2&count=estimate")
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert isinstance(data["total"], int)
+    assert data["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_filter_products_invalid_cursor_400(client):
+    """Некорректный курсор — 400."""
+    response = await client.get("/product?cursor=not-a-cursor")
+
+    assert response.status_code == 400
+    assert response.json()["success"] is False
@@ -0,0 +1,65 @@
+"""
+Тесты получения товаров по списку id (POST /product/batch).
+
+Проверяют:
+- Порядок запроса, отбрасывание повторов и список отсутствующих id
+- Повторный запрос обслуживается кэшем read-модели без обращений к БД
+- Ограничение размера запроса
+"""
+import pytest
+
+from src.core.conf.settings import get_settings
+
+
+async def _create_product(client, name: str, price: str) -> int:
+    response = await client.post("/product", data={"name": name, "price": price})
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_products_in_request_order(authorized_client, client, statement_log):
+    """
+    Сценарий:
+    1. Запрос трёх товаров в произвольном порядке, с повтором и несуществующим id
+    2. Товары — в порядке запроса без повторов, несуществующий id — в missing_ids
+    3. Повторный запрос целиком из кэша
+    """
+    first_id = await _create_product(authorized_client, "Batch A", "10.00")
+    second_id = await _create_product(authorized_client, "Batch B", "20.00")
+    third_id = await _create_product(authorized_client, "Batch C", "30.00")
+    ids = [third_id, 999999, first_id, third_id, second_id]
+
+    response = await client.post("/product/batch", json={"ids": ids})
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [item["id"] for item in data["items"]] == [third_id, first_id, second_id]
+    assert [item["price"] for item in data["items"]] == ["30.00", "10.00", "20.00"]
+    assert data["missing_ids"] == [999999]
+
+    existing = [third_id, first_id, second_id]
+    with statement_log() as counter:
+        response = await client.post("/product/batch", json={"ids": existing})
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["data"]["items"]] == existing
+    assert counter.count == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_400_too_many_ids(client):
+    """Запрос больше PRODUCT_BATCH_MAX_IDS отклоняется"""
+    max_ids = get_settings().PRODUCT_BATCH_MAX_IDS
+    response = await client.post(
+        "/product/batch",
+        json={"ids": list(range(1, max_ids + 2))},
+    )
+    assert response.status_code == 400
+    assert response.json()["error"]["details"]["reason"] == "too_many_ids"
+
+
+@pytest.mark.asyncio
+async def test_batch_422_empty_ids(client):
+    """Пустой список id — ошибка валидации"""
+    response = await client.post("/product/batch", json={"ids": []})
+    assert response.status_code == 422
@@ -0,0 +1,207 @@
+"""
+Тесты индекса товаров на битовых картах (ProductBitmapIndex) и фильтрации
+каталога по нему (PRODUCT_INDEX_FILTER_ENABLED).
+
+Проверяют:
+- Пересечение условий: категории, регион, id, атрибуты (ИЛИ внутри атрибута)
+- Порядок страницы и keyset-продолжение для всех сортировок
+- Что GET /product по индексу совпадает с SQL-фильтрацией и видит изменения
+"""
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.catalog.category.application.read_models.pricing import (
+    PriceFormula,
+    PriceFormulas,
+)
+from src.catalog.product.application.dto.product import ProductCursorDTO
+from src.catalog.product.application.services.bitmap_index import (
+    ProductBitmapIndex,
+    ProductIndexDocument,
+    bitmap_of,
+    iter_bits,
+)
+from src.core.conf.settings import get_settings
+
+
+def _document(category_id: int, region_id: int, price: str, **attributes: str) -> ProductIndexDocument:
+    return ProductIndexDocument(
+        category_id=category_id,
+        region_id=region_id,
+        price=Decimal(price),
+        attributes=frozenset(attributes.items()),
+    )
+
+
+def _index() -> ProductBitmapIndex:
+    index = ProductBitmapIndex(poll_interval=5)
+    index.rebuild(
+        {
+            1: _document(10, 1, "300", Color="Black", RAM="8 GB"),
+            2: _document(10, 1, "100", Color="White", RAM="16 GB"),
+            3: _document(10, 2, "200", Color="Black", RAM="16 GB"),
+            9: _document(20, 1, "100", Color="Black", RAM="8 GB"),
+            130: _document(10, 1, "200", Color="Black"),
+        },
+        watermark=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    return index
+
+
+def test_bitmap_index_match_intersects_conditions():
+    """Условия пересекаются, значения одного атрибута объединяются"""
+    index = _index()
+
+    assert list(iter_bits(index.match())) == [1, 2, 3, 9, 130]
+    assert list(iter_bits(index.match(category_ids=[10], attributes={"Color": ["Black"]}))) == [1, 3, 130]
+    assert list(iter_bits(index.match(attributes={"RAM": ["8 GB", "16 GB"]}, region_id=1))) == [1, 2, 9]
+    assert list(iter_bits(index.match(category_ids=[10, 20], product_ids=[2, 9, 77]))) == [2, 9]
+    assert index.match(attributes={"Color": ["Red"]}) == 0
+
+    # Товар удалён и пересоздан в другой категории с другим цветом
+    index.apply({130: _document(20, 1, "200", Color="White")}, removed=[1])
+    assert list(iter_bits(index.match(category_ids=[10], attributes={"Color": ["Black"]}))) == [3]
+    assert list(iter_bits(index.match(category_ids=[20], attributes={"Color": ["White"]}))) == [130]
+    assert list(iter_bits(index.match())) == [2, 3, 9, 130]
+
+
+def test_bitmap_of_sets_bits_of_all_ids():
+    """bitmap_of собирает карту за один проход, повторы и порядок не важны"""
+    ids = [130, 0, 7, 8, 64, 7, 1000]
+
+    assert list(iter_bits(bitmap_of(ids))) == sorted(set(ids))
+    assert bitmap_of([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_bitmap_index_sync_swaps_in_rebuilt_index():
+    """Полная перестройка в sync собирается отдельно и подменяет индекс целиком"""
+    index = _index()
+    index.mark_stale()
+
+    async def load_documents(product_ids=None, updated_since=None):
+        assert list(iter_bits(index.match())) == [1, 2, 3, 9, 130]
+        return {5: _document(30, 1, "50", Color="Red")}
+
+    async def load_deleted_ids(since):
+        return []
+
+    async def load_watermark():
+        return datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+    await index.sync(load_documents, load_deleted_ids, load_watermark)
+
+    assert list(iter_bits(index.match())) == [5]
+    assert list(iter_bits(index.match(attributes={"Color": ["Red"]}))) == [5]
+
+
+def test_bitmap_index_page_follows_sql_order():
+    """Страница совпадает с ORDER BY id / (price, id) / (price DESC, id)"""
+    index = _index()
+    bitmap = index.match()
+
+    assert index.page(bitmap, "default", limit=2, offset=1) == [2, 3]
+    assert index.page(bitmap, "price_asc", limit=10) == [2, 9, 3, 130, 1]
+    assert index.page(bitmap, "price_desc", limit=10) == [1, 3, 130, 2, 9]
+
+    # С курсором offset не используется, продолжаем строго после позиции
+    assert index.page(bitmap, "default", limit=2, offset=5, after=ProductCursorDTO("default", id=3)) == [9, 130]
+    assert index.page(
+        bitmap, "price_asc", limit=2, after=ProductCursorDTO("price_asc", id=3, price=Decimal("200")),
+    ) == [130, 1]
+    assert index.page(
+        bitmap, "price_desc", limit=10, after=ProductCursorDTO("price_desc", id=3, price=Decimal("200")),
+    ) == [130, 2, 9]
+
+
+
+def test_bitmap_index_price_list_matches_sorted_order():
+    """Проход списка по цене даёт тот же порядок, что сортировка результата"""
+    index = ProductBitmapIndex(poll_interval=5)
+    index.rebuild(
+        {
+            product_id: _document(product_id % 3 + 1, 1, f"{product_id * 37 % 50}.{product_id % 7}")
+            for product_id in range(1, 201)
+        },
+    )
+    # Точечные изменения после сборки: цена, категория, удаление
+    index.apply({5: _document(2, 1, "0.01"), 300: _document(1, 1, "25.3")}, removed=[7, 8])
+    formulas = PriceFormulas({
+        # Множитель меньше единицы: округление сводит разные цены к одной
+        2: PriceFormula(factor=Decimal("0.1"), addend=Decimal("1")),
+        3: PriceFormula(factor=Decimal("1.2"), addend=Decimal("0")),
+    })
+    bitmap = index.match()
+    matched = set(iter_bits(bitmap))
+
+    for sort_type, sign in (("price_asc", 1), ("price_desc", -1)):
+        for prices in (None, formulas):
+            expected = [key[1] for key in index._sorted_keys(matched, sign, prices)]
+            assert index.page(bitmap, sort_type, limit=500, formulas=prices) == expected
+            assert index.page(bitmap, sort_type, limit=10, offset=20, formulas=prices) == expected[20:30]
+
+            document = index._documents[expected[40]]
+            price = prices.final_price(document.price, document.category_id) if prices else document.price
+            cursor = ProductCursorDTO(sort_type, id=expected[40], price=price)
+            assert index.page(bitmap, sort_type, limit=5, after=cursor, formulas=prices) == expected[41:46]
+
+@pytest.fixture
+def index_filter(monkeypatch):
+    monkeypatch.setattr(get_settings(), "PRODUCT_INDEX_FILTER_ENABLED", True)
+
+
+async def _create(authorized_client, name: str, price: str, category_id: int, color: str) -> int:
+    response = await authorized_client.post(
+        "/product",
+        data={
+            "name": name,
+            "price": price,
+            "category_id": str(category_id),
+            "attributes_json": json.dumps(
+                [{"name": "Color", "value": color, "is_filterable": True}]
+            ),
+        },
+    )
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+@pytest.mark.asyncio
+async def test_filter_by_index_returns_page_and_total(index_filter, authorized_client, client):
+    """
+    Сценарий:
+    1. Три товара, фильтр по цвету с сортировкой по цене
+    2. Меняем цвет одного товара — индекс подхватывает изменение по событию
+    """
+    category = await authorized_client.post("/category", json={"name": "Phones"})
+    category_id = category.json()["data"]["id"]
+
+    first_id = await _create(authorized_client, "Phone A", "300.00", category_id, "Black")
+    await _create(authorized_client, "Phone B", "100.00", category_id, "White")
+    third_id = await _create(authorized_client, "Phone C", "200.00", category_id, "Black")
+
+    params = {
+        "category_id": category_id,
+        "attributes": json.dumps({"Color": ["Black"]}),
+        "sort_type": "price_asc",
+    }
+    response = await client.get("/product", params=params)
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total"] == 2
+    assert [item["id"] for item in data["items"]] == [third_id, first_id]
+    assert data["items"][0]["attributes"][0]["value"] == "Black"
+
+    update = await authorized_client.put(
+        f"/product/{first_id}",
+        data={"attributes_json": json.dumps([{"name": "Color", "value": "White", "is_filterable": True}])},
+    )
+    assert update.status_code == 200
+
+    response = await client.get("/product", params=params)
+    data = response.json()["data"]
+    assert data["total"] == 1
+    assert [item["id"] for item in data["items"]] == [third_id]
@@ -0,0 +1,137 @@
+"""
+Тесты карточек товаров (view=card) в списке, поиске и пакетном запросе.
+
+Проверяют:
+- В карточке только название, цены, рейтинг и главное изображение
+- Одинаковые карточки из SQL, проекции product_read_model и индекса товаров
+- Связи, не нужные карточке, не загружаются из БД
+"""
+import json
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.catalog.product.infrastructure.orm.product_read_model import (
+    ProductReadModelProjector,
+)
+from src.core.conf.settings import get_settings
+
+CARD_FIELDS = {"id", "name", "price", "final_price", "rating", "images"}
+
+
+async def _create_product(authorized_client, name: str, category_id: int) -> tuple[int, int]:
+    """Товар с двумя изображениями; возвращает (id товара, upload_id главного)."""
+    upload_ids = []
+    for i in range(2):
+        upload = await authorized_client.post(
+            "/upload/",
+            data={"folder": "products"},
+            files=[(
+                "file",
+                (f"{name}-{i}.jpg", b"\xff\xd8\xff\xe0" + f"{name}{i}".encode(), "image/jpeg"),
+            )],
+        )
+        assert upload.status_code == 200
+        upload_ids.append(upload.json()["data"]["upload_id"])
+
+    response = await authorized_client.post(
+        "/product",
+        data={
+            "name": name,
+            "description": "Описание",
+            "price": "100.00",
+            "category_id": str(category_id),
+            "attributes_json": json.dumps(
+                [{"name": "Color", "value": "Black", "is_filterable": True}]
+            ),
+            "images_json": json.dumps([
+                {"upload_id": upload_ids[0], "is_main": False, "ordering": 0},
+                {"upload_id": upload_ids[1], "is_main": True, "ordering": 1},
+            ]),
+        },
+    )
+    assert response.status_code == 200
+    return response.json()["data"]["id"], upload_ids[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "setting",
+    [None, "PRODUCT_READ_MODEL_ENABLED", "PRODUCT_INDEX_FILTER_ENABLED"],
+)
+async def test_card_view_in_list_search_and_batch(
+    setting, monkeypatch, engine, authorized_client, client
+):
+    """
+    Сценарий:
+    1. Два товара с атрибутом и двумя изображениями, проекция перестроена
+    2. Список, поиск и пакетный запрос с view=card отдают только поля карточки
+       и главное изображение
+    3. Без view ответ прежний (все поля)
+    """
+    category = await authorized_client.post("/category", json={"name": "Cards"})
+    category_id = category.json()["data"]["id"]
+    first_id, first_main = await _create_product(authorized_client, "Card A", category_id)
+    second_id, second_main = await _create_product(authorized_client, "Card B", category_id)
+    main_uploads = {first_id: first_main, second_id: second_main}
+
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_factory() as db:
+        await ProductReadModelProjector(db).rebuild()
+        await db.commit()
+    if setting:
+        monkeypatch.setattr(get_settings(), setting, True)
+
+    responses = [
+        await client.get("/product", params={"category_id": category_id, "view": "card"}),
+        await client.get("/product/search", params={"query": "Card", "view": "card"}),
+        await client.post(
+            "/product/batch",
+            params={"view": "card"},
+            json={"ids": [second_id, first_id]},
+        ),
+    ]
+    for response in responses:
+        assert response.status_code == 200
+        items = response.json()["data"]["items"]
+        assert {item["id"] for item in items} == {first_id, second_id}
+        for item in items:
+            assert set(item) == CARD_FIELDS
+            assert item["price"] == item["final_price"] == "100.00"
+            assert [image["upload_id"] for image in item["images"]] == [main_uploads[item["id"]]]
+            assert item["images"][0]["image_url"]
+
+    full = await client.get("/product", params={"category_id": category_id})
+    item = full.json()["data"]["items"][0]
+    assert item["description"] == "Описание"
+    assert len(item["images"]) == 2
+    assert item["attributes"][0]["name"] == "Color"
+
+
+@pytest.mark.asyncio
+async def test_card_view_skips_relationships(statement_log, authorized_client, client):
+    """Карточки читаются без запросов к атрибутам, тегам, поставщикам и регионам"""
+    category = await authorized_client.post("/category", json={"name": "Cards"})
+    category_id = category.json()["data"]["id"]
+    await _create_product(authorized_client, "Card A", category_id)
+    # Снимок дерева категорий и формулы цен загружаются первым запросом
+    await client.get("/product", params={"limit": 1})
+
+    skipped = ("product_attribute_values", "product_tags", "suppliers", "regions")
+    params = {"sort_type": "price_asc", "count": "none"}
+
+    with statement_log() as full:
+        response = await client.get("/product", params=params)
+    assert response.status_code == 200
+    assert any(
+        table in statement for statement in full.statements for table in skipped
+    )
+
+    with statement_log() as card:
+        response = await client.get("/product", params={**params, "view": "card"})
+    assert response.status_code == 200
+    assert len(response.json()["data"]["items"]) == 1
+    assert not any(
+        table in statement for statement in card.statements for table in skipped
+    )
+    assert len(card.statements) < len(full.statements)
@@ -0,0 +1,85 @@
+"""
+Тесты поиска товаров по search_vector/pg_trgm (PRODUCT_SEARCH_FULLTEXT_ENABLED).
+
+Проверяют:
+- Поиск по префиксу слова в названии
+- Поиск по значению атрибута (search_vector обновляется триггером)
+- Обновление поискового документа после изменения названия
+"""
+import json
+
+import pytest
+
+from src.core.conf.settings import get_settings
+
+
+@pytest.fixture
+def fulltext_search(monkeypatch):
+    monkeypatch.setattr(get_settings(), "PRODUCT_SEARCH_FULLTEXT_ENABLED", True)
+
+
+@pytest.mark.asyncio
+async def test_fulltext_search_by_name_prefix(fulltext_search, authorized_client, client):
+    """Запрос 'iph' находит товары со словом iPhone в названии"""
+    await authorized_client.post("/product", data={"name": "iPhone 15 Pro", "price": "999.00"})
+    await authorized_client.post("/product", data={"name": "iPhone 16", "price": "1099.00"})
+    await authorized_client.post("/product", data={"name": "Galaxy S24", "price": "899.00"})
+
+    response = await client.get("/product/search?query=iph")
+    assert response.status_code == 200
+
+    data = response.json()["data"]
+    assert data["total"] == 2
+    assert {item["name"] for item in data["items"]} == {"iPhone 15 Pro", "iPhone 16"}
+
+
+@pytest.mark.asyncio
+async def test_fulltext_search_by_attribute_value(fulltext_search, authorized_client, client):
+    """Слово из значения атрибута находит товар вместе со словом из названия"""
+    await authorized_client.post(
+        "/product",
+        data={
+            "name": "iPhone 15",
+            "price": "899.00",
+            "attributes_json": json.dumps(
+                [{"name": "Color", "value": "Midnight Blue", "is_filterable": True}]
+            ),
+        },
+    )
+    await authorized_client.post(
+        "/product",
+        data={
+            "name": "iPhone 15",
+            "price": "899.00",
+            "attributes_json": json.dumps(
+                [{"name": "Color", "value": "Starlight", "is_filterable": True}]
+            ),
+        },
+    )
+
+    response = await client.get("/product/search?query=iphone midnight")
+    assert response.status_code == 200
+
+    data = response.json()["data"]
+    assert data["total"] == 1
+    assert data["items"][0]["name"] == "iPhone 15"
+
+
+@pytest.mark.asyncio
+async def test_fulltext_search_follows_rename(fulltext_search, authorized_client, client):
+    """После переименования товар ищется по новому названию, а не по старому"""
+    create = await authorized_client.post("/product", data={"name": "Pixel 8", "price": "699.00"})
+    product_id = create.json()["data"]["id"]
+
+    update = await authorized_client.put(
+        f"/product/{product_id}",
+        data={"name": "Nothing Phone", "price": "699.00"},
+    )
+    assert update.status_code == 200
+
+    old = (await client.get("/product/search?query=pixel")).json()["data"]
+    new = (await client.get("/product/search?query=nothing")).json()["data"]
+
+    assert old["total"] == 0
+    assert new["total"] == 1
+    assert new["items"][0]["id"] == product_id
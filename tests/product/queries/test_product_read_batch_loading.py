@@ -0,0 +1,114 @@
+import json
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.catalog.product.infrastructure.orm.product_read_optimized import (
+    OptimizedProductReadRepository,
+)
+
+JPEG_BYTES = b"\xff\xd8\xff\xe0product-image"
+
+
+async def _create_products(authorized_client, count: int) -> list[int]:
+    product_ids = []
+    for i in range(count):
+        upload_resp = await authorized_client.post(
+            "/upload/",
+            data={"folder": "products"},
+            files=[("file", (f"test{i}.jpg", JPEG_BYTES, "image/jpeg"))],
+        )
+        assert upload_resp.status_code == 200
+        upload_id = upload_resp.json()["data"]["upload_id"]
+
+        response = await authorized_client.post(
+            "/product",
+            data={
+                "name": f"Batch Product {i}",
+                "price": f"{100 + i}.00",
+                "attributes_json": json.dumps(
+                    [
+                        {"name": "RAM", "value": f"{i} GB", "is_filterable": True},
+                        {"name": "Color", "value": "Black", "is_filterable": True},
+                    ]
+                ),
+                "images_json": json.dumps(
+                    [{"upload_id": upload_id, "is_main": True, "ordering": 0}]
+                ),
+            },
+        )
+        assert response.status_code == 200
+        product_ids.append(response.json()["data"]["id"])
+    return product_ids
+
+
+@pytest.mark.asyncio
+async def test_optimized_filter_statement_count_does_not_depend_on_page_size(
+    authorized_client,
+    engine,
+    statement_log,
+):
+    """
+    Проверяет, что изображения и атрибуты загружаются пакетно.
+
+    Сценарий:
+    1. Создаём 6 товаров с изображением и атрибутами
+    2. Запрашиваем страницы размером 2 и 6
+    3. Количество SQL-запросов одинаково, данные собраны для каждого товара
+    """
+    await _create_products(authorized_client, 6)
+
+    async_session = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async with async_session() as session:
+        repository = OptimizedProductReadRepository(session)
+
+        with statement_log() as small_page:
+            small_items, small_total = await repository.filter(
+                name="Batch Product",
+                category_id=None,
+                product_type_id=None,
+                limit=2,
+                offset=0,
+            )
+
+        with statement_log() as full_page:
+            full_items, full_total = await repository.filter(
+                name="Batch Product",
+                category_id=None,
+                product_type_id=None,
+                limit=6,
+                offset=0,
+            )
+
+    assert small_total == full_total == 6
+    assert len(small_items) == 2
+    assert len(full_items) == 6
+    assert small_page.count == full_page.count
+
+    for item in full_items:
+        assert len(item.images) == 1
+        assert item.images[0].is_main is True
+        assert {attr.name for attr in item.attributes} == {"RAM", "Color"}
+
+
+@pytest.mark.asyncio
+async def test_optimized_get_by_id_uses_batched_loaders(authorized_client, engine):
+    """get_by_id собирает изображения, атрибуты и количество отзывов тем же путём."""
+    product_ids = await _create_products(authorized_client, 1)
+
+    async_session = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async with async_session() as session:
+        repository = OptimizedProductReadRepository(session)
+        dto = await repository.get_by_id(product_ids[0])
+        by_name = await repository.get_by_name("Batch Product 0")
+
+    assert dto is not None
+    assert dto.id == product_ids[0]
+    assert len(dto.images) == 1
+    assert len(dto.attributes) == 2
+    assert dto.rating.count == 0
+
+    assert by_name is not None
+    assert by_name.id == dto.id
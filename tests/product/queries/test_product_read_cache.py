@@ -0,0 +1,211 @@
+from decimal import Decimal
+
+import pytest
+
+from src.catalog.category.domain.aggregates.category import CategoryAggregate
+from src.catalog.product.application.dto.product import (
+    ProductAttributeReadDTO,
+    ProductCardDTO,
+    ProductImageReadDTO,
+    ProductRatingDTO,
+    ProductReadDTO,
+    TagReadDTO,
+)
+from src.catalog.product.infrastructure.orm.cache.cached_product_read import (
+    CachedProductReadRepository,
+    ProductReadCacheInvalidator,
+)
+from src.catalog.suppliers.domain.aggregates.supplier import SupplierAggregate
+from src.core.cache.lru import LRUCache
+from src.regions.domain.aggregates.region import RegionAggregate
+
+
+class _FakeReadRepository:
+
+    def __init__(self, dto: ProductReadDTO):
+        self.dto = dto
+        self.calls = 0
+        self.views = []
+
+    async def get_by_id(self, product_id: int):
+        self.calls += 1
+        return self.dto if product_id == self.dto.id else None
+
+    async def get_by_name(self, name: str):
+        self.calls += 1
+        return self.dto if name == self.dto.name else None
+
+    async def get_many(self, product_ids: list[int], view: str = "full"):
+        self.calls += 1
+        self.views.append(view)
+        return [self.dto] if self.dto.id in product_ids else []
+
+
+def _build_dto() -> ProductReadDTO:
+    return ProductReadDTO(
+        id=1,
+        name="iPhone 15",
+        description="Смартфон",
+        price=Decimal("999.90"),
+        rating=ProductRatingDTO(value=4.5, count=2),
+        images=[
+            ProductImageReadDTO(upload_id=9, image_key="products/b.jpg", ordering=1),
+            ProductImageReadDTO(upload_id=7, image_key="products/a.jpg", is_main=True),
+        ],
+        attributes=[ProductAttributeReadDTO(id=3, name="RAM", value="8 GB", is_filterable=True)],
+        tags=[TagReadDTO(tag_id=5, name="новинка")],
+        category=CategoryAggregate(category_id=2, name="Смартфоны", device_type_id=4),
+        supplier=SupplierAggregate(supplier_id=6, name="Поставщик"),
+        region=RegionAggregate(region_id=8, name="Москва"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_product_read_cache_roundtrip_and_invalidation():
+    """
+    Снимок DTO переживает кэш без потерь, события сбрасывают кэш.
+
+    Сценарий:
+    1. Первый get_by_id идёт в репозиторий, второй и get_by_name — из кэша
+    2. Событие по товару сбрасывает только его запись
+    3. Событие по категории меняет поколение и сбрасывает всё
+    """
+    cache = LRUCache()
+    source = _FakeReadRepository(_build_dto())
+    repository = CachedProductReadRepository(db_repository=source, cache=cache)
+    invalidator = ProductReadCacheInvalidator(cache)
+
+    first = await repository.get_by_id(1)
+    second = await repository.get_by_id(1)
+
+    assert source.calls == 1
+    assert second is not first
+    assert second.price == first.price
+    assert second.category.name == "Смартфоны"
+    assert second.category.device_type_id == 4
+    assert second.supplier.name == "Поставщик"
+    assert second.region.name == "Москва"
+    assert second.tags[0].name == "новинка"
+    assert second.rating.count == 2
+
+    await invalidator.handle({"entity": "product", "entity_id": 1, "data": {}})
+    await repository.get_by_id(1)
+    assert source.calls == 2
+
+    await invalidator.handle({"entity": "review", "entity_id": 10, "data": {"product_id": 1}})
+    await repository.get_by_id(1)
+    assert source.calls == 3
+
+    await invalidator.handle({"entity": "category", "entity_id": 2, "data": {}})
+    await repository.get_by_id(1)
+    assert source.calls == 4
+
+    # Чужие сущности кэш не трогают
+    await invalidator.handle({"entity": "faq", "entity_id": 1, "data": {}})
+    await repository.get_by_id(1)
+    assert source.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_product_read_cache_get_many_loads_only_misses():
+    """get_many отдаёт попадания из кэша, промахи дочитывает одним вызовом, порядок сохраняется"""
+    cache = LRUCache()
+    source = _FakeReadRepository(_build_dto())
+    repository = CachedProductReadRepository(db_repository=source, cache=cache)
+
+    assert [dto.id for dto in await repository.get_many([42, 1, 1])] == [1, 1]
+    assert source.calls == 1
+
+    items = await repository.get_many([1, 42])
+    assert [dto.id for dto in items] == [1]
+    assert items[0].category.name == "Смартфоны"
+    # 1 из кэша, 42 не существует и дочитывается снова
+    assert source.calls == 2
+
+    assert await repository.get_many([]) == []
+    assert source.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_product_read_cache_get_many_card_view():
+    """view=card строится из полного снимка кэша; карточки-промахи в кэш не пишутся"""
+    cache = LRUCache()
+    source = _FakeReadRepository(_build_dto())
+    repository = CachedProductReadRepository(db_repository=source, cache=cache)
+
+    await repository.get_many([1], view="card")
+    await repository.get_many([1], view="card")
+    assert source.calls == 2
+    assert source.views == ["card", "card"]
+
+    await repository.get_many([1])
+    [card] = await repository.get_many([1], view="card")
+    assert source.calls == 3
+
+    assert isinstance(card, ProductCardDTO)
+    assert card.category_id == 2
+    assert card.price == Decimal("999.90")
+    assert card.rating.count == 2
+    assert [image.upload_id for image in card.images] == [7]
+
+
+@pytest.mark.asyncio
+async def test_get_product_second_request_served_from_cache(authorized_client, statement_log):
+    """Повторный GET /product/{id} не обращается к базе."""
+    create = await authorized_client.post(
+        "/product",
+        data={"name": "Кэшируемый товар", "price": "100.00"},
+    )
+    assert create.status_code == 200
+    product_id = create.json()["data"]["id"]
+
+    first = await authorized_client.get(f"/product/{product_id}")
+    assert first.status_code == 200
+
+    with statement_log() as counter:
+        second = await authorized_client.get(f"/product/{product_id}")
+
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert counter.count == 0
+
+
+@pytest.mark.asyncio
+async def test_get_product_not_stale_after_update(authorized_client):
+    """После UpdateProductCommand GET /product/{id} отдаёт новую цену."""
+    create = await authorized_client.post(
+        "/product",
+        data={"name": "Товар с ценой", "price": "100.00"},
+    )
+    product_id = create.json()["data"]["id"]
+
+    before = await authorized_client.get(f"/product/{product_id}")
+    assert before.json()["data"]["price"] == "100.00"
+
+    update = await authorized_client.put(
+        f"/product/{product_id}",
+        data={"price": "150.00"},
+    )
+    assert update.status_code == 200
+
+    after = await authorized_client.get(f"/product/{product_id}")
+    assert after.json()["data"]["price"] == "150.00"
+
+
+@pytest.mark.asyncio
+async def test_get_product_not_stale_after_tag_update(authorized_client, product_with_tags):
+    """Переименование тега сбрасывает закэшированные товары."""
+    product_id = product_with_tags["product"]["id"]
+    tag_id = product_with_tags["tags"][0]["tag_id"]
+
+    before = await authorized_client.get(f"/product/{product_id}")
+    assert "популярный" in {tag["name"] for tag in before.json()["data"]["tags"]}
+
+    update = await authorized_client.put(
+        f"/product/tags/{tag_id}",
+        json={"name": "хит"},
+    )
+    assert update.status_code == 200
+
+    after = await authorized_client.get(f"/product/{product_id}")
+    assert "хит" in {tag["name"] for tag in after.json()["data"]["tags"]}
@@ -0,0 +1,196 @@
+"""
+Тесты проекции product_read_model (PRODUCT_READ_MODEL_ENABLED).
+
+Проверяют:
+- Снимок ProductReadDTO восстанавливается без потерь
+- get_by_id и filter читают готовые снимки из проекции
+- Проектор по событиям товара и категории обновляет затронутые строки
+- Догоняющая проекция подбирает изменения без событий, устаревший снимок
+  не перезаписывает более свежую строку
+"""
+import json
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select, text, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.catalog.category.domain.aggregates.category import CategoryAggregate
+from src.catalog.product.application.dto.product import (
+    ProductAttributeReadDTO,
+    ProductImageReadDTO,
+    ProductRatingDTO,
+    ProductReadDTO,
+    TagReadDTO,
+)
+from src.catalog.product.application.read_models.product_snapshot import (
+    product_from_snapshot,
+    product_to_snapshot,
+)
+from src.catalog.product.infrastructure.models.product_read_model import (
+    ProductReadModel,
+)
+from src.catalog.product.infrastructure.orm.product_read_model import (
+    ProductReadModelProjector,
+    ProductReadModelUpdater,
+)
+from src.core.conf.settings import get_settings
+
+
+def test_product_snapshot_round_trip():
+    """Снимок после JSON восстанавливается в DTO с теми же данными"""
+    dto = ProductReadDTO(
+        id=7,
+        name="Phone",
+        description=None,
+        price=Decimal("199.90"),
+        rating=ProductRatingDTO(value=4.5, count=3),
+        images=[ProductImageReadDTO(upload_id=1, image_key="a.png", image_url="https://cdn/a.png", is_main=True)],
+        attributes=[ProductAttributeReadDTO(id=2, name="Color", value="Black", is_filterable=True)],
+        tags=[TagReadDTO(tag_id=5, name="New", color="#fff")],
+        category=CategoryAggregate(category_id=3, name="Phones", description=None, parent_id=None),
+    )
+
+    snapshot = json.loads(json.dumps(product_to_snapshot(dto)))
+    restored = product_from_snapshot(snapshot)
+
+    assert restored.price == Decimal("199.90")
+    assert restored.category.name == "Phones"
+    assert product_to_snapshot(restored) == snapshot
+
+
+@pytest.fixture
+def read_model(monkeypatch):
+    monkeypatch.setattr(get_settings(), "PRODUCT_READ_MODEL_ENABLED", True)
+
+
+async def _create(authorized_client, name: str, category_id: int, color: str) -> int:
+    response = await authorized_client.post(
+        "/product",
+        data={
+            "name": name,
+            "price": "100.00",
+            "category_id": str(category_id),
+            "attributes_json": json.dumps(
+                [{"name": "Color", "value": color, "is_filterable": True}]
+            ),
+        },
+    )
+    assert response.status_code == 200
+    return response.json()["data"]["id"]
+
+
+@pytest.mark.asyncio
+async def test_reads_come_from_projection(read_model, engine, authorized_client, client):
+    """
+    Сценарий:
+    1. Два товара, полная перестройка проекции
+    2. Меняем снимок прямо в проекции — get_by_id и filter отдают его
+    """
+    category = await authorized_client.post("/category", json={"name": "Phones"})
+    category_id = category.json()["data"]["id"]
+    black_id = await _create(authorized_client, "Phone A", category_id, "Black")
+    await _create(authorized_client, "Phone B", category_id, "White")
+
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_factory() as db:
+        assert await ProductReadModelProjector(db).rebuild(chunk_size=1) == 2
+        document = await db.scalar(
+            select(ProductReadModel.document).where(ProductReadModel.product_id == black_id)
+        )
+        await db.execute(
+            update(ProductReadModel)
+            .where(ProductReadModel.product_id == black_id)
+            .values(document={**document, "name": "Projected"})
+        )
+        await db.commit()
+
+    response = await client.get(f"/product/{black_id}")
+    assert response.status_code == 200
+    assert response.json()["data"]["name"] == "Projected"
+
+    response = await client.get(
+        "/product",
+        params={"category_id": category_id, "attributes": json.dumps({"Color": ["Black"]})},
+    )
+    data = response.json()["data"]
+    assert data["total"] == 1
+    assert [item["name"] for item in data["items"]] == ["Projected"]
+
+
+@pytest.mark.asyncio
+async def test_projector_follows_product_and_category_events(engine, authorized_client):
+    """Событие товара пересобирает его строку, событие категории — строки её товаров"""
+    category = await authorized_client.post("/category", json={"name": "Phones"})
+    category_id = category.json()["data"]["id"]
+    product_id = await _create(authorized_client, "Phone A", category_id, "Black")
+
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    updater = ProductReadModelUpdater(session_factory)
+    await updater.handle({"entity": "product", "entity_id": product_id})
+
+    await authorized_client.put(f"/category/{category_id}", json={"name": "Smartphones"})
+    await updater.handle({"entity": "category", "entity_id": category_id})
+
+    async with session_factory() as db:
+        row = (await db.execute(
+            select(ProductReadModel).where(ProductReadModel.product_id == product_id)
+        )).scalar_one()
+
+    assert row.category_id == category_id
+    assert row.attribute_pairs == [{"name": "Color", "value": "Black"}]
+    assert row.document["category"]["name"] == "Smartphones"
+
+    assert (await authorized_client.delete(f"/product/{product_id}")).status_code == 200
+    await updater.handle({"entity": "product", "entity_id": product_id})
+
+    async with session_factory() as db:
+        assert await db.scalar(select(ProductReadModel.product_id)) is None
+
+
+@pytest.mark.asyncio
+async def test_catch_up_projects_changes_without_events(engine, authorized_client):
+    """Изменение, событие о котором потерялось, подбирает догоняющая проекция"""
+    category = await authorized_client.post("/category", json={"name": "Phones"})
+    category_id = category.json()["data"]["id"]
+    product_id = await _create(authorized_client, "Phone A", category_id, "Black")
+
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    updater = ProductReadModelUpdater(session_factory)
+    await updater.handle({"entity": "product", "entity_id": product_id})
+
+    response = await authorized_client.put(f"/product/{product_id}", data={"name": "Phone B"})
+    assert response.status_code == 200
+
+    assert await updater.catch_up() >= 1
+
+    async with session_factory() as db:
+        assert await db.scalar(
+            select(ProductReadModel.name).where(ProductReadModel.product_id == product_id)
+        ) == "Phone B"
+
+
+@pytest.mark.asyncio
+async def test_stale_projection_does_not_overwrite_newer_row(engine, authorized_client):
+    """Снимок из транзакции, начатой раньше записанного, строку не перезаписывает"""
+    category = await authorized_client.post("/category", json={"name": "Phones"})
+    product_id = await _create(authorized_client, "Phone A", category.json()["data"]["id"], "Black")
+
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_factory() as db:
+        await ProductReadModelProjector(db).project([product_id])
+        await db.execute(
+            update(ProductReadModel)
+            .where(ProductReadModel.product_id == product_id)
+            .values(name="Newer", projected_at=func.now() + text("interval '1 hour'"))
+        )
+        await db.commit()
+
+    async with session_factory() as db:
+        await ProductReadModelProjector(db).project([product_id])
+        await db.commit()
+
+    async with session_factory() as db:
+        assert await db.scalar(
+            select(ProductReadModel.name).where(ProductReadModel.product_id == product_id)
+        ) == "Newer"
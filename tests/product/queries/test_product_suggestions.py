@@ -0,0 +1,151 @@
+"""
+Тесты индекса подсказок следующего слова (SuggestionIndex, /product/search/suggest).
+
+Проверяют:
+- Подсказки по всему каталогу, а не по странице поиска
+- Сужение подсказок предыдущими терминами запроса
+- Инкрементальное обновление индекса при изменении и удалении товара
+- Подбор изменений других воркеров опросом и перестройку без пустого индекса
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from src.catalog.product.application.services.suggestion_index import (
+    SuggestionIndex,
+    SuggestionIndexUpdater,
+)
+
+
+def _words(suggestions):
+    return {s.word: s.count for s in suggestions}
+
+
+def test_suggestion_index_counts_products_and_narrows_by_terms():
+    """Подсказки считаются по товарам и учитывают все термины запроса"""
+    index = SuggestionIndex()
+    index.upsert(1, ["iPhone 15 Pro", "Midnight Blue"])
+    index.upsert(2, ["iPhone 15 Max"])
+    index.upsert(3, ["iPhone 16 Pro"])
+    index.upsert(4, ["Galaxy S24", "Midnight Black"])
+
+    assert _words(index.suggest(["iph"])) == {"15": 2, "16": 1}
+    assert _words(index.suggest(["iPhone", "15"])) == {"Pro": 1, "Max": 1}
+    assert _words(index.suggest(["midnight"])) == {"Blue": 1, "Black": 1}
+    assert _words(index.suggest(["galaxy", "midnight"])) == {"Black": 1}
+    assert index.suggest(["nokia"]) == []
+
+
+def test_suggestion_index_upsert_and_remove():
+    """Повторный upsert заменяет документ товара, remove убирает его целиком"""
+    index = SuggestionIndex()
+    index.upsert(1, ["iPhone 15 Pro"])
+    index.upsert(1, ["iPhone 17 Air"])
+
+    assert _words(index.suggest(["iphone"])) == {"17": 1}
+    assert index.suggest(["15"]) == []
+
+    index.remove(1)
+    assert index.suggest(["iphone"]) == []
+    assert index._words == []
+
+
+@pytest.mark.asyncio
+async def test_suggestion_index_updater_marks_pending_changes():
+    """События товаров помечают товар, события атрибутов — полную перестройку"""
+    index = SuggestionIndex()
+    index.take_pending()
+    updater = SuggestionIndexUpdater(index)
+
+    await updater.handle({"entity": "product", "entity_id": 7})
+    await updater.handle({"entity": "review", "entity_id": 1, "data": {"product_id": 8}})
+    assert index.take_pending() == (False, {7}, None)
+
+    await updater.handle({"entity": "product_attribute", "entity_id": 3})
+    assert index.take_pending() == (True, set(), None)
+
+
+def test_suggestion_index_apply_keeps_words_sorted():
+    """Пачка изменений обновляет отсортированный список слов одним слиянием"""
+    index = SuggestionIndex()
+    index.rebuild({1: ["Pixel 8"], 2: ["Galaxy S24"]})
+    assert index._words == ["8", "galaxy", "pixel", "s24"]
+
+    index.apply({1: ["Pixel 9 Pro"], 3: ["Aquos R8"]}, removed=[2])
+
+    assert index._words == ["9", "aquos", "pixel", "pro", "r8"]
+    assert _words(index.suggest(["pixel"])) == {"9": 1}
+
+
+@pytest.mark.asyncio
+async def test_suggestion_index_sync_polls_other_workers_changes():
+    """
+    Сценарий:
+    1. Первая синхронизация строит индекс и запоминает отметку
+    2. Следующая (после poll_interval) перечитывает товары, изменённые
+       другими воркерами после отметки, и убирает удалённые
+    """
+    watermark = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    catalog = {1: ["Pixel 8"], 2: ["Galaxy S24"]}
+    calls = []
+
+    async def load_documents(product_ids=None, updated_since=None):
+        calls.append((product_ids, updated_since))
+        if updated_since is not None:
+            return {1: ["Pixel 9"]}
+        return dict(catalog)
+
+    async def load_deleted_ids(since):
+        return [2]
+
+    async def load_watermark():
+        return watermark
+
+    index = SuggestionIndex(poll_interval=0)
+    await index.sync(load_documents, load_deleted_ids, load_watermark)
+    assert _words(index.suggest(["galaxy"])) == {"S24": 1}
+
+    await index.sync(load_documents, load_deleted_ids, load_watermark)
+
+    assert calls == [(None, None), (None, watermark)]
+    assert _words(index.suggest(["pixel"])) == {"9": 1}
+    assert index.suggest(["galaxy"]) == []
+
+
+@pytest.mark.asyncio
+async def test_suggest_endpoint_covers_whole_catalog(authorized_client, client):
+    """Подсказки учитывают все товары каталога, а не только первую страницу поиска"""
+    for i in range(12):
+        await authorized_client.post("/product", data={"name": f"iPhone 15 Model{i}", "price": "999.00"})
+    await authorized_client.post("/product", data={"name": "iPhone 16 Pro", "price": "1099.00"})
+
+    response = await client.get("/product/search/suggest?query=iphone")
+    assert response.status_code == 200
+    suggestions = {s["word"]: s["count"] for s in response.json()["data"]["suggestions"]}
+    assert suggestions == {"15": 12, "16": 1}
+
+    search = await client.get("/product/search?query=iphone&limit=2")
+    assert search.status_code == 200
+    data = search.json()["data"]
+    assert len(data["items"]) == 2
+    assert {s["word"]: s["count"] for s in data["suggestions"]} == {"15": 12, "16": 1}
+
+
+@pytest.mark.asyncio
+async def test_suggest_endpoint_follows_product_changes(authorized_client, client):
+    """После переименования и удаления товара подсказки обновляются"""
+    first = await authorized_client.post("/product", data={"name": "Pixel 8 Pro", "price": "699.00"})
+    second = await authorized_client.post("/product", data={"name": "Pixel 9", "price": "799.00"})
+
+    response = await client.get("/product/search/suggest?query=pixel")
+    assert {s["word"] for s in response.json()["data"]["suggestions"]} == {"8", "9"}
+
+    await authorized_client.put(
+        f"/product/{first.json()['data']['id']}",
+        data={"name": "Pixel 10", "price": "699.00"},
+    )
+    await authorized_client.delete(f"/product/{second.json()['data']['id']}")
+
+    response = await client.get("/product/search/suggest?query=pixel")
+    assert response.status_code == 200
+    assert [s["word"] for s in response.json()["data"]["suggestions"]] == ["10"]
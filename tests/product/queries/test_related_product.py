@@ -1,6 +1,7 @@
 import json
 
 import pytest
+from sqlalchemy import text
 
 
 async def _create_category(authorized_client, name: str) -> int:
@@ -294,3 +295,100 @@ async def test_related_products_ignores_non_groupable_attrs(authorized_client, c
     assert "Samsung Watch Красный 41" in names
     assert "Samsung Watch Красный 45" in names
     assert "Samsung Watch Синий 41" not in names
+
+
+@pytest.mark.asyncio
+async def test_related_products_statement_count_does_not_depend_on_family_size(
+    authorized_client,
+    client,
+    statement_log,
+):
+    """
+    Товары семейства читаются одним пакетом (get_many), а не запросом на товар.
+
+    Сценарий:
+    1. Семейства из 2 и из 6 вариантов в разных категориях
+    2. Количество SQL-запросов related одинаково, порядок — по id
+    """
+    families = {}
+    for size in (2, 6):
+        category_id = await _create_category(authorized_client, f"Family {size}")
+        families[size] = [
+            await _create_product_with_attrs(
+                authorized_client,
+                name=f"Family {size} Variant {index}",
+                category_id=category_id,
+                attrs=[
+                    {"name": "Серия", "value": "one", "is_filterable": True, "is_groupable": True},
+                    {"name": "Размер", "value": f"{index}", "is_filterable": True, "is_groupable": False},
+                ],
+            )
+            for index in range(size)
+        ]
+
+    # Снимок дерева категорий и формулы цен загружаются первым запросом выдачи
+    assert (await client.get("/product?limit=1")).status_code == 200
+
+    counts = {}
+    for size, product_ids in families.items():
+        with statement_log() as counter:
+            response = await client.get(f"/product/related/variants?product_id={product_ids[0]}")
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["data"]["items"]] == product_ids
+        counts[size] = counter.count
+
+    assert counts[2] == counts[6]
+
+
+@pytest.mark.asyncio
+async def test_related_products_follow_attribute_changes(authorized_client, client, engine):
+    """
+    Сигнатура семейства пересчитывается при изменении атрибутов товара.
+
+    Сценарий:
+    1. Два товара с одинаковыми groupable-атрибутами — одно семейство
+    2. У второго меняется цвет — он выходит из семейства
+    3. Цвет возвращается — товар снова в семействе, сигнатуры равны
+    """
+    category_id = await _create_category(authorized_client, "Pixel 8")
+    attrs = [
+        {"name": "Память", "value": "128 Гб", "is_filterable": True, "is_groupable": True},
+        {"name": "Цвет", "value": "Белый", "is_filterable": True, "is_groupable": True},
+        {"name": "Комплект", "value": "Базовый", "is_filterable": False, "is_groupable": False},
+    ]
+    base_id = await _create_product_with_attrs(
+        authorized_client, name="Pixel 8 Белый", category_id=category_id, attrs=attrs,
+    )
+    other_id = await _create_product_with_attrs(
+        authorized_client, name="Pixel 8 Белый Б/У", category_id=category_id, attrs=attrs[:2],
+    )
+
+    async def family() -> list[int]:
+        response = await client.get(f"/product/related/variants?product_id={base_id}")
+        assert response.status_code == 200
+        return [item["id"] for item in response.json()["data"]["items"]]
+
+    assert await family() == [base_id, other_id]
+
+    recolored = [attrs[0], {**attrs[1], "value": "Черный"}]
+    response = await authorized_client.put(
+        f"/product/{other_id}", data={"attributes_json": json.dumps(recolored)}
+    )
+    assert response.status_code == 200
+    assert await family() == [base_id]
+
+    response = await authorized_client.put(
+        f"/product/{other_id}", data={"attributes_json": json.dumps(attrs[:2])}
+    )
+    assert response.status_code == 200
+    assert await family() == [base_id, other_id]
+
+    async with engine.connect() as conn:
+        signatures = (
+            await conn.execute(
+                text("SELECT variant_signature FROM products WHERE id = ANY(:ids)"),
+                {"ids": [base_id, other_id]},
+            )
+        ).scalars().all()
+    assert len(set(signatures)) == 1
+    assert signatures[0] is not None